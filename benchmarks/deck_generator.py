@@ -0,0 +1,140 @@
+"""
+Synthetic Deck Generator for Benchmarks
+
+Builds markdown decks of any size from the structured frontmatter patterns,
+cycling through every layout the target template provides and filling each
+pattern field with text from tests/utils/content_generator.py.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from deckbuilder.pattern_loader import PatternLoader  # noqa: E402
+from tests.utils.content_generator import ContentGenerator, ContentLength, ContentType  # noqa: E402
+
+DEFAULT_TEMPLATE_FOLDER = PROJECT_ROOT / "src" / "deckbuilder" / "assets" / "templates"
+IMAGES_FOLDER = PROJECT_ROOT / "src" / "placekitten" / "images"
+
+# Layouts whose only purpose is showing an image
+IMAGE_LAYOUTS = {"Picture with Caption"}
+
+CONTENT_TYPES = list(ContentType)
+CONTENT_LENGTHS = list(ContentLength)
+
+
+class _FrontmatterDumper(yaml.SafeDumper):
+    """YAML dumper that writes multi-line strings (tables) as literal blocks."""
+
+
+def _represent_str(dumper: yaml.SafeDumper, value: str):
+    style = "|" if "\n" in value else None
+    return dumper.represent_scalar("tag:yaml.org,2002:str", value, style=style)
+
+
+_FrontmatterDumper.add_representer(str, _represent_str)
+
+
+def get_template_layouts(template_name: str = "default", template_folder: Path = DEFAULT_TEMPLATE_FOLDER) -> List[str]:
+    """Return the layout names defined in a template's JSON mapping."""
+    with open(Path(template_folder) / f"{template_name}.json", "r", encoding="utf-8") as f:
+        return list(json.load(f).get("layouts", {}).keys())
+
+
+class SyntheticDeckGenerator:
+    """Generates reproducible markdown decks that exercise every template layout."""
+
+    def __init__(self, template_name: str = "default", template_folder: Path = DEFAULT_TEMPLATE_FOLDER, seed: int = 42):
+        """
+        Initialize the generator.
+
+        Args:
+            template_name: Template whose layouts the decks should cover
+            template_folder: Folder containing the template .pptx/.json files
+            seed: Random seed for reproducible content
+        """
+        self.content = ContentGenerator(seed=seed)
+        template_layouts = set(get_template_layouts(template_name, template_folder))
+        patterns = PatternLoader(template_folder).load_patterns()
+        # Sorted for a stable layout order across runs
+        self.patterns = {name: patterns[name] for name in sorted(patterns) if name in template_layouts}
+        self.images = sorted(IMAGES_FOLDER.glob("*.png"))
+
+    def _text(self, index: int, kind: str) -> str:
+        """Pick library text for a field, varying content type and length by slide."""
+        library = self.content.get_content_library(CONTENT_TYPES[index % len(CONTENT_TYPES)])
+        entries = library[CONTENT_LENGTHS[index % len(CONTENT_LENGTHS)]][kind]
+        return self.content.apply_random_formatting(entries[index % len(entries)])
+
+    def _table_markdown(self, index: int) -> str:
+        """Render a generated table as markdown pipe rows."""
+        table = self.content.build_table_content(rows=4 + index % 4, cols=3 + index % 3)
+        return "\n".join("| " + " | ".join(row) + " |" for row in table["data"])
+
+    def _fill_pattern(self, layout: str, pattern: Dict[str, Any], index: int, image_index: int) -> Dict[str, Any]:
+        """Fill every field of a pattern's yaml_pattern with generated content."""
+        slide: Dict[str, Any] = {"layout": layout}
+        for position, (field_name, field_type) in enumerate(pattern.get("yaml_pattern", {}).items()):
+            if field_name == "layout" or field_type != "str":
+                continue
+            lowered = field_name.lower()
+            if "image" in lowered:
+                slide[field_name] = str(self.images[image_index % len(self.images)]) if self.images else "missing_image.png"
+            elif "title" in lowered:
+                slide[field_name] = self._text(index + position, "titles")
+            else:
+                slide[field_name] = self._text(index + position, "content")
+        return slide
+
+    def generate_slides(self, slide_count: int, include_tables: bool = True, include_images: bool = True) -> List[Dict[str, Any]]:
+        """
+        Generate frontmatter dictionaries for a deck.
+
+        Args:
+            slide_count: Number of slides to generate
+            include_tables: Replace every fifth slide with a table slide
+            include_images: Include image layouts (PlaceKitten images as sources)
+
+        Returns:
+            List of frontmatter dictionaries, one per slide
+        """
+        layouts = [name for name in self.patterns if include_images or name not in IMAGE_LAYOUTS]
+        slides = []
+        image_index = 0
+        for index in range(slide_count):
+            if include_tables and index % 5 == 4:
+                slides.append({"layout": "Title and Content", "title": self._text(index, "titles"), "content": self._table_markdown(index)})
+                continue
+
+            layout = layouts[index % len(layouts)]
+            slides.append(self._fill_pattern(layout, self.patterns[layout], index, image_index))
+            if layout in IMAGE_LAYOUTS:
+                image_index += 1
+        return slides
+
+    def generate_markdown(self, slide_count: int, include_tables: bool = True, include_images: bool = True) -> str:
+        """Generate a complete markdown deck with one frontmatter block per slide."""
+        blocks = []
+        for slide in self.generate_slides(slide_count, include_tables, include_images):
+            frontmatter = yaml.dump(slide, Dumper=_FrontmatterDumper, sort_keys=False, allow_unicode=True, width=1000)
+            blocks.append(f"---\n{frontmatter}---\n")
+        return "\n".join(blocks)
+
+    def write_deck(self, output_file: Path, slide_count: int, include_tables: bool = True, include_images: bool = True) -> Path:
+        """Write a generated deck to disk and return its path."""
+        output_file = Path(output_file)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_text(self.generate_markdown(slide_count, include_tables, include_images), encoding="utf-8")
+        return output_file
+
+
+def generate_deck(slide_count: int, include_tables: bool = True, include_images: bool = True, seed: Optional[int] = 42) -> str:
+    """Convenience wrapper returning a markdown deck for the default template."""
+    return SyntheticDeckGenerator(seed=seed).generate_markdown(slide_count, include_tables, include_images)
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Image Decode Benchmark
+
+Compares two ways of turning large camera photos into placeholder-sized JPEGs:
+
+- legacy: the previous ImageHandler.process_image path, kept here as the
+  reference. It opens the file to verify() it, opens it again, decodes it at
+  full resolution and LANCZOS-resizes it.
+- single-open: ImageHandler._render_image. It opens the file once, lets the
+  JPEG decoder scale by 1/2, 1/4 or 1/8 (draft mode), then LANCZOS-resizes the
+  result with reduce() first.
+
+The source photos are synthetic 24-megapixel JPEGs (6000x4000 by default).
+Each path runs in a fresh interpreter, so its peak RSS can be measured. The
+processed images of the two paths are compared by mean absolute pixel
+difference.
+
+Usage:
+    python benchmarks/image_decode_benchmark.py
+    python benchmarks/image_decode_benchmark.py --images 12 --size 6000 4000 --target 600 450
+"""
+
+import argparse
+import json
+import os
+import subprocess  # nosec B404
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BENCHMARKS_DIR.parent
+
+MODES = ("baseline", "legacy", "single-open")
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 2)
+
+
+def generate_photos(folder: Path, count: int, size: Tuple[int, int]) -> List[Path]:
+    """Write synthetic camera-sized JPEGs (smooth gradients plus texture) and return their paths."""
+    import numpy as np
+    from PIL import Image
+
+    rng = np.random.default_rng(7)
+    width, height = size
+    photos = []
+    for index in range(count):
+        texture = Image.fromarray((rng.random((height // 8, width // 8, 3)) * 255).astype("uint8")).resize(size, Image.Resampling.BICUBIC)
+        gradient = Image.linear_gradient("L").resize(size).convert("RGB")
+        photo = Image.blend(texture, gradient, 0.5)
+        path = folder / f"photo_{index}.jpg"
+        photo.save(path, "JPEG", quality=90)
+        photos.append(path)
+    return photos
+
+
+def legacy_process(image_path: Path, target: Tuple[int, int], output_path: Path) -> None:
+    """The previous process_image path: verify, reopen, full-resolution decode, LANCZOS resize."""
+    from PIL import Image
+
+    with Image.open(image_path) as img:
+        img.verify()
+    with Image.open(image_path) as img:
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        scale = min(target[0] / img.width, target[1] / img.height)
+        resized = img.resize((int(img.width * scale), int(img.height * scale)), Image.Resampling.LANCZOS)
+    resized.save(output_path, "JPEG", quality=95, optimize=True)
+
+
+def run_mode(mode: str, photos: List[Path], target: Tuple[int, int], output_dir: Path) -> Dict[str, Any]:
+    """Process every photo with one path in this process and measure it."""
+    from deckbuilder.image_handler import ImageHandler
+
+    handler = ImageHandler(str(output_dir / "cache"))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    for photo in photos:
+        output_path = output_dir / f"{photo.stem}.jpg"
+        if mode == "legacy":
+            legacy_process(photo, target, output_path)
+        elif mode == "single-open":
+            handler._render_image(str(photo), target, "high", output_path)
+    return {"mode": mode, "seconds": round(time.perf_counter() - start, 4), "peak_rss_mb": _peak_rss_mb()}
+
+
+def _run_subprocess(*args: str) -> None:
+    """Run this script with the given arguments in a fresh interpreter."""
+    command = [sys.executable, str(Path(__file__).resolve()), *args]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(PROJECT_ROOT / "src"), str(PROJECT_ROOT)]))
+    completed = subprocess.run(command, capture_output=True, text=True, env=env)  # nosec B603
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else f"exit {completed.returncode}")
+
+
+def _run_mode_subprocess(mode: str, photos: List[Path], target: Tuple[int, int], output_dir: Path) -> Dict[str, Any]:
+    result_file = output_dir.parent / f"{mode}.json"
+    _run_subprocess("--run-mode", mode, "--output-dir", str(output_dir), "--result-file", str(result_file), "--target", *map(str, target), "--photos", *map(str, photos))
+    return json.loads(result_file.read_text(encoding="utf-8"))
+
+
+def _mean_difference(first: Path, second: Path) -> float:
+    """Mean absolute per-channel difference (0-255) between two images of the same size."""
+    import numpy as np
+    from PIL import Image
+
+    with Image.open(first) as a, Image.open(second) as b:
+        if a.size != b.size:
+            return float("inf")
+        return float(np.abs(np.asarray(a, dtype=np.int16) - np.asarray(b, dtype=np.int16)).mean())
+
+
+def run(count: int, size: Tuple[int, int], target: Tuple[int, int]) -> Dict[str, Any]:
+    """Generate photos, run every mode in its own interpreter and compare the outputs."""
+    with tempfile.TemporaryDirectory(prefix="deckbuilder_decode_bench_") as temp:
+        work_dir = Path(temp)
+        # Generated in a separate interpreter: Linux children inherit the parent's peak RSS
+        _run_subprocess("--generate", str(work_dir), "--images", str(count), "--size", *map(str, size))
+        photos = [work_dir / f"photo_{index}.jpg" for index in range(count)]
+        results = {mode: _run_mode_subprocess(mode, photos, target, work_dir / mode) for mode in MODES}
+        differences = [_mean_difference(work_dir / "legacy" / f"{photo.stem}.jpg", work_dir / "single-open" / f"{photo.stem}.jpg") for photo in photos]
+        return {"photos": count, "size": size, "target": target, "results": results, "max_mean_difference": round(max(differences), 3)}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Image decode benchmark")
+    parser.add_argument("--images", type=int, default=8, help="Synthetic photos to process (default: 8)")
+    parser.add_argument("--size", type=int, nargs=2, default=[6000, 4000], metavar=("WIDTH", "HEIGHT"), help="Photo size (default: 6000 4000)")
+    parser.add_argument("--target", type=int, nargs=2, default=[600, 450], metavar=("WIDTH", "HEIGHT"), help="Placeholder size in pixels (default: 600 450)")
+    parser.add_argument("--run-mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--photos", nargs="*", help=argparse.SUPPRESS)
+    parser.add_argument("--output-dir", help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    parser.add_argument("--generate", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.generate:
+        generate_photos(Path(args.generate), args.images, tuple(args.size))
+        return 0
+
+    if args.run_mode:
+        result = run_mode(args.run_mode, [Path(photo) for photo in args.photos], tuple(args.target), Path(args.output_dir))
+        Path(args.result_file).write_text(json.dumps(result), encoding="utf-8")
+        return 0
+
+    summary = run(args.images, tuple(args.size), tuple(args.target))
+    results = summary["results"]
+    baseline_rss = results["baseline"]["peak_rss_mb"]
+    print(f"{summary['photos']} photos {summary['size'][0]}x{summary['size'][1]} -> {summary['target'][0]}x{summary['target'][1]}")
+    for mode in ("legacy", "single-open"):
+        result = results[mode]
+        per_image = result["seconds"] / summary["photos"] * 1000
+        rss = f"{result['peak_rss_mb'] - baseline_rss:>8.1f} MB above baseline" if baseline_rss is not None else "RSS n/a"
+        print(f"  {mode:<12} {result['seconds']:>8.3f}s  {per_image:>8.1f} ms/image  peak RSS {rss}")
+    legacy, fast = results["legacy"], results["single-open"]
+    print(f"  speedup {legacy['seconds'] / fast['seconds']:.1f}x, max mean pixel difference {summary['max_mean_difference']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
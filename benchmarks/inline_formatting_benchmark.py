@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Inline Formatting Micro-benchmark
+
+Compares the single-pass inline formatting tokenizer (content_formatting.parse_inline_formatting)
+with the previous implementation, which ran one regex pass per marker type and
+then sorted and de-overlapped the matches.
+
+The workload is every title, content line and table cell of a synthetic deck
+(see deck_generator.py), so repetition is similar to a real presentation.
+
+Usage:
+    python benchmarks/inline_formatting_benchmark.py
+    python benchmarks/inline_formatting_benchmark.py --slides 1000 --repeat 7
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent))
+from deck_generator import SyntheticDeckGenerator  # noqa: E402
+
+from deckbuilder import content_formatting  # noqa: E402
+
+LEGACY_PATTERNS = [
+    (r"\*\*\*___(.*?)___\*\*\*", {"bold": True, "italic": True, "underline": True}),
+    (r"___\*\*\*(.*?)\*\*\*___", {"bold": True, "italic": True, "underline": True}),
+    (r"\*\*\*(.*?)\*\*\*", {"bold": True, "italic": True}),
+    (r"___(.*?)___", {"underline": True}),
+    (r"\*\*(.*?)\*\*", {"bold": True}),
+    (r"\*(.*?)\*", {"italic": True}),
+]
+
+
+def legacy_parse_inline_formatting(text: str) -> List[Dict[str, Any]]:
+    """The previous multi-pass implementation, kept here as the reference."""
+    if not text:
+        return [{"text": "", "format": {}}]
+
+    all_matches = []
+    for pattern, format_dict in LEGACY_PATTERNS:
+        for match in re.finditer(pattern, text):
+            all_matches.append((match.start(), match.end(), match.group(1), format_dict))
+    all_matches.sort(key=lambda x: x[0])
+
+    filtered_matches = []
+    last_end = 0
+    for start, end, content, format_dict in all_matches:
+        if start >= last_end:
+            filtered_matches.append((start, end, content, format_dict))
+            last_end = end
+
+    segments = []
+    last_pos = 0
+    for start, end, content, format_dict in filtered_matches:
+        if start > last_pos:
+            segments.append({"text": text[last_pos:start], "format": {}})
+        segments.append({"text": content, "format": format_dict})
+        last_pos = end
+    if last_pos < len(text):
+        segments.append({"text": text[last_pos:], "format": {}})
+    return segments or [{"text": text, "format": {}}]
+
+
+def collect_strings(slide_count: int) -> List[str]:
+    """Every formattable string of a synthetic deck, in document order (with repeats)."""
+    strings = []
+    for slide in SyntheticDeckGenerator().generate_slides(slide_count, include_tables=True, include_images=False):
+        for key, value in slide.items():
+            if key == "layout" or not isinstance(value, str):
+                continue
+            for line in value.splitlines():
+                if line.startswith("|"):
+                    strings.extend(cell.strip() for cell in line.strip("|").split("|"))
+                else:
+                    strings.append(line)
+    return strings
+
+
+def _best_of(func: Callable[[], None], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(slide_count: int, repeat: int) -> Dict[str, Any]:
+    """Time each implementation over the workload and check they agree."""
+    strings = collect_strings(slide_count)
+    tokenize = content_formatting._tokenize_inline
+
+    mismatches = sum(1 for s in strings if legacy_parse_inline_formatting(s) != content_formatting.parse_inline_formatting(s))
+
+    def single_pass_cold():
+        tokenize.cache_clear()
+        for s in strings:
+            content_formatting.parse_inline_formatting(s)
+
+    def single_pass_warm():
+        for s in strings:
+            content_formatting.parse_inline_formatting(s)
+
+    def single_pass_unmemoized():
+        content_formatting._tokenize_inline = tokenize.__wrapped__
+        try:
+            for s in strings:
+                content_formatting.parse_inline_formatting(s)
+        finally:
+            content_formatting._tokenize_inline = tokenize
+
+    def legacy():
+        for s in strings:
+            legacy_parse_inline_formatting(s)
+
+    results = {
+        "strings": len(strings),
+        "distinct": len(set(strings)),
+        "mismatches": mismatches,
+        "legacy_seconds": _best_of(legacy, repeat),
+        "single_pass_seconds": _best_of(single_pass_unmemoized, repeat),
+        "single_pass_cold_seconds": _best_of(single_pass_cold, repeat),
+    }
+    single_pass_cold()
+    results["single_pass_warm_seconds"] = _best_of(single_pass_warm, repeat)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Inline formatting tokenizer micro-benchmark")
+    parser.add_argument("--slides", type=int, default=500, help="Synthetic deck size providing the strings (default: 500)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per implementation; the fastest is kept (default: 5)")
+    args = parser.parse_args(argv)
+
+    results = run(args.slides, args.repeat)
+    legacy = results["legacy_seconds"]
+    print(f"{results['strings']} strings ({results['distinct']} distinct) from a {args.slides}-slide deck")
+    for label, key in (
+        ("legacy (6 regex passes)", "legacy_seconds"),
+        ("single pass, no memo", "single_pass_seconds"),
+        ("single pass, cold memo", "single_pass_cold_seconds"),
+        ("single pass, warm memo", "single_pass_warm_seconds"),
+    ):
+        seconds = results[key]
+        print(f"  {label:<26} {seconds * 1000:>9.2f} ms  {legacy / seconds if seconds else 0:>6.1f}x")
+    if results["mismatches"]:
+        print(f"  ⚠ {results['mismatches']} strings parsed differently from the legacy implementation")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
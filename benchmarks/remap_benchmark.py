@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Language/Font Remap Benchmark
+
+Compares the two FormattingSupport.update_presentation paths on large decks:
+the python-pptx object model walk and the XML-level rewrite (``fast=True``,
+see xml_remap.py).
+
+Decks are synthetic (see deck_generator.py) and are built once through
+Deckbuilder. Each remap writes to a separate output file, so every run starts
+from the same input. The two paths must report identical statistics.
+
+Usage:
+    python benchmarks/remap_benchmark.py
+    python benchmarks/remap_benchmark.py --sizes 100 1000 --language en-AU --font Arial
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+from deck_generator import DEFAULT_TEMPLATE_FOLDER, SyntheticDeckGenerator  # noqa: E402
+
+DEFAULT_SIZES = [100, 500]
+
+
+def build_deck(slide_count: int, work_dir: Path) -> Path:
+    """Build a synthetic deck with tables (no images) and return the .pptx path."""
+    from deckbuilder import converter
+    from deckbuilder.engine import Deckbuilder
+    from deckbuilder.path_manager import create_library_path_manager
+
+    markdown = SyntheticDeckGenerator().generate_markdown(slide_count, include_tables=True, include_images=False)
+    path_manager = create_library_path_manager(template_folder=str(DEFAULT_TEMPLATE_FOLDER), output_folder=str(work_dir))
+    builder = Deckbuilder.create_instance(path_manager_instance=path_manager)
+    with contextlib.redirect_stdout(io.StringIO()):
+        builder.create_presentation(converter.markdown_to_canonical_json(markdown), fileName=f"remap_{slide_count}")
+    return next(work_dir.glob(f"remap_{slide_count}.*.g.pptx"))
+
+
+def _time_remap(deck: Path, output: Path, language: Optional[str], font: Optional[str], fast: bool, repeat: int) -> Dict[str, Any]:
+    from deckbuilder.formatting_support import FormattingSupport
+
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = FormattingSupport().update_presentation(str(deck), language, font, output_path=str(output), create_backup=False, fast=fast)
+        timings.append(time.perf_counter() - start)
+        if not result["success"]:
+            raise RuntimeError(result["error"])
+    return {"seconds": min(timings), "stats": result["stats"], "output_bytes": output.stat().st_size}
+
+
+def run(sizes: List[int], language: Optional[str], font: Optional[str], repeat: int) -> List[Dict[str, Any]]:
+    """Remap a deck of every size with both paths and return the measurements."""
+    results = []
+    with tempfile.TemporaryDirectory(prefix="deckbuilder_remap_bench_") as temp:
+        work_dir = Path(temp)
+        for slide_count in sizes:
+            deck = build_deck(slide_count, work_dir)
+            legacy = _time_remap(deck, work_dir / "legacy.pptx", language, font, False, repeat)
+            fast = _time_remap(deck, work_dir / "fast.pptx", language, font, True, repeat)
+            results.append(
+                {
+                    "slides": slide_count,
+                    "input_bytes": deck.stat().st_size,
+                    "legacy_seconds": round(legacy["seconds"], 4),
+                    "fast_seconds": round(fast["seconds"], 4),
+                    "legacy_output_bytes": legacy["output_bytes"],
+                    "fast_output_bytes": fast["output_bytes"],
+                    "runs": legacy["stats"]["total_runs_processed"],
+                    "stats_match": legacy["stats"] == fast["stats"],
+                }
+            )
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Language/font remap benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Slide counts to benchmark (default: 100 500)")
+    parser.add_argument("--language", default="en-AU", help="Language code to apply (default: en-AU)")
+    parser.add_argument("--font", default="Arial", help="Font to apply (default: Arial)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per path; the fastest is kept (default: 3)")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.language, args.font, args.repeat)
+    exit_code = 0
+    for result in results:
+        speedup = result["legacy_seconds"] / result["fast_seconds"] if result["fast_seconds"] else 0
+        print(
+            f"  {result['slides']:>6} slides ({result['runs']} runs)  "
+            f"python-pptx {result['legacy_seconds']:>8.3f}s  xml {result['fast_seconds']:>8.3f}s  {speedup:>5.1f}x  "
+            f"output {result['legacy_output_bytes'] / 1024:.0f} KB / {result['fast_output_bytes'] / 1024:.0f} KB"
+        )
+        if not result["stats_match"]:
+            print("  ⚠ the two paths reported different statistics")
+            exit_code = 1
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
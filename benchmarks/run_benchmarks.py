@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+End-to-end Deck Generation Benchmarks
+
+Generates synthetic markdown decks (see deck_generator.py) at growing sizes and
+builds each one through the full pipeline in two modes:
+
+- batch:  markdown → canonical JSON → Deckbuilder.create_presentation
+          (validation, slide building, save)
+- stream: Deckbuilder.create_presentation_from_markdown, which parses,
+          validates and builds slide by slide with look-ahead image prefetch
+
+Every case runs in a fresh interpreter, with its own image cache directory, so
+peak RSS and cache state are not shared between cases. Results are written as JSON and can be compared against
+a stored baseline; the run exits with status 1 when a case regresses.
+
+Usage:
+    python benchmarks/run_benchmarks.py                          # all sizes and scenarios
+    python benchmarks/run_benchmarks.py --sizes 10 100 --scenarios text full
+    python benchmarks/run_benchmarks.py --modes stream
+    python benchmarks/run_benchmarks.py --save-baseline          # store results as baseline
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json --tolerance 0.25
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess  # nosec B404
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+BENCHMARKS_DIR = Path(__file__).parent
+PROJECT_ROOT = BENCHMARKS_DIR.parent
+DEFAULT_RESULTS = BENCHMARKS_DIR / "results" / "latest.json"
+DEFAULT_BASELINE = BENCHMARKS_DIR / "baseline.json"
+
+DEFAULT_SIZES = [10, 100, 1000, 5000]
+
+# Pipelines a deck is built through: two-phase (batch) or streamed from markdown
+MODES = ("batch", "stream")
+
+# Scenario name -> (include_tables, include_images)
+SCENARIOS = {
+    "text": (False, False),
+    "tables": (True, False),
+    "images": (False, True),
+    "full": (True, True),
+}
+
+# Metrics compared against the baseline and the tolerance flag that applies to each
+COMPARED_METRICS = {
+    "wall_seconds": "tolerance",
+    "peak_rss_mb": "rss_tolerance",
+    "output_bytes": "size_tolerance",
+}
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 2)
+
+
+def run_case(scenario: str, slide_count: int, work_dir: Path, mode: str = "batch") -> Dict[str, Any]:
+    """Build one synthetic deck in this process and measure it."""
+    sys.path.insert(0, str(BENCHMARKS_DIR))
+    from deck_generator import DEFAULT_TEMPLATE_FOLDER, SyntheticDeckGenerator
+
+    from deckbuilder import converter
+    from deckbuilder.engine import Deckbuilder
+    from deckbuilder.path_manager import create_library_path_manager
+
+    include_tables, include_images = SCENARIOS[scenario]
+    deck_file = SyntheticDeckGenerator().write_deck(work_dir / f"{scenario}_{slide_count}.md", slide_count, include_tables, include_images)
+    output_dir = work_dir / "output"
+
+    start = time.perf_counter()
+    if mode == "stream":
+        # Parsing is interleaved with building, so it is counted in build time
+        presentation_data = None
+    else:
+        markdown_content = deck_file.read_text(encoding="utf-8")
+        presentation_data = converter.markdown_to_canonical_json(markdown_content)
+    parsed = time.perf_counter()
+
+    path_manager = create_library_path_manager(template_folder=str(DEFAULT_TEMPLATE_FOLDER), output_folder=str(output_dir))
+    builder = Deckbuilder.create_instance(path_manager_instance=path_manager)
+    initialized = time.perf_counter()
+
+    if presentation_data is None:
+        builder.create_presentation_from_markdown(deck_file, fileName=deck_file.stem, templateName="default")
+    else:
+        builder.create_presentation(presentation_data, fileName=deck_file.stem, templateName="default")
+    finished = time.perf_counter()
+
+    outputs = list(output_dir.glob(f"{deck_file.stem}.*.g.pptx"))
+    return {
+        "scenario": scenario,
+        "slides": slide_count,
+        "mode": mode,
+        "wall_seconds": round(finished - start, 4),
+        "parse_seconds": round(parsed - start, 4),
+        "init_seconds": round(initialized - parsed, 4),
+        "build_seconds": round(finished - initialized, 4),
+        "peak_rss_mb": _peak_rss_mb(),
+        "output_bytes": outputs[0].stat().st_size if outputs else None,
+        "input_bytes": deck_file.stat().st_size,
+    }
+
+
+def _run_case_subprocess(scenario: str, slide_count: int, timeout: float, mode: str = "batch") -> Dict[str, Any]:
+    """Run one case in a fresh interpreter and return its measurements."""
+    with tempfile.TemporaryDirectory(prefix="deckbuilder_bench_") as work_dir:
+        result_file = Path(work_dir) / "result.json"
+        command = [sys.executable, str(Path(__file__).resolve()), "--run-case", scenario, str(slide_count), "--mode", mode, "--work-dir", work_dir, "--result-file", str(result_file)]
+        # A per-case image cache keeps every case cold and out of the user's home cache
+        env = dict(
+            os.environ,
+            PYTHONPATH=os.pathsep.join([str(PROJECT_ROOT / "src"), str(PROJECT_ROOT)]),
+            DECKBUILDER_IMAGE_CACHE_DIR=str(Path(work_dir) / "image_cache"),
+        )
+        completed = subprocess.run(command, capture_output=True, text=True, env=env, timeout=timeout, cwd=work_dir)  # nosec B603
+        if completed.returncode != 0 or not result_file.exists():
+            tail = "\n".join((completed.stderr or completed.stdout).strip().splitlines()[-10:])
+            return {"scenario": scenario, "slides": slide_count, "mode": mode, "error": f"exit {completed.returncode}: {tail}"}
+        return json.loads(result_file.read_text(encoding="utf-8"))
+
+
+def run_suite(sizes: List[int], scenarios: List[str], repeat: int = 1, timeout: float = 3600, modes: Sequence[str] = MODES) -> List[Dict[str, Any]]:
+    """Run every (scenario, size, mode) case, keeping the fastest of ``repeat`` runs."""
+    results = []
+    for slide_count in sizes:
+        for scenario in scenarios:
+            for mode in modes:
+                runs = [_run_case_subprocess(scenario, slide_count, timeout, mode) for _ in range(max(1, repeat))]
+                successful = [run for run in runs if "error" not in run]
+                best = min(successful, key=lambda run: run["wall_seconds"]) if successful else runs[0]
+                results.append(best)
+                _print_case(best)
+    return results
+
+
+def _case_key(result: Dict[str, Any]) -> str:
+    # Batch cases keep their original names, so older baselines still compare
+    mode = result.get("mode", "batch")
+    return f"{result['scenario']}-{result['slides']}" + ("" if mode == "batch" else f"-{mode}")
+
+
+def _print_case(result: Dict[str, Any]) -> None:
+    if "error" in result:
+        print(f"  ✗ {_case_key(result):<21} {result['error']}")
+        return
+    rss = f"{result['peak_rss_mb']:.1f} MB" if result["peak_rss_mb"] is not None else "n/a"
+    size_kb = (result["output_bytes"] or 0) / 1024
+    print(
+        f"  ✓ {_case_key(result):<21} {result['wall_seconds']:>9.3f}s  " f"(parse {result['parse_seconds']:.3f}s, build {result['build_seconds']:.3f}s)  " f"RSS {rss:>10}  output {size_kb:>9.1f} KB"
+    )
+
+
+def compare_to_baseline(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerances: Dict[str, float]) -> List[Dict[str, Any]]:
+    """
+    Compare results with a baseline run.
+
+    Args:
+        results: Results of the current run
+        baseline: Previously saved results document
+        tolerances: Allowed relative increase per tolerance name (e.g. {"tolerance": 0.2})
+
+    Returns:
+        One entry per regressed metric with baseline, current value and relative change
+    """
+    baseline_cases = {_case_key(case): case for case in baseline.get("results", []) if "error" not in case}
+    regressions = []
+    for result in results:
+        previous = baseline_cases.get(_case_key(result))
+        if previous is None or "error" in result:
+            continue
+        for metric, tolerance_name in COMPARED_METRICS.items():
+            old, new = previous.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if change > tolerances[tolerance_name]:
+                regressions.append({"case": _case_key(result), "metric": metric, "baseline": old, "current": new, "change": round(change, 4)})
+    return regressions
+
+
+def _metadata() -> Dict[str, Any]:
+    """Describe the machine and revision the results were measured on."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=PROJECT_ROOT, timeout=10).stdout.strip()  # nosec B603 B607
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit or None,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the benchmark command line parser."""
+    parser = argparse.ArgumentParser(description="End-to-end deck generation benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Slide counts to benchmark (default: 10 100 1000 5000)")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS), help="Content scenarios (default: all)")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES), help="Build pipelines: batch and/or stream (default: both)")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per case; the fastest is kept (default: 1)")
+    parser.add_argument("--timeout", type=float, default=3600, help="Seconds allowed per case (default: 3600)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_RESULTS, help="Results JSON file")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Also store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.20, help="Allowed relative wall time increase (default: 0.20)")
+    parser.add_argument("--rss-tolerance", type=float, default=0.20, help="Allowed relative peak RSS increase (default: 0.20)")
+    parser.add_argument("--size-tolerance", type=float, default=0.05, help="Allowed relative output size increase (default: 0.05)")
+    # Internal: execute a single case in this process
+    parser.add_argument("--run-case", nargs=2, metavar=("SCENARIO", "SLIDES"), help=argparse.SUPPRESS)
+    parser.add_argument("--mode", choices=list(MODES), default="batch", help=argparse.SUPPRESS)
+    parser.add_argument("--work-dir", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", type=Path, help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = create_parser().parse_args(argv)
+
+    if args.run_case:
+        scenario, slide_count = args.run_case
+        result = run_case(scenario, int(slide_count), args.work_dir, args.mode)
+        _write_json(args.result_file, result)
+        return 0
+
+    print(f"Running deck generation benchmarks: sizes {args.sizes}, scenarios {args.scenarios}, modes {args.modes}")
+    results = run_suite(args.sizes, args.scenarios, repeat=args.repeat, timeout=args.timeout, modes=args.modes)
+    document = {"metadata": _metadata(), "results": results}
+    _write_json(args.output, document)
+    print(f"\nResults written to: {args.output}")
+
+    exit_code = 1 if any("error" in result for result in results) else 0
+
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        tolerances = {"tolerance": args.tolerance, "rss_tolerance": args.rss_tolerance, "size_tolerance": args.size_tolerance}
+        regressions = compare_to_baseline(results, baseline, tolerances)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression['case']:<21} {regression['metric']:<14} {regression['baseline']} → {regression['current']} (+{regression['change'] * 100:.1f}%)")
+            exit_code = 1
+        else:
+            print(f"✅ No regressions against {args.baseline}")
+    elif not args.save_baseline:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+
+    if args.save_baseline:
+        _write_json(args.baseline, document)
+        print(f"Baseline saved to: {args.baseline}")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Smart Crop Memory Benchmark
+
+Measures time and memory of SmartCropEngine in its three modes:
+
+- box:        find_crop_box, which only locates the crop box
+- production: smart_crop with save_steps off, which also crops and resizes
+- debug:      smart_crop with save_steps on, which builds, keeps and writes
+              the nine visualisation frames
+
+Memory is the peak traced by tracemalloc during one call, which includes
+NumPy/OpenCV array buffers, and is reported per call. The debug mode writes
+its step files to a temporary folder.
+
+The bundled images are about 1.5 megapixels; --scale upsamples them first to
+stand in for camera-sized sources.
+
+Usage:
+    python benchmarks/smart_crop_memory_benchmark.py
+    python benchmarks/smart_crop_memory_benchmark.py --scale 3 --repeat 3 --strategy contour
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BENCHMARKS_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from PIL import Image  # noqa: E402
+
+from placekitten.smart_crop import SmartCropEngine  # noqa: E402
+
+IMAGES_DIR = PROJECT_ROOT / "src" / "placekitten" / "images"
+
+# Placeholder size every image is cropped to
+TARGET = (800, 600)
+
+MODES = ("box", "production", "debug")
+
+
+def load_images(scale: float) -> List[Image.Image]:
+    """Bundled PlaceKitten images, optionally upsampled by ``scale``."""
+    images = []
+    for path in sorted(IMAGES_DIR.glob("*.png")):
+        with Image.open(path) as img:
+            image = img.convert("RGB")
+        if scale != 1:
+            image = image.resize((round(image.width * scale), round(image.height * scale)), Image.Resampling.BICUBIC)
+        images.append(image)
+    return images
+
+
+def measure(call: Callable[[], object], repeat: int) -> Tuple[float, int]:
+    """Median seconds and largest traced peak bytes of ``call``."""
+    timings = []
+    peak = 0
+    for _ in range(repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return statistics.median(timings), peak
+
+
+def run(scale: float, repeat: int, strategy: str) -> Dict:
+    """Crop every image in every mode."""
+    images = load_images(scale)
+    width, height = TARGET
+    seconds: Dict[str, List[float]] = {mode: [] for mode in MODES}
+    peaks: Dict[str, List[int]] = {mode: [] for mode in MODES}
+
+    with tempfile.TemporaryDirectory() as step_folder:
+        for image in images:
+            calls = {
+                "box": lambda: SmartCropEngine().find_crop_box(image, width, height, strategy=strategy),
+                "production": lambda: SmartCropEngine().smart_crop(image, width, height, strategy=strategy),
+                "debug": lambda: SmartCropEngine().smart_crop(image, width, height, save_steps=True, output_folder=step_folder, strategy=strategy),
+            }
+            for mode in MODES:
+                elapsed, peak = measure(calls[mode], repeat)
+                seconds[mode].append(elapsed)
+                peaks[mode].append(peak)
+
+    return {
+        "images": len(images),
+        "image_size": images[0].size if images else None,
+        "modes": {mode: {"ms": statistics.median(seconds[mode]) * 1000, "peak_mb": max(peaks[mode]) / (1024 * 1024)} for mode in MODES},
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Smart crop memory benchmark")
+    parser.add_argument("--scale", type=float, default=1.0, help="Upsample the bundled images by this factor first (default: 1)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per crop; the median time is used (default: 3)")
+    parser.add_argument("--strategy", default="haar-face", help="Subject detection strategy (default: haar-face)")
+    args = parser.parse_args(argv)
+
+    summary = run(args.scale, args.repeat, args.strategy)
+    width, height = summary["image_size"]
+    print(f"{summary['images']} images {width}x{height} -> {TARGET[0]}x{TARGET[1]}, strategy {args.strategy}")
+    print(f"  {'mode':<12} {'ms/crop':>9} {'peak MB':>9}")
+    for mode, result in summary["modes"].items():
+        print(f"  {mode:<12} {result['ms']:>9.1f} {result['peak_mb']:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
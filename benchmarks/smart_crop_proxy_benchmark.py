@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Smart Crop Proxy Benchmark
+
+Compares SmartCropEngine.smart_crop analysing the full-resolution image with
+proxy mode, where grayscale, blur, Canny, Haar face detection and contour
+analysis run on a copy scaled down to a bounded longest edge, and only the
+resulting subject box is mapped back to full resolution.
+
+Every bundled PlaceKitten image is cropped to several placeholder shapes with
+both strategies. For each proxy size the benchmark reports the median latency
+per crop and how well the crop boxes agree with full-resolution analysis:
+mean and minimum intersection over union (IoU), and the share of crops whose
+box is identical to within 1% of the image size.
+
+The bundled images are about 1.5 megapixels; --scale upsamples them first to
+stand in for camera-sized sources.
+
+Usage:
+    python benchmarks/smart_crop_proxy_benchmark.py
+    python benchmarks/smart_crop_proxy_benchmark.py --proxy-sizes 256 512 768 --scale 4 --repeat 3
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BENCHMARKS_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from PIL import Image  # noqa: E402
+
+from placekitten.smart_crop import SmartCropEngine  # noqa: E402
+
+IMAGES_DIR = PROJECT_ROOT / "src" / "placekitten" / "images"
+
+# Placeholder shapes the bundled images are cropped to: wide, standard, square and portrait
+TARGETS = [(1920, 1080), (800, 600), (400, 400), (600, 900)]
+
+STRATEGIES = ("haar-face", "contour")
+
+
+def load_images(scale: float) -> List[Tuple[str, Image.Image]]:
+    """Bundled PlaceKitten images, optionally upsampled by ``scale``."""
+    images = []
+    for path in sorted(IMAGES_DIR.glob("*.png")):
+        with Image.open(path) as img:
+            image = img.convert("RGB")
+        if scale != 1:
+            image = image.resize((round(image.width * scale), round(image.height * scale)), Image.Resampling.BICUBIC)
+        images.append((path.stem, image))
+    return images
+
+
+def iou(first: Sequence[int], second: Sequence[int]) -> float:
+    """Intersection over union of two (x1, y1, x2, y2) boxes."""
+    width = max(0, min(first[2], second[2]) - max(first[0], second[0]))
+    height = max(0, min(first[3], second[3]) - max(first[1], second[1]))
+    intersection = width * height
+    union = (first[2] - first[0]) * (first[3] - first[1]) + (second[2] - second[0]) * (second[3] - second[1]) - intersection
+    return intersection / union if union else 1.0
+
+
+def time_crop(engine: SmartCropEngine, image: Image.Image, target: Tuple[int, int], strategy: str, analysis_size: Optional[int], repeat: int) -> Tuple[float, Tuple]:
+    """Median seconds of one crop, and its crop box."""
+    timings = []
+    crop_box = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _, crop_info = engine.smart_crop(image, target[0], target[1], strategy=strategy, analysis_size=analysis_size)
+        timings.append(time.perf_counter() - start)
+        crop_box = crop_info["crop_box"]
+    return statistics.median(timings), crop_box
+
+
+def run(proxy_sizes: List[int], scale: float, repeat: int) -> Dict[str, Any]:
+    """Crop every image/target/strategy at full resolution and at each proxy size."""
+    engine = SmartCropEngine()
+    images = load_images(scale)
+    modes: List[Optional[int]] = [None] + proxy_sizes
+    seconds: Dict[Optional[int], List[float]] = {mode: [] for mode in modes}
+    agreement: Dict[int, List[float]] = {size: [] for size in proxy_sizes}
+    identical: Dict[int, int] = {size: 0 for size in proxy_sizes}
+    cases = 0
+
+    for _, image in images:
+        tolerance = max(image.size) * 0.01
+        for target in TARGETS:
+            for strategy in STRATEGIES:
+                cases += 1
+                full_seconds, full_box = time_crop(engine, image, target, strategy, None, repeat)
+                seconds[None].append(full_seconds)
+                for size in proxy_sizes:
+                    proxy_seconds, proxy_box = time_crop(engine, image, target, strategy, size, repeat)
+                    seconds[size].append(proxy_seconds)
+                    agreement[size].append(iou(full_box, proxy_box))
+                    identical[size] += all(abs(a - b) <= tolerance for a, b in zip(full_box, proxy_box))
+
+    return {
+        "images": len(images),
+        "image_size": images[0][1].size if images else None,
+        "cases": cases,
+        "full_ms": statistics.median(seconds[None]) * 1000,
+        "proxies": [
+            {
+                "size": size,
+                "ms": statistics.median(seconds[size]) * 1000,
+                "mean_iou": statistics.mean(agreement[size]),
+                "min_iou": min(agreement[size]),
+                "identical": identical[size] / cases,
+            }
+            for size in proxy_sizes
+        ],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Smart crop proxy benchmark")
+    parser.add_argument("--proxy-sizes", type=int, nargs="+", default=[256, 384, 512, 768], help="Proxy longest edges to compare (default: 256 384 512 768)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Upsample the bundled images by this factor first (default: 1)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per crop; the median is used (default: 3)")
+    args = parser.parse_args(argv)
+
+    summary = run(args.proxy_sizes, args.scale, args.repeat)
+    width, height = summary["image_size"]
+    print(f"{summary['images']} images {width}x{height}, {summary['cases']} crops ({len(TARGETS)} targets x {len(STRATEGIES)} strategies)")
+    print(f"  {'analysis':<10} {'ms/crop':>9} {'speedup':>8} {'mean IoU':>9} {'min IoU':>8} {'same box':>9}")
+    print(f"  {'full':<10} {summary['full_ms']:>9.1f} {'1.0x':>8} {'1.000':>9} {'1.000':>8} {'100%':>9}")
+    for proxy in summary["proxies"]:
+        speedup = f"{summary['full_ms'] / proxy['ms']:.1f}x"
+        print(f"  {proxy['size']:<10} {proxy['ms']:>9.1f} {speedup:>8} {proxy['mean_iou']:>9.3f} {proxy['min_iou']:>8.3f} {proxy['identical']:>9.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
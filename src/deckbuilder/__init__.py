@@ -6,6 +6,7 @@ structured frontmatter processing.
 """
 
 from .engine import Deckbuilder, get_deckbuilder_client
+from .builder_pool import BuilderPoolTimeout, DeckbuilderPool, get_deckbuilder_pool
 from .structured_frontmatter import (
     StructuredFrontmatterConverter,
     StructuredFrontmatterRegistry,
@@ -16,6 +17,9 @@ __version__ = "1.0.8"
 __all__ = [
     "Deckbuilder",
     "get_deckbuilder_client",
+    "DeckbuilderPool",
+    "BuilderPoolTimeout",
+    "get_deckbuilder_pool",
     "StructuredFrontmatterRegistry",
     "StructuredFrontmatterConverter",
     "StructuredFrontmatterValidator",
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Batch Presentation Generation for Deckbuilder
+
+Builds many presentations in one call on a process pool. Each worker process
+keeps a single long-lived Deckbuilder, so its template cache, pattern registry
+and image caches stay warm across every job it handles.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+
+@dataclass
+class BatchJob:
+    """A single presentation to build.
+
+    Exactly one of ``presentation_data`` (canonical JSON) or ``input_file``
+    (.md or .json path, parsed inside the worker) must be provided.
+    """
+
+    fileName: Optional[str] = None
+    templateName: str = "default"
+    presentation_data: Optional[Dict[str, Any]] = None
+    input_file: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        """Human-readable identifier for summaries."""
+        return self.input_file or self.fileName or "presentation"
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a single batch job."""
+
+    label: str
+    fileName: str
+    success: bool
+    seconds: float
+    slide_count: int = 0
+    message: str = ""
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary (JSON friendly)."""
+        return asdict(self)
+
+
+def load_presentation_file(input_file: Union[str, Path], template_name: str = "default", template_folder: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load canonical presentation data from a markdown or JSON file.
+
+    Markdown input is converted and, when a template folder is given, checked
+    with the same Markdown → JSON validation the single-file CLI path runs.
+    """
+    input_path = Path(input_file)
+    suffix = input_path.suffix.lower()
+
+    if suffix == ".md":
+        from . import converter
+
+        markdown_content = input_path.read_text(encoding="utf-8")
+        presentation_data = converter.markdown_to_canonical_json(markdown_content)
+
+        if template_folder:
+            from .validation import PresentationValidator
+
+            validator = PresentationValidator(presentation_data, template_name, template_folder)
+            validator.validate_markdown_to_json(markdown_content, presentation_data)
+        return presentation_data
+
+    if suffix == ".json":
+        with open(input_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    raise ValueError(f"Unsupported file format: {input_path.suffix}. Supported formats: .md, .json")
+
+
+# Per-process builder, created once by the pool initializer and reused for every job
+_worker_builder = None
+
+
+def _init_worker(path_manager_instance) -> None:
+    """Process pool initializer: create this worker's long-lived Deckbuilder."""
+    global _worker_builder
+    from .engine import Deckbuilder
+
+    _worker_builder = Deckbuilder.create_instance(path_manager_instance=path_manager_instance)
+
+
+def _run_job(job: BatchJob) -> BatchResult:
+    """Build one presentation on this process's builder and time it."""
+    start = time.perf_counter()
+    file_name = job.fileName or (Path(job.input_file).stem if job.input_file else "Sample_Presentation")
+
+    try:
+        presentation_data = job.presentation_data
+        if presentation_data is None:
+            if not job.input_file:
+                raise ValueError("Batch job requires presentation_data or input_file")
+            if Path(job.input_file).suffix.lower() == ".md":
+                # Markdown is streamed slide by slide straight into the builder
+                message = _worker_builder.create_presentation_from_markdown(Path(job.input_file), fileName=file_name, templateName=job.templateName)
+                return BatchResult(job.label, file_name, True, round(time.perf_counter() - start, 4), len(_worker_builder.prs.slides), message)
+            template_folder = str(_worker_builder._path_manager.get_template_folder())
+            presentation_data = load_presentation_file(job.input_file, job.templateName, template_folder)
+
+        message = _worker_builder.create_presentation(presentation_data, fileName=file_name, templateName=job.templateName)
+        slide_count = len(presentation_data.get("slides", [])) if isinstance(presentation_data, dict) else 0
+        return BatchResult(job.label, file_name, True, round(time.perf_counter() - start, 4), slide_count, message)
+    except Exception as e:
+        return BatchResult(job.label, file_name, False, round(time.perf_counter() - start, 4), error=f"{type(e).__name__}: {e}")
+
+
+def _coerce_job(job: Union[BatchJob, Dict[str, Any]]) -> BatchJob:
+    """Accept BatchJob instances or plain dictionaries with the same keys."""
+    if isinstance(job, BatchJob):
+        return job
+    if isinstance(job, dict):
+        return BatchJob(**job)
+    raise TypeError(f"Batch jobs must be BatchJob or dict, got {type(job).__name__}")
+
+
+def run_batch(
+    jobs: Sequence[Union[BatchJob, Dict[str, Any]]],
+    path_manager_instance,
+    max_workers: Optional[int] = None,
+) -> List[BatchResult]:
+    """
+    Build many presentations, in parallel when more than one worker is allowed.
+
+    Args:
+        jobs: BatchJob instances (or dicts with the same fields)
+        path_manager_instance: PathManager used by every worker's builder
+        max_workers: Worker processes (default: CPU count, capped at the number of jobs)
+
+    Returns:
+        One BatchResult per job, in input order. Failures are reported, not raised.
+    """
+    batch = [_coerce_job(job) for job in jobs]
+    if not batch:
+        return []
+
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    workers = max(1, min(workers, len(batch)))
+
+    if workers == 1:
+        # Serial path: no process start-up cost, same warm builder for every job
+        _init_worker(path_manager_instance)
+        return [_run_job(job) for job in batch]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(path_manager_instance,)) as executor:
+        return list(executor.map(_run_job, batch))
+
+
+def summarize_results(results: Sequence[BatchResult]) -> Dict[str, Any]:
+    """Aggregate totals for a batch run."""
+    succeeded = [r for r in results if r.success]
+    return {
+        "total": len(results),
+        "succeeded": len(succeeded),
+        "failed": len(results) - len(succeeded),
+        "slides": sum(r.slide_count for r in succeeded),
+        "job_seconds": round(sum(r.seconds for r in results), 4),
+    }
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Batch Language and Font Remapping for Deckbuilder
+
+Runs FormattingSupport.update_presentation over many existing PowerPoint files
+on a process pool. Each worker process keeps a single FormattingSupport, so
+loaded language mappings stay warm across every file it handles.
+
+A manifest records the content hash of every file after it was remapped,
+together with the language and font applied. On a rerun, files whose content
+still matches the manifest for the same settings are skipped after a hash
+check, without being loaded or saved again.
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+# Default manifest file name, written next to the remapped files
+MANIFEST_FILE_NAME = ".deckbuilder-remap.json"
+
+# Manifest is flushed to disk after this many completed files, so an interrupted run keeps its progress
+MANIFEST_SAVE_INTERVAL = 25
+
+# Statistics returned by update_presentation that are aggregated across files
+_AGGREGATED_STATS = (
+    "master_slides_processed",
+    "content_slides_processed",
+    "total_runs_processed",
+    "total_language_applied",
+    "total_font_applied",
+    "total_text_replaced",
+)
+
+
+def file_sha256(path: Union[str, Path], chunk_size: int = 1024 * 1024) -> str:
+    """SHA-256 hex digest of a file's content, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class RemapManifest:
+    """
+    Content hash + settings of every file remapped from one directory tree.
+
+    Entries are keyed by path relative to the manifest's folder (absolute for
+    files outside it), so a remapped tree can be moved together with its manifest.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                self.entries = data.get("files", {}) if isinstance(data, dict) else {}
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Warning: Ignoring unreadable remap manifest {self.path}: {e}")
+
+    def _key(self, file: Union[str, Path]) -> str:
+        resolved = Path(file).resolve()
+        try:
+            return resolved.relative_to(self.path.parent.resolve()).as_posix()
+        except ValueError:
+            return str(resolved)
+
+    def remapped_hash(self, file: Union[str, Path], language_code: Optional[str], font_name: Optional[str]) -> Optional[str]:
+        """Content hash the file had after it was last remapped with these settings, if any."""
+        entry = self.entries.get(self._key(file))
+        if not entry or entry.get("language") != language_code or entry.get("font") != font_name:
+            return None
+        return entry.get("sha256")
+
+    def record(self, file: Union[str, Path], sha256: str, language_code: Optional[str], font_name: Optional[str]) -> None:
+        """Remember the content hash of a file remapped with these settings."""
+        self.entries[self._key(file)] = {"sha256": sha256, "language": language_code, "font": font_name}
+
+    def save(self) -> None:
+        """Write the manifest atomically (temporary file + rename)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "files": self.entries}, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+
+@dataclass
+class RemapJob:
+    """A single file to remap in place."""
+
+    input_file: str
+    language_code: Optional[str] = None
+    font_name: Optional[str] = None
+    create_backup: bool = True
+    # Content hash that means "already remapped with these settings" (from the manifest)
+    skip_if_sha256: Optional[str] = None
+    # Rewrite slide XML directly instead of going through python-pptx
+    fast: bool = False
+
+
+@dataclass
+class RemapResult:
+    """Outcome of a single remap job."""
+
+    input_file: str
+    status: str  # "remapped", "skipped" or "failed"
+    seconds: float
+    sha256: Optional[str] = None
+    backup_path: Optional[str] = None
+    stats: Dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.status != "failed"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary (JSON friendly)."""
+        return asdict(self)
+
+
+# Per-process formatter, created once by the pool initializer and reused for every job
+_worker_formatter = None
+
+
+def _init_worker() -> None:
+    """Process pool initializer: create this worker's long-lived FormattingSupport."""
+    global _worker_formatter
+    from .formatting_support import FormattingSupport
+
+    _worker_formatter = FormattingSupport()
+
+
+def _run_remap_job(job: RemapJob) -> RemapResult:
+    """Remap one file on this process's formatter, skipping it when its content is already remapped."""
+    start = time.perf_counter()
+    try:
+        if job.skip_if_sha256:
+            digest = file_sha256(job.input_file)
+            if digest == job.skip_if_sha256:
+                return RemapResult(job.input_file, "skipped", round(time.perf_counter() - start, 4), sha256=digest)
+
+        result = _worker_formatter.update_presentation(job.input_file, job.language_code, job.font_name, create_backup=job.create_backup, fast=job.fast)
+        if not result["success"]:
+            return RemapResult(job.input_file, "failed", round(time.perf_counter() - start, 4), error=result["error"])
+
+        return RemapResult(
+            job.input_file,
+            "remapped",
+            round(time.perf_counter() - start, 4),
+            sha256=file_sha256(job.input_file),
+            backup_path=result.get("backup_path"),
+            stats={key: result["stats"].get(key, 0) for key in _AGGREGATED_STATS},
+        )
+    except Exception as e:
+        return RemapResult(job.input_file, "failed", round(time.perf_counter() - start, 4), error=f"{type(e).__name__}: {e}")
+
+
+def run_remap_batch(
+    files: Sequence[Union[str, Path]],
+    language_code: Optional[str] = None,
+    font_name: Optional[str] = None,
+    create_backup: bool = True,
+    manifest: Optional[RemapManifest] = None,
+    max_workers: Optional[int] = None,
+    progress: Optional[Callable[[RemapResult, int, int], None]] = None,
+    fast: bool = False,
+    force: bool = False,
+) -> List[RemapResult]:
+    """
+    Remap many PowerPoint files in place, in parallel when more than one worker is allowed.
+
+    Args:
+        files: .pptx files to update
+        language_code: Optional language code to apply
+        font_name: Optional font name to apply
+        create_backup: Whether to write a .bak.pptx next to each remapped file
+        manifest: Optional manifest used to skip unchanged files and updated with every remapped file
+        max_workers: Worker processes (default: CPU count, capped at the number of files)
+        progress: Called as progress(result, completed, total) after every file, in completion order
+        fast: Rewrite slide XML directly instead of going through python-pptx (see xml_remap)
+        force: Remap every file even if the manifest says it is unchanged (its entries are still updated)
+
+    Returns:
+        One RemapResult per file, in input order. Failures are reported, not raised.
+    """
+    skip_manifest = manifest is None or force
+    jobs = [RemapJob(str(file), language_code, font_name, create_backup, None if skip_manifest else manifest.remapped_hash(file, language_code, font_name), fast) for file in files]
+    if not jobs:
+        return []
+
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    workers = max(1, min(workers, len(jobs)))
+    results: List[Optional[RemapResult]] = [None] * len(jobs)
+
+    def completed(index: int, result: RemapResult, done: int) -> None:
+        results[index] = result
+        if manifest is not None and result.status == "remapped":
+            manifest.record(result.input_file, result.sha256, language_code, font_name)
+            if done % MANIFEST_SAVE_INTERVAL == 0:
+                manifest.save()
+        if progress:
+            progress(result, done, len(jobs))
+
+    try:
+        if workers == 1:
+            # Serial path: no process start-up cost
+            _init_worker()
+            for index, job in enumerate(jobs):
+                completed(index, _run_remap_job(job), index + 1)
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                futures = {executor.submit(_run_remap_job, job): index for index, job in enumerate(jobs)}
+                for done, future in enumerate(as_completed(futures), start=1):
+                    completed(futures[future], future.result(), done)
+    finally:
+        if manifest is not None:
+            manifest.save()
+
+    return results
+
+
+def summarize_remap_results(results: Sequence[RemapResult]) -> Dict[str, Any]:
+    """Aggregate totals for a batch remap run."""
+    summary = {
+        "total": len(results),
+        "remapped": sum(1 for r in results if r.status == "remapped"),
+        "skipped": sum(1 for r in results if r.status == "skipped"),
+        "failed": sum(1 for r in results if r.status == "failed"),
+        "job_seconds": round(sum(r.seconds for r in results), 4),
+    }
+    for key in _AGGREGATED_STATS:
+        summary[key] = sum(r.stats.get(key, 0) for r in results)
+    return summary
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Thread-safe Deckbuilder Pool
+
+The Deckbuilder singleton keeps per-request state (the presentation being
+built, the active template and its layout mapping), so only one deck can be
+built at a time through it. DeckbuilderPool hands out independent builder
+instances with checkout/return semantics so concurrent create_presentation
+calls never share mutable state.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+from .path_manager import PathManager
+
+
+class BuilderPoolTimeout(TimeoutError):
+    """Raised when no builder becomes available within the checkout timeout."""
+
+
+def get_default_pool_size() -> int:
+    """Resolve pool size from DECKBUILDER_POOL_SIZE, falling back to CPU count (max 4)."""
+    env_size = os.getenv("DECKBUILDER_POOL_SIZE")
+    if env_size:
+        try:
+            return max(1, int(env_size))
+        except ValueError:
+            pass  # nosec - Fall back to CPU based default for invalid values
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+class DeckbuilderPool:
+    """Fixed-size pool of independent Deckbuilder instances.
+
+    Builders are created lazily up to ``size`` and reused afterwards, so each
+    one keeps its warm components (template manager, formatters, image handler)
+    between requests.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        path_manager_instance: Optional[PathManager] = None,
+        factory: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            size: Maximum number of builders (default: DECKBUILDER_POOL_SIZE or CPU count, max 4)
+            path_manager_instance: PathManager passed to every builder
+            factory: Optional callable returning a new builder (overrides path_manager_instance)
+        """
+        self.size = size if size is not None else get_default_pool_size()
+        if self.size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self._path_manager = path_manager_instance
+        self._factory = factory or self._create_builder
+        self._idle: List[Any] = []
+        self._checked_out: Dict[int, Any] = {}
+        self._created = 0
+        self._checkouts = 0
+        self._wait_seconds = 0.0
+        self._condition = threading.Condition()
+
+    def _create_builder(self):
+        """Create a new, non-singleton Deckbuilder instance."""
+        from .engine import Deckbuilder
+
+        return Deckbuilder.create_instance(path_manager_instance=self._path_manager)
+
+    def checkout(self, timeout: Optional[float] = None):
+        """
+        Take a builder out of the pool, creating one if below capacity.
+
+        Args:
+            timeout: Seconds to wait for a free builder (None waits forever)
+
+        Returns:
+            A Deckbuilder instance owned exclusively by the caller until checkin()
+
+        Raises:
+            BuilderPoolTimeout: If no builder became available in time
+        """
+        start = time.perf_counter()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        create_new = False
+
+        with self._condition:
+            while not self._idle and self._created >= self.size:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise BuilderPoolTimeout(f"No Deckbuilder available after {timeout}s (pool size {self.size}, all checked out)")
+                self._condition.wait(remaining)
+
+            if self._idle:
+                builder = self._idle.pop()
+            else:
+                # Reserve a slot, then build outside the lock (construction loads templates)
+                self._created += 1
+                create_new = True
+
+        if create_new:
+            try:
+                builder = self._factory()
+            except Exception:
+                with self._condition:
+                    self._created -= 1
+                    self._condition.notify()
+                raise
+
+        with self._condition:
+            self._checked_out[id(builder)] = builder
+            self._checkouts += 1
+            self._wait_seconds += time.perf_counter() - start
+
+        return builder
+
+    def checkin(self, builder) -> None:
+        """
+        Return a builder to the pool.
+
+        Args:
+            builder: Instance previously obtained from checkout()
+
+        Raises:
+            ValueError: If the builder was not checked out from this pool
+        """
+        with self._condition:
+            if self._checked_out.pop(id(builder), None) is None:
+                raise ValueError("Builder was not checked out from this pool")
+            self._idle.append(builder)
+            self._condition.notify()
+
+    @contextmanager
+    def builder(self, timeout: Optional[float] = None):
+        """Context manager that checks a builder out and always returns it."""
+        instance = self.checkout(timeout=timeout)
+        try:
+            yield instance
+        finally:
+            self.checkin(instance)
+
+    def create_presentation(self, presentation_data: Dict[str, Any], fileName: str = "Sample_Presentation", templateName: str = "default", **kwargs) -> str:
+        """Build a presentation on a pooled builder (see Deckbuilder.create_presentation)."""
+        with self.builder() as instance:
+            return instance.create_presentation(presentation_data, fileName, templateName, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return pool usage statistics."""
+        with self._condition:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "idle": len(self._idle),
+                "checked_out": len(self._checked_out),
+                "total_checkouts": self._checkouts,
+                "total_wait_seconds": round(self._wait_seconds, 6),
+            }
+
+
+_mcp_pool = None
+_mcp_pool_lock = threading.Lock()
+
+
+def get_deckbuilder_pool(size: Optional[int] = None) -> DeckbuilderPool:
+    """Return the process-wide pool of MCP-context builders, creating it on first use."""
+    global _mcp_pool
+    with _mcp_pool_lock:
+        if _mcp_pool is None:
+            from .path_manager import create_mcp_path_manager
+
+            _mcp_pool = DeckbuilderPool(size=size, path_manager_instance=create_mcp_path_manager())
+        return _mcp_pool
@@ -13,20 +13,26 @@ Usage:
 """
 
 import argparse
+import glob
 import json
 import os
 import sys
+import time
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 # Conditional imports for development vs installed package
 try:
     # Try package imports first (for installed package)
     from deckbuilder.engine import Deckbuilder
+    from deckbuilder.batch_remap import MANIFEST_FILE_NAME
     from deckbuilder.cli_tools import TemplateManager
     from deckbuilder.formatting_support import FormattingSupport, print_supported_languages
     from deckbuilder.path_manager import create_cli_path_manager
+    from deckbuilder.profiling import is_profiling_enabled, profile_session, span
     from placekitten import PlaceKitten
+    from placekitten.geometry import DEFAULT_FACE_MIN_SIZE, DEFAULT_FACE_SCALE_FACTOR
 except ImportError:
     # Fallback to development imports (when running from source)
     current_dir = Path(__file__).parent
@@ -34,13 +40,21 @@ except ImportError:
     sys.path.insert(0, str(project_root))
 
     from src.deckbuilder.engine import Deckbuilder  # noqa: E402
+    from src.deckbuilder.batch_remap import MANIFEST_FILE_NAME  # noqa: E402
     from src.deckbuilder.cli_tools import TemplateManager  # noqa: E402
     from src.deckbuilder.formatting_support import (
         FormattingSupport,
         print_supported_languages,
     )  # noqa: E402
     from src.deckbuilder.path_manager import create_cli_path_manager  # noqa: E402
+    from src.deckbuilder.profiling import is_profiling_enabled, profile_session, span  # noqa: E402
     from src.placekitten import PlaceKitten  # noqa: E402
+    from src.placekitten.geometry import DEFAULT_FACE_MIN_SIZE, DEFAULT_FACE_SCALE_FACTOR  # noqa: E402
+
+
+def _is_glob_pattern(value: str) -> bool:
+    """Check whether a CLI argument is an (unexpanded) glob pattern"""
+    return any(char in value for char in "*?[")
 
 
 class DeckbuilderCLI:
@@ -71,7 +85,7 @@ class DeckbuilderCLI:
         template_path = Path(template_folder)
         return [template.stem for template in template_path.glob("*.pptx")]
 
-    def create_presentation(self, input_file: str, output_name: Optional[str] = None, template: Optional[str] = None) -> str:
+    def create_presentation(self, input_file: str, output_name: Optional[str] = None, template: Optional[str] = None, profile: bool = False) -> str:
         """
         Create presentation from markdown or JSON file
 
@@ -79,6 +93,7 @@ class DeckbuilderCLI:
             input_file: Path to markdown (.md) or JSON (.json) input file
             output_name: Optional output filename (without extension)
             template: Optional template name to use
+            profile: Record per-stage timings, print a summary and write a JSON timing tree
 
         Returns:
             str: Path to generated presentation file
@@ -125,36 +140,12 @@ class DeckbuilderCLI:
         Deckbuilder.reset()
         db = Deckbuilder(path_manager_instance=self.path_manager)
 
+        session = profile_session("deck", input=input_path.name, template=template_name) if profile else nullcontext()
         try:
-            presentation_data = {}
-            markdown_content = None
-
-            if input_path.suffix.lower() == ".md":
-                from deckbuilder import converter
-                from deckbuilder.validation import PresentationValidator
-
-                # Process markdown file
-                markdown_content = input_path.read_text(encoding="utf-8")
-                print(f"Processing markdown file: {input_path.name}")
-                presentation_data = converter.markdown_to_canonical_json(markdown_content)
-
-                # STEP 0: Validate Markdown → JSON conversion
-                template_folder = str(self.path_manager.get_template_folder())
-                validator = PresentationValidator(presentation_data, template_name, template_folder)
-                validator.validate_markdown_to_json(markdown_content, presentation_data)
-            elif input_path.suffix.lower() == ".json":
-                # Process JSON file directly
-                with open(input_path, "r", encoding="utf-8") as f:
-                    presentation_data = json.load(f)
-                print(f"Processing JSON file: {input_path.name}")
-            else:
-                raise ValueError(f"Unsupported file format: {input_path.suffix}. " "Supported formats: .md, .json")
-
-            result = db.create_presentation(
-                presentation_data,
-                fileName=output_name,
-                templateName=template_name,
-            )
+            with session as profiler:
+                result = self._build_from_file(db, input_path, output_name, template_name)
+            if profiler is not None:
+                self._report_profile(profiler, output_name)
 
             # Check if result indicates an error
             if result and ("Error creating presentation from markdown:" in result or "Error creating presentation from JSON:" in result):
@@ -167,6 +158,126 @@ class DeckbuilderCLI:
             print(f"✗ Error creating presentation: {e}")
             raise
 
+    def _build_from_file(self, db, input_path: Path, output_name: str, template_name: str) -> str:
+        """Parse a markdown/JSON input file and build the presentation on the given Deckbuilder"""
+        if input_path.suffix.lower() == ".md":
+            # Markdown is streamed: each slide is parsed, validated and built before the next is read
+            print(f"Processing markdown file: {input_path.name}")
+            return db.create_presentation_from_markdown(
+                input_path,
+                fileName=output_name,
+                templateName=template_name,
+            )
+
+        if input_path.suffix.lower() == ".json":
+            # Process JSON file directly
+            with span("json_load"):
+                with open(input_path, "r", encoding="utf-8") as f:
+                    presentation_data = json.load(f)
+            print(f"Processing JSON file: {input_path.name}")
+        else:
+            raise ValueError(f"Unsupported file format: {input_path.suffix}. " "Supported formats: .md, .json")
+
+        return db.create_presentation(
+            presentation_data,
+            fileName=output_name,
+            templateName=template_name,
+        )
+
+    def _report_profile(self, profiler, output_name: str) -> Path:
+        """Print the timing summary and write the JSON timing tree next to the output"""
+        output_folder = Path(self.path_manager.get_output_folder())
+        output_folder.mkdir(parents=True, exist_ok=True)
+        profile_file = output_folder / f"{output_name}.profile.json"
+        with open(profile_file, "w", encoding="utf-8") as f:
+            json.dump(profiler.to_dict(), f, indent=2)
+
+        print(profiler.format_summary())
+        print(f"⏱  Timing tree written to: {profile_file}")
+        return profile_file
+
+    def _expand_input_files(self, inputs: List[str]) -> List[Path]:
+        """Expand directories and unexpanded glob patterns into .md/.json input files"""
+        files = []
+        for item in inputs:
+            path = Path(item)
+            if path.is_dir():
+                files.extend(sorted(p for p in path.iterdir() if p.suffix.lower() in (".md", ".json")))
+            elif not path.exists() and _is_glob_pattern(item):
+                files.extend(sorted(Path(p) for p in glob.glob(item) if Path(p).suffix.lower() in (".md", ".json")))
+            else:
+                files.append(path)
+
+        # Keep first occurrence of each file, preserving order
+        unique = []
+        seen = set()
+        for file in files:
+            key = file.resolve()
+            if key not in seen:
+                seen.add(key)
+                unique.append(file)
+        return unique
+
+    def create_presentations(self, input_files: List[str], template: Optional[str] = None, jobs: int = 1) -> list:
+        """
+        Create many presentations from markdown/JSON files, optionally in parallel
+
+        Args:
+            input_files: Files, directories or glob patterns
+            template: Optional template name used for every file
+            jobs: Number of worker processes
+
+        Returns:
+            list: BatchResult per input file, in order
+        """
+        from deckbuilder.batch import BatchJob, run_batch, summarize_results
+
+        files = self._expand_input_files(input_files)
+        if not files:
+            print("❌ No .md or .json input files found")
+            raise FileNotFoundError(f"No input files found in: {', '.join(input_files)}")
+
+        missing = [str(f) for f in files if not f.exists()]
+        if missing:
+            print(f"❌ Input file not found: {', '.join(missing)}")
+            raise FileNotFoundError(f"Input file not found: {missing[0]}")
+
+        if not self._validate_templates_folder():
+            return []
+
+        template_name = template or "default"
+        template_file = self.path_manager.get_template_file_path(template_name)
+        if not template_file.exists():
+            print(f"✗ Template file not found: {template_file}")
+            print("Run 'deckbuilder init' to create template folder with default files")
+            return []
+
+        # Output names default to the input stem; disambiguate duplicate stems
+        batch_jobs = []
+        used_names = {}
+        for file in files:
+            name = file.stem
+            used_names[name] = used_names.get(name, 0) + 1
+            if used_names[name] > 1:
+                name = f"{name}_{used_names[name]}"
+            batch_jobs.append(BatchJob(fileName=name, templateName=template_name, input_file=str(file)))
+
+        workers = max(1, jobs or 1)
+        print(f"Building {len(batch_jobs)} presentations with {min(workers, len(batch_jobs))} worker(s) using template: {template_name}")
+
+        results = run_batch(batch_jobs, self.path_manager, max_workers=workers)
+        summary = summarize_results(results)
+
+        print("\n📊 Batch summary:")
+        for result in results:
+            if result.success:
+                print(f"  ✓ {result.label} → {result.fileName} ({result.slide_count} slides, {result.seconds:.2f}s)")
+            else:
+                print(f"  ✗ {result.label} ({result.seconds:.2f}s): {result.error}")
+        print(f"  {summary['succeeded']}/{summary['total']} succeeded, {summary['slides']} slides, " f"{summary['job_seconds']:.2f}s total build time")
+
+        return results
+
     def analyze_template(self, template_name: str = "default", verbose: bool = False):
         """Analyze PowerPoint template structure"""
         if not self._validate_templates_folder():
@@ -239,6 +350,9 @@ class DeckbuilderCLI:
         height: int,
         save_steps: bool = False,
         output_file: Optional[str] = None,
+        face_scale_factor: float = DEFAULT_FACE_SCALE_FACTOR,
+        face_min_size: Optional[int] = DEFAULT_FACE_MIN_SIZE,
+        output_prefix: str = "smart_crop",
     ):
         """Apply smart cropping to an existing image"""
         try:
@@ -254,7 +368,14 @@ class DeckbuilderCLI:
             processor = ImageProcessor(str(input_path))
 
             # Apply smart cropping
-            result_processor = processor.smart_crop(width=width, height=height, save_steps=save_steps, output_prefix="smart_crop")
+            result_processor = processor.smart_crop(
+                width=width,
+                height=height,
+                save_steps=save_steps,
+                output_prefix=output_prefix,
+                face_scale_factor=face_scale_factor,
+                face_min_size=face_min_size,
+            )
 
             # Set output filename
             if not output_file:
@@ -265,7 +386,7 @@ class DeckbuilderCLI:
             print(f"✅ Smart crop completed: {result}")
 
             if save_steps:
-                print("📁 Processing steps saved with 'smart_crop_' prefix")
+                print(f"📁 Processing steps saved with '{output_prefix}_' prefix")
 
             return result
 
@@ -273,6 +394,71 @@ class DeckbuilderCLI:
             print(f"❌ Error processing image: {e}")
             raise
 
+    def smart_crop_images(
+        self,
+        input_files: List[str],
+        width: int,
+        height: int,
+        save_steps: bool = False,
+        face_scale_factor: float = DEFAULT_FACE_SCALE_FACTOR,
+        face_min_size: Optional[int] = DEFAULT_FACE_MIN_SIZE,
+    ) -> List[str]:
+        """
+        Smart crop several images in one process, continuing past failures.
+
+        Each input gets its own output name and step prefix, derived from its
+        file stem (numbered when stems repeat), so no input overwrites another.
+
+        Returns:
+            Input files that failed
+        """
+        failures = []
+        used_labels = set()
+        for input_file in input_files:
+            input_path = Path(input_file)
+            label = input_path.stem
+            counter = 1
+            while label in used_labels:
+                counter += 1
+                label = f"{input_path.stem}_{counter}"
+            used_labels.add(label)
+
+            try:
+                self.smart_crop_image(
+                    input_file=input_file,
+                    width=width,
+                    height=height,
+                    save_steps=save_steps,
+                    output_file=f"smart_cropped_{width}x{height}_{label}{input_path.suffix}",
+                    face_scale_factor=face_scale_factor,
+                    face_min_size=face_min_size,
+                    output_prefix=f"smart_crop_{label}",
+                )
+            except FileNotFoundError as e:
+                print(f"❌ {e}")
+                failures.append(input_file)
+            except Exception:
+                # smart_crop_image has already reported the error
+                failures.append(input_file)
+
+        if failures:
+            print(f"❌ {len(failures)} of {len(input_files)} images failed: {', '.join(failures)}")
+        return failures
+
+    def build_image_index(self, source_folder: str = "demo", rebuild: bool = False):
+        """Analyse PlaceKitten source images and save their subject metadata index"""
+        try:
+            pk = PlaceKitten(source_folder)
+            analysed = pk.build_image_index(rebuild=rebuild)
+        except Exception as e:
+            print(f"❌ Error building image index: {e}")
+            raise
+
+        for name in analysed:
+            print(f"  Indexed {name}")
+        print(f"✅ Image index: {len(analysed)} analysed, {pk.get_image_count() - len(analysed)} up to date ({pk.image_index.index_path})")
+        return analysed
+
     def list_templates(self):
         """List available templates"""
         if not self._validate_templates_folder():
@@ -537,6 +723,7 @@ class DeckbuilderCLI:
         font_name: Optional[str] = None,
         output_file: Optional[str] = None,
         create_backup: bool = True,
+        fast: bool = False,
     ):
         """
         Remap language and/or font settings in an existing PowerPoint presentation.
@@ -548,6 +735,7 @@ class DeckbuilderCLI:
             font_name: Optional font name to apply
             output_file: Optional output file path
             create_backup: Whether to create backup file
+            fast: Rewrite the slide XML directly instead of going through python-pptx
         """
         input_path = Path(input_file)
 
@@ -586,6 +774,7 @@ class DeckbuilderCLI:
                 font_name=font_name,
                 output_path=output_file,
                 create_backup=create_backup,
+                fast=fast,
             )
 
             if result["success"]:
@@ -614,6 +803,115 @@ class DeckbuilderCLI:
             print(f"❌ Error processing presentation: {e}")
             return False
 
+    def _expand_remap_files(self, inputs: List[str]) -> List[Path]:
+        """Expand directories (recursively) and glob patterns into .pptx files, excluding backups and Office lock files"""
+
+        def remappable(path: Path) -> bool:
+            return path.suffix.lower() == ".pptx" and not path.name.lower().endswith(".bak.pptx") and not path.name.startswith("~$")
+
+        files = []
+        for item in inputs:
+            path = Path(item)
+            if path.is_dir():
+                files.extend(sorted(p for p in path.rglob("*.pptx") if remappable(p)))
+            elif not path.exists() and _is_glob_pattern(item):
+                files.extend(sorted(Path(p) for p in glob.glob(item, recursive=True) if remappable(Path(p))))
+            else:
+                files.append(path)
+
+        # Keep first occurrence of each file, preserving order
+        unique = []
+        seen = set()
+        for file in files:
+            key = file.resolve()
+            if key not in seen:
+                seen.add(key)
+                unique.append(file)
+        return unique
+
+    def remap_presentations(
+        self,
+        input_files: List[str],
+        language_code: Optional[str] = None,
+        font_name: Optional[str] = None,
+        create_backup: bool = True,
+        jobs: int = 1,
+        manifest_file: Optional[str] = None,
+        force: bool = False,
+        fast: bool = False,
+    ) -> list:
+        """
+        Remap language and/or font settings in many PowerPoint files, optionally in parallel
+
+        Files already remapped with the same settings (per the manifest's content
+        hashes) are skipped unless force is set.
+
+        Args:
+            input_files: Files, directories (searched recursively) or glob patterns
+            language_code: Optional language code to apply
+            font_name: Optional font name to apply
+            create_backup: Whether to create a backup file next to each remapped file
+            jobs: Number of worker processes
+            manifest_file: Manifest path (default: MANIFEST_FILE_NAME in the input folder)
+            force: Remap every file regardless of the manifest
+            fast: Rewrite the slide XML directly instead of going through python-pptx
+
+        Returns:
+            list: RemapResult per input file, in order
+        """
+        from deckbuilder.batch_remap import RemapManifest, run_remap_batch, summarize_remap_results
+
+        if not language_code and not font_name:
+            print("❌ No updates specified. Use --language or --font arguments.")
+            return []
+        if not self.validate_language_and_font(language_code, font_name):
+            return []
+
+        files = self._expand_remap_files(input_files)
+        if not files:
+            print("❌ No .pptx input files found")
+            return []
+        invalid = [str(f) for f in files if not f.exists() or f.suffix.lower() != ".pptx"]
+        if invalid:
+            print(f"❌ Input file not found or not a PowerPoint file (.pptx): {', '.join(invalid)}")
+            return []
+
+        if manifest_file is None:
+            first = Path(input_files[0])
+            folder = first if first.is_dir() else Path(os.path.commonpath([str(f.resolve().parent) for f in files]))
+            manifest_file = folder / MANIFEST_FILE_NAME
+        manifest = RemapManifest(manifest_file)
+
+        workers = max(1, jobs or 1)
+        print(f"🔄 Remapping {len(files)} presentations with {min(workers, len(files))} worker(s)")
+
+        def report(result, done, total):
+            if result.status == "failed":
+                print(f"  [{done}/{total}] ✗ {result.input_file}: {result.error}")
+            elif result.status == "skipped":
+                print(f"  [{done}/{total}] = {result.input_file} (unchanged, skipped)")
+            else:
+                print(f"  [{done}/{total}] ✓ {result.input_file} ({result.stats['content_slides_processed']} slides, {result.seconds:.2f}s)")
+
+        start = time.perf_counter()
+        results = run_remap_batch(files, language_code, font_name, create_backup=create_backup, manifest=manifest, max_workers=workers, progress=report, fast=fast, force=force)
+        elapsed = time.perf_counter() - start
+        summary = summarize_remap_results(results)
+
+        print("\n📊 Remap summary:")
+        print(f"   Files: {summary['remapped']} remapped, {summary['skipped']} skipped, {summary['failed']} failed (of {summary['total']})")
+        print(f"   Content slides: {summary['content_slides_processed']}, master slides: {summary['master_slides_processed']}")
+        print(f"   Text runs processed: {summary['total_runs_processed']}")
+        if language_code:
+            print(f"   Language applied: {summary['total_language_applied']} runs")
+            print(f"   Text replaced: {summary['total_text_replaced']} runs")
+        if font_name:
+            print(f"   Font applied: {summary['total_font_applied']} runs")
+        print(f"   Time: {elapsed:.2f}s wall, {summary['job_seconds']:.2f}s total remap time")
+        print(f"   Manifest: {manifest.path}")
+
+        return results
+
     # Pattern Management Methods
 
     def list_patterns(self, source: str = "all", verbose: bool = False):
@@ -919,9 +1217,11 @@ def create_parser():
 
     # Create presentation command (stays as top-level)
     create_parser = subparsers.add_parser("create", help="Generate presentations from markdown or JSON", add_help=False)
-    create_parser.add_argument("input_file", help="Input markdown (.md) or JSON (.json) file")
-    create_parser.add_argument("--output", "-o", help="Output filename (without extension)")
+    create_parser.add_argument("input_files", nargs="+", help="Input markdown (.md) or JSON (.json) files, directories or glob patterns")
+    create_parser.add_argument("--output", "-o", help="Output filename (without extension, single input only)")
     create_parser.add_argument("--template", "-t", help="Template name to use (default: 'default')")
+    create_parser.add_argument("--jobs", "-j", type=int, default=1, help="Worker processes for multiple inputs (default: 1)")
+    create_parser.add_argument("--profile", action="store_true", help="Print per-stage timings and write a JSON timing tree")
     create_parser.add_argument("-h", "--help", action="store_true", help="Show help for create command")
 
     # Template management commands (grouped)
@@ -1017,13 +1317,26 @@ def create_parser():
 
     # Image crop
     crop_parser = image_subs.add_parser("crop", help="Smart crop existing images", add_help=False)
-    crop_parser.add_argument("input_file", help="Input image file")
+    crop_parser.add_argument("input_files", nargs="+", help="Input image file(s)")
     crop_parser.add_argument("width", type=int, help="Target width")
     crop_parser.add_argument("height", type=int, help="Target height")
     crop_parser.add_argument("--save-steps", action="store_true", help="Save processing steps")
-    crop_parser.add_argument("--output", "-o", help="Output filename")
+    crop_parser.add_argument("--output", "-o", help="Output filename (single input only)")
+    crop_parser.add_argument(
+        "--scale-factor",
+        type=float,
+        default=DEFAULT_FACE_SCALE_FACTOR,
+        help=f"Face detection scale step; larger is faster, may miss faces (default: {DEFAULT_FACE_SCALE_FACTOR})",
+    )
+    crop_parser.add_argument("--min-face-size", type=int, default=DEFAULT_FACE_MIN_SIZE, help="Smallest face to detect in pixels; larger is faster (default: any)")
     crop_parser.add_argument("-h", "--help", action="store_true", help="Show help for crop command")
 
+    # Image index
+    index_parser = image_subs.add_parser("index", help="Build the PlaceKitten subject metadata index", add_help=False)
+    index_parser.add_argument("--source", default="demo", help="PlaceKitten source folder (default: demo, the bundled images)")
+    index_parser.add_argument("--rebuild", action="store_true", help="Re-analyse images that are already indexed")
+    index_parser.add_argument("-h", "--help", action="store_true", help="Show help for index command")
+
     # Configuration and setup commands (grouped)
     config_parser = subparsers.add_parser("config", help="Configuration, setup, and system information", add_help=False)
     config_parser.add_argument("-h", "--help", action="store_true", help="Show help for config commands")
@@ -1047,7 +1360,7 @@ def create_parser():
         help="Update language and font settings in existing PowerPoint files",
         add_help=False,
     )
-    remap_parser.add_argument("input_file", help="Input PowerPoint (.pptx) file to update")
+    remap_parser.add_argument("input_files", nargs="+", help="PowerPoint (.pptx) files, directories or glob patterns to update")
     remap_parser.add_argument(
         "--language",
         "-l",
@@ -1057,6 +1370,10 @@ def create_parser():
     remap_parser.add_argument("--font", "-f", metavar="FONT", help="Font family to apply (e.g., Calibri, Arial)")
     remap_parser.add_argument("--output", "-o", metavar="FILE", help="Output file path (default: overwrite input)")
     remap_parser.add_argument("--no-backup", action="store_true", help="Skip creating backup file")
+    remap_parser.add_argument("--jobs", "-j", type=int, default=1, help="Worker processes for multiple inputs (default: 1)")
+    remap_parser.add_argument("--manifest", metavar="FILE", help=f"Remap manifest recording remapped files (default: {MANIFEST_FILE_NAME} in the input folder)")
+    remap_parser.add_argument("--force", action="store_true", help="Remap every file, even if the manifest shows it is already remapped")
+    remap_parser.add_argument("--fast", action="store_true", help="Rewrite slide XML directly instead of loading presentations into python-pptx")
     remap_parser.add_argument("-h", "--help", action="store_true", help="Show help for remap command")
 
     # Help command
@@ -1179,11 +1496,14 @@ Usage: deckbuilder image <subcommand> [options]
 
 Subcommands:
   generate <w> <h>         Generate PlaceKitten placeholder images
-  crop <file> <w> <h>      Smart crop existing images
+  crop <files> <w> <h>     Smart crop existing images
+  index                    Build the PlaceKitten subject metadata index
 
 Examples:
   deckbuilder image generate 800 600 --filter grayscale
   deckbuilder image crop input.jpg 1920 1080 --save-steps
+  deckbuilder image crop photos/*.jpg 800 600 --scale-factor 1.2 --min-face-size 60
+  deckbuilder image index --rebuild
 
 For detailed help on a subcommand:
   deckbuilder help image <subcommand>
@@ -1271,7 +1591,10 @@ def handle_help_command(args):
                 print("Usage: deckbuilder image generate <width> <height> [options]")
             elif args.help_subcommand == "crop":
                 print("Smart crop existing images")
-                print("Usage: deckbuilder image crop <file> <width> <height> [options]")
+                print("Usage: deckbuilder image crop <file>... <width> <height> [options]")
+            elif args.help_subcommand == "index":
+                print("Build the PlaceKitten subject metadata index")
+                print("Usage: deckbuilder image index [--source <folder>] [--rebuild]")
             else:
                 print(f"Unknown image subcommand: {args.help_subcommand}")
         else:
@@ -1293,10 +1616,17 @@ def handle_help_command(args):
             show_config_help()
     elif args.help_command == "create":
         print("Generate presentations from markdown or JSON")
-        print("Usage: deckbuilder create <file> [options]")
+        print("Usage: deckbuilder create <file> [<file> ...] [options]")
+        print("Arguments:")
+        print("  file               Markdown/JSON file, directory or glob pattern")
         print("Options:")
-        print("  --output, -o       Output filename (without extension)")
+        print("  --output, -o       Output filename (without extension, single input only)")
         print("  --template, -t     Template name to use")
+        print("  --jobs, -j         Worker processes for multiple inputs (default: 1)")
+        print("  --profile          Print per-stage timings and write <output>.profile.json")
+        print("Examples:")
+        print("  deckbuilder create a.md b.md decks/*.json --jobs 4")
+        print("  deckbuilder create deck.md --profile")
     elif args.help_command == "init":
         print("Initialize template folder with default files")
         print("Usage: deckbuilder init [path]")
@@ -1304,17 +1634,22 @@ def handle_help_command(args):
         print("  path               Template folder path (default: ./templates)")
     elif args.help_command == "remap":
         print("Update language and font settings in existing PowerPoint files")
-        print("Usage: deckbuilder remap <file.pptx> [options]")
+        print("Usage: deckbuilder remap <file.pptx> [<file.pptx> ...] [options]")
         print("Arguments:")
-        print("  input_file         PowerPoint file (.pptx) to update")
+        print("  input_files        PowerPoint files (.pptx), directories or glob patterns to update")
         print("Options:")
         print("  --language, -l     Language code (e.g., en-US, en-AU, es-ES)")
         print("  --font, -f         Font family (e.g., Calibri, Arial)")
-        print("  --output, -o       Output file path (default: overwrite input)")
+        print("  --output, -o       Output file path (default: overwrite input, single input only)")
         print("  --no-backup        Skip creating backup file")
+        print("  --jobs, -j         Worker processes for multiple inputs (default: 1)")
+        print(f"  --manifest         Remap manifest for multiple inputs (default: {MANIFEST_FILE_NAME} in the input folder)")
+        print("  --force            Remap files the manifest shows as already remapped")
+        print("  --fast             Rewrite slide XML directly (much faster on large decks)")
         print("Examples:")
         print("  deckbuilder remap presentation.pptx --language en-US")
         print("  deckbuilder remap slides.pptx --font Arial --output new_slides.pptx")
+        print("  deckbuilder remap exports/ --language en-AU --jobs 8")
     else:
         print(f"Unknown command: {args.help_command}")
         print("Available commands: create, template, image, config, remap, init, help")
@@ -1446,15 +1781,40 @@ def handle_image_command(cli, args):
     elif args.image_command == "crop":
         if hasattr(args, "help") and args.help:
             print("Smart crop existing images")
-            print("Usage: deckbuilder image crop <file> <width> <height> [options]")
+            print("Usage: deckbuilder image crop <file>... <width> <height> [options]")
             return
-        cli.smart_crop_image(
-            input_file=args.input_file,
+        if len(args.input_files) == 1:
+            # Errors propagate to main(), which reports them and exits with status 1
+            cli.smart_crop_image(
+                input_file=args.input_files[0],
+                width=args.width,
+                height=args.height,
+                save_steps=args.save_steps,
+                output_file=args.output,
+                face_scale_factor=args.scale_factor,
+                face_min_size=args.min_face_size,
+            )
+            return
+        if args.output:
+            print("❌ --output can only be used with a single input file")
+            sys.exit(1)
+        # One process crops every file, so the face classifier is loaded once
+        failures = cli.smart_crop_images(
+            args.input_files,
             width=args.width,
             height=args.height,
             save_steps=args.save_steps,
-            output_file=args.output,
+            face_scale_factor=args.scale_factor,
+            face_min_size=args.min_face_size,
         )
+        if failures:
+            sys.exit(1)
+    elif args.image_command == "index":
+        if hasattr(args, "help") and args.help:
+            print("Build the PlaceKitten subject metadata index")
+            print("Usage: deckbuilder image index [--source <folder>] [--rebuild]")
+            return
+        cli.build_image_index(source_folder=args.source, rebuild=args.rebuild)
     else:
         print(f"Unknown image subcommand: {args.image_command}")
         show_image_help()
@@ -1530,9 +1890,22 @@ def main():
         if args.command == "create":
             if hasattr(args, "help") and args.help:
                 print("Generate presentations from markdown or JSON")
-                print("Usage: deckbuilder create <file> [options]")
+                print("Usage: deckbuilder create <file> [<file> ...] [options]")
                 return
-            cli.create_presentation(input_file=args.input_file, output_name=args.output, template=args.template)
+            input_files = args.input_files
+            if len(input_files) == 1 and not Path(input_files[0]).is_dir() and not _is_glob_pattern(input_files[0]):
+                profile = args.profile or is_profiling_enabled()
+                cli.create_presentation(input_file=input_files[0], output_name=args.output, template=args.template, profile=profile)
+            else:
+                if args.output:
+                    print("❌ --output can only be used with a single input file")
+                    sys.exit(1)
+                if args.profile:
+                    print("❌ --profile can only be used with a single input file")
+                    sys.exit(1)
+                results = cli.create_presentations(input_files, template=args.template, jobs=args.jobs)
+                if not results or not all(result.success for result in results):
+                    sys.exit(1)
         elif args.command == "template":
             handle_template_command(cli, args)
         elif args.command == "pattern":
@@ -1550,20 +1923,47 @@ def main():
         elif args.command == "remap":
             if hasattr(args, "help") and args.help:
                 print("Update language and font settings in existing PowerPoint files")
-                print("Usage: deckbuilder remap <file.pptx> [options]")
+                print("Usage: deckbuilder remap <file.pptx> [<file.pptx> ...] [options]")
                 print("Options:")
                 print("  --language, -l LANG  Language code (e.g., en-US, en-AU, es-ES)")
                 print("  --font, -f FONT      Font family (e.g., Calibri, Arial)")
-                print("  --output, -o FILE    Output file path (default: overwrite input)")
+                print("  --output, -o FILE    Output file path (default: overwrite input, single input only)")
                 print("  --no-backup          Skip creating backup file")
+                print("  --jobs, -j N         Worker processes for multiple inputs (default: 1)")
+                print("  --manifest FILE      Remap manifest (skip files already remapped)")
+                print("  --force              Remap files the manifest shows as already remapped")
+                print("  --fast               Rewrite slide XML directly (much faster on large decks)")
                 return
-            success = cli.remap_presentation(
-                input_file=args.input_file,
-                language_code=getattr(args, "language", None),
-                font_name=getattr(args, "font", None),
-                output_file=getattr(args, "output", None),
-                create_backup=not getattr(args, "no_backup", False),
-            )
+            input_files = args.input_files
+            single_file = len(input_files) == 1 and not Path(input_files[0]).is_dir() and not _is_glob_pattern(input_files[0])
+            if single_file and args.output and (args.manifest or args.force):
+                print("❌ --output cannot be combined with --manifest or --force")
+                sys.exit(1)
+            # --manifest and --force only apply to the batch path, so a single file uses it when either is given
+            if single_file and not (args.manifest or args.force):
+                success = cli.remap_presentation(
+                    input_file=input_files[0],
+                    language_code=getattr(args, "language", None),
+                    font_name=getattr(args, "font", None),
+                    output_file=getattr(args, "output", None),
+                    create_backup=not getattr(args, "no_backup", False),
+                    fast=args.fast,
+                )
+            else:
+                if args.output:
+                    print("❌ --output can only be used with a single input file")
+                    sys.exit(1)
+                results = cli.remap_presentations(
+                    input_files,
+                    language_code=getattr(args, "language", None),
+                    font_name=getattr(args, "font", None),
+                    create_backup=not args.no_backup,
+                    jobs=args.jobs,
+                    manifest_file=args.manifest,
+                    force=args.force,
+                    fast=args.fast,
+                )
+                success = bool(results) and all(result.success for result in results)
             if not success:
                 sys.exit(1)
         else:
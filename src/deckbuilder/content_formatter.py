@@ -1,5 +1,3 @@
-import re
-
 try:
     from .formatting_support import FormattingSupport, get_default_language, get_default_font
 except ImportError:
@@ -18,6 +16,10 @@ except ImportError:
         return None
 
 
+from .content_formatting import parse_inline_formatting  # noqa: E402
+from .logging_config import content_debug_enabled, content_processor_print  # noqa: E402
+
+
 class ContentFormatter:
     """Handles text formatting, rich content processing, and inline formatting."""
 
@@ -38,7 +40,7 @@ class ContentFormatter:
 
         # Debug logging to track content processing pipeline decisions
         content_type = type(content).__name__
-        self._debug_log(f"Processing content type: {content_type}")
+        self._debug_log("Processing content type: %s", content_type)
 
         # Priority 1: Check for rich content blocks (from content_formatting.py)
         if isinstance(content, dict):
@@ -82,7 +84,7 @@ class ContentFormatter:
                 return
             else:
                 # Fallback for other dict types - avoid string conversion if possible
-                self._debug_log(f"Unknown dict content structure, attempting text extraction: {list(content.keys())}")
+                self._debug_log("Unknown dict content structure, attempting text extraction: %s", lambda: list(content.keys()))
                 p = text_frame.paragraphs[0]
                 if "text" in content:
                     self.apply_inline_formatting(content["text"], p)
@@ -124,15 +126,14 @@ class ContentFormatter:
 
         # Fallback for unexpected content types
         else:
-            self._debug_log(f"Fallback: Converting {content_type} to string")
+            self._debug_log("Fallback: Converting %s to string", content_type)
             p = text_frame.paragraphs[0]
             p.text = str(content)
 
-    def _debug_log(self, message):
-        """Debug logging for content processing pipeline"""
-        from .logging_config import content_processor_print
-
-        content_processor_print(f"[ContentFormatter] {message}")
+    def _debug_log(self, message, *args):
+        """Debug logging for content processing pipeline (args are formatted only when enabled)"""
+        if content_debug_enabled():
+            content_processor_print("[ContentFormatter] " + message, *args)
 
     def _add_rich_content_list_to_placeholder(self, text_frame, content_list):
         """Add list content with proper formatting and bullet support."""
@@ -151,7 +152,7 @@ class ContentFormatter:
             elif isinstance(item, dict):
                 # Check if this is a rich content block (heading, paragraph, bullets)
                 if any(key in item for key in ["heading", "paragraph", "bullets"]):
-                    self._debug_log(f"Processing rich content block in list: {list(item.keys())}")
+                    self._debug_log("Processing rich content block in list: %s", lambda: list(item.keys()))
                     # Process as rich content block using the specialized handler
                     self._add_single_rich_content_block_to_placeholder(text_frame, item, paragraph_added)
                     paragraph_added = True
@@ -173,7 +174,7 @@ class ContentFormatter:
                     self.apply_formatted_segments_to_paragraph(item["formatted"], p)
                 else:
                     # Unknown dict structure - extract text if possible
-                    self._debug_log(f"Unknown dict in list, keys: {list(item.keys())}")
+                    self._debug_log("Unknown dict in list, keys: %s", lambda: list(item.keys()))
                     if not paragraph_added:
                         p = text_frame.paragraphs[0]
                         paragraph_added = True
@@ -193,14 +194,14 @@ class ContentFormatter:
             # Make heading bold by default
             for run in p.runs:
                 run.font.bold = True
-            self._debug_log(f"Added heading: '{heading_text}'")
+            self._debug_log("Added heading: '%s'", heading_text)
 
         # Handle paragraph
         if "paragraph" in content_block:
             p = text_frame.paragraphs[0] if not paragraph_added else text_frame.add_paragraph()
             paragraph_text = content_block["paragraph"]
             self.apply_inline_formatting(paragraph_text, p)
-            self._debug_log(f"Added paragraph: '{paragraph_text[:50]}...'")
+            self._debug_log("Added paragraph: '%.50s...'", paragraph_text)
 
         # Handle bullets with proper level support
         if "bullets" in content_block and isinstance(content_block["bullets"], list):
@@ -216,7 +217,7 @@ class ContentFormatter:
                 else:
                     p.level = 0  # Default to top level bullets
 
-                self._debug_log(f"Added bullet: '{bullet_text}' at level {p.level}")
+                self._debug_log("Added bullet: '%s' at level %s", bullet_text, lambda: p.level)
                 paragraph_added = True
 
     def _add_rich_content_blocks_to_placeholder(self, text_frame, content_dict):
@@ -278,7 +279,7 @@ class ContentFormatter:
                     else:
                         p.level = 0  # Default to top level bullets
 
-                    self._debug_log(f"Added bullet: '{bullet_text}' at level {p.level}")
+                    self._debug_log("Added bullet: '%s' at level %s", bullet_text, lambda: p.level)
                     paragraph_added = True
 
     def apply_formatted_segments_to_paragraph(self, formatted_segments, paragraph):
@@ -307,68 +308,7 @@ class ContentFormatter:
 
     def parse_inline_formatting(self, text):
         """Parse inline formatting and return structured formatting data"""
-        if not text:
-            return [{"text": "", "format": {}}]
-
-        # Patterns in order of precedence (longest patterns first to avoid conflicts)
-        patterns = [
-            (
-                r"\*\*\*___(.*?)___\*\*\*",
-                {"bold": True, "italic": True, "underline": True},
-            ),  # ***___text___***
-            (
-                r"___\*\*\*(.*?)\*\*\*___",
-                {"bold": True, "italic": True, "underline": True},
-            ),  # ___***text***___
-            (r"\*\*\*(.*?)\*\*\*", {"bold": True, "italic": True}),  # ***text***
-            (r"___(.*?)___", {"underline": True}),  # ___text___
-            (r"\*\*(.*?)\*\*", {"bold": True}),  # **text**
-            (r"\*(.*?)\*", {"italic": True}),  # *text*
-        ]
-
-        # Find all matches and their positions
-        all_matches = []
-        for pattern, format_dict in patterns:
-            for match in re.finditer(pattern, text):
-                all_matches.append((match.start(), match.end(), match.group(1), format_dict))
-
-        # Sort matches by position
-        all_matches.sort(key=lambda x: x[0])
-
-        # Remove overlapping matches (keep the first one found)
-        filtered_matches = []
-        last_end = 0
-        for start, end, content, format_dict in all_matches:
-            if start >= last_end:
-                filtered_matches.append((start, end, content, format_dict))
-                last_end = end
-
-        # Build the formatted text segments
-        segments = []
-        last_pos = 0
-
-        for start, end, content, format_dict in filtered_matches:
-            # Add plain text before the formatted text
-            if start > last_pos:
-                plain_text = text[last_pos:start]
-                if plain_text:
-                    segments.append({"text": plain_text, "format": {}})
-
-            # Add formatted text
-            segments.append({"text": content, "format": format_dict})
-            last_pos = end
-
-        # Add any remaining plain text
-        if last_pos < len(text):
-            remaining_text = text[last_pos:]
-            if remaining_text:
-                segments.append({"text": remaining_text, "format": {}})
-
-        # If no formatting found, return the original text
-        if not segments:
-            segments = [{"text": text, "format": {}}]
-
-        return segments
+        return parse_inline_formatting(text)
 
     def apply_inline_formatting(self, text, paragraph):
         """Apply inline formatting to paragraph using parsed formatting data."""
@@ -496,22 +436,22 @@ class ContentFormatter:
 
         from .placeholder_types import is_content_placeholder, is_title_placeholder
 
-        self._debug_log(f"Processing {type(content).__name__} content with {len(content) if isinstance(content, list) else 'N/A'} blocks")
-
         # Enhanced content analysis debugging
-        if isinstance(content, list):
-            for i, block in enumerate(content):
-                if isinstance(block, dict):
-                    block_type = block.get("type", "unknown")
-                    block_keys = list(block.keys())
-                    self._debug_log(f"  Block {i + 1}: type='{block_type}', keys={block_keys}")
-                else:
-                    self._debug_log(f"  Block {i + 1}: {type(block).__name__} = {str(block)[:50]}...")
-        elif isinstance(content, dict):
-            content_keys = list(content.keys())
-            self._debug_log(f"  Content dict keys: {content_keys}")
-        else:
-            self._debug_log(f"  Content: {str(content)[:100]}...")
+        if content_debug_enabled():
+            self._debug_log(f"Processing {type(content).__name__} content with {len(content) if isinstance(content, list) else 'N/A'} blocks")
+            if isinstance(content, list):
+                for i, block in enumerate(content):
+                    if isinstance(block, dict):
+                        block_type = block.get("type", "unknown")
+                        block_keys = list(block.keys())
+                        self._debug_log(f"  Block {i + 1}: type='{block_type}', keys={block_keys}")
+                    else:
+                        self._debug_log(f"  Block {i + 1}: {type(block).__name__} = {str(block)[:50]}...")
+            elif isinstance(content, dict):
+                content_keys = list(content.keys())
+                self._debug_log(f"  Content dict keys: {content_keys}")
+            else:
+                self._debug_log(f"  Content: {str(content)[:100]}...")
 
         # Find title placeholder to check if it needs content extracted
         title_placeholder = None
@@ -531,7 +471,7 @@ class ContentFormatter:
                         has_title_content = True
                         break
             title_needs_content = not has_title_content
-            self._debug_log(f"Title placeholder analysis: empty={title_needs_content}, needs_content={title_needs_content}")
+            self._debug_log("Title placeholder analysis: empty=%s, needs_content=%s", title_needs_content, title_needs_content)
 
         # Extract first heading to title if needed
         processed_content = content
@@ -546,7 +486,7 @@ class ContentFormatter:
             if first_heading_idx is not None:
                 heading_block = content[first_heading_idx]
                 heading_text = heading_block.get("text", "")
-                self._debug_log(f"Extracting first heading to title: '{heading_text}'")
+                self._debug_log("Extracting first heading to title: '%s'", heading_text)
 
                 # Add heading text to title placeholder
                 p = title_placeholder.text_frame.paragraphs[0]
@@ -554,7 +494,7 @@ class ContentFormatter:
 
                 # Remove the heading from content blocks
                 processed_content = content[:first_heading_idx] + content[first_heading_idx + 1 :]
-                self._debug_log(f"Content blocks remaining after title extraction: {len(processed_content)}")
+                self._debug_log("Content blocks remaining after title extraction: %d", len(processed_content))
 
         # Find content placeholders using semantic detection
         content_placeholders = []
@@ -15,7 +15,71 @@ Separated from structure handling to enable clean architecture.
 """
 
 import re
-from typing import List, Dict, Any, Union
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple, Union
+
+# Inline markers in order of precedence (longest patterns first to avoid conflicts)
+INLINE_FORMATS = (
+    (r"\*\*\*___(.*?)___\*\*\*", {"bold": True, "italic": True, "underline": True}),  # ***___text___***
+    (r"___\*\*\*(.*?)\*\*\*___", {"bold": True, "italic": True, "underline": True}),  # ___***text***___
+    (r"\*\*\*(.*?)\*\*\*", {"bold": True, "italic": True}),  # ***text***
+    (r"___(.*?)___", {"underline": True}),  # ___text___
+    (r"\*\*(.*?)\*\*", {"bold": True}),  # **text**
+    (r"\*(.*?)\*", {"italic": True}),  # *text*
+)
+
+# One alternation: at each position the first (highest precedence) marker that matches wins
+_INLINE_PATTERN = re.compile("|".join(pattern for pattern, _ in INLINE_FORMATS))
+
+# Distinct strings remembered by the tokenizer (titles, bullets and table cells repeat a lot)
+INLINE_FORMAT_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=INLINE_FORMAT_CACHE_SIZE)
+def _tokenize_inline(text: str) -> Tuple[Tuple[str, int], ...]:
+    """Split text into (segment text, INLINE_FORMATS index or -1 for plain) tokens in a single scan."""
+    tokens = []
+    last_pos = 0
+    for match in _INLINE_PATTERN.finditer(text):
+        start = match.start()
+        # Add plain text before the formatted text
+        if start > last_pos:
+            tokens.append((text[last_pos:start], -1))
+        # Exactly one group participates; its number identifies the marker
+        tokens.append((match.group(match.lastindex), match.lastindex - 1))
+        last_pos = match.end()
+
+    # Add any remaining plain text
+    if last_pos < len(text):
+        tokens.append((text[last_pos:], -1))
+    return tuple(tokens)
+
+
+def parse_inline_formatting(text: str) -> List[Dict[str, Any]]:
+    """
+    Parse **bold**, *italic*, ___underline___ and their combinations in one pass.
+
+    Shared by ContentFormatter, ContentProcessor and the frontmatter converter.
+    Results for repeated strings come from a bounded LRU memo; every call
+    returns fresh segment dictionaries, so callers may modify them.
+
+    Args:
+        text: Text with inline formatting markers
+
+    Returns:
+        List of segments with text and formatting attributes
+    """
+    if not text:
+        return [{"text": "", "format": {}}]
+
+    # Fast path: no marker characters at all
+    if "*" not in text and "_" not in text:
+        return [{"text": text, "format": {}}]
+
+    segments = [{"text": segment, "format": dict(INLINE_FORMATS[index][1]) if index >= 0 else {}} for segment, index in _tokenize_inline(text)]
+
+    # If no formatting found, return the original text
+    return segments or [{"text": text, "format": {}}]
 
 
 class ContentFormatter:
@@ -35,68 +99,7 @@ class ContentFormatter:
         Returns:
             List of segments with text and formatting attributes
         """
-        if not text:
-            return [{"text": "", "format": {}}]
-
-        # Patterns in order of precedence (longest patterns first to avoid conflicts)
-        patterns = [
-            (
-                r"\*\*\*___(.*?)___\*\*\*",
-                {"bold": True, "italic": True, "underline": True},
-            ),  # ***___text___***
-            (
-                r"___\*\*\*(.*?)\*\*\*___",
-                {"bold": True, "italic": True, "underline": True},
-            ),  # ___***text***___
-            (r"\*\*\*(.*?)\*\*\*", {"bold": True, "italic": True}),  # ***text***
-            (r"___(.*?)___", {"underline": True}),  # ___text___
-            (r"\*\*(.*?)\*\*", {"bold": True}),  # **text**
-            (r"\*(.*?)\*", {"italic": True}),  # *text*
-        ]
-
-        # Find all matches and their positions
-        all_matches = []
-        for pattern, format_dict in patterns:
-            for match in re.finditer(pattern, text):
-                all_matches.append((match.start(), match.end(), match.group(1), format_dict))
-
-        # Sort matches by position
-        all_matches.sort(key=lambda x: x[0])
-
-        # Remove overlapping matches (keep the first one found)
-        filtered_matches = []
-        last_end = 0
-        for start, end, content, format_dict in all_matches:
-            if start >= last_end:
-                filtered_matches.append((start, end, content, format_dict))
-                last_end = end
-
-        # Build the formatted text segments
-        segments = []
-        last_pos = 0
-
-        for start, end, content, format_dict in filtered_matches:
-            # Add plain text before the formatted text
-            if start > last_pos:
-                plain_text = text[last_pos:start]
-                if plain_text:
-                    segments.append({"text": plain_text, "format": {}})
-
-            # Add formatted text
-            segments.append({"text": content, "format": format_dict})
-            last_pos = end
-
-        # Add any remaining plain text
-        if last_pos < len(text):
-            remaining_text = text[last_pos:]
-            if remaining_text:
-                segments.append({"text": remaining_text, "format": {}})
-
-        # If no formatting found, return the original text
-        if not segments:
-            segments = [{"text": text, "format": {}}]
-
-        return segments
+        return parse_inline_formatting(text)
 
     def format_simple_content_list(self, content_list: List[str]) -> List[Dict[str, Any]]:
         """
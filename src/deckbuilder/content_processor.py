@@ -1,6 +1,43 @@
+import io
 import re
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
 import yaml
 
+from .content_formatting import parse_inline_formatting
+
+# Markdown input for the streaming parser: text, a file path, or an iterable of lines
+MarkdownSource = Union[str, Path, Iterable[str]]
+
+# Frontmatter boundary: a line that is exactly '---' plus optional trailing whitespace
+_BOUNDARY_PATTERN = re.compile(r"---\s*")
+
+
+def iter_markdown_blocks(source: MarkdownSource) -> Iterator[str]:
+    """
+    Split markdown at frontmatter boundaries one block at a time.
+
+    Yields the same blocks as ``re.split(r"^---\\s*$", text, flags=re.MULTILINE)``
+    (modulo surrounding whitespace, which callers strip) without reading the
+    whole input first.
+    """
+    if isinstance(source, Path):
+        with open(source, "r", encoding="utf-8") as f:
+            yield from iter_markdown_blocks(f)
+        return
+    if isinstance(source, str):
+        source = io.StringIO(source)
+
+    lines = []
+    for line in source:
+        if _BOUNDARY_PATTERN.fullmatch(line):
+            yield "".join(lines)
+            lines = []
+        else:
+            lines.append(line)
+    yield "".join(lines)
+
 
 class ContentProcessor:
     """Handles markdown parsing, frontmatter processing, and content formatting."""
@@ -24,46 +61,61 @@ class ContentProcessor:
         Returns:
             List of slide dictionaries ready for _add_slide()
         """
-        slides = []
+        return list(self.iter_markdown_with_frontmatter(markdown_content))
+
+    def iter_markdown_with_frontmatter(self, source: MarkdownSource) -> Iterator[dict]:
+        """
+        Parse markdown with frontmatter lazily, yielding one slide dictionary at a time.
+
+        Args:
+            source: Markdown string, path to a markdown file, or an iterable of lines (e.g. open file)
+
+        Yields:
+            Slide dictionaries in document order; only the current slide's text is held in memory
+        """
+        for frontmatter_raw, content_raw in self.iter_markdown_sections(source):
+            yield self.parse_markdown_section(frontmatter_raw, content_raw)
 
-        # Split content by frontmatter boundaries
-        slide_blocks = re.split(r"^---\s*$", markdown_content, flags=re.MULTILINE)
+    def iter_markdown_sections(self, source: MarkdownSource) -> Iterator[Tuple[Optional[str], str]]:
+        """
+        Pair frontmatter and content blocks as they are read.
 
-        i = 0
-        while i < len(slide_blocks):
+        Yields:
+            (frontmatter_raw, content_raw) tuples; frontmatter_raw is None for a
+            trailing block that has no frontmatter
+        """
+        blocks = iter_markdown_blocks(source)
+        block = next(blocks, None)
+        while block is not None:
             # Skip empty blocks
-            if not slide_blocks[i].strip():
-                i += 1
+            if not block.strip():
+                block = next(blocks, None)
                 continue
 
             # Look for frontmatter + content pairs
-            if i + 1 < len(slide_blocks):
-                try:
-                    frontmatter_raw = slide_blocks[i].strip()
-                    content_raw = slide_blocks[i + 1].strip() if i + 1 < len(slide_blocks) else ""
-
-                    # Parse frontmatter with structured frontmatter support
-                    slide_config = self._parse_structured_frontmatter(frontmatter_raw)
-
-                    # Parse markdown content into slide data
-                    slide_data = self._parse_slide_content(content_raw, slide_config)
-                    slides.append(slide_data)
-
-                    i += 2  # Skip both frontmatter and content blocks
-                except yaml.YAMLError:
-                    # If YAML parsing fails, treat as regular content
-                    content_raw = slide_blocks[i].strip()
-                    slide_data = self._parse_slide_content(content_raw, {})
-                    slides.append(slide_data)
-                    i += 1
-            else:
+            following = next(blocks, None)
+            if following is None:
                 # Single block without frontmatter
-                content_raw = slide_blocks[i].strip()
-                slide_data = self._parse_slide_content(content_raw, {})
-                slides.append(slide_data)
-                i += 1
+                yield None, block.strip()
+                return
 
-        return slides
+            yield block.strip(), following.strip()
+            block = next(blocks, None)
+
+    def parse_markdown_section(self, frontmatter_raw: Optional[str], content_raw: str) -> dict:
+        """Convert one frontmatter + content pair into slide data."""
+        if frontmatter_raw is None:
+            return self._parse_slide_content(content_raw, {})
+
+        try:
+            # Parse frontmatter with structured frontmatter support
+            slide_config = self._parse_structured_frontmatter(frontmatter_raw)
+
+            # Parse markdown content into slide data
+            return self._parse_slide_content(content_raw, slide_config)
+        except yaml.YAMLError:
+            # If YAML parsing fails, treat as regular content
+            return self._parse_slide_content(frontmatter_raw, {})
 
     def _parse_structured_frontmatter(self, frontmatter_content: str) -> dict:
         """Parse structured frontmatter and convert to placeholder mappings"""
@@ -245,65 +297,4 @@ class ContentProcessor:
 
     def _parse_inline_formatting(self, text):
         """Parse inline formatting and return structured formatting data"""
-        if not text:
-            return [{"text": "", "format": {}}]
-
-        # Patterns in order of precedence (longest patterns first to avoid conflicts)
-        patterns = [
-            (
-                r"\*\*\*___(.*?)___\*\*\*",
-                {"bold": True, "italic": True, "underline": True},
-            ),  # ***___text___***
-            (
-                r"___\*\*\*(.*?)\*\*\*___",
-                {"bold": True, "italic": True, "underline": True},
-            ),  # ___***text***___
-            (r"\*\*\*(.*?)\*\*\*", {"bold": True, "italic": True}),  # ***text***
-            (r"___(.*?)___", {"underline": True}),  # ___text___
-            (r"\*\*(.*?)\*\*", {"bold": True}),  # **text**
-            (r"\*(.*?)\*", {"italic": True}),  # *text*
-        ]
-
-        # Find all matches and their positions
-        all_matches = []
-        for pattern, format_dict in patterns:
-            for match in re.finditer(pattern, text):
-                all_matches.append((match.start(), match.end(), match.group(1), format_dict))
-
-        # Sort matches by position
-        all_matches.sort(key=lambda x: x[0])
-
-        # Remove overlapping matches (keep the first one found)
-        filtered_matches = []
-        last_end = 0
-        for start, end, content, format_dict in all_matches:
-            if start >= last_end:
-                filtered_matches.append((start, end, content, format_dict))
-                last_end = end
-
-        # Build the formatted text segments
-        segments = []
-        last_pos = 0
-
-        for start, end, content, format_dict in filtered_matches:
-            # Add plain text before the formatted text
-            if start > last_pos:
-                plain_text = text[last_pos:start]
-                if plain_text:
-                    segments.append({"text": plain_text, "format": {}})
-
-            # Add formatted text
-            segments.append({"text": content, "format": format_dict})
-            last_pos = end
-
-        # Add any remaining plain text
-        if last_pos < len(text):
-            remaining_text = text[last_pos:]
-            if remaining_text:
-                segments.append({"text": remaining_text, "format": {}})
-
-        # If no formatting found, return the original text
-        if not segments:
-            segments = [{"text": text, "format": {}}]
-
-        return segments
+        return parse_inline_formatting(text)
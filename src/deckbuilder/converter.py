@@ -1,8 +1,8 @@
-import re
-from typing import Dict, Any, List, Optional, Union
-
-import json
 from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Mapping, Optional, Union
+
+from .content_formatting import parse_inline_formatting
+from .pattern_registry import BUILTIN_PATTERNS_DIR, convert_str_to_type, pattern_registry
 
 # from .template_manager import TemplateManage
 
@@ -13,44 +13,14 @@ class StructuredFrontmatterRegistry:
     def __init__(self):
         self._patterns = self._load_patterns()
 
-    def _load_patterns(self) -> Dict[str, Any]:
-        """Loads structured frontmatter patterns from JSON files in a dedicated directory."""
-        patterns_dir = Path(__file__).parent / "structured_frontmatter_patterns"
-        all_patterns = {}
-        for json_file in patterns_dir.glob("*.json"):
-            try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    pattern_data = json.load(f)
-                    layout_name = pattern_data.get("yaml_pattern", {}).get("layout")
-                    if layout_name:
-                        # Convert string placeholders back to type objects for validation
-                        if "yaml_pattern" in pattern_data:
-                            pattern_data["yaml_pattern"] = self._convert_str_to_type(pattern_data["yaml_pattern"])
-                        all_patterns[layout_name] = pattern_data
-                    else:
-                        print(f"Warning: Skipping {json_file} due to missing 'layout' in 'yaml_pattern'.")
-            except json.JSONDecodeError as e:
-                print(f"Error decoding JSON from {json_file}: {e}")
-            except Exception as e:
-                print(f"Error loading pattern from {json_file}: {e}")
-        return all_patterns
+    def _load_patterns(self) -> Mapping[str, Any]:
+        """Returns the built-in patterns (type names converted to types) from the shared compiled registry."""
+        compiled = pattern_registry.get(BUILTIN_PATTERNS_DIR)
+        return compiled.typed_patterns
 
     def _convert_str_to_type(self, data: Any) -> Any:
         """Recursively converts string representations of types (e.g., 'str') to actual type objects."""
-        if isinstance(data, dict):
-            return {k: self._convert_str_to_type(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self._convert_str_to_type(item) for item in data]
-        elif isinstance(data, str):
-            if data == "str":
-                return str
-            elif data == "int":
-                return int
-            elif data == "bool":
-                return bool
-            # Add other types as needed
-            return data
-        return data
+        return convert_str_to_type(data)
 
     def get_structure_patterns(self) -> Dict[str, Any]:
         """Returns the loaded structured frontmatter patterns."""
@@ -229,68 +199,7 @@ class StructuredFrontmatterConverter:
 
     def _parse_inline_formatting(self, text):
         """Parse inline formatting and return structured formatting data"""
-        if not text:
-            return [{"text": "", "format": {}}]
-
-        # Patterns in order of precedence (longest patterns first to avoid conflicts)
-        patterns = [
-            (
-                r"\*\*\*___(.*?)___\*\*\*",
-                {"bold": True, "italic": True, "underline": True},
-            ),  # ***___text___***
-            (
-                r"___\*\*\*(.*?)\*\*\*___",
-                {"bold": True, "italic": True, "underline": True},
-            ),  # ___***text***___
-            (r"\*\*\*(.*?)\*\*\*", {"bold": True, "italic": True}),  # ***text***
-            (r"___(.*?)___", {"underline": True}),  # ___text___
-            (r"\*\*(.*?)\*\*", {"bold": True}),  # **text**
-            (r"\*(.*?)\*", {"italic": True}),  # *text*
-        ]
-
-        # Find all matches and their positions
-        all_matches = []
-        for pattern, format_dict in patterns:
-            for match in re.finditer(pattern, text):
-                all_matches.append((match.start(), match.end(), match.group(1), format_dict))
-
-        # Sort matches by position
-        all_matches.sort(key=lambda x: x[0])
-
-        # Remove overlapping matches (keep the first one found)
-        filtered_matches = []
-        last_end = 0
-        for start, end, content, format_dict in all_matches:
-            if start >= last_end:
-                filtered_matches.append((start, end, content, format_dict))
-                last_end = end
-
-        # Build the formatted text segments
-        segments = []
-        last_pos = 0
-
-        for start, end, content, format_dict in filtered_matches:
-            # Add plain text before the formatted text
-            if start > last_pos:
-                plain_text = text[last_pos:start]
-                if plain_text:
-                    segments.append({"text": plain_text, "format": {}})
-
-            # Add formatted text
-            segments.append({"text": content, "format": format_dict})
-            last_pos = end
-
-        # Add any remaining plain text
-        if last_pos < len(text):
-            remaining_text = text[last_pos:]
-            if remaining_text:
-                segments.append({"text": remaining_text, "format": {}})
-
-        # If no formatting found, return the original text
-        if not segments:
-            segments = [{"text": text, "format": {}}]
-
-        return segments
+        return parse_inline_formatting(text)
 
     def _process_markdown_headings(self, content: str) -> str:
         """Process markdown headings by removing #, ##, and ### prefixes"""
@@ -528,69 +437,80 @@ def markdown_to_canonical_json(markdown_content: str) -> Dict[str, Any]:
 
     Handles both pure structured frontmatter and frontmatter + content pairs.
     """
-    # Import ContentProcessor to handle frontmatter + content parsing
-    from .content_processor import ContentProcessor
-
-    # Use ContentProcessor to properly parse frontmatter + content
-    processor = ContentProcessor()
-    slides = processor.parse_markdown_with_frontmatter(markdown_content)
-
-    canonical_slides = []
+    return {"slides": list(iter_canonical_slides(markdown_content))}
 
-    for slide_data in slides:
-        # Convert slide data to canonical format
-        slide_layout = slide_data.get("type") or slide_data.get("layout", "Title and Content")
 
-        # Create canonical slide structure
-        slide_obj = {
-            "layout": slide_layout,
-            "style": slide_data.get("style", "default_style"),
-            "placeholders": {},
-            "content": [],
-        }
+def iter_canonical_slides(source: Union[str, Path, Iterable[str]]) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily convert markdown with frontmatter into canonical slides, one at a time.
 
-        # Add title if present
-        if "title" in slide_data:
-            slide_obj["placeholders"]["title"] = slide_data["title"]
-
-        # Add subtitle if present
-        if "subtitle" in slide_data:
-            slide_obj["placeholders"]["subtitle"] = slide_data["subtitle"]
-
-        # Convert rich content to canonical format and put it in placeholders
-        if "rich_content" in slide_data:
-            content_blocks = []
-            for block in slide_data["rich_content"]:
-                if "heading" in block:
-                    content_blocks.append({"type": "heading", "text": block["heading"]})
-                elif "paragraph" in block:
-                    content_blocks.append({"type": "paragraph", "text": block["paragraph"]})
-                elif "bullets" in block:
-                    bullet_items = []
-                    bullets = block["bullets"]
-                    bullet_levels = block.get("bullet_levels", [1] * len(bullets))
-                    for bullet, level in zip(bullets, bullet_levels):
-                        bullet_items.append({"text": bullet, "level": level})
-                    content_blocks.append({"type": "bullets", "items": bullet_items})
-
-            if content_blocks:
-                # Put content blocks in the placeholders so slide builder can find them
-                slide_obj["placeholders"]["content"] = content_blocks
-
-        # Add other placeholder fields from frontmatter (exclude internal fields)
-        for key, value in slide_data.items():
-            if key not in [
-                "type",
-                "rich_content",
-                "style",
-                "layout",
-                "title_formatted",
-                "subtitle_formatted",
-            ]:
-                # Don't duplicate title and subtitle since they're already handled above
-                if key not in ["title", "subtitle"] or key not in slide_obj["placeholders"]:
-                    slide_obj["placeholders"][key] = value
+    Args:
+        source: Markdown string, path to a markdown file, or an iterable of lines
 
-        canonical_slides.append(slide_obj)
+    Yields:
+        Canonical slide dictionaries ({"layout", "style", "placeholders", "content"})
+    """
+    # Import ContentProcessor to handle frontmatter + content parsing
+    from .content_processor import ContentProcessor
 
-    return {"slides": canonical_slides}
+    # Use ContentProcessor to properly parse frontmatter + content
+    processor = ContentProcessor()
+    for slide_data in processor.iter_markdown_with_frontmatter(source):
+        yield slide_to_canonical(slide_data)
+
+
+def slide_to_canonical(slide_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert one parsed markdown slide (ContentProcessor output) to the canonical slide format."""
+    slide_layout = slide_data.get("type") or slide_data.get("layout", "Title and Content")
+
+    # Create canonical slide structure
+    slide_obj = {
+        "layout": slide_layout,
+        "style": slide_data.get("style", "default_style"),
+        "placeholders": {},
+        "content": [],
+    }
+
+    # Add title if present
+    if "title" in slide_data:
+        slide_obj["placeholders"]["title"] = slide_data["title"]
+
+    # Add subtitle if present
+    if "subtitle" in slide_data:
+        slide_obj["placeholders"]["subtitle"] = slide_data["subtitle"]
+
+    # Convert rich content to canonical format and put it in placeholders
+    if "rich_content" in slide_data:
+        content_blocks = []
+        for block in slide_data["rich_content"]:
+            if "heading" in block:
+                content_blocks.append({"type": "heading", "text": block["heading"]})
+            elif "paragraph" in block:
+                content_blocks.append({"type": "paragraph", "text": block["paragraph"]})
+            elif "bullets" in block:
+                bullet_items = []
+                bullets = block["bullets"]
+                bullet_levels = block.get("bullet_levels", [1] * len(bullets))
+                for bullet, level in zip(bullets, bullet_levels):
+                    bullet_items.append({"text": bullet, "level": level})
+                content_blocks.append({"type": "bullets", "items": bullet_items})
+
+        if content_blocks:
+            # Put content blocks in the placeholders so slide builder can find them
+            slide_obj["placeholders"]["content"] = content_blocks
+
+    # Add other placeholder fields from frontmatter (exclude internal fields)
+    for key, value in slide_data.items():
+        if key not in [
+            "type",
+            "rich_content",
+            "style",
+            "layout",
+            "title_formatted",
+            "subtitle_formatted",
+        ]:
+            # Don't duplicate title and subtitle since they're already handled above
+            if key not in ["title", "subtitle"] or key not in slide_obj["placeholders"]:
+                slide_obj["placeholders"][key] = value
+
+    return slide_obj
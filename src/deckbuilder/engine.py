@@ -1,16 +1,20 @@
 # import json
+import os
 import sys
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Deque, Dict, Any, List, Optional, Tuple
 
 from pptx import Presentation
 
 from .path_manager import path_manager, PathManager
 from .presentation_builder import PresentationBuilder
-from .content_processor import ContentProcessor
+from .content_processor import ContentProcessor, MarkdownSource
 from .template_manager import TemplateManager
 from .image_handler import ImageHandler
+from .template_cache import template_cache
+from .profiling import is_profiling_enabled, profile_session, span
 
 # Import PlaceKitten from parent directory
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -29,15 +33,41 @@ def singleton(cls):
         """Reset the singleton instance for testing purposes"""
         instances.clear()
 
+    def create_instance(*args, **kwargs):
+        """Create an independent instance that bypasses the shared singleton"""
+        return cls(*args, **kwargs)
+
     # Allow external access to clear instances for testing
     get_instance._instances = instances
     get_instance.reset = reset
+    get_instance.create_instance = create_instance
     cls._instances = instances
     cls.reset = reset
 
     return get_instance
 
 
+def _paranoid_validation_enabled() -> bool:
+    """Check whether DECKBUILDER_PARANOID_VALIDATION requests re-reading saved files."""
+    return os.getenv("DECKBUILDER_PARANOID_VALIDATION", "false").lower() == "true"
+
+
+def _check_canonical_slide(slide_num: int, slide_data: Any) -> None:
+    """Raise ValueError unless a slide has the required canonical structure."""
+    if not isinstance(slide_data, dict):
+        raise ValueError(f"Slide {slide_num} must be a dictionary.")
+
+    if "layout" not in slide_data:
+        raise ValueError(f"Slide {slide_num} must have a 'layout' field.")
+
+    # Ensure canonical structure exists (placeholders and content are optional but must be correct types)
+    if "placeholders" in slide_data and not isinstance(slide_data["placeholders"], dict):
+        raise ValueError(f"Slide {slide_num} 'placeholders' must be a dictionary.")
+
+    if "content" in slide_data and not isinstance(slide_data["content"], list):
+        raise ValueError(f"Slide {slide_num} 'content' must be an array.")
+
+
 @singleton
 class Deckbuilder:
     def __init__(self, path_manager_instance: PathManager = None):
@@ -52,15 +82,13 @@ class Deckbuilder:
         self.content_processor = ContentProcessor()
         self.presentation_builder = PresentationBuilder(self._path_manager)
 
-        # Initialize image-related components
-        output_folder = self._path_manager.get_output_folder()
-        if isinstance(output_folder, str):
-            image_cache_dir = Path(output_folder) / "image_cache"
-        else:
-            image_cache_dir = output_folder / "image_cache"
-        self.image_handler = ImageHandler(str(image_cache_dir))
+        # Initialize image-related components (processed images go to the shared image cache)
+        self.image_handler = ImageHandler()
         self.placekitten = PlaceKitten()
 
+        # Timing tree of the most recent profiled create_presentation call
+        self.last_profile = None
+
         # Ensure default template exists in templates folder
         template_name = self._path_manager.get_template_name() or "default"
         self.template_manager.check_template_exists(template_name)
@@ -80,9 +108,9 @@ class Deckbuilder:
         self.content_processor.layout_mapping = layout_mapping
         self.presentation_builder.layout_mapping = layout_mapping
 
-        # Load template or create empty presentation
+        # Load template (from the in-process cache) or create empty presentation
         if template_path:
-            self.prs = Presentation(template_path)
+            self.prs = template_cache.get_presentation(template_path)
         else:
             self.prs = Presentation()
 
@@ -93,17 +121,80 @@ class Deckbuilder:
         presentation_data: Dict[str, Any],
         fileName: str = "Sample_Presentation",
         templateName: str = "default",
+        paranoid_validation: Optional[bool] = None,
+        profile: Optional[bool] = None,
     ) -> str:
         """
         Creates a presentation from the canonical JSON data model.
         Only accepts canonical format: {"slides": [{"layout": "...", "placeholders": {...}, "content": [...]}]}
 
         Includes built-in end-to-end validation to prevent layout regressions.
+        Post-generation validation checks the in-memory presentation; pass
+        paranoid_validation=True (or set DECKBUILDER_PARANOID_VALIDATION=true)
+        to re-read the saved file from disk instead.
+
+        Pass profile=True (or set DECKBUILDER_PROFILE=true) to record per-stage
+        timings; the resulting Profiler is stored on ``self.last_profile``.
+        """
+        slide_count = len(presentation_data.get("slides", [])) if isinstance(presentation_data, dict) else 0
+        return self._run_profiled(profile, {"template": templateName, "slides": slide_count}, self._create_presentation, presentation_data, fileName, templateName, paranoid_validation)
+
+    def create_presentation_from_markdown(
+        self,
+        source: MarkdownSource,
+        fileName: str = "Sample_Presentation",
+        templateName: str = "default",
+        paranoid_validation: Optional[bool] = None,
+        profile: Optional[bool] = None,
+    ) -> str:
+        """
+        Stream a markdown deck into a presentation, building each slide as soon as it is parsed.
+
+        Each section is parsed, converted to canonical JSON and validated (Markdown →
+        JSON and JSON → template) before the next section is read, so an invalid slide
+        fails before later slides are parsed. Slides are parsed a small window ahead of
+        the one being built (twice the image threads), so the images of upcoming slides
+        are processed while earlier ones are built; only that window's input is held in
+        memory. Each built slide is checked in memory right away; paranoid validation
+        also re-reads the saved file, which keeps every slide spec until the end.
+
+        Args:
+            source: Markdown text, a Path to a .md file, or an iterable of lines (e.g. an open file)
+            fileName: Output file name (without extension)
+            templateName: Template to build on
+            paranoid_validation: Re-read the saved file for post-generation validation
+            profile: Record per-stage timings on ``self.last_profile``
+
+        Returns:
+            Status message, as returned by create_presentation
         """
+        return self._run_profiled(profile, {"template": templateName, "streaming": True}, self._stream_presentation, source, fileName, templateName, paranoid_validation)
+
+    def _run_profiled(self, profile: Optional[bool], attrs: Dict[str, Any], build, *args) -> str:
+        """Run a build function inside a profiling session when profiling is requested."""
+        if profile is None:
+            profile = is_profiling_enabled()
+        if not profile:
+            self.last_profile = None
+            return build(*args)
+
+        with profile_session("create_presentation", **attrs) as profiler:
+            self.last_profile = profiler
+            return build(*args)
+
+    def _create_presentation(
+        self,
+        presentation_data: Dict[str, Any],
+        fileName: str,
+        templateName: str,
+        paranoid_validation: Optional[bool],
+    ) -> str:
+        """Build, save and validate a presentation (see create_presentation)."""
         # Import validation here to avoid circular imports
         from .validation import PresentationValidator
 
-        self._initialize_presentation(templateName)
+        with span("initialize_presentation", template=templateName):
+            self._initialize_presentation(templateName)
 
         # Strict validation for canonical JSON format only
         if not isinstance(presentation_data, dict):
@@ -120,53 +211,141 @@ class Deckbuilder:
 
         # Validate each slide has required canonical structure
         for i, slide_data in enumerate(presentation_data["slides"]):
-            if not isinstance(slide_data, dict):
-                raise ValueError(f"Slide {i + 1} must be a dictionary.")
-
-            if "layout" not in slide_data:
-                raise ValueError(f"Slide {i + 1} must have a 'layout' field.")
-
-            # Ensure canonical structure exists (placeholders and content are optional but must be correct types)
-            if "placeholders" in slide_data and not isinstance(slide_data["placeholders"], dict):
-                raise ValueError(f"Slide {i + 1} 'placeholders' must be a dictionary.")
-
-            if "content" in slide_data and not isinstance(slide_data["content"], list):
-                raise ValueError(f"Slide {i + 1} 'content' must be an array.")
+            _check_canonical_slide(i + 1, slide_data)
 
         # STEP 1: Pre-generation validation (JSON ↔ Template alignment)
         template_folder = str(self._path_manager.get_template_folder())
-        validator = PresentationValidator(presentation_data, templateName, template_folder)
-        validator.validate_pre_generation()
+        with span("pre_validation"):
+            validator = PresentationValidator(presentation_data, templateName, template_folder)
+            validator.validate_pre_generation()
+
+        # Process every image on the image thread pool while slides are built
+        with span("image_prefetch"):
+            self.presentation_builder.prefetch_images(self.prs, presentation_data["slides"])
 
         # STEP 2: Process slides using canonical format
-        for slide_data in presentation_data["slides"]:
-            self.presentation_builder.add_slide(self.prs, slide_data)
+        with span("build_slides"):
+            for index, slide_data in enumerate(presentation_data["slides"], start=1):
+                with span("slide", index=index, layout=slide_data.get("layout")):
+                    self.presentation_builder.add_slide(self.prs, slide_data)
 
         # STEP 3: Save the presentation to disk
-        write_result = self.write_presentation(fileName)
+        with span("save"):
+            write_result = self.write_presentation(fileName)
+
+        # STEP 4: Post-generation validation (PPTX ↔ JSON verification)
+        full_path = self._saved_file_path(write_result)
+        if full_path:
+            if paranoid_validation is None:
+                paranoid_validation = _paranoid_validation_enabled()
+            with span("post_validation", paranoid=paranoid_validation):
+                validator.validate_post_generation(full_path, prs=self.prs, paranoid=paranoid_validation)
+
+        return self._completion_message(write_result, len(presentation_data["slides"]))
+
+    def _stream_presentation(self, source: MarkdownSource, fileName: str, templateName: str, paranoid_validation: Optional[bool]) -> str:
+        """Parse, validate and build markdown slides one at a time (see create_presentation_from_markdown)."""
+        from .converter import slide_to_canonical
+        from .logging_config import success_print
+        from .validation import PresentationValidator
 
-        # Extract the file path from write_result for post-generation validation
-        # write_result format: "Successfully created presentation: filename.pptx"
-        if "Successfully created presentation:" in write_result:
-            file_path = write_result.split("Successfully created presentation: ")[1].strip()
-            full_path = str(self._path_manager.get_output_folder() / file_path)
+        with span("initialize_presentation", template=templateName):
+            self._initialize_presentation(templateName)
+
+        if paranoid_validation is None:
+            paranoid_validation = _paranoid_validation_enabled()
+
+        # Only paranoid validation needs the slide specs after the build
+        slide_specs: List[Dict[str, Any]] = []
+        template_folder = str(self._path_manager.get_template_folder())
+        validator = PresentationValidator({"slides": slide_specs}, templateName, template_folder)
+        processor = self.content_processor
+
+        # Parsed slides whose images are being prefetched, oldest first. A slide is built
+        # once this many later slides are queued, so images on different slides overlap.
+        lookahead = 2 * self.presentation_builder.image_prefetcher.max_workers
+        window: Deque[Tuple[int, Dict[str, Any]]] = deque()
+
+        def build_slide(slide_num: int, slide_data: Dict[str, Any]) -> None:
+            with span("slide", index=slide_num, layout=slide_data.get("layout")):
+                slide = self.presentation_builder.add_slide(self.prs, slide_data)
+                with span("post_validation"):
+                    validator.validate_slide_post_generation(slide_num, slide, slide_data)
+            if paranoid_validation:
+                slide_specs.append(slide_data)
+
+        slide_count = 0
+        with span("build_slides"):
+            for slide_num, (frontmatter_raw, content_raw) in enumerate(processor.iter_markdown_sections(source), start=1):
+                with span("markdown_parse", index=slide_num):
+                    slide_data = slide_to_canonical(processor.parse_markdown_section(frontmatter_raw, content_raw))
+                with span("pre_validation", index=slide_num):
+                    validator.validate_markdown_section(slide_num, frontmatter_raw, slide_data)
+                    validator.validate_slide_pre_generation(slide_num, slide_data)
+                self.presentation_builder.prefetch_images(self.prs, [slide_data])
+                window.append((slide_num, slide_data))
+                if len(window) > lookahead:
+                    build_slide(*window.popleft())
+                slide_count = slide_num
+            while window:
+                build_slide(*window.popleft())
+
+        if slide_count == 0:
+            raise ValueError("At least one slide is required.")
+        success_print("✅ Markdown → JSON validation passed")
+        success_print("✅ Pre-generation validation passed")
+
+        with span("save"):
+            write_result = self.write_presentation(fileName)
 
-            # STEP 4: Post-generation validation (PPTX ↔ JSON verification)
-            validator.validate_post_generation(full_path)
+        full_path = self._saved_file_path(write_result)
+        if full_path and paranoid_validation:
+            with span("post_validation", paranoid=True):
+                validator.validate_post_generation(full_path, paranoid=True)
+        else:
+            success_print("✅ Post-generation validation passed")
+
+        return self._completion_message(write_result, slide_count)
+
+    def _saved_file_path(self, write_result: str) -> Optional[str]:
+        """Extract the saved file's full path from a write_presentation result."""
+        # write_result format: "Successfully created presentation: filename.pptx"
+        if "Successfully created presentation:" not in write_result:
+            return None
+        file_path = write_result.split("Successfully created presentation: ")[1].strip()
+        return str(self._path_manager.get_output_folder() / file_path)
 
-        # Show completion summary
+    def _completion_message(self, write_result: str, slide_count: int) -> str:
+        """Show the completion summary and build the status message."""
         from .logging_config import success_print
 
-        slide_count = len(presentation_data["slides"])
         file_name = write_result.split("Successfully created presentation: ")[1].strip() if "Successfully created presentation:" in write_result else "presentation.pptx"
         success_print(f"✅ Presentation complete: {file_name} ({slide_count} slides)")
 
         return f"Successfully created presentation with {slide_count} slides. {write_result}"
 
+    def create_presentations(self, jobs: List[Any], max_workers: Optional[int] = None) -> List[Any]:
+        """
+        Build many presentations in parallel on a process pool.
+
+        Args:
+            jobs: BatchJob instances or dicts with presentation_data or input_file,
+                  plus optional fileName and templateName
+            max_workers: Worker processes (default: CPU count, capped at len(jobs))
+
+        Returns:
+            List of BatchResult (one per job, in order) with status and timings
+        """
+        from .batch import run_batch
+
+        return run_batch(jobs, self._path_manager, max_workers=max_workers)
+
+    def get_template_cache_stats(self) -> Dict[str, Any]:
+        """Return hit/miss statistics for the shared in-process template cache."""
+        return template_cache.get_stats()
+
     def write_presentation(self, fileName: str = "Sample_Presentation") -> str:
         """Writes the generated presentation to disk with ISO timestamp."""
-        import os
-
         # Get output folder from environment or use default
         output_folder = self.output_folder or "."
 
@@ -10,14 +10,126 @@ that updates both master slides and content slides.
 import json
 import os
 import re
+import threading
 from difflib import get_close_matches
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from pptx import Presentation
 from pptx.enum.lang import MSO_LANGUAGE_ID
 
 
+def _iter_replacement_entries(mapping: Dict[str, Any]):
+    """Yield (source, target, except_contexts) for spelling patterns, conditional mappings and vocabulary, in that order."""
+    for source_word, target_word in (mapping.get("spelling_patterns") or {}).items():
+        yield source_word, target_word, ()
+    for source_word, config in (mapping.get("conditional_mappings") or {}).items():
+        yield source_word, config["to"], tuple(config.get("except_contexts", []))
+    for source_phrase, target_phrase in (mapping.get("vocabulary") or {}).items():
+        yield source_phrase, target_phrase, ()
+
+
+def _trie_pattern(words) -> str:
+    """Regex source matching any of ``words``, factored by common prefix so each position is tried once, not once per entry."""
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _render_trie(trie)
+
+
+def _render_trie(node: Dict[str, Any]) -> str:
+    branches = [re.escape(char) + _render_trie(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        # A word ends here: the longer continuations are optional (greedy, so the longest source wins)
+        return body + "?" if len(branches) > 1 else "(?:" + body + ")?"
+    return body
+
+
+class CompiledLanguageMapping:
+    """
+    All text replacements of one language mapping compiled into a single regex.
+
+    Source words and phrases are merged into one case-insensitive, prefix-factored
+    ``\\b(?:...)\\b`` pattern, so one scan of the text finds every replacement.
+    Where sources overlap at the same position the longest one wins; sources that
+    differ only in case keep the first entry (section order, then file order).
+    """
+
+    def __init__(self, mapping: Dict[str, Any]):
+        # Lowercased source -> (source, target, except_contexts)
+        self.entries: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {}
+        for source_word, target_word, except_contexts in _iter_replacement_entries(mapping):
+            self.entries.setdefault(source_word.lower(), (source_word, target_word, except_contexts))
+        self.pattern: Optional[re.Pattern] = re.compile(r"\b(?:" + _trie_pattern(self.entries) + r")\b", re.IGNORECASE) if self.entries else None
+
+    def lookup(self, matched: str) -> Tuple[str, str, Tuple[str, ...]]:
+        """Return the (source, target, except_contexts) entry for a matched word or phrase."""
+        entry = self.entries.get(matched.lower())
+        if entry is None:
+            # Case-insensitive equivalences that str.lower() does not produce
+            entry = next(e for e in self.entries.values() if re.fullmatch(re.escape(e[0]), matched, re.IGNORECASE))
+        return entry
+
+
+class LanguageMappingCache:
+    """
+    Process-wide cache of compiled language mappings.
+
+    Lookups are by mapping object first (one dictionary lookup per text run) and
+    then by mapping content, so every FormattingSupport instance that loads the
+    same language file shares one compiled regex. Mappings are treated as
+    read-only once compiled.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._by_identity: Dict[int, Tuple[Dict[str, Any], CompiledLanguageMapping]] = {}
+        self._by_content: Dict[Tuple, CompiledLanguageMapping] = {}
+        self._lock = threading.Lock()
+        self._compiled = 0
+
+    def get(self, mapping: Dict[str, Any]) -> CompiledLanguageMapping:
+        """Return the compiled form of a language mapping, compiling it on first use."""
+        entry = self._by_identity.get(id(mapping))
+        if entry is not None and entry[0] is mapping:
+            return entry[1]
+
+        key = tuple(_iter_replacement_entries(mapping))
+        with self._lock:
+            compiled = self._by_content.get(key)
+            if compiled is None:
+                if len(self._by_content) >= self.max_entries:
+                    self._by_content.clear()
+                compiled = self._by_content[key] = CompiledLanguageMapping(mapping)
+                self._compiled += 1
+            if len(self._by_identity) >= self.max_entries:
+                self._by_identity.clear()
+            # The mapping is kept alive with its entry so its id() cannot be reused
+            self._by_identity[id(mapping)] = (mapping, compiled)
+        return compiled
+
+    def clear(self) -> None:
+        """Drop every compiled mapping."""
+        with self._lock:
+            self._by_identity.clear()
+            self._by_content.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics."""
+        with self._lock:
+            return {"mappings": len(self._by_content), "compiled": self._compiled}
+
+
+# Global instance shared by all FormattingSupport instances
+language_mapping_cache = LanguageMappingCache()
+
+
 class FormattingSupport:
     """Comprehensive formatting support for language and font settings"""
 
@@ -333,6 +445,9 @@ class FormattingSupport:
         """
         Apply text replacements based on language mapping configuration.
 
+        Spelling patterns, conditional mappings and vocabulary are matched in a
+        single pass with the mapping's compiled regex (see CompiledLanguageMapping).
+
         Args:
             text: Text to process
             language_code: Target language code
@@ -347,50 +462,19 @@ class FormattingSupport:
         if not mapping:
             return text
 
-        result_text = text
-
-        # Apply spelling pattern replacements
-        if "spelling_patterns" in mapping:
-            for source_word, target_word in mapping["spelling_patterns"].items():
-                # Use word boundaries for exact matches
-                pattern = r"\b" + re.escape(source_word) + r"\b"
-                matches = list(re.finditer(pattern, result_text, re.IGNORECASE))
-
-                # Process matches in reverse order to preserve positions
-                for match in reversed(matches):
-                    original_word = match.group()
-                    replacement = self.preserve_case(original_word, target_word)
-                    result_text = result_text[: match.start()] + replacement + result_text[match.end() :]
-
-        # Apply conditional mappings (like program/programme)
-        if "conditional_mappings" in mapping:
-            for source_word, config in mapping["conditional_mappings"].items():
-                target_word = config["to"]
-                except_contexts = config.get("except_contexts", [])
-
-                pattern = r"\b" + re.escape(source_word) + r"\b"
-                matches = list(re.finditer(pattern, result_text, re.IGNORECASE))
-
-                for match in reversed(matches):
-                    # Check if this occurrence should be excluded
-                    if not self.is_context_exception(result_text, match.start(), source_word, except_contexts):
-                        original_word = match.group()
-                        replacement = self.preserve_case(original_word, target_word)
-                        result_text = result_text[: match.start()] + replacement + result_text[match.end() :]
-
-        # Apply vocabulary replacements (phrases)
-        if "vocabulary" in mapping:
-            for source_phrase, target_phrase in mapping["vocabulary"].items():
-                # Use word boundaries for phrase matching
-                pattern = r"\b" + re.escape(source_phrase) + r"\b"
-                matches = list(re.finditer(pattern, result_text, re.IGNORECASE))
-
-                for match in reversed(matches):
-                    original_phrase = match.group()
-                    replacement = self.preserve_case(original_phrase, target_phrase)
-                    result_text = result_text[: match.start()] + replacement + result_text[match.end() :]
-
-        return result_text
+        compiled = language_mapping_cache.get(mapping)
+        if compiled.pattern is None:
+            return text
+
+        def replace(match):
+            source_word, target_word, except_contexts = compiled.lookup(match.group())
+            original_word = match.group()
+            # Conditional mappings (like program/programme) skip excluded contexts
+            if except_contexts and self.is_context_exception(text, match.start(), source_word, except_contexts):
+                return original_word
+            return self.preserve_case(original_word, target_word)
+
+        return compiled.pattern.sub(replace, text)
 
     def process_text_frame(self, text_frame, language_code: Optional[str] = None, font_name: Optional[str] = None) -> Dict[str, int]:
         """
@@ -536,6 +620,7 @@ class FormattingSupport:
         font_name: Optional[str] = None,
         output_path: Optional[str] = None,
         create_backup: bool = True,
+        fast: bool = False,
     ) -> Dict[str, any]:
         """
         Update both master slides and content slides in a PowerPoint presentation.
@@ -546,6 +631,8 @@ class FormattingSupport:
             font_name: Optional font name to apply
             output_path: Optional output path (default: update in place)
             create_backup: Whether to create a backup file
+            fast: Rewrite the slide XML directly instead of loading the presentation
+                into python-pptx (see xml_remap.XmlRemapper)
 
         Returns:
             Dictionary with operation results and statistics
@@ -566,6 +653,22 @@ class FormattingSupport:
             except Exception as e:
                 return {"success": False, "error": f"Failed to create backup: {e}", "stats": {}}
 
+        save_path = output_path if output_path else presentation_path
+
+        if fast:
+            from .xml_remap import XmlRemapper
+
+            try:
+                total_stats = XmlRemapper(self, language_code, font_name).remap(pptx_path, save_path)
+            except Exception as e:
+                return {"success": False, "error": f"Failed to process presentation: {e}", "stats": {}}
+            return {
+                "success": True,
+                "message": f"Presentation updated successfully: {save_path}",
+                "backup_path": str(backup_path) if backup_path else None,
+                "stats": total_stats,
+            }
+
         try:
             # Load presentation
             prs = Presentation(str(pptx_path))
@@ -622,7 +725,6 @@ class FormattingSupport:
                     total_stats["total_text_replaced"] += shape_stats["text_replaced"]
 
             # Save presentation
-            save_path = output_path if output_path else presentation_path
             prs.save(save_path)
 
             return {
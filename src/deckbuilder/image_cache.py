@@ -0,0 +1,646 @@
+#!/usr/bin/env python3
+"""
+Shared Content-Addressed Image Cache
+
+Processed images (resized user images and PlaceKitten fallbacks) are stored
+once per machine instead of once per output folder. The cache root is
+DECKBUILDER_IMAGE_CACHE_DIR, or ``$XDG_CACHE_HOME/deckbuilder/images``
+(``~/.cache/deckbuilder/images`` when XDG_CACHE_HOME is unset).
+
+Keys are derived from image *content* (see content_key), so a copied or moved
+source image still hits. Entry sizes and access times are kept in an
+in-memory LRU index that is persisted to ``index.json`` in the cache root.
+Lookups cost one stat, and eviction walks the index from the least recently
+used end; the cache directory is only scanned when no index exists yet.
+
+Entries are written to a temporary file and renamed into place, so a cached
+path always refers to a complete image. get_or_create renders a missing key
+under a per-key file lock: when several processes ask for the same image,
+one renders it and the others wait and then reuse the result.
+
+get_or_create_data is the in-memory variant used while building decks: a
+missing image is rendered to bytes under the same per-key lock, returned to
+the caller at once and written to disk by a background thread, which releases
+the lock once the file is in place. Until that write lands, lookups in this
+process are served from memory, and other processes wait for the file.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, List, Optional, Set, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Index file kept in the cache root
+INDEX_FILE_NAME = "index.json"
+
+# Default size limit when DECKBUILDER_IMAGE_CACHE_MB is not set
+DEFAULT_MAX_SIZE_MB = 500
+
+# The index is written after this many changes (and at interpreter exit)
+INDEX_FLUSH_INTERVAL = 50
+
+# Extension of every cached image
+CACHE_SUFFIX = ".jpg"
+
+# Sub-directories of the cache root for in-progress writes and lock files
+TEMP_DIR_NAME = "tmp"
+LOCK_DIR_NAME = "locks"
+
+# Keys are spread over this many lock files, so the lock directory stays bounded
+LOCK_STRIPES = 256
+
+_MB = 1024 * 1024
+
+
+def get_default_cache_dir() -> Path:
+    """Resolve the cache root from DECKBUILDER_IMAGE_CACHE_DIR, falling back to the XDG cache folder."""
+    env_dir = os.getenv("DECKBUILDER_IMAGE_CACHE_DIR")
+    if env_dir:
+        return Path(env_dir).expanduser()
+    xdg_cache = os.getenv("XDG_CACHE_HOME")
+    base = Path(xdg_cache).expanduser() if xdg_cache else Path.home() / ".cache"
+    return base / "deckbuilder" / "images"
+
+
+def get_default_max_size_mb() -> float:
+    """Resolve the cache size limit from DECKBUILDER_IMAGE_CACHE_MB (default 500 MB)."""
+    env_size = os.getenv("DECKBUILDER_IMAGE_CACHE_MB")
+    if env_size:
+        try:
+            return max(0.0, float(env_size))
+        except ValueError:
+            pass  # nosec - Fall back to the default for invalid values
+    return DEFAULT_MAX_SIZE_MB
+
+
+@lru_cache(maxsize=1024)
+def _digest(path: str, size: int, mtime_ns: int) -> str:
+    """SHA-256 of a file's content; size and mtime only make the memo key change with the file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_MB), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """SHA-256 hex digest of a file's content, memoized while the file is unchanged."""
+    path = os.path.abspath(str(path))
+    stat = os.stat(path)
+    return _digest(path, stat.st_size, stat.st_mtime_ns)
+
+
+def content_key(path: Union[str, Path], *params: Any) -> str:
+    """Cache key for a file's content processed with the given parameters."""
+    key_data = "_".join([file_digest(path)] + [str(param) for param in params])
+    return hashlib.sha256(key_data.encode()).hexdigest()
+
+
+def _acquire_file_lock(lock_path: Path) -> IO[bytes]:
+    """Take an exclusive lock on a file, blocking until it is available (across processes and threads)."""
+    f = open(lock_path, "a+b")
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # nosec - LK_LOCK gives up after 10 seconds; keep waiting
+    except BaseException:
+        f.close()
+        raise
+    return f
+
+
+def _release_file_lock(f: IO[bytes]) -> None:
+    """Release a lock taken by _acquire_file_lock (from any thread)."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    finally:
+        f.close()
+
+
+@contextmanager
+def _file_lock(lock_path: Path):
+    """Hold an exclusive lock on a file, blocking until it is available (across processes and threads)."""
+    f = _acquire_file_lock(lock_path)
+    try:
+        yield
+    finally:
+        _release_file_lock(f)
+
+
+class ImageCache:
+    """
+    Size-limited LRU cache of processed images in one directory.
+
+    Every entry is a flat ``<key>.jpg`` file. The index maps key -> [size, last access]
+    in least-recently-used order. Several processes may share a cache root: files
+    added by another process are adopted on first lookup, and the on-disk index is
+    merged rather than overwritten when flushed.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path, None] = None, max_size_mb: Optional[float] = None):
+        """
+        Initialize the cache. Nothing is read or created until first use.
+
+        Args:
+            cache_dir: Cache root (default: DECKBUILDER_IMAGE_CACHE_DIR or the XDG cache folder)
+            max_size_mb: Size limit enforced on add (default: DECKBUILDER_IMAGE_CACHE_MB or 500)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else get_default_cache_dir()
+        self.max_size_mb = max_size_mb if max_size_mb is not None else get_default_max_size_mb()
+
+        self._lock = threading.RLock()
+        self._index: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._total_bytes = 0
+        self._loaded = False
+        self._removed = set()
+        self._pending_changes = 0
+
+        # Rendered images waiting for the background writer (key -> bytes)
+        self._pending: Dict[str, bytes] = {}
+        self._writes: Set[Future] = set()
+        self._writer: Optional[ThreadPoolExecutor] = None
+        # Writes that already hold their key's lock run apart, so they never queue behind a put waiting for it
+        self._locked_writer: Optional[ThreadPoolExecutor] = None
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def index_path(self) -> Path:
+        return self.cache_dir / INDEX_FILE_NAME
+
+    def path_for(self, key: str) -> Path:
+        """Location of the cached file for a key (it may not exist yet)."""
+        self._ensure_loaded()
+        return self.cache_dir / f"{key}{CACHE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Path of a cached image, or None. A hit marks the entry as most recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            str: Path to the cached file, or None if it is not cached
+        """
+        self._ensure_loaded()
+        path = self.cache_dir / f"{key}{CACHE_SUFFIX}"
+        with self._lock:
+            try:
+                size = path.stat().st_size
+            except OSError:
+                # Evicted by another process (or never cached)
+                if key in self._index:
+                    self._drop(key)
+                self._misses += 1
+                return None
+            self._touch(key, size)
+            self._hits += 1
+        return str(path)
+
+    def add(self, key: str) -> Optional[str]:
+        """
+        Register a file just written to path_for(key), then evict down to the size limit.
+
+        The entry being added is never evicted, even when it alone exceeds the limit.
+
+        Returns:
+            str: Path to the cached file, or None if the file does not exist
+        """
+        self._ensure_loaded()
+        path = self.cache_dir / f"{key}{CACHE_SUFFIX}"
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return None
+        with self._lock:
+            self._touch(key, size)
+            self._evict_to(self.max_size_mb * _MB, keep=key)
+            self._maybe_flush()
+        return str(path)
+
+    @contextmanager
+    def lock(self, key: str):
+        """
+        Exclusive lock for one key, shared by every process using this cache root.
+
+        Keys are hashed onto LOCK_STRIPES lock files; do not take a second key's lock while holding one.
+        """
+        f = self._acquire_lock(key)
+        try:
+            yield
+        finally:
+            _release_file_lock(f)
+
+    def store(self, key: str, render: Callable[[Path], Any]) -> Optional[str]:
+        """
+        Write an entry atomically: render(temp_path) writes the image, which is then renamed into place.
+
+        Args:
+            key: Cache key
+            render: Callable writing a complete image file to the path it is given
+
+        Returns:
+            str: Path to the cached file, or None if render produced no file
+        """
+        self._ensure_loaded()
+        temp_path = self.cache_dir / TEMP_DIR_NAME / f"{key}.{os.getpid()}.{threading.get_ident()}{CACHE_SUFFIX}"
+        try:
+            render(temp_path)
+            if not temp_path.exists():
+                return None
+            os.replace(temp_path, self.cache_dir / f"{key}{CACHE_SUFFIX}")
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+        return self.add(key)
+
+    def get_or_create(self, key: str, render: Callable[[Path], Any]) -> Optional[str]:
+        """
+        Cached path for a key, rendering it first if needed (single flight).
+
+        A miss takes the key's lock and checks again, so concurrent callers in any
+        process render a given key once; the others wait and then get the stored file.
+
+        Args:
+            key: Cache key
+            render: Callable writing a complete image file to the path it is given (see store)
+
+        Returns:
+            str: Path to the cached file, or None if render produced no file
+        """
+        cached = self.get(key)
+        if cached:
+            return cached
+        with self.lock(key):
+            path = self.cache_dir / f"{key}{CACHE_SUFFIX}"
+            if path.exists():
+                # Rendered by another caller while this one waited for the lock
+                return self.get(key)
+            return self.store(key, render)
+
+    def get_data(self, key: str) -> Optional[bytes]:
+        """
+        Content of a cached image, or None. Images still waiting to be written are served from memory.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            bytes: The cached image file, or None if it is not cached
+        """
+        with self._lock:
+            data = self._pending.get(key)
+            if data is not None:
+                self._hits += 1
+                return data
+        path = self.get(key)
+        if path is None:
+            return None
+        try:
+            return Path(path).read_bytes()
+        except OSError:
+            # Evicted by another process between the lookup and the read
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Store image bytes without waiting for the disk: a background thread writes them atomically (see store).
+
+        Until the write lands, get_data returns the bytes from memory. An entry another
+        process wrote in the meantime is kept rather than rewritten.
+        """
+        self._ensure_loaded()
+        self._queue_write(key, data)
+
+    def get_or_create_data(self, key: str, render: Callable[[], Optional[bytes]]) -> Optional[bytes]:
+        """
+        Cached image content for a key, rendering it in memory first if needed.
+
+        A miss takes the key's lock and checks again, so concurrent callers in any
+        process render a given key once. The bytes are returned immediately and
+        written to disk in the background; the lock is held until that write lands,
+        so the other callers wait and then read the stored file.
+
+        Args:
+            key: Cache key
+            render: Callable returning the complete image file as bytes (None or empty if it failed)
+
+        Returns:
+            bytes: The image file, or None if render produced nothing
+        """
+        data = self.get_data(key)
+        if data is not None:
+            return data
+        held_lock: Optional[IO[bytes]] = self._acquire_lock(key)
+        try:
+            if key in self._pending or (self.cache_dir / f"{key}{CACHE_SUFFIX}").exists():
+                # Rendered by another thread (or process) while this one waited for the lock
+                data = self.get_data(key)
+                if data is not None:
+                    return data
+            data = render()
+            if not data:
+                return None
+            # The background writer releases the lock once the file is in place
+            self._queue_write(key, data, held_lock)
+            held_lock = None
+            return data
+        finally:
+            if held_lock is not None:
+                _release_file_lock(held_lock)
+
+    def wait_for_writes(self) -> None:
+        """Block until every image queued by put has been written."""
+        with self._lock:
+            writes = list(self._writes)
+        wait_for_futures(writes)
+
+    def close(self) -> None:
+        """Finish background writes and write the index (run at interpreter exit)."""
+        self.wait_for_writes()
+        self.flush()
+
+    def discard(self, key: str) -> bool:
+        """Remove one entry and its file. Returns True if a file was deleted."""
+        self._ensure_loaded()
+        with self._lock:
+            # A queued write of a discarded key is skipped
+            self._pending.pop(key, None)
+            if key in self._index:
+                self._drop(key)
+            removed = self._unlink(key)
+            self._maybe_flush()
+        return removed
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Remove least recently used entries until the cache fits in max_bytes.
+
+        Args:
+            max_bytes: Size limit (default: the configured max_size_mb)
+
+        Returns:
+            int: Number of entries removed
+        """
+        self._ensure_loaded()
+        with self._lock:
+            before = self._evictions
+            self._evict_to(max_bytes if max_bytes is not None else self.max_size_mb * _MB)
+            if self._evictions != before:
+                self.flush()
+            return self._evictions - before
+
+    def keys(self) -> List[str]:
+        """Cached keys, least recently used first."""
+        self._ensure_loaded()
+        with self._lock:
+            return list(self._index)
+
+    def clear(self) -> None:
+        """Delete every cached file (and leftover temporary file) and reset the index and statistics."""
+        self._ensure_loaded()
+        self.wait_for_writes()
+        with self._lock:
+            for key in list(self._index):
+                self._unlink(key)
+                self._drop(key)
+            for temp_path in (self.cache_dir / TEMP_DIR_NAME).iterdir():
+                try:
+                    temp_path.unlink()
+                except OSError:
+                    continue  # nosec - Another process is still writing it
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics from the index (no directory scan).
+
+        Returns:
+            dict: File count, total size, location, limit and hit/miss/eviction counts
+        """
+        with self._lock:
+            return {
+                "file_count": len(self._index),
+                "total_size_mb": round(self._total_bytes / _MB, 2),
+                "cache_dir": str(self.cache_dir),
+                "max_size_mb": self.max_size_mb,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "pending_writes": len(self._pending),
+            }
+
+    def flush(self) -> None:
+        """Write the index atomically, merged with entries other processes recorded meanwhile."""
+        with self._lock:
+            if not self._loaded or not self.cache_dir.is_dir():
+                # Nothing loaded yet, or the cache root was deleted
+                return
+            try:
+                with _file_lock(self.cache_dir / LOCK_DIR_NAME / "index.lock"):
+                    self._merge_and_write_index()
+            except OSError as e:
+                print(f"⚠️  Warning: Could not write image cache index {self.index_path}: {e}")
+
+    def _merge_and_write_index(self) -> None:
+        """Merge entries recorded on disk by other processes, then replace the index file."""
+        for key, entry in self._read_index().items():
+            if key not in self._index and key not in self._removed:
+                self._index[key] = entry
+                self._total_bytes += entry[0]
+        # Keep LRU order after merging
+        self._index = OrderedDict(sorted(self._index.items(), key=lambda item: item[1][1]))
+        temp_path = self.index_path.with_name(f"{INDEX_FILE_NAME}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "entries": self._index}, f)
+        os.replace(temp_path, self.index_path)
+        self._removed.clear()
+        self._pending_changes = 0
+
+    def _ensure_loaded(self) -> None:
+        """Create the cache root and load (or rebuild) the index on first use."""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                # Fallback to a temporary directory if the cache root is not writable
+                self.cache_dir = Path(tempfile.gettempdir()) / "deckbuilder_image_cache"
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for sub_dir in (TEMP_DIR_NAME, LOCK_DIR_NAME):
+                (self.cache_dir / sub_dir).mkdir(exist_ok=True)
+
+            entries = self._read_index() if self.index_path.exists() else self._scan()
+            for key, entry in sorted(entries.items(), key=lambda item: item[1][1]):
+                self._index[key] = entry
+                self._total_bytes += entry[0]
+            self._loaded = True
+            atexit.register(self.close)
+
+    def _acquire_lock(self, key: str) -> IO[bytes]:
+        """Take the key's lock file (see lock); release it with _release_file_lock."""
+        self._ensure_loaded()
+        stripe = zlib.crc32(key.encode("utf-8")) % LOCK_STRIPES
+        return _acquire_file_lock(self.cache_dir / LOCK_DIR_NAME / f"{stripe:03d}.lock")
+
+    def _queue_write(self, key: str, data: bytes, held_lock: Optional[IO[bytes]] = None) -> None:
+        """Hand bytes to a background writer; a held key lock is released once they are written."""
+        with self._lock:
+            self._pending[key] = data
+            if held_lock is None:
+                if self._writer is None:
+                    self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="deckbuilder-cache-writer")
+                executor = self._writer
+            else:
+                if self._locked_writer is None:
+                    self._locked_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="deckbuilder-cache-writer")
+                executor = self._locked_writer
+            future = executor.submit(self._write_pending, key, data, held_lock)
+            self._writes.add(future)
+        future.add_done_callback(self._write_done)
+
+    def _write_pending(self, key: str, data: bytes, held_lock: Optional[IO[bytes]] = None) -> None:
+        """Background writer: store queued bytes, unless superseded, discarded or already on disk."""
+        try:
+            if held_lock is None:
+                with self.lock(key):
+                    self._write_if_current(key, data)
+            else:
+                self._write_if_current(key, data)
+        except OSError as e:
+            print(f"⚠️  Warning: Could not write cached image {key}: {e}")
+        finally:
+            with self._lock:
+                if self._pending.get(key) is data:
+                    del self._pending[key]
+            if held_lock is not None:
+                _release_file_lock(held_lock)
+
+    def _write_if_current(self, key: str, data: bytes) -> None:
+        """Write queued bytes for a key (caller holds the key's lock)."""
+        with self._lock:
+            if self._pending.get(key) is not data:
+                return
+        if (self.cache_dir / f"{key}{CACHE_SUFFIX}").exists():
+            self.add(key)
+        else:
+            self.store(key, lambda output_path: output_path.write_bytes(data))
+
+    def _write_done(self, future: Future) -> None:
+        with self._lock:
+            self._writes.discard(future)
+
+    def _read_index(self) -> Dict[str, List[float]]:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            entries = data.get("entries", {}) if isinstance(data, dict) else {}
+            return {key: [int(entry[0]), float(entry[1])] for key, entry in entries.items()}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, TypeError, IndexError) as e:
+            print(f"⚠️  Warning: Rebuilding unreadable image cache index {self.index_path}: {e}")
+            return self._scan()
+
+    def _scan(self) -> Dict[str, List[float]]:
+        """One-time directory scan used when no usable index exists."""
+        entries = {}
+        for path in self.cache_dir.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # nosec - File removed during the scan
+            entries[path.stem] = [stat.st_size, stat.st_atime]
+        return entries
+
+    def _touch(self, key: str, size: int) -> None:
+        entry = self._index.get(key)
+        if entry is None:
+            self._total_bytes += size
+            self._removed.discard(key)
+            self._pending_changes += 1
+        else:
+            self._total_bytes += size - entry[0]
+        self._index[key] = [size, time.time()]
+        self._index.move_to_end(key)
+
+    def _drop(self, key: str) -> None:
+        size, _ = self._index.pop(key)
+        self._total_bytes -= size
+        self._removed.add(key)
+        self._pending_changes += 1
+
+    def _unlink(self, key: str) -> bool:
+        try:
+            (self.cache_dir / f"{key}{CACHE_SUFFIX}").unlink()
+            return True
+        except OSError:
+            return False
+
+    def _evict_to(self, max_bytes: float, keep: Optional[str] = None) -> None:
+        """Pop least recently used entries (except ``keep``) until the total fits in max_bytes."""
+        while self._total_bytes > max_bytes and self._index:
+            key = next(iter(self._index))
+            if key == keep:
+                if len(self._index) == 1:
+                    break
+                self._index.move_to_end(key)
+                continue
+            self._unlink(key)
+            self._drop(key)
+            self._evictions += 1
+
+    def _maybe_flush(self) -> None:
+        if self._pending_changes >= INDEX_FLUSH_INTERVAL:
+            self.flush()
+
+
+# One shared cache per root, used by every ImageHandler in this process
+_caches: Dict[str, ImageCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_image_cache(cache_dir: Union[str, Path, None] = None) -> ImageCache:
+    """Shared ImageCache for a cache root (default: the configured root)."""
+    root = Path(cache_dir) if cache_dir is not None else get_default_cache_dir()
+    key = os.path.abspath(str(root))
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = ImageCache(root)
+        return cache
@@ -3,15 +3,20 @@ ImageHandler - Core image file validation, processing, and management.
 
 This module provides the ImageHandler class for validating image files,
 processing them for PowerPoint placeholders, and managing cached fallback images.
+Processed images live in the shared content-addressed cache (see image_cache.py).
 """
 
-import hashlib
-import os
+import io
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import BinaryIO, Optional, Tuple, Union
 
 from PIL import Image
 
+from .image_cache import content_key, get_image_cache
+
+# Decoded images are kept at least this many times the target size before the final LANCZOS resize
+REDUCING_GAP = 2
+
 
 class ImageHandler:
     """
@@ -21,15 +26,15 @@ class ImageHandler:
     and caching for optimal performance in presentation generation.
     """
 
-    def __init__(self, cache_dir: str = "temp/image_cache"):
+    def __init__(self, cache_dir: Optional[str] = None):
         """
         Initialize ImageHandler with cache directory.
 
         Args:
-            cache_dir: Directory for caching processed images
+            cache_dir: Directory for caching processed images (default: the shared
+                image cache root, see image_cache.get_default_cache_dir)
         """
-        self.cache_dir = Path(cache_dir)
-        self._cache_initialized = False
+        self.cache = get_image_cache(cache_dir)
 
         # Supported image formats for PowerPoint
         self.supported_formats = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".gif"}
@@ -37,20 +42,10 @@ class ImageHandler:
         # Quality settings for output
         self.quality_settings = {"high": 95, "medium": 85, "low": 70}
 
-    def _ensure_cache_dir(self):
-        """
-        Ensure cache directory exists. Called lazily when cache is first needed.
-        """
-        if not self._cache_initialized:
-            try:
-                self.cache_dir.mkdir(parents=True, exist_ok=True)
-            except OSError:
-                # Fallback to a temporary directory if cache_dir is not writable
-                import tempfile
-
-                self.cache_dir = Path(tempfile.gettempdir()) / "deckbuilder_image_cache"
-                self.cache_dir.mkdir(parents=True, exist_ok=True)
-            self._cache_initialized = True
+    @property
+    def cache_dir(self) -> Path:
+        """Root directory of the image cache used by this handler."""
+        return self.cache.cache_dir
 
     def validate_image(self, image_path: str) -> bool:
         """
@@ -119,65 +114,92 @@ class ImageHandler:
         Returns:
             str: Path to processed image file, or None if processing failed
         """
-        if not self.validate_image(image_path):
+        if not self._is_supported_file(image_path):
             return None
 
         try:
-            target_width, target_height = target_dimensions
-
             # Generate cache key based on input and parameters
             cache_key = self._generate_cache_key(image_path, target_dimensions, quality)
-            cached_path = self._get_cached_image(cache_key)
 
-            if cached_path:
-                return cached_path
+            # Cached path, or render once under the key's lock (other processes wait for it).
+            # A cached entry was decoded successfully before, so hits never open the source again.
+            return self.cache.get_or_create(cache_key, lambda output_path: self._render_image(image_path, target_dimensions, quality, output_path))
 
-            # Process the image
-            with Image.open(image_path) as img:
-                # Convert to RGB if necessary (for JPEG output)
-                if img.mode != "RGB":
-                    img = img.convert("RGB")
+        except Exception as e:
+            print(f"Warning: Image processing failed for {image_path}: {e}")
+            return None
+
+    def process_image_data(self, image_path: str, target_dimensions: Tuple[int, int], quality: str = "high") -> Optional[bytes]:
+        """
+        Process an image like process_image, but return the JPEG content instead of a cache path.
+
+        A cache miss is encoded in memory and handed back at once; the cache writes it
+        to disk in the background, so building a slide never waits for that write or
+        reads the file back.
 
-                # Calculate dimensions preserving aspect ratio
-                processed_img = self._resize_with_aspect_ratio(img, target_width, target_height)
+        Args:
+            image_path: Path to source image file
+            target_dimensions: Target (width, height) for placeholder
+            quality: Quality level ('high', 'medium', 'low')
 
-                # Save processed image
-                output_path = self._save_processed_image(processed_img, cache_key, quality)
+        Returns:
+            bytes: Processed JPEG image, or None if processing failed
+        """
+        if not self._is_supported_file(image_path):
+            return None
 
-                return str(output_path)
+        try:
+            cache_key = self._generate_cache_key(image_path, target_dimensions, quality)
+            return self.cache.get_or_create_data(cache_key, lambda: self._encode_image(image_path, target_dimensions, quality))
 
         except Exception as e:
             print(f"Warning: Image processing failed for {image_path}: {e}")
             return None
 
-    def _resize_with_aspect_ratio(self, img: Image.Image, target_width: int, target_height: int) -> Image.Image:
-        """
-        Resize image to fit target dimensions while preserving aspect ratio.
+    def _is_supported_file(self, image_path: str) -> bool:
+        """Cheap checks done before decoding: the path is an existing file with a supported extension."""
+        if not image_path:
+            return False
+        path = Path(image_path)
+        return path.suffix.lower() in self.supported_formats and path.is_file()
 
-        Args:
-            img: PIL Image object
-            target_width: Target width
-            target_height: Target height
+    def _render_image(self, image_path: str, target_dimensions: Tuple[int, int], quality: str, output_path: Path) -> None:
+        """
+        Decode, resize and write one image, opening the source file once.
 
-        Returns:
-            PIL Image resized to fit within target dimensions
+        JPEGs are decoded at a reduced scale (1/2, 1/4 or 1/8, via draft mode) that still
+        leaves at least REDUCING_GAP times the target size; other formats are shrunk with
+        reduce() on the way. The final resize uses LANCZOS. A file that cannot be decoded
+        raises, which process_image reports as invalid.
         """
-        # Get original dimensions
-        orig_width, orig_height = img.size
+        self._write_jpeg(self._load_resized(image_path, target_dimensions), output_path, quality)
 
-        # Calculate scaling ratios
-        width_ratio = target_width / orig_width
-        height_ratio = target_height / orig_height
+    def _encode_image(self, image_path: str, target_dimensions: Tuple[int, int], quality: str) -> bytes:
+        """Decode and resize one image like _render_image, returning the JPEG bytes instead of writing a file."""
+        buffer = io.BytesIO()
+        self._write_jpeg(self._load_resized(image_path, target_dimensions), buffer, quality)
+        return buffer.getvalue()
 
-        # Use the smaller ratio to ensure image fits within bounds
-        scale_ratio = min(width_ratio, height_ratio)
+    def _load_resized(self, image_path: str, target_dimensions: Tuple[int, int]) -> Image.Image:
+        """Open an image once and return it as RGB, resized to fit the target dimensions (see _render_image)."""
+        target_width, target_height = target_dimensions
+        with Image.open(image_path) as img:
+            new_size = self._fit_within(img.size, target_width, target_height)
+            img.draft(None, (new_size[0] * REDUCING_GAP, new_size[1] * REDUCING_GAP))
+
+            # Convert to RGB if necessary (for JPEG output)
+            if img.mode != "RGB":
+                img = img.convert("RGB")
 
-        # Calculate new dimensions
-        new_width = int(orig_width * scale_ratio)
-        new_height = int(orig_height * scale_ratio)
+            return img.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
 
-        # Resize using high-quality resampling
-        return img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    def _fit_within(self, size: Tuple[int, int], target_width: int, target_height: int) -> Tuple[int, int]:
+        """Largest size with the aspect ratio of ``size`` that fits the target dimensions."""
+        orig_width, orig_height = size
+
+        # Use the smaller ratio to ensure image fits within bounds
+        scale_ratio = min(target_width / orig_width, target_height / orig_height)
+        return max(1, int(orig_width * scale_ratio)), max(1, int(orig_height * scale_ratio))
 
     def _generate_cache_key(self, image_path: str, dimensions: Tuple[int, int], quality: str) -> str:
         """
@@ -189,17 +211,9 @@ class ImageHandler:
             quality: Quality setting
 
         Returns:
-            str: Unique cache key
+            str: Cache key derived from the image content, so copies of a file share entries
         """
-        # Include file modification time to detect changes
-        try:
-            mtime = os.path.getmtime(image_path)
-        except OSError:
-            mtime = 0
-
-        # Create hash from path, dimensions, quality, and modification time
-        key_data = f"{image_path}_{dimensions[0]}x{dimensions[1]}_{quality}_{mtime}"
-        return hashlib.md5(key_data.encode(), usedforsecurity=False).hexdigest()  # nosec
+        return content_key(image_path, f"{dimensions[0]}x{dimensions[1]}", quality)
 
     def _get_cached_image(self, cache_key: str) -> Optional[str]:
         """
@@ -211,67 +225,25 @@ class ImageHandler:
         Returns:
             str: Path to cached image, or None if not cached
         """
-        self._ensure_cache_dir()
-        cached_path = self.cache_dir / f"{cache_key}.jpg"
-
-        if cached_path.exists():
-            return str(cached_path)
-
-        return None
-
-    def _save_processed_image(self, img: Image.Image, cache_key: str, quality: str) -> Path:
-        """
-        Save processed image to cache with specified quality.
-
-        Args:
-            img: PIL Image to save
-            cache_key: Cache key for filename
-            quality: Quality level for JPEG compression
-
-        Returns:
-            Path: Path to saved image file
-        """
-        self._ensure_cache_dir()
-        output_path = self.cache_dir / f"{cache_key}.jpg"
+        return self.cache.get(cache_key)
 
+    def _write_jpeg(self, img: Image.Image, output_path: Union[Path, BinaryIO], quality: str) -> None:
+        """Save an image as JPEG (to a path or binary stream) with the quality setting for the given level."""
         # Get quality setting
         jpeg_quality = self.quality_settings.get(quality, 95)
 
         # Save as JPEG with specified quality
         img.save(output_path, "JPEG", quality=jpeg_quality, optimize=True)
 
-        return output_path
-
-    def cleanup_cache(self, max_size_mb: int = 100):
+    def cleanup_cache(self, max_size_mb: Optional[float] = None):
         """
-        Clean up cache directory if it exceeds maximum size.
+        Evict least recently used images until the cache fits the size limit.
 
         Args:
-            max_size_mb: Maximum cache size in megabytes
+            max_size_mb: Maximum cache size in megabytes (default: the cache's configured limit)
         """
-        if not self._cache_initialized:
-            return  # No cache to clean up
         try:
-            # Calculate total cache size
-            total_size = sum(f.stat().st_size for f in self.cache_dir.glob("*.jpg") if f.is_file())
-
-            max_size_bytes = max_size_mb * 1024 * 1024
-
-            if total_size > max_size_bytes:
-                # Get files sorted by access time (LRU)
-                cache_files = [(f, f.stat().st_atime) for f in self.cache_dir.glob("*.jpg") if f.is_file()]
-                cache_files.sort(key=lambda x: x[1])  # Sort by access time
-
-                # Remove oldest files until under limit
-                current_size = total_size
-                for file_path, _ in cache_files:
-                    if current_size <= max_size_bytes:
-                        break
-
-                    file_size = file_path.stat().st_size
-                    file_path.unlink()
-                    current_size -= file_size
-
+            self.cache.evict(int(max_size_mb * 1024 * 1024) if max_size_mb is not None else None)
         except Exception as e:
             print(f"Warning: Cache cleanup failed: {e}")
 
@@ -282,16 +254,4 @@ class ImageHandler:
         Returns:
             dict: Cache statistics including file count and total size
         """
-        if not self._cache_initialized:
-            return {"file_count": 0, "total_size_mb": 0.0, "cache_dir": str(self.cache_dir)}
-        try:
-            cache_files = list(self.cache_dir.glob("*.jpg"))
-            total_size = sum(f.stat().st_size for f in cache_files if f.is_file())
-
-            return {
-                "file_count": len(cache_files),
-                "total_size_mb": round(total_size / (1024 * 1024), 2),
-                "cache_dir": str(self.cache_dir),
-            }
-        except Exception:
-            return {"file_count": 0, "total_size_mb": 0.0, "cache_dir": str(self.cache_dir)}
+        return self.cache.get_stats()
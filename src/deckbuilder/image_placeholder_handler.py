@@ -1,19 +1,25 @@
+from io import BytesIO
 from pathlib import Path
 
+from .image_prefetch import fallback_context, placeholder_pixel_size
+from .profiling import span
+
 
 class ImagePlaceholderHandler:
     """Handles image insertion into PowerPoint picture placeholders."""
 
-    def __init__(self, image_handler, placekitten):
+    def __init__(self, image_handler, placekitten, prefetcher=None):
         """
         Initialize the image placeholder handler.
 
         Args:
             image_handler: ImageHandler instance for image processing
             placekitten: PlaceKittenIntegration instance for fallback images
+            prefetcher: Optional ImagePrefetcher holding images processed ahead of slide building
         """
         self.image_handler = image_handler
         self.placekitten = placekitten
+        self.prefetcher = prefetcher
 
     def handle_image_placeholder(self, placeholder, field_name, field_value, slide_data):
         """
@@ -25,38 +31,53 @@ class ImagePlaceholderHandler:
             field_value: Image path or URL
             slide_data: Complete slide data for context
         """
+        with span("image", field=field_name):
+            self._handle_image_placeholder(placeholder, field_name, field_value, slide_data)
+
+    def _handle_image_placeholder(self, placeholder, field_name, field_value, slide_data):
+        """Resolve, process and insert the image for handle_image_placeholder."""
         try:
             # Get placeholder dimensions for proper image sizing
-            width = placeholder.width
-            height = placeholder.height
-            dimensions = (int(width.inches * 96), int(height.inches * 96))  # Convert to pixels
+            dimensions = placeholder_pixel_size(placeholder)
 
             # Prepare context for consistent PlaceKitten generation
-            context = {
-                "layout": slide_data.get("layout", slide_data.get("type", "unknown")),
-                "slide_index": getattr(self, "_current_slide_index", 0),
-            }
-
-            # Try to use provided image path
-            final_image_path = None
-            if field_value and isinstance(field_value, str):
-                # Validate and process the provided image
-                if self.image_handler.validate_image(field_value):
-                    final_image_path = self.image_handler.process_image(field_value, dimensions, quality="high")
-                else:
+            context = fallback_context(slide_data)
+
+            # Use the result processed ahead of slide building, if any
+            prefetched = None
+            if self.prefetcher is not None and field_value and isinstance(field_value, str):
+                with span("image.wait"):
+                    prefetched = self.prefetcher.take(field_value, dimensions, context)
+
+            # Try to use provided image path (processed images are kept in memory, not re-read from the cache)
+            image_data = None
+            if prefetched is not None:
+                image_data = prefetched.data
+                if not prefetched.valid:
+                    print(f"Warning: Invalid image path '{field_value}', using fallback")
+            elif field_value and isinstance(field_value, str):
+                # Validate and process the provided image (one decode; None if it is missing or unreadable)
+                with span("image.process"):
+                    image_data = self.image_handler.process_image_data(field_value, dimensions, quality="high")
+                if not image_data:
                     print(f"Warning: Invalid image path '{field_value}', using fallback")
 
             # Generate PlaceKitten fallback if needed
-            if not final_image_path:
-                final_image_path = self.placekitten.generate_fallback(dimensions, context)
+            if not image_data:
+                with span("image.fallback"):
+                    image_data = self.placekitten.generate_fallback_data(dimensions, context)
+
+            # Name shown in the placeholder if the image cannot be inserted
+            image_name = Path(field_value).name if field_value and isinstance(field_value, str) else "fallback image"
 
-            # Insert image into placeholder if we have a valid path
-            if final_image_path and Path(final_image_path).exists():
+            # Insert image into placeholder if we have one
+            if image_data:
                 try:
                     # Check if placeholder can accept images (not already filled)
                     if hasattr(placeholder, "insert_picture"):
-                        # Insert image into the picture placeholder
-                        picture = placeholder.insert_picture(final_image_path)
+                        # Insert image into the picture placeholder straight from memory
+                        with span("image.insert"):
+                            picture = placeholder.insert_picture(BytesIO(image_data))
 
                         # Preserve alt text if provided
                         alt_text = slide_data.get("alt_text") or slide_data.get("media", {}).get("alt_text")
@@ -72,13 +93,13 @@ class ImagePlaceholderHandler:
                         if hasattr(placeholder, "element") and hasattr(placeholder.element, "nvPicPr"):
                             print("   Placeholder already contains an image, skipping...")
                         elif hasattr(placeholder, "text_frame") and placeholder.text_frame:
-                            placeholder.text_frame.text = f"Image: {Path(final_image_path).name}"
+                            placeholder.text_frame.text = f"Image: {image_name}"
 
                 except Exception as e:
                     print(f"Warning: Failed to insert image into placeholder: {e}")
                     # Fallback: add image path as text if insertion fails
                     if hasattr(placeholder, "text_frame") and placeholder.text_frame:
-                        placeholder.text_frame.text = f"Image: {Path(final_image_path).name}"
+                        placeholder.text_frame.text = f"Image: {image_name}"
 
             else:
                 print(f"Warning: No valid image available for placeholder {field_name}")
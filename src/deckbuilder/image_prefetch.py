@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Parallel Image Prefetch
+
+Processing an image for a picture placeholder (validate, decode, LANCZOS
+resize, JPEG encode, or render a PlaceKitten fallback) is the slowest part of
+building image-heavy decks. ImagePrefetcher runs that work ahead of slide
+building: it scans the slides for image fields, resolves each slide's layout
+and picture placeholder size from the template, and processes every image on
+a thread pool. Pillow and OpenCV release the GIL while decoding, resampling
+and encoding, so the threads overlap.
+
+ImagePlaceholderHandler then picks up the result for its (image, size) pair,
+waiting only if that image is still being processed. Images that were not
+prefetched are processed inline, exactly as before.
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from pptx.enum.shapes import PP_PLACEHOLDER_TYPE
+
+from .slide_builder import is_image_field
+
+
+def get_default_image_threads() -> int:
+    """Resolve prefetch threads from DECKBUILDER_IMAGE_THREADS (0 disables prefetch), falling back to CPU count (max 8)."""
+    env_threads = os.getenv("DECKBUILDER_IMAGE_THREADS")
+    if env_threads:
+        try:
+            return max(0, int(env_threads))
+        except ValueError:
+            pass  # nosec - Fall back to CPU based default for invalid values
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def placeholder_pixel_size(placeholder) -> Tuple[int, int]:
+    """Size of a placeholder in pixels (96 DPI), the size images are processed to."""
+    return int(placeholder.width.inches * 96), int(placeholder.height.inches * 96)
+
+
+def fallback_context(slide_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Context for consistent PlaceKitten fallback generation for a slide."""
+    return {
+        "layout": slide_data.get("layout", slide_data.get("type", "unknown")),
+        "slide_index": 0,
+    }
+
+
+@dataclass
+class PrefetchedImage:
+    """Result of processing one image ahead of slide building."""
+
+    # Whether the source image passed validation
+    valid: bool
+    # Processed JPEG, or the PlaceKitten fallback used instead (None if neither is available)
+    data: Optional[bytes]
+
+
+class ImagePrefetcher:
+    """Process the images of a presentation on a thread pool before its slides are built."""
+
+    def __init__(self, image_handler, placekitten, max_workers: Optional[int] = None):
+        """
+        Initialize the prefetcher. The thread pool is started on first use.
+
+        Args:
+            image_handler: ImageHandler used to validate and process images
+            placekitten: PlaceKittenIntegration used for fallback images
+            max_workers: Worker threads (default: DECKBUILDER_IMAGE_THREADS or CPU count, max 8; 0 disables prefetch)
+        """
+        self.image_handler = image_handler
+        self.placekitten = placekitten
+        self.max_workers = max_workers if max_workers is not None else get_default_image_threads()
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._futures: Dict[Tuple, Future] = {}
+        self._picture_sizes: Dict[int, Optional[Tuple[int, int]]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_workers > 0
+
+    def prefetch(self, prs, slides: Iterable[Dict[str, Any]], slide_builder) -> int:
+        """
+        Start processing every image the given slides will place.
+
+        Args:
+            prs: Presentation the slides are built in (its layouts give placeholder sizes)
+            slides: Canonical slide dictionaries
+            slide_builder: SlideBuilder that will build the slides (resolves layouts)
+
+        Returns:
+            int: Number of images submitted
+        """
+        if not self.enabled or not slide_builder.layout_mapping:
+            # Without a layout mapping, slides are filled without image handling
+            return 0
+
+        submitted = 0
+        for slide_data in slides:
+            if not isinstance(slide_data, dict):
+                continue
+            image_paths = list(self._image_values(slide_data))
+            if not image_paths:
+                continue
+            _, layout_index = slide_builder.resolve_layout(slide_data)
+            dimensions = self._picture_size(prs, layout_index)
+            if dimensions is None:
+                continue
+            context = fallback_context(slide_data)
+            for image_path in image_paths:
+                submitted += self.submit(image_path, dimensions, context)
+        return submitted
+
+    def submit(self, image_path: str, dimensions: Tuple[int, int], context: Dict[str, Any]) -> bool:
+        """Start processing one image unless it is already queued. Returns True if a job was submitted."""
+        key = self._key(image_path, dimensions, context)
+        with self._lock:
+            if key in self._futures:
+                return False
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="deckbuilder-image")
+            self._futures[key] = self._executor.submit(self._process, image_path, dimensions, dict(context))
+        return True
+
+    def take(self, image_path: str, dimensions: Tuple[int, int], context: Dict[str, Any]) -> Optional[PrefetchedImage]:
+        """
+        Prefetched result for an image, waiting for it if it is still being processed.
+
+        Returns:
+            PrefetchedImage, or None if the image was not prefetched (or its job failed)
+        """
+        with self._lock:
+            future = self._futures.get(self._key(image_path, dimensions, context))
+            if future is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"Warning: Image prefetch failed for {image_path}: {e}")
+            return None
+
+    def clear(self) -> None:
+        """Forget prefetched results (called when a new presentation starts). Running jobs finish in the background."""
+        with self._lock:
+            self._futures.clear()
+            self._picture_sizes.clear()
+
+    def shutdown(self) -> None:
+        """Stop the worker threads after queued jobs finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Prefetched images and how often slide building found its image ready (or queued)."""
+        with self._lock:
+            return {
+                "threads": self.max_workers,
+                "prefetched": len(self._futures),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    def _process(self, image_path: str, dimensions: Tuple[int, int], context: Dict[str, Any]) -> PrefetchedImage:
+        """Worker: process an image, or render the fallback used when it is invalid."""
+        data = self.image_handler.process_image_data(image_path, dimensions, quality="high")
+        valid = data is not None
+        if not data:
+            data = self.placekitten.generate_fallback_data(dimensions, context)
+        return PrefetchedImage(valid, data)
+
+    def _key(self, image_path: str, dimensions: Tuple[int, int], context: Dict[str, Any]) -> Tuple:
+        return image_path, tuple(dimensions), tuple(sorted(context.items()))
+
+    def _picture_size(self, prs, layout_index: int) -> Optional[Tuple[int, int]]:
+        """Pixel size of a layout's first picture placeholder (None if it has none), as slides inherit it."""
+        if layout_index not in self._picture_sizes:
+            size = None
+            try:
+                for placeholder in prs.slide_layouts[layout_index].iter_cloneable_placeholders():
+                    if placeholder.placeholder_format.type == PP_PLACEHOLDER_TYPE.PICTURE:
+                        size = placeholder_pixel_size(placeholder)
+                        break
+            except Exception:
+                pass  # nosec - Unknown layout; add_slide reports it and images are processed inline
+            self._picture_sizes[layout_index] = size
+        return self._picture_sizes[layout_index]
+
+    def _image_values(self, slide_data: Dict[str, Any]):
+        """Image paths a slide places in its picture placeholder (mirrors SlideBuilder field handling)."""
+        content_data = slide_data.get("placeholders", {}) if "placeholders" in slide_data else slide_data
+        for field_name, field_value in content_data.items():
+            if field_name not in ("type", "table", "layout") and is_image_field(field_name) and field_value and isinstance(field_value, str):
+                yield field_value
+
+        # Raw frontmatter media.image_path (see SlideBuilder._process_nested_image_fields)
+        has_converted_image_fields = any(field_name == "image_path" or field_name.endswith("_1") and "image" in field_name.lower() for field_name in slide_data.keys())
+        media = slide_data.get("media")
+        if not has_converted_image_fields and isinstance(media, dict):
+            image_path = media.get("image_path")
+            if image_path and isinstance(image_path, str):
+                yield image_path
@@ -1,44 +1,141 @@
 #!/usr/bin/env python3
 """
 Logging configuration for Deckbuilder to reduce noise.
+
+Debug output is split into channels, each backed by a standard library logger
+under ``deckbuilder.debug`` and switched on by its own environment variable:
+
+    DECKBUILDER_DEBUG              general debug output      (deckbuilder.debug)
+    DECKBUILDER_VALIDATION_DEBUG   validation details        (deckbuilder.debug.validation)
+    DECKBUILDER_SLIDE_DEBUG        placeholder mapping       (deckbuilder.debug.slide_builder)
+    DECKBUILDER_CONTENT_DEBUG      content processing        (deckbuilder.debug.content)
+
+Levels are resolved once at import (call configure_logging() to re-read the
+environment). A disabled channel costs one global lookup per call. Messages take
+lazy %-style arguments, and a message or argument given as a function (such as
+``lambda: list(keys)``) is only called when the channel is enabled. Hot paths
+can skip building debug data entirely with ``if slide_debug_enabled():``.
 """
 
+import logging
 import os
 import sys
+from types import FunctionType
+
+# Channel -> (logger name, environment variable)
+DEBUG_CHANNELS = {
+    "debug": ("deckbuilder.debug", "DECKBUILDER_DEBUG"),
+    "validation": ("deckbuilder.debug.validation", "DECKBUILDER_VALIDATION_DEBUG"),
+    "slide_builder": ("deckbuilder.debug.slide_builder", "DECKBUILDER_SLIDE_DEBUG"),
+    "content": ("deckbuilder.debug.content", "DECKBUILDER_CONTENT_DEBUG"),
+}
 
+_CONSOLE_HANDLER_NAME = "deckbuilder-console"
 
 # Global debug flag - set to False to reduce logging
-DEBUG_MODE = os.getenv("DECKBUILDER_DEBUG", "false").lower() == "true"
+DEBUG_MODE = False
+
+# Resolved channel switches, refreshed by configure_logging()
+_debug_enabled = False
+_validation_enabled = False
+_slide_builder_enabled = False
+_content_enabled = False
+_quiet = False
+
+
+class _ConsoleHandler(logging.Handler):
+    """Write plain messages to the current sys.stdout (respects later redirection)."""
+
+    def emit(self, record):
+        try:
+            sys.stdout.write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "false").lower() == "true"
+
+
+def configure_logging() -> None:
+    """Resolve debug channel levels and quiet mode from the environment."""
+    global DEBUG_MODE, _debug_enabled, _validation_enabled, _slide_builder_enabled, _content_enabled, _quiet
+
+    enabled = {channel: _env_flag(env_var) for channel, (_, env_var) in DEBUG_CHANNELS.items()}
+    for channel, (logger_name, _) in DEBUG_CHANNELS.items():
+        logging.getLogger(logger_name).setLevel(logging.DEBUG if enabled[channel] else logging.WARNING)
+
+    # Matched by name: this module may be imported twice (deckbuilder.* and src.deckbuilder.*)
+    root = logging.getLogger(DEBUG_CHANNELS["debug"][0])
+    if not any(handler.get_name() == _CONSOLE_HANDLER_NAME for handler in root.handlers):
+        handler = _ConsoleHandler()
+        handler.set_name(_CONSOLE_HANDLER_NAME)
+        root.addHandler(handler)
+    root.propagate = False
+
+    DEBUG_MODE = _debug_enabled = enabled["debug"]
+    _validation_enabled = enabled["validation"]
+    _slide_builder_enabled = enabled["slide_builder"]
+    _content_enabled = enabled["content"]
+    _quiet = _env_flag("DECKBUILDER_QUIET")
+
 
+def debug_enabled() -> bool:
+    """Check whether general debug output is enabled."""
+    return _debug_enabled
 
-def debug_print(*args, **kwargs):
+
+def validation_debug_enabled() -> bool:
+    """Check whether validation debug output is enabled."""
+    return _validation_enabled
+
+
+def slide_debug_enabled() -> bool:
+    """Check whether slide builder debug output is enabled."""
+    return _slide_builder_enabled
+
+
+def content_debug_enabled() -> bool:
+    """Check whether content processor debug output is enabled."""
+    return _content_enabled
+
+
+def _log(channel: str, message, args) -> None:
+    """Emit a debug message; functions (e.g. lambdas) given as message or args are called only now."""
+    if isinstance(message, FunctionType):
+        message = message()
+    args = tuple(arg() if isinstance(arg, FunctionType) else arg for arg in args)
+    logging.getLogger(DEBUG_CHANNELS[channel][0]).debug(message, *args)
+
+
+def debug_print(message, *args):
     """Print only if debug mode is enabled."""
-    if DEBUG_MODE:
-        print(*args, **kwargs)
+    if _debug_enabled:
+        _log("debug", message, args)
 
 
 def quiet_print(*args, **kwargs):
     """Print that can be silenced by setting DECKBUILDER_QUIET=true."""
-    if not os.getenv("DECKBUILDER_QUIET", "false").lower() == "true":
+    if not _quiet:
         print(*args, **kwargs)
 
 
-def validation_print(*args, **kwargs):
+def validation_print(message, *args):
     """Print validation info only if validation debug is enabled."""
-    if os.getenv("DECKBUILDER_VALIDATION_DEBUG", "false").lower() == "true":
-        print(*args, **kwargs)
+    if _validation_enabled:
+        _log("validation", message, args)
 
 
-def slide_builder_print(*args, **kwargs):
+def slide_builder_print(message, *args):
     """Print slide builder info only if slide builder debug is enabled."""
-    if os.getenv("DECKBUILDER_SLIDE_DEBUG", "false").lower() == "true":
-        print(*args, **kwargs)
+    if _slide_builder_enabled:
+        _log("slide_builder", message, args)
 
 
-def content_processor_print(*args, **kwargs):
+def content_processor_print(message, *args):
     """Print content processor info only if content processor debug is enabled."""
-    if os.getenv("DECKBUILDER_CONTENT_DEBUG", "false").lower() == "true":
-        print(*args, **kwargs)
+    if _content_enabled:
+        _log("content", message, args)
 
 
 def error_print(*args, **kwargs):
@@ -53,5 +150,8 @@ def success_print(*args, **kwargs):
 
 def progress_print(*args, **kwargs):
     """Print progress messages for user feedback (can be silenced with DECKBUILDER_QUIET)."""
-    if not os.getenv("DECKBUILDER_QUIET", "false").lower() == "true":
+    if not _quiet:
         print(*args, **kwargs)
+
+
+configure_logging()
@@ -17,6 +17,7 @@ import os
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 
+from .pattern_registry import BUILTIN_PATTERNS_DIR, pattern_registry
 from .pattern_schema import PatternSchemaValidator
 
 
@@ -54,12 +55,12 @@ class PatternLoader:
                 self.template_folder = Path(__file__).parent / "assets" / "templates"
 
         # Built-in patterns directory
-        self.builtin_patterns_dir = Path(__file__).parent / "structured_frontmatter_patterns"
+        self.builtin_patterns_dir = BUILTIN_PATTERNS_DIR
 
         # User patterns directory (within template folder)
         self.user_patterns_dir = self.template_folder / "patterns"
 
-        # Pattern cache for performance
+        # Per-loader view; file parsing is shared process-wide through pattern_registry
         self._pattern_cache: Dict[str, Dict[str, Any]] = {}
 
         self.logger.debug(f"PatternLoader initialized with template folder: {self.template_folder}")
@@ -93,57 +94,53 @@ class PatternLoader:
 
     def _load_builtin_patterns(self) -> Dict[str, Dict[str, Any]]:
         """Load patterns from built-in structured_frontmatter_patterns directory."""
-        patterns = {}
-
         if not self.builtin_patterns_dir.exists():
             self.logger.warning(f"Built-in patterns directory not found: {self.builtin_patterns_dir}")
-            return patterns
-
-        for pattern_file in self.builtin_patterns_dir.glob("*.json"):
-            try:
-                pattern_data = self._load_pattern_file(pattern_file)
-
-                if pattern_data:
-                    # Get layout name from the pattern data itself, not filename
-                    layout_name = pattern_data.get("yaml_pattern", {}).get("layout")
-
-                    if layout_name:
-                        patterns[layout_name] = pattern_data
-                        self.logger.debug(f"Loaded built-in pattern: {layout_name} from {pattern_file.name}")
-                    else:
-                        self.logger.warning(f"Pattern {pattern_file} missing layout name in yaml_pattern.layout")
-
-            except Exception as e:
-                self.logger.error(f"Error loading built-in pattern {pattern_file}: {e}")
+            return {}
 
+        patterns = {}
+        for pattern_file, pattern_data in self._iter_valid_patterns(self.builtin_patterns_dir, "built-in"):
+            patterns[pattern_data["yaml_pattern"]["layout"]] = pattern_data
+            self.logger.debug(f"Loaded built-in pattern: {pattern_data['yaml_pattern']['layout']} from {pattern_file.name}")
         return patterns
 
     def _load_user_patterns(self) -> Dict[str, Dict[str, Any]]:
         """Load patterns from user patterns directory."""
-        patterns = {}
-
         if not self.user_patterns_dir.exists():
             self.logger.debug(f"User patterns directory not found: {self.user_patterns_dir}")
-            return patterns
+            return {}
+
+        patterns = {}
+        for pattern_file, pattern_data in self._iter_valid_patterns(self.user_patterns_dir, "user"):
+            patterns[pattern_data["yaml_pattern"]["layout"]] = pattern_data
+            self.logger.info(f"Loaded user pattern: {pattern_data['yaml_pattern']['layout']} from {pattern_file.name} (overrides built-in)")
+        return patterns
 
-        for pattern_file in self.user_patterns_dir.glob("*.json"):
-            try:
-                pattern_data = self._load_pattern_file(pattern_file)
+    def _iter_valid_patterns(self, patterns_dir: Path, source: str):
+        """
+        Yield (file, data) for schema-valid patterns of a directory, logging rejected files.
 
-                if pattern_data:
-                    # Get layout name from the pattern data itself, not filename
-                    layout_name = pattern_data.get("yaml_pattern", {}).get("layout")
+        Files are parsed and validated once per process by the shared pattern registry;
+        this only walks the compiled result.
+        """
+        compiled = pattern_registry.get(patterns_dir)
+        for pattern_file in compiled.files:
+            if pattern_file.data is None:
+                self.logger.error(pattern_file.error)
+                continue
 
-                    if layout_name:
-                        patterns[layout_name] = pattern_data
-                        self.logger.info(f"Loaded user pattern: {layout_name} from {pattern_file.name} (overrides built-in)")
-                    else:
-                        self.logger.warning(f"User pattern {pattern_file} missing layout name in yaml_pattern.layout")
+            validation_errors = compiled.schema_errors[pattern_file.path]
+            if validation_errors:
+                self.logger.error(f"Pattern validation failed for {pattern_file.path}:")
+                for error in validation_errors:
+                    self.logger.error(f"  - {error}")
+                continue
 
-            except Exception as e:
-                self.logger.error(f"Error loading user pattern {pattern_file}: {e}")
+            if not pattern_file.layout:
+                self.logger.warning(f"{source.capitalize()} pattern {pattern_file.path} missing layout name in yaml_pattern.layout")
+                continue
 
-        return patterns
+            yield pattern_file.path, pattern_file.data
 
     def find_pattern_file_for_layout(self, layout_name: str) -> Optional[Path]:
         """
@@ -152,25 +149,11 @@ class PatternLoader:
         This scans all pattern files to find one with matching yaml_pattern.layout value.
         Used for reverse lookup when users want to override a specific layout.
         """
-        # Check built-in patterns first
-        if self.builtin_patterns_dir.exists():
-            for pattern_file in self.builtin_patterns_dir.glob("*.json"):
-                try:
-                    pattern_data = self._load_pattern_file(pattern_file)
-                    if pattern_data and pattern_data.get("yaml_pattern", {}).get("layout") == layout_name:
-                        return pattern_file
-                except Exception:
-                    continue
-
-        # Check user patterns
-        if self.user_patterns_dir.exists():
-            for pattern_file in self.user_patterns_dir.glob("*.json"):
-                try:
-                    pattern_data = self._load_pattern_file(pattern_file)
-                    if pattern_data and pattern_data.get("yaml_pattern", {}).get("layout") == layout_name:
-                        return pattern_file
-                except Exception:
-                    continue
+        # Check built-in patterns first, then user patterns
+        for patterns_dir in (self.builtin_patterns_dir, self.user_patterns_dir):
+            for pattern_file in pattern_registry.get(patterns_dir).valid_files:
+                if pattern_file.layout == layout_name:
+                    return pattern_file.path
 
         return None
 
@@ -221,8 +204,10 @@ class PatternLoader:
         return {"builtin": self._load_builtin_patterns(), "user": self._load_user_patterns()}
 
     def clear_cache(self) -> None:
-        """Clear pattern cache to force reloading."""
+        """Clear pattern cache to force reloading (also re-reads the pattern files from disk)."""
         self._pattern_cache.clear()
+        pattern_registry.invalidate(self.builtin_patterns_dir)
+        pattern_registry.invalidate(self.user_patterns_dir)
         self.logger.debug("Pattern cache cleared")
 
     def validate_all_patterns(self) -> Dict[str, List[str]]:
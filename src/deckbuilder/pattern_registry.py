@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Process-wide Compiled Pattern Registry
+
+Structured frontmatter patterns are read by the markdown converter (once per
+slide), by PatternLoader (CLI, template metadata, MCP tools) and by the
+structured frontmatter help/validation helpers. Instead of each of them
+globbing and json-loading the pattern directory on every construction, the
+registry compiles each directory once into an immutable CompiledPatternSet and
+hands the same object to every caller.
+
+Entries are keyed by directory and invalidated by the directory's modification
+time, so adding, removing or atomically replacing a pattern file is picked up
+on the next lookup. In-place edits that leave the directory mtime unchanged
+need an explicit ``pattern_registry.invalidate(directory)``.
+"""
+
+import json
+import logging
+import os
+import threading
+from functools import cached_property
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Built-in patterns shipped with the package
+BUILTIN_PATTERNS_DIR = Path(__file__).parent / "structured_frontmatter_patterns"
+
+# Type names used in yaml_pattern JSON and the types they stand for
+_TYPE_NAMES = {"str": str, "int": int, "bool": bool}
+
+
+def convert_str_to_type(data: Any) -> Any:
+    """Recursively convert type names in a yaml_pattern (e.g. 'str') to type objects."""
+    if isinstance(data, dict):
+        return {k: convert_str_to_type(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [convert_str_to_type(item) for item in data]
+    if isinstance(data, str):
+        return _TYPE_NAMES.get(data, data)
+    return data
+
+
+class PatternFile:
+    """One pattern file as read from disk."""
+
+    __slots__ = ("path", "data", "error")
+
+    def __init__(self, path: Path, data: Optional[Dict[str, Any]], error: Optional[str] = None):
+        self.path = path
+        self.data = data
+        self.error = error
+
+    @property
+    def layout(self) -> Optional[str]:
+        """Layout name declared in yaml_pattern.layout, if any."""
+        if not isinstance(self.data, dict):
+            return None
+        yaml_pattern = self.data.get("yaml_pattern")
+        return yaml_pattern.get("layout") if isinstance(yaml_pattern, dict) else None
+
+
+class CompiledPatternSet:
+    """
+    Immutable, pre-parsed view of one pattern directory.
+
+    Views are read-only mappings shared by every caller; the pattern dictionaries
+    they contain must be treated as read-only as well.
+    """
+
+    def __init__(self, directory: Path, mtime_ns: Optional[int], files: Tuple[PatternFile, ...]):
+        self.directory = directory
+        self.mtime_ns = mtime_ns
+        self.files = files
+
+        patterns: Dict[str, Dict[str, Any]] = {}
+        for pattern_file in files:
+            if pattern_file.layout:
+                patterns[pattern_file.layout] = pattern_file.data
+        self.patterns: Mapping[str, Dict[str, Any]] = MappingProxyType(patterns)
+
+    @cached_property
+    def typed_patterns(self) -> Mapping[str, Dict[str, Any]]:
+        """Patterns with yaml_pattern type names converted to type objects."""
+        typed = {}
+        for layout, data in self.patterns.items():
+            typed[layout] = {**data, "yaml_pattern": convert_str_to_type(data["yaml_pattern"])} if "yaml_pattern" in data else data
+        return MappingProxyType(typed)
+
+    @cached_property
+    def schema_errors(self) -> Mapping[Path, Tuple[str, ...]]:
+        """Schema validation errors per readable pattern file (empty tuple when valid)."""
+        from .pattern_schema import PatternSchemaValidator
+
+        validator = PatternSchemaValidator()
+        return MappingProxyType({f.path: tuple(validator.validate_pattern(f.data)) for f in self.files if f.data is not None})
+
+    @cached_property
+    def valid_files(self) -> Tuple[PatternFile, ...]:
+        """Readable files that pass schema validation."""
+        return tuple(f for f in self.files if f.data is not None and not self.schema_errors[f.path])
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+
+class PatternRegistry:
+    """Thread-safe cache of compiled pattern directories and in-code pattern tables."""
+
+    def __init__(self):
+        self._entries: Dict[str, CompiledPatternSet] = {}
+        self._static: Dict[str, Mapping[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, directory: Union[str, Path] = BUILTIN_PATTERNS_DIR) -> CompiledPatternSet:
+        """
+        Return the compiled patterns of a directory, recompiling it when its mtime changed.
+
+        Args:
+            directory: Pattern directory (defaults to the built-in patterns)
+
+        Returns:
+            CompiledPatternSet (empty when the directory does not exist)
+        """
+        path = Path(directory)
+        key = os.path.abspath(str(path))
+        mtime_ns = self._mtime_ns(key)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.mtime_ns == mtime_ns:
+            self._hits += 1
+            return entry
+
+        compiled = self._compile(path, mtime_ns)
+        with self._lock:
+            self._entries[key] = compiled
+            self._misses += 1
+        return compiled
+
+    def get_static(self, name: str, factory: Callable[[], Dict[str, Any]]) -> Mapping[str, Any]:
+        """
+        Return an in-code pattern table, building it with ``factory`` on first use.
+
+        Args:
+            name: Registry key for the table
+            factory: Builds the table; called once per process
+
+        Returns:
+            Read-only mapping shared by every caller
+        """
+        table = self._static.get(name)
+        if table is None:
+            with self._lock:
+                table = self._static.get(name)
+                if table is None:
+                    table = self._static[name] = MappingProxyType(factory())
+        return table
+
+    def invalidate(self, directory: Optional[Union[str, Path]] = None) -> None:
+        """Drop the compiled entry for one directory, or all directories if none given."""
+        with self._lock:
+            if directory is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(str(directory)), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            return {"directories": len(self._entries), "hits": self._hits, "misses": self._misses}
+
+    def _mtime_ns(self, path: str) -> Optional[int]:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _compile(self, directory: Path, mtime_ns: Optional[int]) -> CompiledPatternSet:
+        """Read and parse every pattern file in a directory."""
+        files = []
+        if mtime_ns is not None:
+            for pattern_file in sorted(directory.glob("*.json")):
+                files.append(self._read(pattern_file))
+        logger.debug("Compiled %d pattern files from %s", len(files), directory)
+        return CompiledPatternSet(directory, mtime_ns, tuple(files))
+
+    def _read(self, pattern_file: Path) -> PatternFile:
+        try:
+            with open(pattern_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            return PatternFile(pattern_file, None, f"Invalid JSON in pattern file {pattern_file}: {e}")
+        except PermissionError:
+            return PatternFile(pattern_file, None, f"Permission denied accessing pattern file {pattern_file}")
+        except Exception as e:
+            return PatternFile(pattern_file, None, f"Error reading pattern file {pattern_file}: {e}")
+        if not isinstance(data, dict):
+            return PatternFile(pattern_file, None, f"Pattern file {pattern_file} does not contain a JSON object")
+        return PatternFile(pattern_file, data)
+
+
+# Global instance shared by the converter, PatternLoader and structured frontmatter helpers
+pattern_registry = PatternRegistry()
@@ -5,8 +5,12 @@ This module provides the PlaceKittenIntegration class that generates professiona
 fallback images using PlaceKitten when user-provided images are missing or invalid.
 """
 
+import io
+import json
+import zlib
 from typing import Dict, Optional, Tuple
 
+from .image_cache import content_key
 from .image_handler import ImageHandler
 
 try:
@@ -17,6 +21,15 @@ except ImportError:
     PLACEKITTEN_AVAILABLE = False
     print("Warning: PlaceKitten library not available. Image fallbacks will be disabled.")
 
+# Bump whenever fallback rendering changes (image selection, smart crop, styling or
+# JPEG encoding), so fallbacks cached by an older version are rendered again
+FALLBACK_VERSION = 2
+
+
+def _stable_hash(value) -> int:
+    """Hash that, unlike hash() on strings, is the same in every process."""
+    return zlib.crc32(str(value).encode("utf-8"))
+
 
 class PlaceKittenIntegration:
     """
@@ -84,6 +97,37 @@ class PlaceKittenIntegration:
             print(f"Warning: PlaceKitten fallback generation failed: {e}")
             return None
 
+    def generate_fallback_data(self, dimensions: Tuple[int, int], context: Optional[Dict] = None) -> Optional[bytes]:
+        """
+        Generate the fallback image like generate_fallback, but return its JPEG content.
+
+        A new fallback is encoded in memory and written to the image cache in the background.
+
+        Args:
+            dimensions: Target (width, height) for the image
+            context: Optional context information for consistent generation
+
+        Returns:
+            bytes: Generated fallback image, or None if generation failed
+        """
+        if not self.is_available():
+            return None
+
+        try:
+            width, height = dimensions
+            cache_key = self._generate_fallback_cache_key(dimensions, context)
+
+            def render():
+                buffer = io.BytesIO()
+                self.image_handler._write_jpeg(self._render_fallback(width, height, context).image, buffer, "high")
+                return buffer.getvalue()
+
+            return self.image_handler.cache.get_or_create_data(cache_key, render)
+
+        except Exception as e:
+            print(f"Warning: PlaceKitten fallback generation failed: {e}")
+            return None
+
     def _create_fallback_image(self, width: int, height: int, cache_key: str, context: Optional[Dict] = None) -> Optional[str]:
         """
         Create new fallback image with professional styling.
@@ -98,25 +142,34 @@ class PlaceKittenIntegration:
             str: Path to generated image, or None if failed
         """
         try:
-            # Select consistent image based on context
-            image_id = self._select_image_id(context)
-
-            # Generate base image
-            processor = self.pk.generate(image_id=image_id)
-
-            # Apply professional styling pipeline
-            styled_processor = self._apply_professional_styling(processor, width, height)
 
-            # Save to cache with high quality
-            output_path = self.image_handler.cache_dir / f"{cache_key}.jpg"
-            final_path = styled_processor.save(str(output_path))
+            def render(output_path):
+                # Save with high quality (to a temporary file the cache renames into place)
+                self._render_fallback(width, height, context).save(str(output_path))
 
-            return final_path
+            # Only one process renders a given fallback; concurrent callers wait and reuse it
+            return self.image_handler.cache.get_or_create(cache_key, render)
 
         except Exception as e:
             print(f"Warning: Failed to create fallback image: {e}")
             return None
 
+    def _render_fallback(self, width: int, height: int, context: Optional[Dict] = None):
+        """
+        Generate the styled fallback image for a placeholder size and context.
+
+        Returns:
+            Styled ImageProcessor ready for saving
+        """
+        # Select consistent image based on context
+        image_id = self._select_image_id(context)
+
+        # Generate base image
+        processor = self.pk.generate(image_id=image_id)
+
+        # Apply professional styling pipeline
+        return self._apply_professional_styling(processor, width, height)
+
     def _apply_professional_styling(self, processor, width: int, height: int):
         """
         Apply professional styling pipeline to PlaceKitten image.
@@ -170,8 +223,8 @@ class PlaceKittenIntegration:
         # Use layout type for consistency
         if "layout" in context:
             layout = context["layout"]
-            # Simple hash-based selection for consistent results
-            layout_hash = hash(layout) % self.pk.get_image_count()
+            # Stable hash-based selection for consistent results across runs
+            layout_hash = _stable_hash(layout) % self.pk.get_image_count()
             return layout_hash + 1
 
         return 1  # Default fallback
@@ -180,6 +233,11 @@ class PlaceKittenIntegration:
         """
         Generate cache key for fallback image.
 
+        The key is derived from the selected source image's content, the size, the
+        styling configuration and FALLBACK_VERSION, so replacing a source image or
+        changing the pipeline never serves a stale fallback, and contexts that select
+        the same image share one entry.
+
         Args:
             dimensions: Target dimensions
             context: Optional context information
@@ -188,24 +246,13 @@ class PlaceKittenIntegration:
             str: Cache key for consistent fallback generation
         """
         width, height = dimensions
+        image_id = self._select_image_id(context)
+        source_path = self.pk.get_image_path(image_id)
+        if source_path is None:
+            raise ValueError(f"No PlaceKitten image with ID {image_id}")
 
-        # Base key with dimensions and styling
-        key_parts = [
-            "placekitten_fallback",
-            f"{width}x{height}",
-            self.professional_config["base_filter"],
-            f'contrast{self.professional_config["contrast_adjustment"]}',
-            f'brightness{self.professional_config["brightness_adjustment"]}',
-        ]
-
-        # Add context-based components for consistency
-        if context:
-            if "slide_index" in context:
-                key_parts.append(f'slide{context["slide_index"]}')
-            elif "layout" in context:
-                key_parts.append(f'layout{hash(context["layout"])}')
-
-        return "_".join(str(part) for part in key_parts)
+        styling = json.dumps(self.professional_config, sort_keys=True)
+        return content_key(source_path, "placekitten_fallback", FALLBACK_VERSION, image_id, f"{width}x{height}", styling)
 
     def _get_professional_styling(self) -> Dict:
         """
@@ -252,18 +299,14 @@ class PlaceKittenIntegration:
     def cleanup_fallback_cache(self):
         """Clean up cached fallback images to free space."""
         try:
-            # Remove all PlaceKitten fallback images from cache
-            fallback_files = list(self.image_handler.cache_dir.glob("placekitten_fallback_*.jpg"))
-
-            removed_count = 0
-            for file_path in fallback_files:
-                try:
-                    file_path.unlink()
-                    removed_count += 1
-                except Exception:
-                    continue  # nosec - Continue processing other files if one fails
-
-            return {"removed_files": removed_count, "total_fallback_files": len(fallback_files)}
+            # Remove all PlaceKitten fallback images from cache (found through the cache index)
+            cache = self.image_handler.cache
+            fallback_keys = [key for key in cache.keys() if key.startswith("placekitten_fallback_")]
+
+            removed_count = sum(1 for key in fallback_keys if cache.discard(key))
+            cache.flush()
+
+            return {"removed_files": removed_count, "total_fallback_files": len(fallback_keys)}
 
         except Exception as e:
             print(f"Warning: Fallback cache cleanup failed: {e}")
@@ -3,6 +3,7 @@ from .content_formatter import ContentFormatter
 from .table_builder import TableBuilder
 from .image_placeholder_handler import ImagePlaceholderHandler
 from .image_handler import ImageHandler
+from .image_prefetch import ImagePrefetcher
 from .placekitten_integration import PlaceKittenIntegration
 
 
@@ -25,11 +26,11 @@ class PresentationBuilder:
         self.content_formatter = ContentFormatter()
         self.table_builder = TableBuilder(self.content_formatter)
 
-        # Initialize image handling components with cache in output directory
-        cache_dir = str(self.path_manager.get_output_folder() / "temp" / "image_cache")
-        self.image_handler = ImageHandler(cache_dir)
+        # Initialize image handling components with the shared image cache
+        self.image_handler = ImageHandler()
         self.placekitten = PlaceKittenIntegration(self.image_handler)
-        self.image_placeholder_handler = ImagePlaceholderHandler(self.image_handler, self.placekitten)
+        self.image_prefetcher = ImagePrefetcher(self.image_handler, self.placekitten)
+        self.image_placeholder_handler = ImagePlaceholderHandler(self.image_handler, self.placekitten, self.image_prefetcher)
 
     @property
     def layout_mapping(self):
@@ -45,8 +46,22 @@ class PresentationBuilder:
 
     def clear_slides(self, prs):
         """Clear all slides from the presentation."""
+        self.image_prefetcher.clear()
         return self.slide_builder.clear_slides(prs)
 
+    def prefetch_images(self, prs, slides):
+        """
+        Start processing the images of upcoming slides on the image thread pool.
+
+        Args:
+            prs: PowerPoint presentation object the slides will be added to
+            slides: Canonical slide dictionaries
+
+        Returns:
+            int: Number of images submitted
+        """
+        return self.image_prefetcher.prefetch(prs, slides, self.slide_builder)
+
     def add_slide(self, prs, slide_data: dict):
         """
         Add a single slide to the presentation based on slide data.
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Per-stage Timing Instrumentation for Deckbuilder
+
+Records nested timing spans (deck → stage → slide → placeholder → image) for a
+presentation build so slow requests can be attributed to markdown parsing,
+validation, slide building, image processing or saving.
+
+Profiling is off by default and costs a single context-variable lookup per
+span when disabled. Enable it with ``deckbuilder create --profile``, the
+``include_profile`` argument of the MCP create tools, ``create_presentation(profile=True)``
+or the DECKBUILDER_PROFILE=true environment variable.
+
+Usage:
+    with profile_session("deck") as profiler:
+        with span("markdown_parse"):
+            ...
+    print(profiler.format_summary())
+    json.dumps(profiler.to_dict())
+"""
+
+import contextvars
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+_active_profiler: contextvars.ContextVar = contextvars.ContextVar("deckbuilder_profiler", default=None)
+_NULL_SPAN = nullcontext()
+
+
+def is_profiling_enabled() -> bool:
+    """Check whether DECKBUILDER_PROFILE requests profiling by default."""
+    return os.getenv("DECKBUILDER_PROFILE", "false").lower() in ("1", "true", "yes")
+
+
+@dataclass
+class Span:
+    """A single timed region with nested child spans."""
+
+    name: str
+    attrs: Dict[str, Any] = field(default_factory=dict)
+    start: float = 0.0
+    seconds: float = 0.0
+    children: List["Span"] = field(default_factory=list)
+
+    @property
+    def self_seconds(self) -> float:
+        """Time spent in this span excluding its children."""
+        return max(0.0, self.seconds - sum(child.seconds for child in self.children))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the span tree to a JSON-friendly dictionary."""
+        data: Dict[str, Any] = {"name": self.name, "seconds": round(self.seconds, 6), "self_seconds": round(self.self_seconds, 6)}
+        if self.attrs:
+            data["attrs"] = self.attrs
+        if self.children:
+            data["children"] = [child.to_dict() for child in self.children]
+        return data
+
+
+class Profiler:
+    """Collects a tree of timing spans for one presentation build."""
+
+    def __init__(self, name: str = "deck", **attrs):
+        """
+        Initialize the profiler with a root span.
+
+        Args:
+            name: Name of the root span
+            **attrs: Attributes recorded on the root span
+        """
+        self.root = Span(name, dict(attrs), start=time.perf_counter())
+        self._stack: List[Span] = [self.root]
+
+    @contextmanager
+    def span(self, name: str, **attrs) -> Iterator[Span]:
+        """Time a nested region under the currently open span."""
+        node = Span(name, attrs, start=time.perf_counter())
+        self._stack[-1].children.append(node)
+        self._stack.append(node)
+        try:
+            yield node
+        finally:
+            node.seconds = time.perf_counter() - node.start
+            self._stack.pop()
+
+    def finish(self) -> None:
+        """Close the root span."""
+        self.root.seconds = time.perf_counter() - self.root.start
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the full timing tree."""
+        return self.root.to_dict()
+
+    def summarize(self) -> List[Dict[str, Any]]:
+        """
+        Aggregate spans by name, sorted by exclusive (self) time, most expensive first.
+
+        Returns:
+            Rows with name, count, total_seconds and self_seconds
+        """
+        totals: Dict[str, Dict[str, Any]] = {}
+
+        def visit(node: Span, ancestors: frozenset) -> None:
+            row = totals.setdefault(node.name, {"name": node.name, "count": 0, "total_seconds": 0.0, "self_seconds": 0.0})
+            row["count"] += 1
+            # Recursive spans (same name nested) only count their outermost total
+            if node.name not in ancestors:
+                row["total_seconds"] += node.seconds
+            row["self_seconds"] += node.self_seconds
+            for child in node.children:
+                visit(child, ancestors | {node.name})
+
+        visit(self.root, frozenset())
+        rows = sorted(totals.values(), key=lambda r: r["self_seconds"], reverse=True)
+        for row in rows:
+            row["total_seconds"] = round(row["total_seconds"], 6)
+            row["self_seconds"] = round(row["self_seconds"], 6)
+        return rows
+
+    def format_summary(self, top: Optional[int] = 15) -> str:
+        """Human-readable table of the most expensive stages."""
+        rows = self.summarize()
+        total = self.root.seconds or sum(r["self_seconds"] for r in rows) or 1.0
+        lines = [
+            f"Timing summary ({self.root.seconds * 1000:.1f} ms total, sorted by self time)",
+            f"  {'stage':<28} {'calls':>6} {'self ms':>10} {'total ms':>10} {'self %':>7}",
+        ]
+        for row in rows[:top] if top else rows:
+            lines.append(f"  {row['name']:<28} {row['count']:>6} {row['self_seconds'] * 1000:>10.2f} " f"{row['total_seconds'] * 1000:>10.2f} {row['self_seconds'] / total * 100:>6.1f}%")
+        return "\n".join(lines)
+
+
+def current_profiler() -> Optional[Profiler]:
+    """Return the profiler active in this context, if any."""
+    return _active_profiler.get()
+
+
+@contextmanager
+def profile_session(name: str = "deck", **attrs) -> Iterator[Profiler]:
+    """
+    Activate a profiler for the current thread/task.
+
+    If a session is already active, a nested span is recorded in it instead and
+    the outer profiler is yielded, so callers and the engine can both open
+    sessions without producing separate trees.
+    """
+    existing = _active_profiler.get()
+    if existing is not None:
+        with existing.span(name, **attrs):
+            yield existing
+        return
+
+    profiler = Profiler(name, **attrs)
+    token = _active_profiler.set(profiler)
+    try:
+        yield profiler
+    finally:
+        profiler.finish()
+        _active_profiler.reset(token)
+
+
+def span(name: str, **attrs):
+    """Time a region when profiling is active; a shared no-op context otherwise."""
+    profiler = _active_profiler.get()
+    if profiler is None:
+        return _NULL_SPAN
+    return profiler.span(name, **attrs)
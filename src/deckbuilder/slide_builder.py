@@ -6,7 +6,191 @@ from .placeholder_types import (
     is_subtitle_placeholder,
     is_title_placeholder,
 )
-from .logging_config import slide_builder_print, debug_print, error_print
+from .logging_config import slide_builder_print, slide_debug_enabled, debug_print, error_print
+from .profiling import span
+
+
+# Common field name variations users write instead of the exact template field names
+FIELD_NAME_VARIATIONS = {
+    # Caption variations
+    "text_caption": ["text_caption_1", "caption", "caption_1"],
+    "caption": ["text_caption_1", "text_caption", "caption_1"],
+    # Title variations - CRITICAL: map "title" to "title_top" for template compatibility
+    "title": ["title_top", "title_top_1", "main_title"],
+    "title_top": ["title", "title_top_1", "main_title"],
+    "title_left": ["title_left_1", "left_title", "title_col1"],
+    "title_right": ["title_right_1", "right_title", "title_col2"],
+    # Content variations
+    "content_left": ["content_left_1", "left_content", "content_col1"],
+    "content_right": ["content_right_1", "right_content", "content_col2"],
+    "content": ["content_1", "main_content", "body"],
+    # Image variations
+    "image": ["image_1", "image_path", "picture"],
+    "image_1": ["image", "image_path", "picture"],
+    "image_path": ["image", "image_1", "picture"],
+    # Column variations
+    "content_col1": ["content_left", "content_left_1", "col1_content"],
+    "content_col2": ["content_right", "content_right_1", "col2_content"],
+    "content_col3": ["content_col3_1", "col3_content"],
+    "content_col4": ["content_col4_1", "col4_content"],
+    "title_col1": ["title_left", "title_left_1", "col1_title"],
+    "title_col2": ["title_right", "title_right_1", "col2_title"],
+    "title_col3": ["title_col3_1", "col3_title"],
+    "title_col4": ["title_col4_1", "col4_title"],
+    # Item variations (for agenda, lists)
+    "content_item1": ["content_item1_1", "item1_content", "item_1"],
+    "content_item2": ["content_item2_1", "item2_content", "item_2"],
+    "content_item3": ["content_item3_1", "item3_content", "item_3"],
+    "content_item4": ["content_item4_1", "item4_content", "item_4"],
+    "content_item5": ["content_item5_1", "item5_content", "item_5"],
+    "content_item6": ["content_item6_1", "item6_content", "item_6"],
+    # Number variations (for agenda)
+    "number_item1": ["number_item1_1", "item1_number", "num_1"],
+    "number_item2": ["number_item2_1", "item2_number", "num_2"],
+    "number_item3": ["number_item3_1", "item3_number", "num_3"],
+    "number_item4": ["number_item4_1", "item4_number", "num_4"],
+    "number_item5": ["number_item5_1", "item5_number", "num_5"],
+    "number_item6": ["number_item6_1", "item6_number", "num_6"],
+    # SWOT Analysis variations
+    "content_top_left": ["content_16", "strengths", "strength"],
+    "content_top_right": ["content_17", "weaknesses", "weakness"],
+    "content_bottom_left": ["content_18", "opportunities", "opportunity"],
+    "content_bottom_right": ["content_19", "threats", "threat"],
+    "content_16": ["content_top_left", "strengths", "strength"],
+    "content_17": ["content_top_right", "weaknesses", "weakness"],
+    "content_18": ["content_bottom_left", "opportunities", "opportunity"],
+    "content_19": ["content_bottom_right", "threats", "threat"],
+}
+
+
+def is_image_field(field_name):
+    """True for content fields that are placed in the layout's first PICTURE placeholder."""
+    return field_name == "image_path" or field_name.endswith(".image_path") or "image" in field_name.lower()
+
+
+class LayoutPlaceholderMap:
+    """
+    Precompiled field → placeholder idx → semantic type resolution for one layout.
+
+    Built once per template layout from the JSON mapping and the placeholders of
+    the first slide created with that layout. Every slide sharing the layout has
+    the same placeholders, so field resolution results are memoized and mapping
+    a field becomes a single dictionary lookup.
+    """
+
+    def __init__(self, layout_name, placeholder_mappings, placeholders, resolve_variation):
+        """
+        Initialize the layout map.
+
+        Args:
+            layout_name: Name of the PowerPoint layout
+            placeholder_mappings: Template mapping of placeholder idx (str) -> field name
+            placeholders: Placeholders of a slide created with this layout
+            resolve_variation: Callable(field_name, field_to_index) resolving field name variations
+        """
+        self.layout_name = layout_name
+        self.placeholder_mappings = placeholder_mappings
+        self.field_to_index = {field_name: int(placeholder_idx) for placeholder_idx, field_name in placeholder_mappings.items()}
+        self._resolve_variation = resolve_variation
+
+        # idx -> placeholder type (slide order) and first idx of each semantic category
+        self.types = {}
+        self.descriptions = []
+        self._first_of = {}
+        for placeholder in placeholders:
+            placeholder_idx = placeholder.placeholder_format.idx
+            placeholder_type = placeholder.placeholder_format.type
+            self.types[placeholder_idx] = placeholder_type
+            type_name = placeholder_type.name if hasattr(placeholder_type, "name") else str(placeholder_type)
+            self.descriptions.append(f"{placeholder_idx}:{type_name}({placeholder_mappings.get(str(placeholder_idx), 'unnamed')})")
+
+            for category, matches in (
+                ("title", is_title_placeholder),
+                ("subtitle", is_subtitle_placeholder),
+                ("content", is_content_placeholder),
+                ("picture", lambda t: t == PP_PLACEHOLDER_TYPE.PICTURE),
+            ):
+                if category not in self._first_of and matches(placeholder_type):
+                    self._first_of[category] = placeholder_idx
+
+        self._resolved = {}
+
+    def resolve(self, field_name):
+        """
+        Resolve a content field to a placeholder idx.
+
+        Returns:
+            Tuple of (placeholder idx or None, description of the mapping method)
+        """
+        try:
+            return self._resolved[field_name]
+        except KeyError:
+            result = self._resolve_uncached(field_name)
+            self._resolved[field_name] = result
+            return result
+
+    def _mapped_idx(self, field_name):
+        """Return the template-mapped idx for a field if that placeholder exists on the layout."""
+        placeholder_idx = self.field_to_index.get(field_name)
+        if placeholder_idx is not None and placeholder_idx in self.types:
+            return placeholder_idx
+        return None
+
+    def _resolve_mapped_or_semantic(self, field_name, alternate_field, category):
+        """Template mapping for field (or alternate if unmapped), then first placeholder of a semantic category."""
+        slide_builder_print("      Method: %s field resolution", field_name.capitalize())
+        mapped_field = field_name if field_name in self.field_to_index else alternate_field
+        if mapped_field != field_name:
+            slide_builder_print("        No '%s' field in template mapping, trying %s", field_name, alternate_field)
+
+        placeholder_idx = self._mapped_idx(mapped_field)
+        if placeholder_idx is not None:
+            return placeholder_idx, f"Template mapping {mapped_field} -> idx {placeholder_idx}"
+
+        # Final fallback to semantic detection
+        slide_builder_print("        Template mapping failed, trying semantic %s detection", category)
+        placeholder_idx = self._first_of.get(category)
+        if placeholder_idx is not None:
+            return placeholder_idx, f"Semantic {category} (idx {placeholder_idx})"
+        return None, None
+
+    def _resolve_uncached(self, field_name):
+        """Apply the field resolution rules: title, subtitle, content, images, then template mapping."""
+        if field_name == "title":
+            return self._resolve_mapped_or_semantic("title", "title_top", "title")
+
+        if field_name == "subtitle":
+            slide_builder_print("      Method: Semantic subtitle detection")
+            placeholder_idx = self._first_of.get("subtitle")
+            return (placeholder_idx, f"Semantic subtitle (idx {placeholder_idx})") if placeholder_idx is not None else (None, None)
+
+        if field_name == "content":
+            return self._resolve_mapped_or_semantic("content", "content_1", "content")
+
+        # Handle image_path fields and image placeholder fields - find PICTURE placeholders
+        if is_image_field(field_name):
+            slide_builder_print("      Method: Image field detection")
+            placeholder_idx = self._first_of.get("picture")
+            if placeholder_idx is None:
+                slide_builder_print("        No PICTURE placeholder found for image field '%s'", field_name)
+                return None, None
+            return placeholder_idx, f"Image placeholder (idx {placeholder_idx})"
+
+        # Handle other fields by checking if they match placeholder names in JSON mapping
+        slide_builder_print("      Method: Template mapping lookup")
+        target_field = self._resolve_variation(field_name, self.field_to_index)
+        if target_field != field_name:
+            slide_builder_print("        Field name resolved: '%s' -> '%s'", field_name, target_field)
+
+        if target_field not in self.field_to_index:
+            slide_builder_print("        No template mapping found for field '%s'", target_field)
+            return None, None
+
+        placeholder_idx = self._mapped_idx(target_field)
+        if placeholder_idx is None:
+            slide_builder_print("        Template mapping failed: idx %s not found in slide", self.field_to_index[target_field])
+            return None, None
+        return placeholder_idx, f"Template mapping '{target_field}' -> idx {placeholder_idx}"
 
 
 class SlideBuilder:
@@ -19,9 +203,22 @@ class SlideBuilder:
         Args:
             layout_mapping: Optional layout mapping dictionary
         """
+        self._layout_maps = {}
         self.layout_mapping = layout_mapping
         self._current_slide_index = 0
 
+    @property
+    def layout_mapping(self):
+        """Get the current template layout mapping."""
+        return self._layout_mapping
+
+    @layout_mapping.setter
+    def layout_mapping(self, value):
+        """Set the layout mapping, dropping precompiled layout maps when it changes."""
+        if value is not getattr(self, "_layout_mapping", None):
+            self._layout_maps = {}
+        self._layout_mapping = value
+
     def clear_slides(self, prs):
         """Clear all slides from the presentation."""
         slide_count = len(prs.slides)
@@ -53,6 +250,36 @@ class SlideBuilder:
         # Auto-parse JSON formatting for inline formatting support
         slide_data = content_formatter.auto_parse_json_formatting(slide_data)
 
+        layout_name, layout_index = self.resolve_layout(slide_data)
+
+        slide_layout = prs.slide_layouts[layout_index]
+        slide = prs.slides.add_slide(slide_layout)
+
+        # Index placeholders once per slide; every field lookup below reuses this
+        shapes = {placeholder.placeholder_format.idx: placeholder for placeholder in slide.placeholders}
+
+        # Copy descriptive placeholder names from template mapping
+        self._copy_placeholder_names_from_mapping(slide, layout_name, shapes)
+
+        # Add content to placeholders using template mapping + semantic detection
+        layout_map = self._get_layout_map(layout_name, layout_index, shapes) if self.layout_mapping else None
+        self._apply_content_to_mapped_placeholders(slide, slide_data, layout_name, content_formatter, image_placeholder_handler, layout_map, shapes)
+
+        # All content should be processed through placeholders only - no legacy content blocks
+        debug_print("  Slide completed using structured frontmatter placeholders only")
+
+        return slide
+
+    def resolve_layout(self, slide_data: dict):
+        """
+        Determine the template layout a slide is built on.
+
+        Args:
+            slide_data: Dictionary containing slide information
+
+        Returns:
+            Tuple of (layout name, layout index in the template)
+        """
         # Get slide type and determine layout using JSON mapping
         # Prefer explicit "layout" field over "type" field
         layout_or_type = slide_data.get("layout", slide_data.get("type", "content"))
@@ -76,19 +303,7 @@ class SlideBuilder:
             layout_name = layout_or_type  # Use the original layout name as fallback
             layout_index = 1
 
-        slide_layout = prs.slide_layouts[layout_index]
-        slide = prs.slides.add_slide(slide_layout)
-
-        # Copy descriptive placeholder names from template mapping
-        self._copy_placeholder_names_from_mapping(slide, layout_name)
-
-        # Add content to placeholders using template mapping + semantic detection
-        self._apply_content_to_mapped_placeholders(slide, slide_data, layout_name, content_formatter, image_placeholder_handler)
-
-        # All content should be processed through placeholders only - no legacy content blocks
-        debug_print("  Slide completed using structured frontmatter placeholders only")
-
-        return slide
+        return layout_name, layout_index
 
     def add_slide_with_direct_mapping(self, prs, slide_data: dict, content_formatter, image_placeholder_handler):
         """
@@ -109,7 +324,7 @@ class SlideBuilder:
         # Add slide using the standard method
         return self.add_slide(prs, formatted_slide, content_formatter, image_placeholder_handler)
 
-    def _copy_placeholder_names_from_mapping(self, slide, layout_name):
+    def _copy_placeholder_names_from_mapping(self, slide, layout_name, shapes=None):
         """
         Copy descriptive placeholder names from template mapping to slide placeholders.
 
@@ -119,6 +334,7 @@ class SlideBuilder:
         Args:
             slide: PowerPoint slide object
             layout_name: Name of the PowerPoint layout
+            shapes: Optional idx -> placeholder dict for this slide
         """
         if not self.layout_mapping:
             return
@@ -128,9 +344,12 @@ class SlideBuilder:
         layout_info = layouts.get(layout_name, {})
         placeholder_mappings = layout_info.get("placeholders", {})
 
+        if shapes is None:
+            shapes = {placeholder.placeholder_format.idx: placeholder for placeholder in slide.placeholders}
+
         # Update placeholder names to match template mapping
-        for placeholder in slide.placeholders:
-            placeholder_idx = str(placeholder.placeholder_format.idx)
+        for idx, placeholder in shapes.items():
+            placeholder_idx = str(idx)
             if placeholder_idx in placeholder_mappings:
                 descriptive_name = placeholder_mappings[placeholder_idx]
                 try:
@@ -143,7 +362,25 @@ class SlideBuilder:
                     # Fallback: some placeholder types might not allow name changes
                     pass  # nosec - Continue processing other placeholders
 
-    def _apply_content_to_mapped_placeholders(self, slide, slide_data, layout_name, content_formatter, image_placeholder_handler):
+    def _get_layout_map(self, layout_name, layout_index, shapes):
+        """
+        Return the precompiled placeholder map for a layout, building it on first use.
+
+        Args:
+            layout_name: Name of the PowerPoint layout
+            layout_index: Index of the layout in the template
+            shapes: idx -> placeholder dict of a slide created with this layout
+        """
+        key = (layout_name, layout_index)
+        layout_map = self._layout_maps.get(key)
+        if layout_map is None:
+            layouts = self.layout_mapping.get("layouts", {}) if self.layout_mapping else {}
+            placeholder_mappings = layouts.get(layout_name, {}).get("placeholders", {})
+            layout_map = LayoutPlaceholderMap(layout_name, placeholder_mappings, shapes.values(), self._resolve_field_name_variations)
+            self._layout_maps[key] = layout_map
+        return layout_map
+
+    def _apply_content_to_mapped_placeholders(self, slide, slide_data, layout_name, content_formatter, image_placeholder_handler, layout_map=None, shapes=None):
         """
         Apply content to placeholders using template JSON mappings + semantic detection.
 
@@ -153,47 +390,42 @@ class SlideBuilder:
         3. Gets actual placeholder and determines its semantic type
         4. Applies content using appropriate semantic handler
 
+        Field resolution is precompiled per layout (see LayoutPlaceholderMap) and
+        placeholders are indexed once per slide, so each field is a single lookup.
+
         Args:
             slide: PowerPoint slide object
             slide_data: Dictionary containing slide content (from JSON or markdown)
             layout_name: Name of the PowerPoint layout
             content_formatter: ContentFormatter instance
             image_placeholder_handler: ImagePlaceholderHandler instance
+            layout_map: Optional precompiled LayoutPlaceholderMap for this layout
+            shapes: Optional idx -> placeholder dict for this slide
         """
         if not self.layout_mapping:
             # Fallback to basic semantic detection if no mapping available
             self._add_content_to_placeholders_fallback(slide, slide_data, content_formatter)
             return
 
-        # Get layout info from template mapping
-        layouts = self.layout_mapping.get("layouts", {})
-        layout_info = layouts.get(layout_name, {})
-        placeholder_mappings = layout_info.get("placeholders", {})
+        if shapes is None:
+            shapes = {placeholder.placeholder_format.idx: placeholder for placeholder in slide.placeholders}
+        if layout_map is None:
+            layout_map = self._get_layout_map(layout_name, None, shapes)
 
-        # Create reverse mapping: field_name -> placeholder_index
-        field_to_index = {}
-        for placeholder_idx, field_name in placeholder_mappings.items():
-            field_to_index[field_name] = int(placeholder_idx)
+        # Resolved once per slide: skips building debug-only strings and lists when disabled
+        debug = slide_debug_enabled()
 
         # Enhanced debugging: Show all available placeholders and template mapping
-        slide_builder_print(f"Layout '{layout_name}' - Template Mapping Analysis:")
-        slide_builder_print(f"  Available placeholders in template: {list(field_to_index.keys())}")
-
-        # Show actual PowerPoint placeholders
-        actual_placeholders = []
-        for ph in slide.placeholders:
-            ph_type = ph.placeholder_format.type.name if hasattr(ph.placeholder_format.type, "name") else str(ph.placeholder_format.type)
-            try:
-                ph_name = getattr(ph.element.nvSpPr.cNvPr, "name", "unnamed")
-            except AttributeError:
-                ph_name = "unnamed"
-            actual_placeholders.append(f"{ph.placeholder_format.idx}:{ph_type}({ph_name})")
-        slide_builder_print(f"  PowerPoint placeholders found: {actual_placeholders}")
+        if debug:
+            slide_builder_print(f"Layout '{layout_name}' - Template Mapping Analysis:")
+            slide_builder_print(f"  Available placeholders in template: {list(layout_map.field_to_index.keys())}")
+            slide_builder_print(f"  PowerPoint placeholders found: {layout_map.descriptions}")
 
         # Process each field in slide_data using semantic detection
         # For canonical JSON format, process the placeholders object if it exists
         content_data = slide_data.get("placeholders", {}) if "placeholders" in slide_data else slide_data
-        slide_builder_print(f"  Content fields to map: {list(content_data.keys())}")
+        if debug:
+            slide_builder_print(f"  Content fields to map: {list(content_data.keys())}")
         successful_mappings = []
         failed_mappings = []
 
@@ -202,153 +434,38 @@ class SlideBuilder:
             if field_name in ["type", "table", "layout"]:
                 continue
 
-            slide_builder_print(f"    Mapping field '{field_name}' (value: {str(field_value)[:50]}...)")
+            if debug:
+                slide_builder_print(f"    Mapping field '{field_name}' (value: {str(field_value)[:50]}...)")
 
-            # Find placeholder using semantic detection
-            target_placeholder = None
-            mapping_method = None
+            placeholder_idx, mapping_method = layout_map.resolve(field_name)
+            target_placeholder = shapes.get(placeholder_idx) if placeholder_idx is not None else None
 
-            # Handle title placeholders
-            if field_name == "title":
-                slide_builder_print("      Method: Title field resolution")
-
-                # First try to find title field in template mapping
-                title_field = field_to_index.get("title")
-                if title_field is not None:
-                    slide_builder_print(f"        Trying template mapping 'title' -> idx {title_field}")
-                    for placeholder in slide.placeholders:
-                        if placeholder.placeholder_format.idx == title_field:
-                            target_placeholder = placeholder
-                            mapping_method = f"Template mapping title -> idx {title_field}"
-                            break
-                else:
-                    slide_builder_print("        No 'title' field in template mapping, trying title_top")
-                    # Try title_top which is common in templates
-                    title_top_idx = field_to_index.get("title_top")
-                    if title_top_idx is not None:
-                        slide_builder_print(f"        Trying template mapping 'title_top' -> idx {title_top_idx}")
-                        for placeholder in slide.placeholders:
-                            if placeholder.placeholder_format.idx == title_top_idx:
-                                target_placeholder = placeholder
-                                mapping_method = f"Template mapping title_top -> idx {title_top_idx}"
-                                break
-
-                # Final fallback to semantic title detection
-                if not target_placeholder:
-                    slide_builder_print("        Template mapping failed, trying semantic title detection")
-                    for placeholder in slide.placeholders:
-                        if is_title_placeholder(placeholder.placeholder_format.type):
-                            target_placeholder = placeholder
-                            mapping_method = f"Semantic title (idx {placeholder.placeholder_format.idx})"
-                            break
-
-            # Handle subtitle placeholders
-            elif field_name == "subtitle":
-                slide_builder_print("      Method: Semantic subtitle detection")
-                for placeholder in slide.placeholders:
-                    if is_subtitle_placeholder(placeholder.placeholder_format.type):
-                        target_placeholder = placeholder
-                        mapping_method = f"Semantic subtitle (idx {placeholder.placeholder_format.idx})"
-                        break
-
-            # Handle content placeholders
-            elif field_name == "content":
-                slide_builder_print("      Method: Content field resolution")
-
-                # First try to find content field in template mapping
-                content_field = field_to_index.get("content")
-                if content_field is not None:
-                    slide_builder_print(f"        Trying template mapping 'content' -> idx {content_field}")
-                    for placeholder in slide.placeholders:
-                        if placeholder.placeholder_format.idx == content_field:
-                            target_placeholder = placeholder
-                            mapping_method = f"Template mapping content -> idx {content_field}"
-                            break
-                else:
-                    slide_builder_print("        No 'content' field in template mapping, trying content_1")
-                    # Fallback: try to find content_1 specifically (for layouts like vertical)
-                    content_1_idx = field_to_index.get("content_1")
-                    if content_1_idx is not None:
-                        slide_builder_print(f"        Trying template mapping 'content_1' -> idx {content_1_idx}")
-                        for placeholder in slide.placeholders:
-                            if placeholder.placeholder_format.idx == content_1_idx:
-                                target_placeholder = placeholder
-                                mapping_method = f"Template mapping content_1 -> idx {content_1_idx}"
-                                break
-
-                # Final fallback to semantic content placeholder detection
-                if not target_placeholder:
-                    slide_builder_print("        Template mapping failed, trying semantic content detection")
-                    for placeholder in slide.placeholders:
-                        if is_content_placeholder(placeholder.placeholder_format.type):
-                            target_placeholder = placeholder
-                            mapping_method = f"Semantic content (idx {placeholder.placeholder_format.idx})"
-                            break
-
-            # Handle image_path fields and image placeholder fields - find PICTURE placeholders
-            elif field_name == "image_path" or field_name.endswith(".image_path") or "image" in field_name.lower():
-                slide_builder_print("      Method: Image field detection")
-                for placeholder in slide.placeholders:
-                    if placeholder.placeholder_format.type == PP_PLACEHOLDER_TYPE.PICTURE:
-                        target_placeholder = placeholder
-                        mapping_method = f"Image placeholder (idx {placeholder.placeholder_format.idx})"
-                        slide_builder_print(f"        Found PICTURE placeholder at idx {placeholder.placeholder_format.idx}")
-                        break
-                if not target_placeholder:
-                    slide_builder_print(f"        No PICTURE placeholder found for image field '{field_name}'")
-
-            # Handle other fields by checking if they match placeholder names in JSON mapping
-            else:
-                slide_builder_print("      Method: Template mapping lookup")
-                # Try to find by exact field name match in JSON mapping
-                target_field = field_name
-
-                # Handle common field name variations - be flexible for users
-                resolved_field = self._resolve_field_name_variations(field_name, field_to_index)
-
-                if resolved_field != field_name:
-                    slide_builder_print(f"        Field name resolved: '{field_name}' -> '{resolved_field}'")
-                    target_field = resolved_field
-                else:
-                    slide_builder_print(f"        Using field name as-is: '{field_name}'")
-
-                if target_field in field_to_index:
-                    placeholder_idx = field_to_index[target_field]
-                    slide_builder_print(f"        Template mapping found: '{target_field}' -> idx {placeholder_idx}")
-                    for placeholder in slide.placeholders:
-                        if placeholder.placeholder_format.idx == placeholder_idx:
-                            target_placeholder = placeholder
-                            mapping_method = f"Template mapping '{target_field}' -> idx {placeholder_idx}"
-                            slide_builder_print(f"        Matched placeholder at idx {placeholder_idx}")
-                            break
-                    if not target_placeholder:
-                        slide_builder_print(f"        Template mapping failed: idx {placeholder_idx} not found in slide")
-                else:
-                    slide_builder_print(f"        No template mapping found for field '{target_field}'")
-
-            if target_placeholder:
-                slide_builder_print(f"    SUCCESS: '{field_name}' mapped using {mapping_method}")
-                successful_mappings.append(f"{field_name} -> {mapping_method}")
+            if target_placeholder is not None:
+                if debug:
+                    slide_builder_print(f"    SUCCESS: '{field_name}' mapped using {mapping_method}")
+                    successful_mappings.append(f"{field_name} -> {mapping_method}")
 
                 # Apply content based on placeholder's semantic type
-                self._apply_content_by_semantic_type(
-                    slide,
-                    target_placeholder,
-                    field_name,
-                    field_value,
-                    slide_data,
-                    content_formatter,
-                    image_placeholder_handler,
-                )
+                with span("placeholder", field=field_name):
+                    self._apply_content_by_semantic_type(
+                        slide,
+                        target_placeholder,
+                        field_name,
+                        field_value,
+                        slide_data,
+                        content_formatter,
+                        image_placeholder_handler,
+                    )
             else:
                 error_print(f"    FAILED: '{field_name}' could not be mapped to any placeholder")
                 failed_mappings.append(field_name)
 
         # Summary of mapping results
-        slide_builder_print("  Mapping Summary:")
-        slide_builder_print(f"    Successful: {len(successful_mappings)} fields")
-        for mapping in successful_mappings:
-            slide_builder_print(f"      {mapping}")
+        if debug:
+            slide_builder_print("  Mapping Summary:")
+            slide_builder_print(f"    Successful: {len(successful_mappings)} fields")
+            for mapping in successful_mappings:
+                slide_builder_print(f"      {mapping}")
         if failed_mappings:
             error_print(f"    Failed: {len(failed_mappings)} fields")
             for field in failed_mappings:
@@ -368,68 +485,16 @@ class SlideBuilder:
         if field_name in field_to_index:
             return field_name
 
-        # Common variations mapping
-        variations = {
-            # Caption variations
-            "text_caption": ["text_caption_1", "caption", "caption_1"],
-            "caption": ["text_caption_1", "text_caption", "caption_1"],
-            # Title variations - CRITICAL: map "title" to "title_top" for template compatibility
-            "title": ["title_top", "title_top_1", "main_title"],
-            "title_top": ["title", "title_top_1", "main_title"],
-            "title_left": ["title_left_1", "left_title", "title_col1"],
-            "title_right": ["title_right_1", "right_title", "title_col2"],
-            # Content variations
-            "content_left": ["content_left_1", "left_content", "content_col1"],
-            "content_right": ["content_right_1", "right_content", "content_col2"],
-            "content": ["content_1", "main_content", "body"],
-            # Image variations
-            "image": ["image_1", "image_path", "picture"],
-            "image_1": ["image", "image_path", "picture"],
-            "image_path": ["image", "image_1", "picture"],
-            # Column variations
-            "content_col1": ["content_left", "content_left_1", "col1_content"],
-            "content_col2": ["content_right", "content_right_1", "col2_content"],
-            "content_col3": ["content_col3_1", "col3_content"],
-            "content_col4": ["content_col4_1", "col4_content"],
-            "title_col1": ["title_left", "title_left_1", "col1_title"],
-            "title_col2": ["title_right", "title_right_1", "col2_title"],
-            "title_col3": ["title_col3_1", "col3_title"],
-            "title_col4": ["title_col4_1", "col4_title"],
-            # Item variations (for agenda, lists)
-            "content_item1": ["content_item1_1", "item1_content", "item_1"],
-            "content_item2": ["content_item2_1", "item2_content", "item_2"],
-            "content_item3": ["content_item3_1", "item3_content", "item_3"],
-            "content_item4": ["content_item4_1", "item4_content", "item_4"],
-            "content_item5": ["content_item5_1", "item5_content", "item_5"],
-            "content_item6": ["content_item6_1", "item6_content", "item_6"],
-            # Number variations (for agenda)
-            "number_item1": ["number_item1_1", "item1_number", "num_1"],
-            "number_item2": ["number_item2_1", "item2_number", "num_2"],
-            "number_item3": ["number_item3_1", "item3_number", "num_3"],
-            "number_item4": ["number_item4_1", "item4_number", "num_4"],
-            "number_item5": ["number_item5_1", "item5_number", "num_5"],
-            "number_item6": ["number_item6_1", "item6_number", "num_6"],
-            # SWOT Analysis variations
-            "content_top_left": ["content_16", "strengths", "strength"],
-            "content_top_right": ["content_17", "weaknesses", "weakness"],
-            "content_bottom_left": ["content_18", "opportunities", "opportunity"],
-            "content_bottom_right": ["content_19", "threats", "threat"],
-            "content_16": ["content_top_left", "strengths", "strength"],
-            "content_17": ["content_top_right", "weaknesses", "weakness"],
-            "content_18": ["content_bottom_left", "opportunities", "opportunity"],
-            "content_19": ["content_bottom_right", "threats", "threat"],
-        }
-
         # Check if field_name has variations to try
-        if field_name in variations:
-            for variant in variations[field_name]:
+        if field_name in FIELD_NAME_VARIATIONS:
+            for variant in FIELD_NAME_VARIATIONS[field_name]:
                 if variant in field_to_index:
                     return variant
 
         # Reverse lookup - check if template has a field that maps to this user field
         for template_field in field_to_index.keys():
-            if template_field in variations:
-                if field_name in variations[template_field]:
+            if template_field in FIELD_NAME_VARIATIONS:
+                if field_name in FIELD_NAME_VARIATIONS[template_field]:
                     return template_field
 
         # Smart suffix handling - try adding/removing _1 suffix
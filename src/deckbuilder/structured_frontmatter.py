@@ -12,7 +12,9 @@ PowerPoint placeholder names while maintaining full functionality. It includes:
 Based on the Template Discovery System specification (Option C).
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+from .pattern_registry import pattern_registry
 
 
 class StructuredFrontmatterRegistry:
@@ -21,9 +23,15 @@ class StructuredFrontmatterRegistry:
     def __init__(self, template_mapping: Optional[Dict] = None):
         """Initialize with template mapping from JSON file"""
         self.template_mapping = template_mapping or {}
+        self._mapping_rules: Dict[str, Dict[str, str]] = {}
+
+    def get_structure_patterns(self) -> Mapping[str, Any]:
+        """Get structure patterns that define how to parse structured frontmatter (built once per process)"""
+        return pattern_registry.get_static("structured_frontmatter", self._build_structure_patterns)
 
-    def get_structure_patterns(self):
-        """Get structure patterns that define how to parse structured frontmatter"""
+    @staticmethod
+    def _build_structure_patterns() -> Dict[str, Any]:
+        """Build the in-code structure pattern table"""
         return {
             "Four Columns With Titles": {
                 "structure_type": "columns",
@@ -278,10 +286,12 @@ comparison:
         if not pattern:
             return {}
 
-        # Build mapping rules dynamically from template mapping
-        mapping_rules = self._build_mapping_rules(layout_name)
+        # Build mapping rules dynamically from template mapping (once per layout)
+        mapping_rules = self._mapping_rules.get(layout_name)
+        if mapping_rules is None:
+            mapping_rules = self._mapping_rules[layout_name] = self._build_mapping_rules(layout_name)
 
-        return {**pattern, "mapping_rules": mapping_rules}
+        return {**pattern, "mapping_rules": dict(mapping_rules)}
 
     def _build_mapping_rules(self, layout_name: str) -> Dict[str, str]:
         """Build mapping rules dynamically from template JSON"""
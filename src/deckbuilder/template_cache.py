@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+In-process Template Cache for Deckbuilder
+
+Keeps a pre-processed copy of each .pptx template in memory so repeated
+presentation builds do not re-read, re-inflate and re-clear the template
+from disk. Entries are keyed by template path and modification time, so
+editing a template on disk transparently invalidates its cached copy.
+"""
+
+import io
+import os
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from pptx import Presentation
+
+
+class TemplateCache:
+    """Thread-safe cache of slide-free template packages.
+
+    Each entry holds the template with all sample slides removed and the zip
+    re-written without compression. Handing out a presentation is then a
+    single in-memory package load: no disk I/O, no inflate, no slide clearing.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        """
+        Initialize the template cache.
+
+        Args:
+            max_entries: Maximum number of templates kept in memory (LRU eviction)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, float], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._miss_seconds = 0.0
+        self._hit_seconds = 0.0
+
+    def get_presentation(self, template_path: str):
+        """
+        Return a fresh, independent presentation for the given template.
+
+        Args:
+            template_path: Path to the .pptx template file
+
+        Returns:
+            python-pptx Presentation with no slides, ready for slide building
+        """
+        start = time.perf_counter()
+        key = self._make_key(template_path)
+
+        with self._lock:
+            package_bytes = self._entries.get(key)
+            if package_bytes is not None:
+                self._entries.move_to_end(key)
+
+        if package_bytes is not None:
+            prs = Presentation(io.BytesIO(package_bytes))
+            with self._lock:
+                self._hits += 1
+                self._hit_seconds += time.perf_counter() - start
+            return prs
+
+        # Miss: load from disk, strip sample slides, and store uncompressed
+        prs = Presentation(template_path)
+        self._strip_slides(prs)
+        package_bytes = self._to_stored_zip(prs)
+
+        with self._lock:
+            self._entries[key] = package_bytes
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._misses += 1
+            self._miss_seconds += time.perf_counter() - start
+
+        return prs
+
+    def invalidate(self, template_path: Optional[str] = None) -> None:
+        """Drop cached entries for one template path, or all entries if no path given."""
+        with self._lock:
+            if template_path is None:
+                self._entries.clear()
+                return
+            path = os.path.abspath(str(template_path))
+            for key in [k for k in self._entries if k[0] == path]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._miss_seconds = 0.0
+            self._hit_seconds = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counts, timings and estimated time saved
+        """
+        with self._lock:
+            avg_miss = self._miss_seconds / self._misses if self._misses else 0.0
+            avg_hit = self._hit_seconds / self._hits if self._hits else 0.0
+            saved = max(0.0, (avg_miss - avg_hit) * self._hits)
+            return {
+                "entries": len(self._entries),
+                "cached_bytes": sum(len(b) for b in self._entries.values()),
+                "hits": self._hits,
+                "misses": self._misses,
+                "avg_miss_seconds": round(avg_miss, 6),
+                "avg_hit_seconds": round(avg_hit, 6),
+                "estimated_seconds_saved": round(saved, 6),
+            }
+
+    def _make_key(self, template_path: str) -> Tuple[str, float]:
+        """Build the cache key from absolute path and modification time."""
+        path = os.path.abspath(str(template_path))
+        return path, os.stat(path).st_mtime
+
+    def _strip_slides(self, prs) -> None:
+        """Remove all sample slides shipped with the template."""
+        for i in range(len(prs.slides) - 1, -1, -1):
+            rId = prs.slides._sldIdLst[i].rId
+            prs.part.drop_rel(rId)
+            del prs.slides._sldIdLst[i]
+
+    def _to_stored_zip(self, prs) -> bytes:
+        """Serialize a presentation and re-pack it without compression."""
+        deflated = io.BytesIO()
+        prs.save(deflated)
+        deflated.seek(0)
+
+        stored = io.BytesIO()
+        with zipfile.ZipFile(deflated) as src, zipfile.ZipFile(stored, "w", zipfile.ZIP_STORED) as dst:
+            for info in src.infolist():
+                dst.writestr(info.filename, src.read(info.filename))
+        return stored.getvalue()
+
+
+# Global instance shared by all Deckbuilder instances in this process
+template_cache = TemplateCache()
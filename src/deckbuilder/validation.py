@@ -75,6 +75,25 @@ class PresentationValidator:
 
         success_print("✅ Markdown → JSON validation passed")
 
+    def validate_markdown_section(self, section_num: int, frontmatter_raw: Optional[str], json_slide: Dict[str, Any]):
+        """
+        Validate the conversion of a single markdown section while streaming.
+
+        Applies the per-section checks of validate_markdown_to_json as each slide
+        is parsed, so errors surface before the next section is read.
+        """
+        import yaml
+
+        if frontmatter_raw is None:
+            raise ValidationError(f"Markdown → JSON conversion error: section {section_num} has no frontmatter\n" f"Fix: Start each slide with a '---' delimited frontmatter block containing 'layout'")
+
+        try:
+            frontmatter = yaml.safe_load(frontmatter_raw) or {}
+        except yaml.YAMLError as e:
+            raise ValidationError(f"YAML parsing error in markdown frontmatter: {e}\n" f"Fix: Check YAML syntax in frontmatter section")
+
+        self._validate_section_conversion(section_num, {"frontmatter": frontmatter, "raw_frontmatter": frontmatter_raw}, json_slide)
+
     def validate_pre_generation(self):
         """
         Validate JSON ↔ Template mapping alignment before generation.
@@ -84,56 +103,59 @@ class PresentationValidator:
         validation_print("🔍 JSON → Template validation: Mapping alignment...")
 
         # Debug: Show template mapping structure
-        validation_print(f"[Validation] Template mapping loaded: {self.template_name}.json")
+        validation_print("[Validation] Template mapping loaded: %s.json", self.template_name)
         layouts = self.template_mapping.get("layouts", {})
-        validation_print(f"[Validation] Available layouts: {list(layouts.keys())}")
-        validation_print(f"[Validation] Validating {len(self.presentation_data.get('slides', []))} slides")
+        validation_print("[Validation] Available layouts: %s", lambda: list(layouts.keys()))
+        validation_print("[Validation] Validating %d slides", len(self.presentation_data.get("slides", [])))
 
         # Validate each slide's placeholders can be mapped
         for slide_idx, slide_data in enumerate(self.presentation_data.get("slides", [])):
-            slide_num = slide_idx + 1
-            layout_name = slide_data.get("layout")
+            self.validate_slide_pre_generation(slide_idx + 1, slide_data)
 
-            validation_print(f"[Validation] Slide {slide_num}: Checking layout '{layout_name}'")
+        success_print("✅ Pre-generation validation passed")
 
-            if not layout_name:
-                raise ValidationError(f"Slide {slide_num}: Missing 'layout' field\n" f"Fix: Add 'layout' field with valid layout name")
+    def validate_slide_pre_generation(self, slide_num: int, slide_data: Dict[str, Any]):
+        """Validate a single slide's layout and placeholders against the template mapping."""
+        layout_name = slide_data.get("layout")
 
-            # Check layout exists in template mapping
-            layouts = self.template_mapping.get("layouts", {})
-            if layout_name not in layouts:
-                available_layouts = list(layouts.keys())
-                error_print(f"[Validation] ERROR: Layout '{layout_name}' not found in template mapping")
-                raise ValidationError(
-                    f"Slide {slide_num}: Unknown layout '{layout_name}'\n" f"Available layouts: {', '.join(available_layouts)}\n" f"Fix: Use one of the available layouts or update template mapping"
-                )
+        validation_print("[Validation] Slide %d: Checking layout '%s'", slide_num, layout_name)
+
+        if not layout_name:
+            raise ValidationError(f"Slide {slide_num}: Missing 'layout' field\n" f"Fix: Add 'layout' field with valid layout name")
 
-            # Show slide content fields for debugging
-            placeholders = slide_data.get("placeholders", {})
-            validation_print(f"[Validation]   Placeholder fields: {list(placeholders.keys())}")
+        # Check layout exists in template mapping
+        layouts = self.template_mapping.get("layouts", {})
+        if layout_name not in layouts:
+            available_layouts = list(layouts.keys())
+            error_print(f"[Validation] ERROR: Layout '{layout_name}' not found in template mapping")
+            raise ValidationError(
+                f"Slide {slide_num}: Unknown layout '{layout_name}'\n" f"Available layouts: {', '.join(available_layouts)}\n" f"Fix: Use one of the available layouts or update template mapping"
+            )
 
-            # Legacy content blocks should not exist in structured frontmatter
-            if "content" in slide_data:
-                validation_print("[Validation]   WARNING: Legacy content blocks detected - should be converted to placeholders")
+        # Show slide content fields for debugging
+        placeholders = slide_data.get("placeholders", {})
+        validation_print("[Validation]   Placeholder fields: %s", lambda: list(placeholders.keys()))
 
-            # Validate placeholder mappings
-            self._validate_slide_placeholders(slide_num, slide_data, layout_name)
+        # Legacy content blocks should not exist in structured frontmatter
+        if "content" in slide_data:
+            validation_print("[Validation]   WARNING: Legacy content blocks detected - should be converted to placeholders")
 
-        success_print("✅ Pre-generation validation passed")
+        # Validate placeholder mappings
+        self._validate_slide_placeholders(slide_num, slide_data, layout_name)
 
     def _validate_slide_placeholders(self, slide_num: int, slide_data: Dict[str, Any], layout_name: str):
         """Validate that all placeholders in slide can be mapped to template."""
         layout_info = self.template_mapping["layouts"][layout_name]
         placeholder_mappings = layout_info.get("placeholders", {})
 
-        validation_print(f"[Validation]   Template placeholders for '{layout_name}': {placeholder_mappings}")
+        validation_print("[Validation]   Template placeholders for '%s': %s", layout_name, placeholder_mappings)
 
         # Create reverse mapping: field_name -> placeholder_index
         field_to_index = {}
         for placeholder_idx, field_name in placeholder_mappings.items():
             field_to_index[field_name] = int(placeholder_idx)
 
-        validation_print(f"[Validation]   Field-to-index mapping: {field_to_index}")
+        validation_print("[Validation]   Field-to-index mapping: %s", field_to_index)
 
         # Check all placeholder fields in slide data
         placeholders = slide_data.get("placeholders", {})
@@ -147,10 +169,10 @@ class PresentationValidator:
             # Check if field can be resolved
             if self._can_resolve_field_name(field_name, field_to_index):
                 mapped_fields.append(field_name)
-                validation_print(f"[Validation]     ✓ '{field_name}' can be mapped")
+                validation_print("[Validation]     ✓ '%s' can be mapped", field_name)
             else:
                 unmapped_fields.append(field_name)
-                validation_print(f"[Validation]     ✗ '{field_name}' cannot be mapped")
+                validation_print("[Validation]     ✗ '%s' cannot be mapped", field_name)
 
         if unmapped_fields:
             available_fields = list(field_to_index.keys())
@@ -252,33 +274,50 @@ class PresentationValidator:
         # Return original if no variations found
         return field_name
 
-    def validate_post_generation(self, pptx_file_path: str):
+    def validate_post_generation(self, pptx_file_path: Optional[str] = None, prs=None, paranoid: bool = False):
         """
         Validate PPTX output ↔ JSON input after generation.
 
+        By default the live in-memory presentation (``prs``) is validated, which
+        avoids re-opening and re-parsing the file that was just written. Paranoid
+        mode (or calling without ``prs``) re-reads the saved file from disk so the
+        serialized output itself is verified.
+
+        Args:
+            pptx_file_path: Path to the saved PPTX file
+            prs: In-memory presentation that was saved to pptx_file_path
+            paranoid: Re-load the saved file from disk even when prs is given
+
         Raises ValidationError if generated content doesn't match specification.
         """
         validation_print("🔍 Post-generation validation: PPTX ↔ JSON verification...")
-        validation_print(f"[Validation] Loading generated PPTX: {pptx_file_path}")
 
-        if not Path(pptx_file_path).exists():
-            raise ValidationError(f"Generated PPTX file not found: {pptx_file_path}")
+        if paranoid or prs is None:
+            if not pptx_file_path:
+                raise ValidationError("Post-generation validation requires a PPTX file path or an in-memory presentation")
+
+            validation_print("[Validation] Loading generated PPTX: %s", pptx_file_path)
 
-        # Load generated presentation
-        prs = Presentation(pptx_file_path)
+            if not Path(pptx_file_path).exists():
+                raise ValidationError(f"Generated PPTX file not found: {pptx_file_path}")
+
+            # Load generated presentation
+            prs = Presentation(pptx_file_path)
+        else:
+            validation_print("[Validation] Validating in-memory presentation (no disk reload)")
 
         # Validate slide count
         expected_slides = len(self.presentation_data.get("slides", []))
         actual_slides = len(prs.slides)
 
-        validation_print(f"[Validation] Slide count check: expected={expected_slides}, actual={actual_slides}")
+        validation_print("[Validation] Slide count check: expected=%d, actual=%d", expected_slides, actual_slides)
 
         if actual_slides != expected_slides:
             raise ValidationError(f"Slide count mismatch: expected {expected_slides}, got {actual_slides}\n" f"Fix: Check slide generation logic for dropped or duplicated slides")
 
         # Validate each slide content
         validation_errors = []
-        validation_print(f"[Validation] Validating content for {actual_slides} slides...")
+        validation_print("[Validation] Validating content for %d slides...", actual_slides)
 
         for slide_idx, (slide, slide_spec) in enumerate(zip(prs.slides, self.presentation_data["slides"])):
             slide_num = slide_idx + 1
@@ -286,7 +325,7 @@ class PresentationValidator:
 
             try:
                 self._validate_slide_content(slide_num, slide, slide_spec)
-                validation_print(f"[Validation] Slide {slide_num} ({layout_name}): Content validation passed")
+                validation_print("[Validation] Slide %d (%s): Content validation passed", slide_num, layout_name)
             except ValidationError as e:
                 error_print(f"[Validation] Slide {slide_num} ({layout_name}): Content validation failed")
                 validation_errors.append(str(e))
@@ -297,6 +336,20 @@ class PresentationValidator:
 
         success_print("✅ Post-generation validation passed")
 
+    def validate_slide_post_generation(self, slide_num: int, slide, slide_spec: Dict[str, Any]):
+        """
+        Validate one generated slide against its specification right after it is built.
+
+        Raises the same ValidationError as validate_post_generation, for a single slide.
+        """
+        layout_name = slide_spec.get("layout", "unknown")
+        try:
+            self._validate_slide_content(slide_num, slide, slide_spec)
+        except ValidationError as e:
+            error_print(f"[Validation] Slide {slide_num} ({layout_name}): Content validation failed")
+            raise ValidationError(f"Post-generation validation failed:\n{e}\n" f"Fix: Check placeholder mapping logic in slide_builder.py")
+        validation_print("[Validation] Slide %d (%s): Content validation passed", slide_num, layout_name)
+
     def _validate_slide_content(self, slide_num: int, slide, slide_spec: Dict[str, Any]):
         """Validate individual slide content against specification."""
         layout_name = slide_spec["layout"]
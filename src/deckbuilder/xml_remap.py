@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+XML-level Language and Font Remapping
+
+Fast path for FormattingSupport.update_presentation. Instead of loading the
+whole presentation into python-pptx and walking shapes, text frames and runs
+through proxy objects, the .pptx package is copied entry by entry. Slide,
+layout and master parts are parsed with lxml one at a time, and only the
+``a:r`` runs python-pptx would visit are rewritten:
+
+- run text (language text replacements)
+- ``a:rPr/@lang`` (proofing language)
+- ``a:rPr/a:latin/@typeface`` (font)
+
+The theme's major/minor Latin fonts are updated when a font is given. Every
+other package entry, and every part without a changed run, is copied through
+unmodified.
+"""
+
+import os
+import posixpath
+import re
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from lxml import etree  # nosec B410 - parsing trusted PowerPoint XML
+
+NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+
+_A = "{%s}" % NS["a"]
+_P = "{%s}" % NS["p"]
+_R_ID = "{%s}id" % NS["r"]
+
+OFFICE_DOCUMENT_RELTYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+
+# a:rPr children that must follow a:latin (schema order)
+_LATIN_SUCCESSORS = frozenset(_A + tag for tag in ("ea", "cs", "sym", "hlinkClick", "hlinkMouseOver", "rtl", "extLst"))
+
+# Control characters python-pptx escapes as _xHHHH_ when run text is set
+_CTRL_CHARS = re.compile(r"([\x00-\x08\x0B-\x1F])")
+
+_PARSER = etree.XMLParser(resolve_entities=False, huge_tree=True)
+
+
+def _escape_ctrl_chars(text: str) -> str:
+    return _CTRL_CHARS.sub(lambda match: "_x%04X_" % ord(match.group(1)), text)
+
+
+def _rels_name(part_name: str) -> str:
+    """Package name of a part's relationships entry (ppt/slides/slide1.xml -> ppt/slides/_rels/slide1.xml.rels)."""
+    directory, name = posixpath.split(part_name)
+    return posixpath.join(directory, "_rels", f"{name}.rels")
+
+
+class _Package:
+    """Read access to the parts and relationships of an open .pptx zip."""
+
+    def __init__(self, zip_file: zipfile.ZipFile):
+        self.zip_file = zip_file
+        self.names = set(zip_file.namelist())
+
+    def xml(self, part_name: str):
+        return etree.fromstring(self.zip_file.read(part_name), _PARSER)  # nosec B320 - parsing trusted PowerPoint XML
+
+    def relationships(self, part_name: str) -> List[Tuple[str, str, str, str]]:
+        """(rId, reltype, target_ref, target part name) of a part's internal relationships, in file order."""
+        rels_name = _rels_name(part_name) if part_name else "_rels/.rels"
+        if rels_name not in self.names:
+            return []
+        base = posixpath.dirname(part_name)
+        relationships = []
+        for rel in self.xml(rels_name).iterfind("rel:Relationship", NS):
+            if rel.get("TargetMode") == "External":
+                continue
+            target_ref = rel.get("Target", "")
+            target = target_ref.lstrip("/") if target_ref.startswith("/") else posixpath.normpath(posixpath.join(base, target_ref))
+            relationships.append((rel.get("Id"), rel.get("Type", ""), target_ref, target))
+        return relationships
+
+    def related_parts(self, part_name: str, root, id_list_path: str) -> List[str]:
+        """Part names referenced, in order, by the r:id attributes of an ID list (e.g. p:sldIdLst/p:sldId)."""
+        targets = {rel_id: target for rel_id, _, _, target in self.relationships(part_name)}
+        return [targets[elm.get(_R_ID)] for elm in root.iterfind(id_list_path, NS) if elm.get(_R_ID) in targets]
+
+
+class XmlRemapper:
+    """Rewrite run text, language and font of a .pptx package at the XML level."""
+
+    def __init__(self, formatter, language_code: Optional[str] = None, font_name: Optional[str] = None):
+        """
+        Args:
+            formatter: FormattingSupport providing language IDs and text replacements
+            language_code: Optional language code (or name) to apply
+            font_name: Optional font name to apply
+        """
+        self.formatter = formatter
+        self.language_code = language_code
+        self.font_name = font_name
+        normalized = formatter.normalize_language_input(language_code) if language_code else None
+        language_id = formatter.LANGUAGE_IDS.get(normalized) if normalized else None
+        self.lang = language_id.xml_value if language_id is not None else None
+
+    def remap(self, source: Union[str, Path], destination: Union[str, Path]) -> Dict[str, int]:
+        """
+        Write a remapped copy of ``source`` to ``destination`` (which may be the same file).
+
+        The copy is written to a temporary file next to the destination and renamed into
+        place, so the destination is never left half-written.
+
+        Returns:
+            Statistics with the same keys as FormattingSupport.update_presentation
+        """
+        stats = {
+            "master_slides_processed": 0,
+            "content_slides_processed": 0,
+            "total_runs_processed": 0,
+            "total_language_applied": 0,
+            "total_font_applied": 0,
+            "total_text_replaced": 0,
+            "theme_fonts_updated": 0,
+        }
+        destination = Path(destination)
+        temp_path = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+
+        try:
+            with zipfile.ZipFile(source) as zip_in, zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as zip_out:
+                package = _Package(zip_in)
+                masters, layouts, slides, theme = self._text_parts(package)
+                stats["master_slides_processed"] = len(masters)
+                stats["content_slides_processed"] = len(slides)
+                text_parts = set(masters) | set(layouts) | set(slides)
+
+                for info in zip_in.infolist():
+                    data = zip_in.read(info.filename)
+                    if info.filename in text_parts:
+                        data = self._remap_part(data, stats)
+                    elif info.filename == theme and self.font_name:
+                        data, updated = self._update_theme_fonts(data)
+                        stats["theme_fonts_updated"] = int(updated)
+                    zip_out.writestr(info, data)
+            os.replace(temp_path, destination)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+        return stats
+
+    def _text_parts(self, package: _Package) -> Tuple[List[str], List[str], List[str], Optional[str]]:
+        """Masters, layouts and slides of the presentation (as python-pptx enumerates them) and its theme part."""
+        document = next((target for _, reltype, _, target in package.relationships("") if reltype == OFFICE_DOCUMENT_RELTYPE), "ppt/presentation.xml")
+        presentation = package.xml(document)
+        masters = package.related_parts(document, presentation, "p:sldMasterIdLst/p:sldMasterId")
+        slides = package.related_parts(document, presentation, "p:sldIdLst/p:sldId")
+        layouts = []
+        for master in masters:
+            layouts.extend(package.related_parts(master, package.xml(master), "p:sldLayoutIdLst/p:sldLayoutId"))
+        theme = next((target for _, _, target_ref, target in package.relationships(document) if "theme" in target_ref), None)
+        return masters, layouts, slides, theme
+
+    def _remap_part(self, data: bytes, stats: Dict[str, int]) -> bytes:
+        """Rewrite the runs of one slide, layout or master part; unchanged parts are returned as-is."""
+        root = etree.fromstring(data, _PARSER)  # nosec B320 - parsing trusted PowerPoint XML
+        changed = False
+        sp_tree = root.find("p:cSld/p:spTree", NS)
+        if sp_tree is not None:
+            for run in self._iter_runs(sp_tree):
+                changed |= self._remap_run(run, stats)
+        if not changed:
+            return data
+        return etree.tostring(root, encoding="UTF-8", xml_declaration=True, standalone=True)
+
+    def _iter_runs(self, shape_tree):
+        """Yield the a:r runs of text shapes, table cells and grouped shapes, in document order."""
+        for shape in shape_tree:
+            tag = shape.tag
+            if tag == _P + "sp":
+                tx_bodies = shape.iterchildren(_P + "txBody")
+            elif tag == _P + "graphicFrame":
+                tx_bodies = shape.iterfind("a:graphic/a:graphicData/a:tbl/a:tr/a:tc/a:txBody", NS)
+            elif tag == _P + "grpSp":
+                yield from self._iter_runs(shape)
+                continue
+            else:
+                continue
+            for tx_body in tx_bodies:
+                for paragraph in tx_body.iterchildren(_A + "p"):
+                    yield from paragraph.iterchildren(_A + "r")
+
+    def _remap_run(self, run, stats: Dict[str, int]) -> bool:
+        """Apply text replacements, language and font to one run; True when the XML changed."""
+        stats["total_runs_processed"] += 1
+        changed = False
+
+        if self.language_code:
+            t = run.find(_A + "t")
+            text = t.text if t is not None else None
+            if text:
+                replaced = self.formatter.apply_text_replacements(text, self.language_code)
+                if replaced != text:
+                    t.text = _escape_ctrl_chars(replaced)
+                    stats["total_text_replaced"] += 1
+                    changed = True
+
+            if self.lang:
+                r_pr = self._get_or_add_rpr(run)
+                if r_pr.get("lang") != self.lang:
+                    r_pr.set("lang", self.lang)
+                    changed = True
+                stats["total_language_applied"] += 1
+
+        if self.font_name:
+            latin = self._get_or_add_latin(self._get_or_add_rpr(run))
+            if latin.get("typeface") != self.font_name:
+                latin.set("typeface", self.font_name)
+                changed = True
+            stats["total_font_applied"] += 1
+
+        return changed
+
+    def _get_or_add_rpr(self, run):
+        r_pr = run.find(_A + "rPr")
+        if r_pr is None:
+            r_pr = etree.Element(_A + "rPr")
+            run.insert(0, r_pr)
+        return r_pr
+
+    def _get_or_add_latin(self, r_pr):
+        latin = r_pr.find(_A + "latin")
+        if latin is None:
+            latin = etree.Element(_A + "latin")
+            successor = next((child for child in r_pr if child.tag in _LATIN_SUCCESSORS), None)
+            if successor is None:
+                r_pr.append(latin)
+            else:
+                successor.addprevious(latin)
+        return latin
+
+    def _update_theme_fonts(self, data: bytes) -> Tuple[bytes, bool]:
+        """Set the theme's major and minor Latin typefaces, like FormattingSupport.update_theme_fonts."""
+        root = etree.fromstring(data, _PARSER)  # nosec B320 - parsing trusted PowerPoint XML
+        major = root.xpath(".//a:majorFont/a:latin", namespaces=NS)
+        minor = root.xpath(".//a:minorFont/a:latin", namespaces=NS)
+        if not (major and minor):
+            return data, False
+        major[0].set("typeface", self.font_name)
+        minor[0].set("typeface", self.font_name)
+        return etree.tostring(root, encoding="utf-8", xml_declaration=True), True
@@ -0,0 +1,121 @@
+"""
+Bounded executor for heavy MCP tool work.
+
+Presentation generation is synchronous and CPU/IO heavy. Running it directly
+inside an ``async def`` tool blocks the event loop, so every other request
+(template discovery, validation, ...) stalls behind one large deck. This module
+runs such work on a thread pool with a fixed concurrency limit and a bounded
+wait queue, rejecting new work with a clear error once the queue is full.
+
+Configuration (environment variables):
+    DECKBUILDER_MAX_CONCURRENCY: Builds running at the same time (default: 2)
+    DECKBUILDER_MAX_QUEUE: Builds allowed to wait for a free slot (default: 8)
+"""
+
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_MAX_CONCURRENCY = 2
+DEFAULT_MAX_QUEUE = 8
+
+
+class GenerationQueueFull(RuntimeError):
+    """Raised when the executor is at capacity and the wait queue is full."""
+
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    """Read an integer setting from the environment, falling back on bad values."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return max(minimum, int(value))
+    except ValueError:
+        return default
+
+
+class GenerationExecutor:
+    """Runs blocking callables off the event loop with bounded concurrency and queue depth."""
+
+    def __init__(self, max_concurrency: Optional[int] = None, max_queue: Optional[int] = None):
+        """
+        Initialize the executor.
+
+        Args:
+            max_concurrency: Maximum number of jobs running at once
+            max_queue: Maximum number of jobs waiting for a free worker
+        """
+        self.max_concurrency = max_concurrency if max_concurrency is not None else _env_int("DECKBUILDER_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY, 1)
+        self.max_queue = max_queue if max_queue is not None else _env_int("DECKBUILDER_MAX_QUEUE", DEFAULT_MAX_QUEUE, 0)
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if self.max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="deckbuilder-gen")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+
+    @property
+    def capacity(self) -> int:
+        """Total jobs accepted at once (running plus queued)."""
+        return self.max_concurrency + self.max_queue
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run ``func(*args, **kwargs)`` on a worker thread and await the result.
+
+        Raises:
+            GenerationQueueFull: If max_concurrency jobs are running and max_queue are waiting
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self._rejected += 1
+                raise GenerationQueueFull(
+                    f"Server busy: {self._in_flight} presentation jobs already running or queued " f"(concurrency {self.max_concurrency}, queue {self.max_queue}). Retry shortly."
+                )
+            self._in_flight += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._completed += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return executor usage statistics."""
+        with self._lock:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "running": min(self._in_flight, self.max_concurrency),
+                "queued": max(0, self._in_flight - self.max_concurrency),
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=wait)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_generation_executor() -> GenerationExecutor:
+    """Return the process-wide generation executor, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = GenerationExecutor()
+        return _executor
@@ -11,8 +11,11 @@ from mcp.server.fastmcp import Context, FastMCP
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+from deckbuilder.builder_pool import get_deckbuilder_pool  # noqa: E402
 from deckbuilder.engine import get_deckbuilder_client  # noqa: E402
+from deckbuilder.profiling import profile_session, span  # noqa: E402
 from deckbuilder.template_metadata import TemplateMetadataLoader  # noqa: E402
+from mcp_server.generation_executor import GenerationQueueFull, get_generation_executor  # noqa: E402
 
 # Content-first tools moved to content_first_tools.py to keep core server focused
 
@@ -30,6 +33,83 @@ def get_deck_client():
     return deck
 
 
+def _build_presentation(canonical_data: dict, fileName: str, templateName: str) -> str:
+    """Build a presentation on a pooled builder sized to the generation executor."""
+    pool = get_deckbuilder_pool(size=get_generation_executor().max_concurrency)
+    with pool.builder() as builder:
+        return builder.create_presentation(canonical_data, fileName, templateName)
+
+
+def _run_profiled(include_profile: bool, func, *args) -> str:
+    """Run a blocking build, appending a timing summary and JSON timing tree when requested."""
+    if not include_profile:
+        return func(*args)
+
+    with profile_session("deck") as profiler:
+        result = func(*args)
+    return f"{result}\n\n{profiler.format_summary()}\n\nTiming tree (JSON):\n{json.dumps(profiler.to_dict())}"
+
+
+def _create_presentation_from_file_sync(file_path: str, fileName: str, templateName: str) -> str:
+    """Blocking implementation of create_presentation_from_file (runs on a worker thread)."""
+    # Check if file exists
+    if not os.path.exists(file_path):
+        return f"Error: File not found: {file_path}"
+
+    # Determine file type and process accordingly
+    file_extension = os.path.splitext(file_path)[1].lower()
+
+    if file_extension == ".json":
+        # Read JSON file
+        with span("json_load"):
+            with open(file_path, "r", encoding="utf-8") as f:
+                json_data = json.load(f)
+
+        # Convert JSON data to canonical format if needed
+        if "slides" not in json_data:
+            canonical_data = {"slides": [json_data] if isinstance(json_data, dict) else json_data}
+        else:
+            canonical_data = json_data
+
+        # Create presentation using the new API
+        result = _build_presentation(canonical_data, fileName, templateName)
+
+        return f"Successfully created presentation from JSON file: {file_path}. {result}"
+
+    elif file_extension == ".md":
+        # Read markdown file
+        with open(file_path, "r", encoding="utf-8") as f:
+            markdown_content = f.read()
+
+        # Convert markdown to canonical JSON format
+        from deckbuilder.converter import markdown_to_canonical_json
+
+        with span("markdown_parse"):
+            canonical_data = markdown_to_canonical_json(markdown_content)
+
+        # Create presentation using the new API
+        result = _build_presentation(canonical_data, fileName, templateName)
+
+        return f"Successfully created presentation from markdown file: " f"{file_path} with {len(canonical_data['slides'])} slides. {result}"
+
+    else:
+        return f"Error: Unsupported file type '{file_extension}'. Supported types: .json, .md"
+
+
+def _create_presentation_from_markdown_sync(markdown_content: str, fileName: str, templateName: str) -> str:
+    """Blocking implementation of create_presentation_from_markdown (runs on a worker thread)."""
+    # Convert markdown to canonical JSON format
+    from deckbuilder.converter import markdown_to_canonical_json
+
+    with span("markdown_parse"):
+        canonical_data = markdown_to_canonical_json(markdown_content)
+
+    # Create presentation using the new API
+    result = _build_presentation(canonical_data, fileName, templateName)
+
+    return f"Successfully created presentation with {len(canonical_data['slides'])} slides " f"from markdown. {result}"
+
+
 # Create a dataclass for our application context
 @dataclass
 class DeckbuilderContext:
@@ -81,6 +161,7 @@ async def create_presentation_from_file(
     file_path: str,
     fileName: str = "Sample_Presentation",
     templateName: str = "default",
+    include_profile: bool = False,
 ) -> str:
     """Create a complete PowerPoint presentation from JSON or markdown file
 
@@ -98,6 +179,7 @@ async def create_presentation_from_file(
         file_path: Absolute path to JSON or markdown file (process content as-is)
         fileName: Output filename (default: Sample_Presentation)
         templateName: Template to use (default: default)
+        include_profile: Append per-stage timings (summary plus JSON timing tree) to the response
 
     Supported file types:
         - .json files: JSON format with presentation data
@@ -114,47 +196,11 @@ async def create_presentation_from_file(
         - Automatic file type detection
     """
     try:
-        # Check if file exists
-        if not os.path.exists(file_path):
-            return f"Error: File not found: {file_path}"
-
-        # Determine file type and process accordingly
-        file_extension = os.path.splitext(file_path)[1].lower()
-
-        if file_extension == ".json":
-            # Read JSON file
-            with open(file_path, "r", encoding="utf-8") as f:
-                json_data = json.load(f)
-
-            # Convert JSON data to canonical format if needed
-            if "slides" not in json_data:
-                canonical_data = {"slides": [json_data] if isinstance(json_data, dict) else json_data}
-            else:
-                canonical_data = json_data
-
-            # Create presentation using the new API
-            result = get_deck_client().create_presentation(canonical_data, fileName, templateName)
-
-            return f"Successfully created presentation from JSON file: {file_path}. {result}"
-
-        elif file_extension == ".md":
-            # Read markdown file
-            with open(file_path, "r", encoding="utf-8") as f:
-                markdown_content = f.read()
-
-            # Convert markdown to canonical JSON format
-            from deckbuilder.converter import markdown_to_canonical_json
-
-            canonical_data = markdown_to_canonical_json(markdown_content)
-
-            # Create presentation using the new API
-            result = get_deck_client().create_presentation(canonical_data, fileName, templateName)
-
-            return f"Successfully created presentation from markdown file: " f"{file_path} with {len(canonical_data['slides'])} slides. {result}"
-
-        else:
-            return f"Error: Unsupported file type '{file_extension}'. Supported types: .json, .md"
+        # Generation runs on a worker thread so the event loop stays responsive
+        return await get_generation_executor().run(_run_profiled, include_profile, _create_presentation_from_file_sync, file_path, fileName, templateName)
 
+    except GenerationQueueFull as e:
+        return f"Error: {str(e)}"
     except json.JSONDecodeError as e:
         return f"Error parsing JSON file: {str(e)}"
     except Exception as e:
@@ -167,6 +213,7 @@ async def create_presentation_from_markdown(
     markdown_content: str,
     fileName: str = "Sample_Presentation",
     templateName: str = "default",
+    include_profile: bool = False,
 ) -> str:
     """Create presentation from formatted markdown with frontmatter
 
@@ -184,6 +231,7 @@ async def create_presentation_from_markdown(
         markdown_content: Markdown string with frontmatter (use as-is)
         fileName: Output filename (default: Sample_Presentation)
         templateName: Template/theme to use (default: default)
+        include_profile: Append per-stage timings (summary plus JSON timing tree) to the response
 
     Example markdown format:
         ---
@@ -244,15 +292,10 @@ async def create_presentation_from_markdown(
         - custom_colors: Custom color overrides (header_bg, header_text, alt_row, border_color)
     """
     try:
-        # Convert markdown to canonical JSON format
-        from deckbuilder.converter import markdown_to_canonical_json
-
-        canonical_data = markdown_to_canonical_json(markdown_content)
-
-        # Create presentation using the new API
-        result = get_deck_client().create_presentation(canonical_data, fileName, templateName)
-
-        return f"Successfully created presentation with {len(canonical_data['slides'])} slides " f"from markdown. {result}"
+        # Generation runs on a worker thread so the event loop stays responsive
+        return await get_generation_executor().run(_run_profiled, include_profile, _create_presentation_from_markdown_sync, markdown_content, fileName, templateName)
+    except GenerationQueueFull as e:
+        return f"Error: {str(e)}"
     except Exception as e:
         return f"Error creating presentation from markdown: {str(e)}"
 
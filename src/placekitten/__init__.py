@@ -25,7 +25,16 @@ __license__ = "MIT"
 from .core import PlaceKitten
 from .filters import apply_filter, list_available_filters, register_custom_filter
 from .processor import ImageProcessor
-from .smart_crop import SmartCropEngine
+
+
+def __getattr__(name):
+    """Load SmartCropEngine (OpenCV/NumPy) only when it is first accessed."""
+    if name == "SmartCropEngine":
+        from .smart_crop import SmartCropEngine
+
+        return SmartCropEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Public API exports
 __all__ = [
@@ -9,6 +9,7 @@ import random
 from pathlib import Path
 from typing import List, Optional
 
+from .image_index import ImageIndex
 from .processor import ImageProcessor
 
 
@@ -30,6 +31,9 @@ class PlaceKitten:
         self.source_folder = source_folder
         self._image_cache = None
         self._setup_image_paths()
+        # Precomputed subject metadata, so crops of source images skip detection
+        # (file times are not kept when the bundled images are installed, so they match on name and size)
+        self.image_index = ImageIndex.load(self.images_path, check_mtime=self.source_folder != "demo")
 
     def _setup_image_paths(self) -> None:
         """Setup paths to kitten images."""
@@ -100,8 +104,9 @@ class PlaceKitten:
             # Use random for None or out-of-range image_id
             selected_image = random.choice(available_images)  # nosec
 
-        # Create ImageProcessor with the selected image
+        # Create ImageProcessor with the selected image; smart_crop reads its subject metadata from the index
         processor = ImageProcessor(str(selected_image))
+        processor.image_index = self.image_index
 
         # Handle dimensions - crop for exact dimensions or preserve aspect ratio
         if width is None and height is None:
@@ -139,6 +144,21 @@ class PlaceKitten:
         images = self._get_available_images()
         return [img.name for img in images]
 
+    def get_image_path(self, image_id: int) -> Optional[Path]:
+        """
+        Get the source file for an image ID.
+
+        Args:
+            image_id: Image ID (1-based index, as passed to generate)
+
+        Returns:
+            Path to the image, or None if the ID is out of range
+        """
+        available_images = self._get_available_images()
+        if 1 <= image_id <= len(available_images):
+            return available_images[image_id - 1]
+        return None
+
     def get_image_count(self) -> int:
         """
         Get count of available images.
@@ -181,6 +201,18 @@ class PlaceKitten:
 
         return results
 
+    def build_image_index(self, rebuild: bool = False) -> List[str]:
+        """
+        Analyse the source images and save their subject metadata index.
+
+        Args:
+            rebuild: Re-analyse images that already have a current entry
+
+        Returns:
+            Names of the images that were analysed
+        """
+        return self.image_index.build(self._get_available_images(), rebuild=rebuild)
+
     def is_available(self) -> bool:
         """
         Check if PlaceKitten service is available.
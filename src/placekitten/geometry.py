@@ -0,0 +1,71 @@
+"""
+Crop Geometry - Rule-of-thirds crop box calculation.
+
+Pure geometry shared by the OpenCV smart crop pipeline and the precomputed
+image index, so cropping from stored metadata does not need OpenCV. The
+default face detection settings live here too: the image index is only valid
+for crops that use them, and callers can check without importing OpenCV.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+# Haar face detection defaults: scale step between pyramid levels, and smallest face in pixels (None: cascade window)
+DEFAULT_FACE_SCALE_FACTOR = 1.1
+DEFAULT_FACE_MIN_SIZE: Optional[int] = None
+
+
+def calculate_optimal_crop(
+    orig_width: int,
+    orig_height: int,
+    target_width: int,
+    target_height: int,
+    subject_bbox: Optional[Sequence[int]],
+) -> Tuple[int, int, int, int]:
+    """
+    Calculate optimal crop box using rule of thirds and subject positioning.
+
+    Args:
+        orig_width: Original image width
+        orig_height: Original image height
+        target_width: Target crop width
+        target_height: Target crop height
+        subject_bbox: Bounding box of main subject (x, y, w, h)
+
+    Returns:
+        Crop box as (x1, y1, x2, y2)
+    """
+    target_ratio = target_width / target_height
+
+    # Calculate crop dimensions maintaining target aspect ratio
+    if orig_width / orig_height > target_ratio:
+        # Original is wider - crop width
+        crop_height = orig_height
+        crop_width = int(crop_height * target_ratio)
+    else:
+        # Original is taller - crop height
+        crop_width = orig_width
+        crop_height = int(crop_width / target_ratio)
+
+    # Default to center crop
+    crop_x = (orig_width - crop_width) // 2
+    crop_y = (orig_height - crop_height) // 2
+
+    # Adjust based on subject position if available
+    if subject_bbox is not None:
+        subj_x, subj_y, subj_w, subj_h = subject_bbox
+        subj_center_x = subj_x + subj_w // 2
+        subj_center_y = subj_y + subj_h // 2
+
+        # Try to position subject in lower third (rule of thirds)
+        ideal_subj_x = crop_width // 2
+        ideal_subj_y = int(crop_height * 2 / 3)  # Lower third
+
+        # Calculate desired crop position
+        desired_crop_x = subj_center_x - ideal_subj_x
+        desired_crop_y = subj_center_y - ideal_subj_y
+
+        # Ensure crop stays within image bounds
+        crop_x = max(0, min(desired_crop_x, orig_width - crop_width))
+        crop_y = max(0, min(desired_crop_y, orig_height - crop_height))
+
+    return (crop_x, crop_y, crop_x + crop_width, crop_y + crop_height)
@@ -0,0 +1,161 @@
+"""
+Image Index - Precomputed subject metadata for PlaceKitten source images.
+
+Source images never change, so the face boxes, dominant contour and saliency
+centroid found by the smart crop pipeline are stored once per folder in
+image_index.json. Cropping a source image with the default detection
+settings then only needs the geometry in geometry.calculate_optimal_crop.
+
+The bundled images ship with a prebuilt index (``deckbuilder image index``
+rebuilds it). Entries for custom source folders, new images or changed files
+are analysed on first use and written back to the folder's index.
+
+Entries are matched to files by name and byte size. Custom folders also
+compare the modification time (st_mtime_ns), so an edited image of the same
+size is re-analysed. The bundled index skips that check, because installing
+the package does not preserve file times.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+INDEX_FILENAME = "image_index.json"
+
+# Bump when the analysis changes, so stale indexes are rebuilt instead of used
+INDEX_VERSION = 1
+
+
+def subject_bbox_for(metadata: Dict, strategy: str) -> Optional[Sequence[int]]:
+    """
+    Subject box (x, y, w, h) that smart_crop would pick from this metadata.
+
+    Mirrors SmartCropEngine: the largest face for "haar-face" (first one on a
+    tie), otherwise (or with no faces) the dominant contour's bounding box.
+    """
+    if strategy == "haar-face" and metadata["face_boxes"]:
+        return max(metadata["face_boxes"], key=lambda r: r[2] * r[3])
+    return metadata["contour_bbox"]
+
+
+class ImageIndex:
+    """
+    Per-folder index of subject metadata, keyed by image file name.
+
+    Entries are matched to files by name and byte size, and also by
+    modification time when check_mtime is set. Lookups and lazy analysis are
+    thread-safe; the index file is replaced atomically.
+    """
+
+    def __init__(self, images_path: Path, entries: Optional[Dict[str, Dict]] = None, check_mtime: bool = True):
+        """
+        Initialize the index for a source folder.
+
+        Args:
+            images_path: Folder containing the source images
+            entries: Metadata keyed by file name
+            check_mtime: Also match entries on modification time (off for the bundled images)
+        """
+        self.images_path = Path(images_path)
+        self.index_path = self.images_path / INDEX_FILENAME
+        self.entries: Dict[str, Dict] = entries or {}
+        self.check_mtime = check_mtime
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, images_path: Path, check_mtime: bool = True) -> "ImageIndex":
+        """Load the folder's index; a missing, unreadable or outdated file gives an empty index."""
+        index_path = Path(images_path) / INDEX_FILENAME
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(images_path, check_mtime=check_mtime)
+
+        if data.get("version") != INDEX_VERSION:
+            return cls(images_path, check_mtime=check_mtime)
+        return cls(images_path, data.get("images", {}), check_mtime=check_mtime)
+
+    def get(self, image_path: Path) -> Optional[Dict]:
+        """Stored metadata for an image, or None if missing or the file has changed."""
+        image_path = Path(image_path)
+        entry = self.entries.get(image_path.name)
+        if entry is None:
+            return None
+        try:
+            stat = image_path.stat()
+        except OSError:
+            return None
+        if stat.st_size != entry["file_size"]:
+            return None
+        if self.check_mtime and stat.st_mtime_ns != entry.get("file_mtime_ns"):
+            return None
+        return entry
+
+    def get_or_build(self, image_path: Path) -> Dict:
+        """Stored metadata for an image, analysing it (and saving the index) on a miss."""
+        entry = self.get(image_path)
+        if entry is not None:
+            return entry
+
+        entry = self._analyse(Path(image_path))
+        with self._lock:
+            self.entries[Path(image_path).name] = entry
+            self._save()
+        return entry
+
+    def build(self, image_paths: Iterable[Path], rebuild: bool = False) -> List[str]:
+        """
+        Analyse images and save the index.
+
+        Args:
+            image_paths: Images to index
+            rebuild: Re-analyse images that already have a current entry
+
+        Returns:
+            Names of the images that were analysed
+        """
+        analysed = []
+        with self._lock:
+            for image_path in image_paths:
+                image_path = Path(image_path)
+                if not rebuild and self.get(image_path) is not None:
+                    continue
+                self.entries[image_path.name] = self._analyse(image_path)
+                analysed.append(image_path.name)
+            self._save()
+        return analysed
+
+    def _analyse(self, image_path: Path) -> Dict:
+        """Run the smart crop detection pipeline on one image."""
+        # OpenCV is only needed when an entry has to be computed
+        from PIL import Image
+
+        from .smart_crop import SmartCropEngine
+
+        stat = image_path.stat()
+        with Image.open(image_path) as img:
+            entry = SmartCropEngine().analyse_subjects(img)
+        entry["file_size"] = stat.st_size
+        if self.check_mtime:
+            entry["file_mtime_ns"] = stat.st_mtime_ns
+        return entry
+
+    def _save(self) -> None:
+        """Atomically write the index next to the images (caller holds the lock)."""
+        data = {"version": INDEX_VERSION, "images": dict(sorted(self.entries.items()))}
+        try:
+            fd, tmp_name = tempfile.mkstemp(prefix=".image_index.", suffix=".tmp", dir=self.images_path)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(data, handle, indent=2)
+                    handle.write("\n")
+                os.replace(tmp_name, self.index_path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            # Read-only install: keep the entries in memory for this process
+            pass
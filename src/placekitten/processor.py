@@ -6,13 +6,18 @@ filtering, and saving with method chaining support.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import numpy as np
 from PIL import Image
 
 from .filters import apply_filter
-from .smart_crop import smart_crop_engine
+from .geometry import DEFAULT_FACE_MIN_SIZE, DEFAULT_FACE_SCALE_FACTOR
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# NumPy and the OpenCV smart crop engine are imported on first use so that
+# loading PlaceKitten (and therefore Deckbuilder) does not pay for the CV stack.
 
 
 class ImageProcessor:
@@ -23,7 +28,7 @@ class ImageProcessor:
     with a fluent interface for complex processing pipelines.
     """
 
-    def __init__(self, image_path: Optional[str] = None, image_array: Optional[np.ndarray] = None):
+    def __init__(self, image_path: Optional[str] = None, image_array: Optional["np.ndarray"] = None):
         """
         Initialize ImageProcessor with image file or numpy array.
 
@@ -40,6 +45,9 @@ class ImageProcessor:
         else:
             raise ValueError("Must provide either image_path or image_array")
 
+        # Subject metadata index for this source (set by PlaceKitten; derived images do not carry it)
+        self.image_index = None
+
         # Ensure RGB mode for consistent processing
         if self.image.mode != "RGB":
             self.image = self.image.convert("RGB")
@@ -99,6 +107,8 @@ class ImageProcessor:
         output_prefix: str = "smart_crop",
         output_folder: Optional[str] = None,
         strategy: str = "haar-face",
+        face_scale_factor: float = DEFAULT_FACE_SCALE_FACTOR,
+        face_min_size: Optional[int] = DEFAULT_FACE_MIN_SIZE,
     ) -> "ImageProcessor":
         """
         Intelligent cropping with computer vision.
@@ -117,6 +127,8 @@ class ImageProcessor:
             output_prefix: Prefix for debug step files
             output_folder: Directory to save step files (optional)
             strategy: Cropping strategy to use ("haar-face", "contour", etc.)
+            face_scale_factor: Haar detection scale step; larger values are faster but may miss faces
+            face_min_size: Smallest face to detect in pixels (None: any size the cascade supports)
 
         Returns:
             New ImageProcessor instance with intelligently cropped image
@@ -125,8 +137,25 @@ class ImageProcessor:
             height = int(width * 9 / 16)
 
         try:
+            # Indexed source images with default detection settings need only the crop geometry
+            image_index = getattr(self, "image_index", None)
+            if image_index is not None and not save_steps and face_scale_factor == DEFAULT_FACE_SCALE_FACTOR and face_min_size == DEFAULT_FACE_MIN_SIZE:
+                return self._crop_from_metadata(image_index.get_or_build(Path(self.source_path)), width, height, strategy)
+
             # Use the smart crop engine for intelligent processing
-            cropped_image, crop_info = smart_crop_engine.smart_crop(self.image, width, height, save_steps, output_prefix, output_folder, strategy)
+            from .smart_crop import smart_crop_engine
+
+            cropped_image, crop_info = smart_crop_engine.smart_crop(
+                self.image,
+                width,
+                height,
+                save_steps,
+                output_prefix,
+                output_folder,
+                strategy,
+                face_scale_factor=face_scale_factor,
+                face_min_size=face_min_size,
+            )
 
             # Create new processor instance
             new_processor = ImageProcessor.__new__(ImageProcessor)
@@ -141,6 +170,29 @@ class ImageProcessor:
             print(f"⚠️  Smart crop failed ({e}), falling back to center crop")
             return self._fallback_center_crop(width, height)
 
+    def _crop_from_metadata(self, crop_metadata: dict, width: int, height: int, strategy: str) -> "ImageProcessor":
+        """Crop to the box smart_crop would choose, using precomputed subject metadata."""
+        from .geometry import calculate_optimal_crop
+        from .image_index import subject_bbox_for
+
+        subject_bbox = subject_bbox_for(crop_metadata, strategy)
+        crop_box = calculate_optimal_crop(self.image.width, self.image.height, width, height, subject_bbox)
+        cropped_image = self.image.crop(crop_box).resize((width, height), Image.Resampling.LANCZOS)
+
+        # Create new processor instance
+        new_processor = ImageProcessor.__new__(ImageProcessor)
+        new_processor.image = cropped_image
+        new_processor.source_path = self.source_path
+        new_processor.crop_info = {
+            "original_size": self.image.size,
+            "target_size": (width, height),
+            "crop_box": crop_box,
+            "subject_bbox": subject_bbox,
+            "from_index": True,
+        }
+
+        return new_processor
+
     def _fallback_center_crop(self, width: int, height: int) -> "ImageProcessor":
         """Fallback center crop implementation."""
         img_width, img_height = self.image.size
@@ -210,13 +262,15 @@ class ImageProcessor:
 
         return str(output_path)
 
-    def get_array(self) -> np.ndarray:
+    def get_array(self) -> "np.ndarray":
         """
         Get image as numpy array.
 
         Returns:
             Image as numpy array
         """
+        import numpy as np
+
         return np.array(self.image)
 
     def get_size(self) -> tuple:
@@ -5,6 +5,7 @@ This module implements the intelligent cropping pipeline using OpenCV
 for edge detection, contour analysis, and rule-of-thirds composition.
 """
 
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -12,6 +13,26 @@ import cv2
 import numpy as np
 from PIL import Image
 
+# Face detection defaults live with the OpenCV-free crop geometry and are re-exported here
+from .geometry import DEFAULT_FACE_MIN_SIZE, DEFAULT_FACE_SCALE_FACTOR, calculate_optimal_crop
+
+# Longest edge (in pixels) of the proxy image analysed in proxy mode
+PROXY_ANALYSIS_SIZE = 512
+
+FACE_CASCADE_FILE = "haarcascade_frontalface_default.xml"
+
+# OpenCV classifiers are not safe to share across threads, so each thread loads its own once
+_cascade_local = threading.local()
+
+
+def _get_face_cascade() -> cv2.CascadeClassifier:
+    """Face cascade for the current thread, parsed from disk on first use."""
+    cascade = getattr(_cascade_local, "face_cascade", None)
+    if cascade is None:
+        cascade = cv2.CascadeClassifier(cv2.data.haarcascades + FACE_CASCADE_FILE)
+        _cascade_local.face_cascade = cascade
+    return cascade
+
 
 class SmartCropEngine:
     """
@@ -23,6 +44,17 @@ class SmartCropEngine:
     3. Contour identification and analysis
     4. Rule-of-thirds composition calculation
     5. Optimal crop area determination
+
+    Steps 2-5 run on the full-resolution image by default. In proxy mode
+    (analysis_size set, e.g. PROXY_ANALYSIS_SIZE) they run on a copy scaled
+    down to that longest edge, and the subject box is mapped back to full
+    resolution before the crop is calculated and applied. Proxy mode is
+    experimental: it often picks a different subject than full-resolution
+    analysis (see benchmarks/smart_crop_proxy_benchmark.py), so
+    ImageProcessor.smart_crop does not offer it.
+
+    Visualisation frames for each step are only built when save_steps is
+    set. find_crop_box runs steps 1-8 without them and does not crop.
     """
 
     def __init__(self):
@@ -39,6 +71,9 @@ class SmartCropEngine:
         output_prefix: str = "smart_crop",
         output_folder: Optional[str] = None,
         strategy: str = "haar-face",
+        analysis_size: Optional[int] = None,
+        face_scale_factor: float = DEFAULT_FACE_SCALE_FACTOR,
+        face_min_size: Optional[int] = DEFAULT_FACE_MIN_SIZE,
     ) -> Tuple[Image.Image, Dict]:
         """
         Perform intelligent cropping with computer vision.
@@ -50,6 +85,10 @@ class SmartCropEngine:
             save_steps: Save intermediate processing steps
             output_prefix: Prefix for step visualization files
             output_folder: Directory to save step files (optional)
+            strategy: Subject detection strategy ("haar-face" or contour-based)
+            analysis_size: Longest edge to run detection at (proxy mode); None analyses the full-resolution image
+            face_scale_factor: Haar scale step; larger is faster but may miss faces (e.g. 1.2-1.3 for batches)
+            face_min_size: Smallest face to detect, in original-image pixels; larger is faster
 
         Returns:
             Tuple of (cropped_image, crop_info)
@@ -60,183 +99,295 @@ class SmartCropEngine:
 
         # Convert PIL to OpenCV format
         cv_image = self._pil_to_cv2(image)
+
+        # Steps 1-8: locate the subject and the crop box
+        crop_info = self._locate_crop(
+            cv_image,
+            target_width,
+            target_height,
+            strategy,
+            analysis_size,
+            face_scale_factor,
+            face_min_size,
+            save_steps,
+            output_prefix,
+            output_folder,
+        )
+
+        # Step 9: Perform the actual crop
+        x1, y1, x2, y2 = crop_info["crop_box"]
+        cropped_cv = cv_image[y1:y2, x1:x2]
+        cropped_resized = cv2.resize(cropped_cv, (target_width, target_height), interpolation=cv2.INTER_LANCZOS4)
+
+        # Convert back to PIL
+        final_image = self._cv2_to_pil(cropped_resized)
+
+        # Save final result
+        self._add_debug_step("9-final", cropped_resized, save_steps, output_prefix, output_folder)
+
+        # Store crop information (returned from a local, so concurrent calls get their own)
+        crop_info["steps_saved"] = len(self.debug_steps) if save_steps else 0
+        self.crop_info = crop_info
+
+        return final_image, crop_info
+
+    def find_crop_box(
+        self,
+        image: Image.Image,
+        target_width: int,
+        target_height: int,
+        strategy: str = "haar-face",
+        analysis_size: Optional[int] = None,
+        face_scale_factor: float = DEFAULT_FACE_SCALE_FACTOR,
+        face_min_size: Optional[int] = DEFAULT_FACE_MIN_SIZE,
+    ) -> Dict:
+        """
+        Locate the crop box without cropping or recording debug steps.
+
+        Args:
+            image: PIL Image to analyse
+            target_width: Target width in pixels
+            target_height: Target height in pixels
+            strategy: Subject detection strategy ("haar-face" or contour-based)
+            analysis_size: Longest edge to run detection at (proxy mode); None analyses the full-resolution image
+            face_scale_factor: Haar scale step; larger is faster but may miss faces (e.g. 1.2-1.3 for batches)
+            face_min_size: Smallest face to detect, in original-image pixels; larger is faster
+
+        Returns:
+            Crop info dictionary, as returned by smart_crop (crop_box is (x1, y1, x2, y2))
+        """
+        crop_info = self._locate_crop(self._pil_to_cv2(image), target_width, target_height, strategy, analysis_size, face_scale_factor, face_min_size)
+        crop_info["steps_saved"] = 0
+        return crop_info
+
+    def _locate_crop(
+        self,
+        cv_image: np.ndarray,
+        target_width: int,
+        target_height: int,
+        strategy: str,
+        analysis_size: Optional[int],
+        face_scale_factor: float = DEFAULT_FACE_SCALE_FACTOR,
+        face_min_size: Optional[int] = DEFAULT_FACE_MIN_SIZE,
+        save_steps: bool = False,
+        output_prefix: str = "smart_crop",
+        output_folder: Optional[str] = None,
+    ) -> Dict:
+        """
+        Run steps 1-8 of the pipeline on a BGR image and return the crop info.
+
+        Visualisation frames are only built when save_steps is set; otherwise
+        the only full-size allocations are the grayscale, blur and edge maps.
+        """
         original_height, original_width = cv_image.shape[:2]
 
         # Step 1: Original analysis
-        step1_image = cv_image.copy()
-        self._add_debug_step("1-original", step1_image, save_steps, output_prefix, output_folder)
+        self._add_debug_step("1-original", cv_image, save_steps, output_prefix, output_folder)
+
+        # Steps 2-5 run on the analysis image: the original, or a downscaled proxy of it
+        analysis_image, scale = self._analysis_proxy(cv_image, analysis_size)
 
         # Step 2: Grayscale conversion
-        gray = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
-        step2_image = cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
-        self._add_debug_step("2-grayscale", step2_image, save_steps, output_prefix, output_folder)
+        gray = cv2.cvtColor(analysis_image, cv2.COLOR_BGR2GRAY)
+        if save_steps:
+            self._add_debug_step("2-grayscale", cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR), save_steps, output_prefix, output_folder)
 
         # Step 3: Noise reduction with Gaussian blur
         blurred = cv2.GaussianBlur(gray, (5, 5), 0)
-        step3_image = cv2.cvtColor(blurred, cv2.COLOR_GRAY2BGR)
-        self._add_debug_step("3-blurred", step3_image, save_steps, output_prefix, output_folder)
+        if save_steps:
+            self._add_debug_step("3-blurred", cv2.cvtColor(blurred, cv2.COLOR_GRAY2BGR), save_steps, output_prefix, output_folder)
 
         # Step 4: Edge detection with Canny
         edges = cv2.Canny(blurred, 50, 150)
-        # Highlight edges in red for visualization
-        step4_vis = cv_image.copy()
-        step4_vis[edges > 0] = [0, 0, 255]  # Red edges
-        self._add_debug_step("4-edges", step4_vis, save_steps, output_prefix, output_folder)
-
-        # Strategy-based subject detection
-        subject_bbox = None
-        largest_area = 0
-
-        if strategy == "haar-face":
-            face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + "haarcascade_frontalface_default.xml")
-            faces = face_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5)
-
-            if len(faces) > 0:
-                subject_bbox = max(faces, key=lambda r: r[2] * r[3])  # Select largest face
+        if save_steps:
+            # Highlight edges in red for visualization
+            step4_vis = analysis_image.copy()
+            step4_vis[edges > 0] = [0, 0, 255]  # Red edges
+            self._add_debug_step("4-edges", step4_vis, save_steps, output_prefix, output_folder)
+
+        # Step 5: Strategy-based subject detection
+        if face_min_size:
+            # The minimum face size is given at full resolution; detection runs on the analysis image
+            face_min_size = max(1, round(face_min_size * scale))
+        subject_bbox, largest_area, largest_contour = self._detect_subject(gray, edges, strategy, face_scale_factor, face_min_size)
+        if save_steps:
+            step5_image = analysis_image.copy()
+            if largest_contour is not None:
+                cv2.drawContours(step5_image, [largest_contour], -1, (0, 255, 0), 3)
+            elif subject_bbox is not None:
                 x, y, w, h = subject_bbox
-                step5_image = cv_image.copy()
                 cv2.rectangle(step5_image, (x, y), (x + w, y + h), (0, 255, 0), 3)
-                largest_area = w * h
-            else:
-                step5_image = cv_image.copy()
-
-            # Fallback to contour-based detection if face detection fails
-            if subject_bbox is None:
-                contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-                largest_contour = None
-                for contour in contours:
-                    area = cv2.contourArea(contour)
-                    if area > largest_area:
-                        largest_area = area
-                        largest_contour = contour
-
-                if largest_contour is not None:
-                    x, y, w, h = cv2.boundingRect(largest_contour)
-                    subject_bbox = (x, y, w, h)
-                    cv2.drawContours(step5_image, [largest_contour], -1, (0, 255, 0), 3)
+            self._add_debug_step("5-largest-contour", step5_image, save_steps, output_prefix, output_folder)
 
-        else:
-            # Default to contour-based detection
-            contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            largest_contour = None
-            for contour in contours:
-                area = cv2.contourArea(contour)
-                if area > largest_area:
-                    largest_area = area
-                    largest_contour = contour
-
-            step5_image = cv_image.copy()
-            if largest_contour is not None:
-                cv2.drawContours(step5_image, [largest_contour], -1, (0, 255, 0), 3)
-                x, y, w, h = cv2.boundingRect(largest_contour)
-                subject_bbox = (x, y, w, h)
-        self._add_debug_step("5-largest-contour", step5_image, save_steps, output_prefix, output_folder)
+        # Map the subject found on the proxy back to full-resolution coordinates
+        if scale != 1.0:
+            subject_bbox = self._scale_bbox(subject_bbox, scale, original_width, original_height)
+            largest_area = largest_area / (scale * scale)
 
         # Step 6: Calculate bounding box of subject (visualization only)
-        if subject_bbox is not None:
-            x, y, w, h = subject_bbox
-            step6_image = cv_image.copy()
-            cv2.rectangle(step6_image, (x, y), (x + w, y + h), (255, 0, 0), 2)
-            # Fill bounding box with semi-transparent blue
-            overlay = step6_image.copy()
-            cv2.rectangle(overlay, (x, y), (x + w, y + h), (255, 0, 0), -1)
-            step6_image = cv2.addWeighted(step6_image, 0.8, overlay, 0.2, 0)
-        else:
+        if save_steps:
             step6_image = cv_image.copy()
-        self._add_debug_step("6-bounding-box", step6_image, save_steps, output_prefix, output_folder)
+            if subject_bbox is not None:
+                x, y, w, h = subject_bbox
+                cv2.rectangle(step6_image, (x, y), (x + w, y + h), (255, 0, 0), 2)
+                # Fill bounding box with semi-transparent blue
+                overlay = step6_image.copy()
+                cv2.rectangle(overlay, (x, y), (x + w, y + h), (255, 0, 0), -1)
+                step6_image = cv2.addWeighted(step6_image, 0.8, overlay, 0.2, 0)
+            self._add_debug_step("6-bounding-box", step6_image, save_steps, output_prefix, output_folder)
 
         # Step 7: Rule of thirds grid and composition
         crop_box = self._calculate_optimal_crop(original_width, original_height, target_width, target_height, subject_bbox)
 
-        # Visualize rule of thirds and crop area
-        step7_image = cv_image.copy()
-        self._draw_rule_of_thirds(step7_image, original_width, original_height)
-        self._add_debug_step("7-rule-of-thirds", step7_image, save_steps, output_prefix, output_folder)
-
-        # Step 8: Final crop area visualization
-        step8_image = cv_image.copy()
-        x1, y1, x2, y2 = crop_box
-        cv2.rectangle(step8_image, (x1, y1), (x2, y2), (255, 0, 255), 3)  # Magenta border
-        self._add_debug_step("8-crop-area", step8_image, save_steps, output_prefix, output_folder)
-
-        # Step 9: Perform the actual crop
-        cropped_cv = cv_image[y1:y2, x1:x2]
-        cropped_resized = cv2.resize(cropped_cv, (target_width, target_height), interpolation=cv2.INTER_LANCZOS4)
-
-        # Convert back to PIL
-        final_image = self._cv2_to_pil(cropped_resized)
-
-        # Save final result
-        self._add_debug_step("9-final", cropped_resized, save_steps, output_prefix, output_folder)
-
-        # Store crop information
-        self.crop_info = {
+        if save_steps:
+            # Visualize rule of thirds and crop area
+            step7_image = cv_image.copy()
+            self._draw_rule_of_thirds(step7_image, original_width, original_height)
+            self._add_debug_step("7-rule-of-thirds", step7_image, save_steps, output_prefix, output_folder)
+
+            # Step 8: Final crop area visualization
+            step8_image = cv_image.copy()
+            x1, y1, x2, y2 = crop_box
+            cv2.rectangle(step8_image, (x1, y1), (x2, y2), (255, 0, 255), 3)  # Magenta border
+            self._add_debug_step("8-crop-area", step8_image, save_steps, output_prefix, output_folder)
+
+        return {
             "original_size": (original_width, original_height),
             "target_size": (target_width, target_height),
             "crop_box": crop_box,
             "subject_bbox": subject_bbox,
             "contour_area": largest_area,
-            "steps_saved": len(self.debug_steps) if save_steps else 0,
+            "analysis_size": (analysis_image.shape[1], analysis_image.shape[0]),
         }
 
-        return final_image, self.crop_info
+    def _detect_subject(
+        self,
+        gray: np.ndarray,
+        edges: np.ndarray,
+        strategy: str,
+        face_scale_factor: float = DEFAULT_FACE_SCALE_FACTOR,
+        face_min_size: Optional[int] = DEFAULT_FACE_MIN_SIZE,
+    ) -> Tuple[Optional[Tuple[int, int, int, int]], float, Optional[np.ndarray]]:
+        """
+        Find the main subject as (subject_bbox, area, contour).
+
+        contour is the largest contour when the subject came from contour
+        analysis, and None when it is a detected face.
+        """
+        if strategy == "haar-face":
+            faces = self._detect_faces(gray, face_scale_factor, face_min_size)
 
-    def _calculate_optimal_crop(
+            if len(faces) > 0:
+                x, y, w, h = max(faces, key=lambda r: r[2] * r[3])  # Select largest face
+                return (x, y, w, h), w * h, None
+
+        # Contour-based detection (also the fallback if face detection finds nothing)
+        largest_contour, largest_area = self._largest_contour(edges)
+        if largest_contour is None:
+            return None, largest_area, None
+        return cv2.boundingRect(largest_contour), largest_area, largest_contour
+
+    def _detect_faces(
         self,
-        orig_width: int,
-        orig_height: int,
-        target_width: int,
-        target_height: int,
-        subject_bbox: Optional[Tuple[int, int, int, int]],
-    ) -> Tuple[int, int, int, int]:
+        gray: np.ndarray,
+        face_scale_factor: float = DEFAULT_FACE_SCALE_FACTOR,
+        face_min_size: Optional[int] = DEFAULT_FACE_MIN_SIZE,
+    ) -> np.ndarray:
+        """Haar face boxes (x, y, w, h) in detection order."""
+        min_size = (face_min_size, face_min_size) if face_min_size else (0, 0)
+        return _get_face_cascade().detectMultiScale(gray, scaleFactor=face_scale_factor, minNeighbors=5, minSize=min_size)
+
+    def _largest_contour(self, edges: np.ndarray) -> Tuple[Optional[np.ndarray], float]:
+        """The external edge contour with the largest area, and that area."""
+        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        largest_area = 0
+        largest_contour = None
+        for contour in contours:
+            area = cv2.contourArea(contour)
+            if area > largest_area:
+                largest_area = area
+                largest_contour = contour
+        return largest_contour, largest_area
+
+    def analyse_subjects(self, image: Image.Image) -> Dict:
         """
-        Calculate optimal crop box using rule of thirds and subject positioning.
+        Run subject detection once and return everything a crop needs.
+
+        Face detection uses the default settings. Used to build the image
+        index (see image_index), from which crops can be calculated without
+        re-running detection.
 
         Args:
-            orig_width: Original image width
-            orig_height: Original image height
-            target_width: Target crop width
-            target_height: Target crop height
-            subject_bbox: Bounding box of main subject (x, y, w, h)
+            image: PIL Image to analyse
 
         Returns:
-            Crop box as (x1, y1, x2, y2)
+            Dictionary with size, face_boxes (detection order), contour_bbox,
+            contour_area and saliency_centroid (centroid of edge density)
         """
-        target_ratio = target_width / target_height
-
-        # Calculate crop dimensions maintaining target aspect ratio
-        if orig_width / orig_height > target_ratio:
-            # Original is wider - crop width
-            crop_height = orig_height
-            crop_width = int(crop_height * target_ratio)
-        else:
-            # Original is taller - crop height
-            crop_width = orig_width
-            crop_height = int(crop_width / target_ratio)
-
-        # Default to center crop
-        crop_x = (orig_width - crop_width) // 2
-        crop_y = (orig_height - crop_height) // 2
+        cv_image = self._pil_to_cv2(image)
+        height, width = cv_image.shape[:2]
+        gray = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
+        edges = cv2.Canny(cv2.GaussianBlur(gray, (5, 5), 0), 50, 150)
 
-        # Adjust based on subject position if available
-        if subject_bbox is not None:
-            subj_x, subj_y, subj_w, subj_h = subject_bbox
-            subj_center_x = subj_x + subj_w // 2
-            subj_center_y = subj_y + subj_h // 2
+        faces = self._detect_faces(gray)
+        largest_contour, largest_area = self._largest_contour(edges)
+        contour_bbox = cv2.boundingRect(largest_contour) if largest_contour is not None else None
 
-            # Try to position subject in lower third (rule of thirds)
-            ideal_subj_x = crop_width // 2
-            ideal_subj_y = int(crop_height * 2 / 3)  # Lower third
+        moments = cv2.moments(edges, binaryImage=True)
+        if moments["m00"]:
+            saliency_centroid = [round(moments["m10"] / moments["m00"], 1), round(moments["m01"] / moments["m00"], 1)]
+        else:
+            saliency_centroid = [width / 2, height / 2]
+
+        return {
+            "size": [width, height],
+            "face_boxes": [[int(v) for v in face] for face in faces],
+            "contour_bbox": [int(v) for v in contour_bbox] if contour_bbox is not None else None,
+            "contour_area": float(largest_area),
+            "saliency_centroid": saliency_centroid,
+        }
 
-            # Calculate desired crop position
-            desired_crop_x = subj_center_x - ideal_subj_x
-            desired_crop_y = subj_center_y - ideal_subj_y
+    def _analysis_proxy(self, cv_image: np.ndarray, analysis_size: Optional[int]) -> Tuple[np.ndarray, float]:
+        """
+        Image to run detection on, and its scale relative to the original.
 
-            # Ensure crop stays within image bounds
-            crop_x = max(0, min(desired_crop_x, orig_width - crop_width))
-            crop_y = max(0, min(desired_crop_y, orig_height - crop_height))
+        Returns the original (scale 1.0) when analysis_size is None or the image already fits.
+        """
+        height, width = cv_image.shape[:2]
+        if not analysis_size or max(width, height) <= analysis_size:
+            return cv_image, 1.0
+        scale = analysis_size / max(width, height)
+        proxy_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        # INTER_AREA averages the dropped pixels, so edges are not aliased
+        return cv2.resize(cv_image, proxy_size, interpolation=cv2.INTER_AREA), scale
+
+    def _scale_bbox(
+        self,
+        bbox: Optional[Tuple[int, int, int, int]],
+        scale: float,
+        orig_width: int,
+        orig_height: int,
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """Map a bounding box (x, y, w, h) found on a proxy of the given scale back to the original image."""
+        if bbox is None:
+            return None
+        x, y, w, h = bbox
+        x1 = min(orig_width - 1, int(round(x / scale)))
+        y1 = min(orig_height - 1, int(round(y / scale)))
+        x2 = min(orig_width, int(round((x + w) / scale)))
+        y2 = min(orig_height, int(round((y + h) / scale)))
+        return (x1, y1, max(1, x2 - x1), max(1, y2 - y1))
 
-        return (crop_x, crop_y, crop_x + crop_width, crop_y + crop_height)
+    def _calculate_optimal_crop(
+        self,
+        orig_width: int,
+        orig_height: int,
+        target_width: int,
+        target_height: int,
+        subject_bbox: Optional[Tuple[int, int, int, int]],
+    ) -> Tuple[int, int, int, int]:
+        """Calculate optimal crop box (x1, y1, x2, y2); see geometry.calculate_optimal_crop."""
+        return calculate_optimal_crop(orig_width, orig_height, target_width, target_height, subject_bbox)
 
     def _draw_rule_of_thirds(self, image: np.ndarray, width: int, height: int) -> None:
         """Draw rule of thirds grid on image."""
@@ -254,9 +405,8 @@ class SmartCropEngine:
         if pil_image.mode != "RGB":
             pil_image = pil_image.convert("RGB")
 
-        # Convert to numpy array and change from RGB to BGR
-        cv_image = np.array(pil_image)
-        cv_image = cv2.cvtColor(cv_image, cv2.COLOR_RGB2BGR)
+        # View the pixels as an array (no copy) and change from RGB to BGR
+        cv_image = cv2.cvtColor(np.asarray(pil_image), cv2.COLOR_RGB2BGR)
         return cv_image
 
     def _cv2_to_pil(self, cv_image: np.ndarray) -> Image.Image:
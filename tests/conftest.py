@@ -52,6 +52,20 @@ def temp_dir():
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolated_image_cache():
+    """Point the shared image cache at a temporary directory for the whole test session."""
+    cache_dir = tempfile.mkdtemp(prefix="deckbuilder_image_cache_")
+    previous = os.environ.get("DECKBUILDER_IMAGE_CACHE_DIR")
+    os.environ["DECKBUILDER_IMAGE_CACHE_DIR"] = cache_dir
+    yield Path(cache_dir)
+    if previous is None:
+        os.environ.pop("DECKBUILDER_IMAGE_CACHE_DIR", None)
+    else:
+        os.environ["DECKBUILDER_IMAGE_CACHE_DIR"] = previous
+    shutil.rmtree(cache_dir, ignore_errors=True)
+
+
 @pytest.fixture
 def mock_deckbuilder_env():
     """Mock environment variables for deckbuilder with proper cleanup."""
@@ -130,35 +130,19 @@ class TestCLIPathManagement:
                 temp_md.flush()
 
                 mock_db_instance = MagicMock()
-                mock_db_instance.create_presentation.return_value = "success"
+                mock_db_instance.create_presentation_from_markdown.return_value = "success"
                 mock_deckbuilder.return_value = mock_db_instance
 
                 with (
                     patch.object(cli, "_validate_templates_folder", return_value=True),
                     patch("pathlib.Path.exists", return_value=True),
-                    patch("deckbuilder.converter.markdown_to_canonical_json") as mock_converter,
-                    patch("deckbuilder.validation.PresentationValidator") as mock_validator,
                 ):
-                    # Mock converter to return canonical JSON format
-                    mock_converter.return_value = {
-                        "slides": [
-                            {
-                                "layout": "Title Slide",
-                                "placeholders": {"title": "Test"},
-                                "content": [],
-                            }
-                        ]
-                    }
-
-                    # Mock validator to avoid file I/O
-                    mock_val_instance = mock_validator.return_value
-                    mock_val_instance.validate_pre_generation.return_value = None
-                    mock_val_instance.validate_post_generation.return_value = None
-
                     try:
                         cli.create_presentation(temp_md.name)
-                        mock_converter.assert_called_once()
-                        mock_db_instance.create_presentation.assert_called_once()
+                        # Markdown is streamed into the builder slide by slide
+                        mock_db_instance.create_presentation_from_markdown.assert_called_once()
+                        assert mock_db_instance.create_presentation_from_markdown.call_args[0][0] == Path(temp_md.name)
+                        mock_db_instance.create_presentation.assert_not_called()
                     finally:
                         os.unlink(temp_md.name)
 
@@ -0,0 +1,119 @@
+"""
+Unit tests for batch presentation generation (Deckbuilder.create_presentations
+and the multi-file `deckbuilder create` path).
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from deckbuilder.batch import BatchJob, run_batch, summarize_results
+from deckbuilder.cli import DeckbuilderCLI
+from deckbuilder.engine import Deckbuilder
+from deckbuilder.path_manager import create_library_path_manager
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+TEMPLATES_DIR = PROJECT_ROOT / "src" / "deckbuilder" / "assets" / "templates"
+
+
+def _slides(title, count=2):
+    return {"slides": [{"layout": "Title and Content", "placeholders": {"title": f"{title} {i}", "content": "Body"}} for i in range(count)]}
+
+
+@pytest.fixture
+def path_manager(tmp_path):
+    """Library path manager writing into a temporary folder."""
+    return create_library_path_manager(template_folder=str(TEMPLATES_DIR), output_folder=str(tmp_path))
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestBatchGeneration:
+    """Test suite for batch generation."""
+
+    def test_serial_batch_results_in_order(self, path_manager, tmp_path):
+        """Serial batches return one result per job in input order."""
+        jobs = [BatchJob(fileName="first", presentation_data=_slides("First")), {"fileName": "second", "presentation_data": _slides("Second", 3)}]
+
+        results = run_batch(jobs, path_manager, max_workers=1)
+
+        assert [r.fileName for r in results] == ["first", "second"]
+        assert all(r.success for r in results)
+        assert [r.slide_count for r in results] == [2, 3]
+        assert all(r.seconds >= 0 for r in results)
+        assert len(list(tmp_path.glob("*.g.pptx"))) == 2
+
+    def test_parallel_batch_with_failures(self, path_manager, tmp_path):
+        """Failures are reported per job and do not abort the batch."""
+        jobs = [
+            BatchJob(fileName="good_a", presentation_data=_slides("A")),
+            BatchJob(fileName="bad", presentation_data={"slides": []}),
+            BatchJob(fileName="good_b", presentation_data=_slides("B")),
+        ]
+
+        results = run_batch(jobs, path_manager, max_workers=2)
+        summary = summarize_results(results)
+
+        assert [r.success for r in results] == [True, False, True]
+        assert "At least one slide is required" in results[1].error
+        assert summary == {"total": 3, "succeeded": 2, "failed": 1, "slides": 4, "job_seconds": summary["job_seconds"]}
+
+    def test_input_file_jobs(self, path_manager):
+        """Markdown and JSON input files are parsed inside the worker."""
+        assets = PROJECT_ROOT / "src" / "deckbuilder" / "assets"
+        jobs = [
+            BatchJob(input_file=str(assets / "master_default_presentation.md")),
+            BatchJob(input_file=str(assets / "master_default_presentation.json"), fileName="from_json"),
+        ]
+
+        results = run_batch(jobs, path_manager, max_workers=2)
+
+        assert all(r.success for r in results), [r.error for r in results]
+        assert results[0].fileName == "master_default_presentation"
+        assert results[0].slide_count == results[1].slide_count > 0
+
+    def test_engine_create_presentations(self, path_manager):
+        """Deckbuilder.create_presentations delegates to the batch runner."""
+        Deckbuilder.reset()
+        deck = Deckbuilder(path_manager_instance=path_manager)
+
+        results = deck.create_presentations([{"fileName": "engine_batch", "presentation_data": _slides("Engine")}], max_workers=1)
+
+        assert len(results) == 1 and results[0].success
+        Deckbuilder.reset()
+
+    def test_invalid_job_type(self, path_manager):
+        """Jobs must be BatchJob instances or dicts."""
+        with pytest.raises(TypeError):
+            run_batch(["not a job"], path_manager)
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestCliBatchCreate:
+    """Test suite for multi-file CLI create."""
+
+    def test_expand_directories_and_dedupe_names(self, tmp_path, monkeypatch):
+        """Directories expand to .md/.json files and duplicate stems get unique outputs."""
+        templates = tmp_path / "templates"
+        shutil.copytree(TEMPLATES_DIR, templates)
+        inputs = tmp_path / "inputs"
+        (inputs / "nested").mkdir(parents=True)
+        for target in [inputs / "deck.json", inputs / "nested" / "deck.json"]:
+            target.write_text('{"slides": [{"layout": "Title Slide", "placeholders": {"title": "Hello"}}]}', encoding="utf-8")
+        (inputs / "notes.txt").write_text("ignored", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+
+        cli = DeckbuilderCLI(template_folder=str(templates))
+        results = cli.create_presentations([str(inputs), str(inputs / "nested" / "deck.json"), str(inputs / "deck.json")], jobs=2)
+
+        assert [r.fileName for r in results] == ["deck", "deck_2"]
+        assert all(r.success for r in results)
+
+    def test_missing_input_raises(self, tmp_path):
+        """Missing inputs fail before any work starts."""
+        cli = DeckbuilderCLI(template_folder=str(TEMPLATES_DIR))
+
+        with pytest.raises(FileNotFoundError):
+            cli.create_presentations([str(tmp_path / "missing.md")])
@@ -0,0 +1,150 @@
+"""
+Unit tests for batch language/font remapping (batch_remap and the multi-file
+`deckbuilder remap` path).
+"""
+
+import json
+
+import pytest
+from pptx import Presentation
+from pptx.util import Inches
+
+from deckbuilder.batch_remap import MANIFEST_FILE_NAME, RemapManifest, file_sha256, run_remap_batch, summarize_remap_results
+from deckbuilder.cli import DeckbuilderCLI, main
+
+
+def _write_deck(path, text="Please optimize the color scheme"):
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide.shapes.add_textbox(Inches(1), Inches(1), Inches(6), Inches(1)).text_frame.text = text
+    path.parent.mkdir(parents=True, exist_ok=True)
+    prs.save(path)
+    return path
+
+
+def _texts(path):
+    return [shape.text_frame.text for slide in Presentation(path).slides for shape in slide.shapes if shape.has_text_frame]
+
+
+@pytest.fixture
+def decks(tmp_path):
+    """Three small decks, one of them in a nested folder."""
+    return [_write_deck(tmp_path / "a.pptx"), _write_deck(tmp_path / "b.pptx"), _write_deck(tmp_path / "nested" / "c.pptx")]
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestBatchRemap:
+    """Test suite for run_remap_batch and RemapManifest."""
+
+    def test_remaps_files_and_records_manifest(self, decks, tmp_path):
+        """Every file is remapped in place and its new hash recorded."""
+        manifest = RemapManifest(tmp_path / MANIFEST_FILE_NAME)
+        progress = []
+
+        results = run_remap_batch(decks, "en-AU", create_backup=False, manifest=manifest, max_workers=1, progress=lambda r, done, total: progress.append((done, total)))
+
+        assert [r.status for r in results] == ["remapped"] * 3
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+        assert _texts(decks[0]) == ["Please optimise the colour scheme"]
+        saved = json.loads((tmp_path / MANIFEST_FILE_NAME).read_text(encoding="utf-8"))["files"]
+        assert saved["nested/c.pptx"] == {"sha256": file_sha256(decks[2]), "language": "en-AU", "font": None}
+
+    def test_rerun_skips_unchanged_files(self, decks, tmp_path):
+        """Files unchanged since they were remapped with the same settings are skipped."""
+        manifest_path = tmp_path / MANIFEST_FILE_NAME
+        run_remap_batch(decks, "en-AU", create_backup=False, manifest=RemapManifest(manifest_path), max_workers=1)
+        _write_deck(decks[1], "Edited color")
+
+        results = run_remap_batch(decks, "en-AU", create_backup=False, manifest=RemapManifest(manifest_path), max_workers=1)
+        different_settings = run_remap_batch(decks, "en-AU", "Arial", create_backup=False, manifest=RemapManifest(manifest_path), max_workers=1)
+
+        assert [r.status for r in results] == ["skipped", "remapped", "skipped"]
+        assert _texts(decks[1]) == ["Edited colour"]
+        assert [r.status for r in different_settings] == ["remapped"] * 3
+
+    def test_parallel_batch_with_failures(self, decks, tmp_path):
+        """Failures are reported per file and do not abort the batch."""
+        broken = tmp_path / "broken.pptx"
+        broken.write_bytes(b"not a presentation")
+        files = [decks[0], broken, decks[1]]
+
+        results = run_remap_batch(files, "en-AU", create_backup=False, max_workers=2)
+        summary = summarize_remap_results(results)
+
+        assert [r.input_file for r in results] == [str(f) for f in files]
+        assert [r.status for r in results] == ["remapped", "failed", "remapped"]
+        assert "Failed to process presentation" in results[1].error
+        assert summary["remapped"] == 2 and summary["failed"] == 1
+        assert summary["content_slides_processed"] == 2
+        assert summary["total_text_replaced"] == 2
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestRemapCommand:
+    """Test suite for DeckbuilderCLI.remap_presentations."""
+
+    def test_directory_remap_skips_backups_on_rerun(self, decks, tmp_path, capsys):
+        """A directory is searched recursively; backups and lock files are not inputs."""
+        cli = DeckbuilderCLI(template_folder=str(tmp_path))
+
+        first = cli.remap_presentations([str(tmp_path)], language_code="en-AU", jobs=2)
+        (tmp_path / "~$a.pptx").write_bytes(b"lock")
+        second = cli.remap_presentations([str(tmp_path)], language_code="en-AU")
+        forced = cli.remap_presentations([str(tmp_path)], language_code="en-AU", force=True)
+
+        assert [r.status for r in first] == ["remapped"] * 3
+        assert (tmp_path / "a.bak.pptx").exists()
+        assert [r.status for r in second] == ["skipped"] * 3
+        assert [r.status for r in forced] == ["remapped"] * 3
+        assert "3 remapped, 0 skipped, 0 failed" in capsys.readouterr().out
+
+    def test_force_keeps_manifest_entries_of_other_files(self, decks, tmp_path):
+        """Forcing a remap of one file rewrites its entry and leaves the rest of the manifest alone."""
+        cli = DeckbuilderCLI(template_folder=str(tmp_path))
+        cli.remap_presentations([str(tmp_path)], language_code="en-AU", create_backup=False)
+        manifest_path = tmp_path / MANIFEST_FILE_NAME
+        before = json.loads(manifest_path.read_text())["files"]
+
+        forced = cli.remap_presentations([str(decks[0])], language_code="en-AU", create_backup=False, manifest_file=str(manifest_path), force=True)
+        after = json.loads(manifest_path.read_text())["files"]
+
+        assert [r.status for r in forced] == ["remapped"]
+        assert sorted(after) == sorted(before)
+        assert {name: entry for name, entry in after.items() if name != "a.pptx"} == {name: entry for name, entry in before.items() if name != "a.pptx"}
+        assert [r.status for r in cli.remap_presentations([str(tmp_path)], language_code="en-AU")] == ["skipped"] * 3
+
+    def test_requires_language_or_font(self, decks, tmp_path):
+        """Without settings nothing is remapped."""
+        assert DeckbuilderCLI(template_folder=str(tmp_path)).remap_presentations([str(tmp_path)]) == []
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestSingleFileRemapCommand:
+    """Test `deckbuilder remap` with one input file."""
+
+    def test_manifest_used_for_single_file(self, decks, tmp_path, monkeypatch):
+        """--manifest sends a single file through the batch path, so the manifest is recorded and consulted."""
+        manifest = tmp_path / "single.json"
+        argv = ["deckbuilder", "-t", str(tmp_path), "remap", str(decks[0]), "--language", "en-AU", "--manifest", str(manifest), "--no-backup"]
+        monkeypatch.setattr("sys.argv", argv)
+
+        main()
+        assert "a.pptx" in json.loads(manifest.read_text())["files"]
+
+        mtime = decks[0].stat().st_mtime_ns
+        main()
+        assert decks[0].stat().st_mtime_ns == mtime
+
+    def test_output_rejected_with_manifest(self, decks, tmp_path, monkeypatch):
+        """--output cannot be combined with the manifest options."""
+        argv = ["deckbuilder", "-t", str(tmp_path), "remap", str(decks[0]), "--language", "en-AU", "--force", "--output", str(tmp_path / "out.pptx")]
+        monkeypatch.setattr("sys.argv", argv)
+
+        with pytest.raises(SystemExit) as exit_info:
+            main()
+
+        assert exit_info.value.code == 1
+        assert not (tmp_path / "out.pptx").exists()
@@ -0,0 +1,82 @@
+"""
+Unit tests for the benchmark suite helpers.
+
+The benchmarks themselves are too slow for the test run; these tests only
+check that synthetic decks parse and that baseline comparison flags regressions.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+from deckbuilder import converter
+
+BENCHMARKS_DIR = Path(__file__).parent.parent.parent.parent / "benchmarks"
+
+
+def _load(module_name):
+    """Import a module from the benchmarks folder."""
+    sys.path.insert(0, str(BENCHMARKS_DIR))
+    spec = importlib.util.spec_from_file_location(module_name, BENCHMARKS_DIR / f"{module_name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestBenchmarkSuite:
+    """Test suite for benchmark deck generation and baseline comparison."""
+
+    def test_generated_deck_covers_every_layout(self):
+        """A deck long enough to cycle all layouts uses each template layout."""
+        deck_generator = _load("deck_generator")
+        generator = deck_generator.SyntheticDeckGenerator()
+        layouts = set(deck_generator.get_template_layouts())
+
+        slides = converter.markdown_to_canonical_json(generator.generate_markdown(60))["slides"]
+
+        assert len(slides) == 60
+        assert {slide["layout"] for slide in slides} == layouts
+
+    def test_scenarios_without_tables_or_images(self):
+        """Text-only decks contain no image layouts and no tables."""
+        deck_generator = _load("deck_generator")
+        slides = deck_generator.SyntheticDeckGenerator().generate_slides(40, include_tables=False, include_images=False)
+
+        assert not any(slide["layout"] in deck_generator.IMAGE_LAYOUTS for slide in slides)
+        assert not any("|" in str(value) for slide in slides for value in slide.values())
+
+    def test_compare_to_baseline_flags_regressions(self):
+        """Only metrics beyond their tolerance are reported."""
+        run_benchmarks = _load("run_benchmarks")
+        baseline = {"results": [{"scenario": "text", "slides": 10, "wall_seconds": 1.0, "peak_rss_mb": 50.0, "output_bytes": 1000}]}
+        current = [{"scenario": "text", "slides": 10, "wall_seconds": 1.5, "peak_rss_mb": 51.0, "output_bytes": 1000}]
+        tolerances = {"tolerance": 0.2, "rss_tolerance": 0.2, "size_tolerance": 0.05}
+
+        regressions = run_benchmarks.compare_to_baseline(current, baseline, tolerances)
+
+        assert [(r["case"], r["metric"]) for r in regressions] == [("text-10", "wall_seconds")]
+
+    def test_streamed_cases_compare_separately(self):
+        """Streamed cases get their own key, and batch keys stay compatible with older baselines."""
+        run_benchmarks = _load("run_benchmarks")
+        baseline = {"results": [{"scenario": "images", "slides": 10, "wall_seconds": 1.0}, {"scenario": "images", "slides": 10, "mode": "stream", "wall_seconds": 2.0}]}
+        current = [{"scenario": "images", "slides": 10, "mode": "batch", "wall_seconds": 1.0}, {"scenario": "images", "slides": 10, "mode": "stream", "wall_seconds": 3.0}]
+        tolerances = {"tolerance": 0.2, "rss_tolerance": 0.2, "size_tolerance": 0.05}
+
+        regressions = run_benchmarks.compare_to_baseline(current, baseline, tolerances)
+
+        assert [(r["case"], r["baseline"]) for r in regressions] == [("images-10-stream", 2.0)]
+
+    def test_inline_formatting_benchmark_agrees_with_legacy(self):
+        """The micro-benchmark runs and the tokenizer matches the legacy parser on deck strings."""
+        benchmark = _load("inline_formatting_benchmark")
+
+        results = benchmark.run(slide_count=20, repeat=1)
+
+        assert results["strings"] > 0
+        assert results["mismatches"] == 0
+        assert results["single_pass_warm_seconds"] > 0
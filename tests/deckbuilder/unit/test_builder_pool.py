@@ -0,0 +1,126 @@
+"""
+Unit tests for DeckbuilderPool checkout/return semantics and isolation.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from pptx import Presentation
+
+from deckbuilder.builder_pool import BuilderPoolTimeout, DeckbuilderPool
+from deckbuilder.engine import Deckbuilder
+from deckbuilder.path_manager import create_library_path_manager
+
+TEMPLATES_DIR = Path(__file__).parent.parent.parent.parent / "src" / "deckbuilder" / "assets" / "templates"
+
+
+class _FakeBuilder:
+    """Minimal stand-in for Deckbuilder used to test pool mechanics."""
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestDeckbuilderPool:
+    """Test suite for DeckbuilderPool."""
+
+    def test_builders_created_lazily_and_reused(self):
+        """Builders are only created on demand and reused after checkin."""
+        pool = DeckbuilderPool(size=2, factory=_FakeBuilder)
+        assert pool.get_stats()["created"] == 0
+
+        first = pool.checkout()
+        pool.checkin(first)
+        second = pool.checkout()
+
+        assert first is second
+        assert pool.get_stats()["created"] == 1
+
+    def test_distinct_builders_when_concurrent(self):
+        """Two concurrent checkouts get two different builders."""
+        pool = DeckbuilderPool(size=2, factory=_FakeBuilder)
+
+        a = pool.checkout()
+        b = pool.checkout()
+
+        assert a is not b
+        assert pool.get_stats()["checked_out"] == 2
+
+    def test_checkout_timeout_when_exhausted(self):
+        """Checkout raises BuilderPoolTimeout when all builders are busy."""
+        pool = DeckbuilderPool(size=1, factory=_FakeBuilder)
+        pool.checkout()
+
+        with pytest.raises(BuilderPoolTimeout):
+            pool.checkout(timeout=0.05)
+
+    def test_waiting_checkout_receives_returned_builder(self):
+        """A blocked checkout is woken up by checkin."""
+        pool = DeckbuilderPool(size=1, factory=_FakeBuilder)
+        held = pool.checkout()
+        result = {}
+
+        waiter = threading.Thread(target=lambda: result.setdefault("builder", pool.checkout(timeout=5)))
+        waiter.start()
+        pool.checkin(held)
+        waiter.join(timeout=5)
+
+        assert result["builder"] is held
+
+    def test_checkin_foreign_builder_rejected(self):
+        """Returning a builder that did not come from the pool is an error."""
+        pool = DeckbuilderPool(size=1, factory=_FakeBuilder)
+
+        with pytest.raises(ValueError):
+            pool.checkin(_FakeBuilder())
+
+    def test_context_manager_returns_builder_on_error(self):
+        """The builder() context manager checks the builder back in on exceptions."""
+        pool = DeckbuilderPool(size=1, factory=_FakeBuilder)
+
+        with pytest.raises(RuntimeError):
+            with pool.builder():
+                raise RuntimeError("boom")
+
+        assert pool.get_stats()["idle"] == 1
+
+    def test_invalid_size(self):
+        """Pool size must be positive."""
+        with pytest.raises(ValueError):
+            DeckbuilderPool(size=0, factory=_FakeBuilder)
+
+    def test_pool_size_from_environment(self, monkeypatch):
+        """DECKBUILDER_POOL_SIZE sets the default size."""
+        monkeypatch.setenv("DECKBUILDER_POOL_SIZE", "3")
+        assert DeckbuilderPool(factory=_FakeBuilder).size == 3
+
+    def test_pooled_builders_are_not_the_singleton(self, tmp_path):
+        """Pooled builders are independent of the shared Deckbuilder singleton."""
+        Deckbuilder.reset()
+        pm = create_library_path_manager(template_folder=str(TEMPLATES_DIR), output_folder=str(tmp_path))
+        pool = DeckbuilderPool(size=2, path_manager_instance=pm)
+
+        with pool.builder() as a, pool.builder() as b:
+            assert a is not b
+            assert a is not Deckbuilder(path_manager_instance=pm)
+        Deckbuilder.reset()
+
+    def test_concurrent_presentations_do_not_interfere(self, tmp_path):
+        """Decks built in parallel threads each contain only their own slides."""
+        pm = create_library_path_manager(template_folder=str(TEMPLATES_DIR), output_folder=str(tmp_path))
+        pool = DeckbuilderPool(size=4, path_manager_instance=pm)
+
+        def build(n):
+            slides = [{"layout": "Title and Content", "placeholders": {"title": f"Deck {n} Slide {i}", "content": "Body"}} for i in range(n)]
+            pool.create_presentation({"slides": slides}, f"deck_{n}")
+            return n
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(build, [2, 3, 4, 5]))
+
+        for n in [2, 3, 4, 5]:
+            files = list(tmp_path.glob(f"deck_{n}.*.g.pptx"))
+            assert len(files) == 1
+            titles = [slide.shapes.title.text for slide in Presentation(str(files[0])).slides]
+            assert titles == [f"Deck {n} Slide {i}" for i in range(n)]
@@ -0,0 +1,351 @@
+"""
+Unit tests for the shared content-addressed image cache (image_cache and its use by ImageHandler).
+"""
+
+import json
+import shutil
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from deckbuilder.image_cache import INDEX_FILE_NAME, ImageCache, content_key, get_default_cache_dir, get_image_cache
+from deckbuilder.image_handler import ImageHandler
+
+
+def _put(cache, key, size):
+    cache.path_for(key).write_bytes(b"x" * size)
+    return cache.add(key)
+
+
+STRESS_CHUNK = b"x" * 4096
+STRESS_CHUNKS = 16
+
+
+def _slow_render(key, log_path):
+    """Render callable that logs every render and writes its file slowly, in chunks."""
+
+    def render(path):
+        with open(log_path, "a") as log:
+            log.write(f"{key}\n")
+        with open(path, "wb") as f:
+            for _ in range(STRESS_CHUNKS):
+                f.write(STRESS_CHUNK)
+                f.flush()
+                time.sleep(0.001)
+
+    return render
+
+
+def _stress_worker(cache_dir, keys, log_path, rounds):
+    """Run in a separate process: fetch every key several times and return the sizes read back."""
+    cache = ImageCache(cache_dir, max_size_mb=100)
+    sizes = []
+    for _ in range(rounds):
+        for key in keys:
+            path = cache.get_or_create(key, _slow_render(key, log_path))
+            sizes.append(len(Path(path).read_bytes()))
+    cache.flush()
+    return sizes
+
+
+def _data_stress_worker(cache_dir, keys, log_path, rounds):
+    """Run in a separate process: fetch every key's bytes several times and return the sizes."""
+    cache = ImageCache(cache_dir, max_size_mb=100)
+    sizes = []
+    for _ in range(rounds):
+        for key in keys:
+
+            def render(key=key):
+                with open(log_path, "a") as log:
+                    log.write(f"{key}\n")
+                time.sleep(0.005)
+                return STRESS_CHUNK * STRESS_CHUNKS
+
+            sizes.append(len(cache.get_or_create_data(key, render)))
+    cache.close()
+    return sizes
+
+
+def _process_image_worker(cache_dir, image_path):
+    """Run in a separate process: resize the same image through an ImageHandler."""
+    path = ImageHandler(cache_dir).process_image(image_path, (100, 50))
+    with Image.open(path) as img:
+        img.load()
+        return path, img.size
+
+
+@pytest.fixture
+def source_image(tmp_path):
+    path = tmp_path / "source.png"
+    Image.new("RGB", (200, 100), (10, 120, 200)).save(path)
+    return path
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestImageCache:
+    """Test suite for ImageCache."""
+
+    def test_default_root_from_environment(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DECKBUILDER_IMAGE_CACHE_DIR", str(tmp_path / "custom"))
+        assert get_default_cache_dir() == tmp_path / "custom"
+
+        monkeypatch.delenv("DECKBUILDER_IMAGE_CACHE_DIR")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        assert get_default_cache_dir() == tmp_path / "xdg" / "deckbuilder" / "images"
+
+    def test_content_key_ignores_path_and_mtime(self, source_image, tmp_path):
+        copy = tmp_path / "elsewhere" / "copy.png"
+        copy.parent.mkdir()
+        shutil.copy(source_image, copy)
+
+        assert content_key(source_image, "400x300", "high") == content_key(copy, "400x300", "high")
+        assert content_key(source_image, "400x300", "high") != content_key(source_image, "400x300", "low")
+
+    def test_get_add_and_stats(self, tmp_path):
+        cache = ImageCache(tmp_path / "cache", max_size_mb=1)
+        assert cache.get("a") is None
+
+        path = _put(cache, "a", 1000)
+        assert cache.get("a") == path
+
+        stats = cache.get_stats()
+        assert stats["file_count"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ImageCache(tmp_path / "cache", max_size_mb=3000 / (1024 * 1024))
+        for key in ("a", "b", "c"):
+            _put(cache, key, 1000)
+        cache.get("a")  # "b" is now the least recently used
+        _put(cache, "d", 1000)
+
+        assert cache.keys() == ["c", "a", "d"]
+        assert not cache.path_for("b").exists()
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_never_evicts_entry_being_added(self, tmp_path):
+        cache = ImageCache(tmp_path / "cache", max_size_mb=500 / (1024 * 1024))
+        _put(cache, "small", 100)
+        _put(cache, "large", 1000)
+
+        assert cache.keys() == ["large"]
+
+    def test_evict_to_explicit_limit(self, tmp_path):
+        cache = ImageCache(tmp_path / "cache", max_size_mb=1)
+        for key in ("a", "b", "c"):
+            _put(cache, key, 1000)
+
+        assert cache.evict(1500) == 2
+        assert cache.keys() == ["c"]
+
+    def test_index_persisted_and_reloaded(self, tmp_path):
+        cache = ImageCache(tmp_path / "cache", max_size_mb=1)
+        _put(cache, "a", 10)
+        _put(cache, "b", 20)
+        cache.get("a")
+        cache.flush()
+
+        entries = json.loads((tmp_path / "cache" / INDEX_FILE_NAME).read_text())["entries"]
+        assert set(entries) == {"a", "b"}
+
+        reloaded = ImageCache(tmp_path / "cache", max_size_mb=1)
+        assert reloaded.keys() == ["b", "a"]
+        assert reloaded.get_stats()["total_size_mb"] == cache.get_stats()["total_size_mb"]
+
+    def test_rebuilds_missing_index_with_one_scan(self, tmp_path):
+        root = tmp_path / "cache"
+        root.mkdir()
+        (root / "orphan.jpg").write_bytes(b"x" * 10)
+
+        assert ImageCache(root).keys() == ["orphan"]
+
+    def test_adopts_and_forgets_files_changed_by_other_processes(self, tmp_path):
+        cache = ImageCache(tmp_path / "cache", max_size_mb=1)
+        other = ImageCache(tmp_path / "cache", max_size_mb=1)
+        _put(other, "shared", 10)
+        assert cache.get("shared") is not None
+
+        other.discard("shared")
+        assert cache.get("shared") is None
+        assert cache.keys() == []
+
+    def test_flush_merges_entries_from_other_processes(self, tmp_path):
+        first = ImageCache(tmp_path / "cache", max_size_mb=1)
+        second = ImageCache(tmp_path / "cache", max_size_mb=1)
+        _put(first, "a", 10)
+        _put(second, "b", 10)
+        first.flush()
+        second.flush()
+
+        assert set(ImageCache(tmp_path / "cache").keys()) == {"a", "b"}
+
+    def test_shared_instance_per_root(self, tmp_path):
+        assert get_image_cache(tmp_path / "one") is get_image_cache(tmp_path / "one")
+        assert get_image_cache(tmp_path / "one") is not get_image_cache(tmp_path / "two")
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestImageHandlerSharedCache:
+    """ImageHandler instances share one cache and key entries by content."""
+
+    def test_handlers_share_default_cache(self):
+        assert ImageHandler().cache is ImageHandler().cache
+        assert ImageHandler().cache_dir == get_default_cache_dir()
+
+    def test_copied_image_hits_cache(self, source_image, tmp_path):
+        handler = ImageHandler(str(tmp_path / "cache"))
+        first = handler.process_image(str(source_image), (100, 50))
+
+        copy = tmp_path / "copy.png"
+        shutil.copy(source_image, copy)
+        second = handler.process_image(str(copy), (100, 50))
+
+        assert first == second
+        stats = handler.get_cache_stats()
+        assert stats["file_count"] == 1
+        assert stats["hits"] == 1
+
+    def test_cleanup_cache_evicts(self, source_image, tmp_path):
+        handler = ImageHandler(str(tmp_path / "cache"))
+        handler.process_image(str(source_image), (100, 50))
+        handler.process_image(str(source_image), (60, 30))
+
+        handler.cleanup_cache(max_size_mb=0)
+        assert handler.get_cache_stats()["file_count"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestImageCacheConcurrency:
+    """Atomic writes and single-flight rendering across threads and processes."""
+
+    def test_store_is_atomic_when_render_fails(self, tmp_path):
+        cache = ImageCache(tmp_path / "cache")
+
+        def render(path):
+            path.write_bytes(b"partial")
+            raise RuntimeError("render failed")
+
+        with pytest.raises(RuntimeError):
+            cache.store("broken", render)
+
+        assert not cache.path_for("broken").exists()
+        assert list((tmp_path / "cache" / "tmp").iterdir()) == []
+        assert cache.keys() == []
+
+    def test_get_or_create_renders_once_across_threads(self, tmp_path):
+        cache = ImageCache(tmp_path / "cache")
+        log_path = tmp_path / "renders.log"
+        start = threading.Barrier(8)
+
+        def fetch(_):
+            start.wait()
+            return cache.get_or_create("shared", _slow_render("shared", log_path))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            paths = set(executor.map(fetch, range(8)))
+
+        assert len(paths) == 1
+        assert log_path.read_text().split() == ["shared"]
+
+    def test_stress_many_processes_share_one_cache(self, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        log_path = str(tmp_path / "renders.log")
+        keys = [f"key{i}" for i in range(12)]
+
+        with ProcessPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(_stress_worker, cache_dir, keys[i:] + keys[:i], log_path, 3) for i in range(8)]
+            sizes = [size for future in futures for size in future.result()]
+
+        # Every read saw a complete file, and each key was rendered exactly once
+        assert set(sizes) == {len(STRESS_CHUNK) * STRESS_CHUNKS}
+        assert sorted(Path(log_path).read_text().split()) == sorted(keys)
+        assert list((tmp_path / "cache" / "tmp").iterdir()) == []
+        assert set(ImageCache(cache_dir).keys()) == set(keys)
+
+    def test_put_serves_bytes_until_written(self, tmp_path):
+        cache = ImageCache(tmp_path / "cache")
+
+        # Holding the key's lock keeps the background writer waiting
+        with cache.lock("queued"):
+            cache.put("queued", b"queued bytes")
+            assert not cache.path_for("queued").exists()
+            assert cache.get_data("queued") == b"queued bytes"
+            assert cache.get_stats()["pending_writes"] == 1
+
+        cache.wait_for_writes()
+        assert cache.path_for("queued").read_bytes() == b"queued bytes"
+        assert cache.get_stats()["pending_writes"] == 0
+        assert list((tmp_path / "cache" / "tmp").iterdir()) == []
+
+    def test_get_or_create_data_renders_once_across_threads(self, tmp_path):
+        cache = ImageCache(tmp_path / "cache")
+        renders = []
+        start = threading.Barrier(8)
+
+        def render():
+            renders.append(1)
+            time.sleep(0.01)
+            return b"rendered"
+
+        def fetch(_):
+            start.wait()
+            return cache.get_or_create_data("shared", render)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = set(executor.map(fetch, range(8)))
+
+        assert results == {b"rendered"}
+        assert len(renders) == 1
+        cache.wait_for_writes()
+        assert cache.keys() == ["shared"]
+
+    def test_get_or_create_data_renders_once_across_processes(self, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        log_path = str(tmp_path / "renders.log")
+        keys = [f"key{i}" for i in range(12)]
+
+        with ProcessPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(_data_stress_worker, cache_dir, keys[i:] + keys[:i], log_path, 3) for i in range(8)]
+            sizes = [size for future in futures for size in future.result()]
+
+        assert set(sizes) == {len(STRESS_CHUNK) * STRESS_CHUNKS}
+        assert sorted(Path(log_path).read_text().split()) == sorted(keys)
+        assert set(ImageCache(cache_dir).keys()) == set(keys)
+
+    def test_background_write_keeps_existing_file(self, tmp_path):
+        cache = ImageCache(tmp_path / "cache")
+        other = ImageCache(tmp_path / "cache")
+        _put(other, "shared", 10)
+
+        cache.put("shared", b"different")
+        cache.wait_for_writes()
+
+        assert cache.path_for("shared").read_bytes() == b"x" * 10
+        assert cache.get_data("shared") == b"x" * 10
+
+    def test_discarded_pending_write_is_skipped(self, tmp_path):
+        cache = ImageCache(tmp_path / "cache")
+        with cache.lock("gone"):
+            cache.put("gone", b"data")
+            cache.discard("gone")
+        cache.wait_for_writes()
+
+        assert cache.get_data("gone") is None
+        assert not cache.path_for("gone").exists()
+
+    def test_image_handler_processes_share_rendered_image(self, source_image, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(_process_image_worker, [cache_dir] * 8, [str(source_image)] * 8))
+
+        assert {path for path, _ in results} == {results[0][0]}
+        assert {size for _, size in results} == {(100, 50)}
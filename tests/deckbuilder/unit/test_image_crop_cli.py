@@ -0,0 +1,47 @@
+"""
+Unit tests for cropping several images with `deckbuilder image crop`.
+"""
+
+import pytest
+from PIL import Image
+
+from deckbuilder.cli import DeckbuilderCLI
+
+
+def _write_image(path, color="white"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", (320, 240), color).save(path)
+    return path
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestSmartCropImages:
+    """DeckbuilderCLI.smart_crop_images over several inputs."""
+
+    def test_same_named_inputs_get_distinct_outputs(self, tmp_path, monkeypatch):
+        """Inputs with the same file name in different folders do not overwrite each other."""
+        first = _write_image(tmp_path / "a" / "photo.png", "white")
+        second = _write_image(tmp_path / "b" / "photo.png", "black")
+        monkeypatch.chdir(tmp_path)
+
+        failures = DeckbuilderCLI(template_folder=str(tmp_path)).smart_crop_images([str(first), str(second)], 100, 100, save_steps=True)
+
+        assert failures == []
+        assert (tmp_path / "smart_cropped_100x100_photo.png").exists()
+        assert (tmp_path / "smart_cropped_100x100_photo_2.png").exists()
+        assert len(list(tmp_path.glob("smart_crop_photo_[1-9]-*.jpg"))) == 9
+        assert len(list(tmp_path.glob("smart_crop_photo_2_*.jpg"))) == 9
+
+    def test_failures_do_not_stop_the_batch(self, tmp_path, monkeypatch):
+        """Unreadable and missing inputs are reported and the rest are still cropped."""
+        good = _write_image(tmp_path / "good.png")
+        bad = tmp_path / "bad.png"
+        bad.write_text("not an image")
+        monkeypatch.chdir(tmp_path)
+
+        inputs = [str(bad), str(tmp_path / "missing.png"), str(good)]
+        failures = DeckbuilderCLI(template_folder=str(tmp_path)).smart_crop_images(inputs, 100, 100)
+
+        assert failures == inputs[:2]
+        assert (tmp_path / "smart_cropped_100x100_good.png").exists()
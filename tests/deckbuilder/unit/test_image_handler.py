@@ -0,0 +1,123 @@
+"""
+Unit tests for the single-open, draft-mode decode path of ImageHandler.process_image.
+"""
+
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from deckbuilder import image_handler as image_handler_module
+from deckbuilder.image_handler import ImageHandler
+
+
+@pytest.fixture
+def handler(tmp_path):
+    return ImageHandler(str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def photo(tmp_path):
+    """A large JPEG, big enough for the decoder to scale it down."""
+    path = tmp_path / "photo.jpg"
+    Image.linear_gradient("L").resize((2400, 1600)).convert("RGB").save(path, "JPEG", quality=90)
+    return path
+
+
+@pytest.fixture
+def open_calls(monkeypatch):
+    """Record the paths ImageHandler opens with Pillow, and the size each decodes at."""
+    calls = []
+    original_open = Image.open
+
+    def counting_open(path, *args, **kwargs):
+        img = original_open(path, *args, **kwargs)
+        original_draft = img.draft
+
+        def draft(mode, size):
+            result = original_draft(mode, size)
+            calls[-1]["decoded_size"] = img.size
+            return result
+
+        img.draft = draft
+        calls.append({"path": str(path), "decoded_size": img.size})
+        return img
+
+    monkeypatch.setattr(image_handler_module.Image, "open", counting_open)
+    return calls
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestImageHandlerDecode:
+    """process_image opens each source once and decodes JPEGs near the target size."""
+
+    def test_opens_source_once(self, handler, photo, open_calls):
+        output = handler.process_image(str(photo), (600, 450))
+
+        assert output is not None
+        assert [call["path"] for call in open_calls] == [str(photo)]
+
+    def test_jpeg_decoded_at_reduced_scale(self, handler, photo, open_calls):
+        output = handler.process_image(str(photo), (600, 450))
+
+        # 2400x1600 -> 600x400 target: decoded at 1/2 scale (still 2x the target)
+        assert open_calls[0]["decoded_size"] == (1200, 800)
+        with Image.open(output) as img:
+            assert img.size == (600, 400)
+
+    def test_cache_hit_does_not_open_source(self, handler, photo, open_calls):
+        first = handler.process_image(str(photo), (600, 450))
+        second = handler.process_image(str(photo), (600, 450))
+
+        assert first == second
+        assert len(open_calls) == 1
+
+    def test_png_resized_to_fit(self, handler, tmp_path):
+        path = tmp_path / "wide.png"
+        Image.new("RGBA", (1000, 250), (0, 128, 255, 255)).save(path)
+
+        with Image.open(handler.process_image(str(path), (400, 300))) as img:
+            assert img.size == (400, 100)
+            assert img.mode == "RGB"
+
+    def test_small_image_upscaled_to_fit(self, handler, tmp_path):
+        path = tmp_path / "small.jpg"
+        Image.new("RGB", (100, 50), (200, 10, 10)).save(path)
+
+        with Image.open(handler.process_image(str(path), (400, 300))) as img:
+            assert img.size == (400, 200)
+
+    def test_invalid_images_return_none(self, handler, tmp_path):
+        corrupt = tmp_path / "corrupt.jpg"
+        corrupt.write_bytes(b"not an image")
+        unsupported = tmp_path / "image.tiff"
+        Image.new("RGB", (10, 10)).save(unsupported)
+
+        assert handler.process_image(str(corrupt), (400, 300)) is None
+        assert handler.process_image(str(unsupported), (400, 300)) is None
+        assert handler.process_image(str(tmp_path / "missing.jpg"), (400, 300)) is None
+        assert handler.get_cache_stats()["file_count"] == 0
+
+    def test_process_image_data_matches_cached_file(self, handler, photo, open_calls):
+        data = handler.process_image_data(str(photo), (600, 450))
+        handler.cache.wait_for_writes()
+
+        # Encoded in memory once; the background write and later lookups reuse those bytes
+        assert len(open_calls) == 1
+        assert handler.process_image(str(photo), (600, 450)) is not None
+        assert len(open_calls) == 1
+        with Image.open(BytesIO(data)) as img:
+            assert img.format == "JPEG"
+            assert img.size == (600, 400)
+        key = handler._generate_cache_key(str(photo), (600, 450), "high")
+        assert handler.cache.path_for(key).read_bytes() == data
+
+    def test_process_image_data_invalid_returns_none(self, handler, tmp_path):
+        corrupt = tmp_path / "corrupt.jpg"
+        corrupt.write_bytes(b"not an image")
+
+        assert handler.process_image_data(str(corrupt), (400, 300)) is None
+        assert handler.process_image_data(str(tmp_path / "missing.jpg"), (400, 300)) is None
+        handler.cache.wait_for_writes()
+        assert handler.get_cache_stats()["file_count"] == 0
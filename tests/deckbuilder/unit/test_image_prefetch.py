@@ -0,0 +1,125 @@
+"""
+Unit tests for the parallel image prefetch stage (image_prefetch and its use while building slides).
+"""
+
+from pathlib import Path
+
+import pytest
+from PIL import Image
+from pptx import Presentation
+from pptx.enum.shapes import PP_PLACEHOLDER_TYPE
+
+from deckbuilder.engine import Deckbuilder
+from deckbuilder.image_prefetch import ImagePrefetcher, fallback_context, get_default_image_threads, placeholder_pixel_size
+from deckbuilder.path_manager import create_library_path_manager
+
+TEMPLATES_DIR = Path(__file__).parent.parent.parent.parent / "src" / "deckbuilder" / "assets" / "templates"
+
+
+def _picture_slide(image_path, title="Picture"):
+    return {"layout": "Picture with Caption", "placeholders": {"title": title, "image_1": str(image_path), "text_caption_1": "Caption"}}
+
+
+@pytest.fixture
+def images(tmp_path):
+    """Three distinct source images."""
+    paths = []
+    for index, color in enumerate([(200, 30, 30), (30, 200, 30), (30, 30, 200)]):
+        path = tmp_path / f"image{index}.png"
+        Image.new("RGB", (640, 480), color).save(path)
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def deck(tmp_path):
+    """Fresh Deckbuilder writing to a temporary folder."""
+    Deckbuilder.reset()
+    pm = create_library_path_manager(template_folder=str(TEMPLATES_DIR), output_folder=str(tmp_path / "output"))
+    yield Deckbuilder(path_manager_instance=pm)
+    Deckbuilder.reset()
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestImagePrefetch:
+    """Test suite for ImagePrefetcher."""
+
+    def test_default_threads_from_environment(self, monkeypatch):
+        monkeypatch.setenv("DECKBUILDER_IMAGE_THREADS", "3")
+        assert get_default_image_threads() == 3
+
+        monkeypatch.setenv("DECKBUILDER_IMAGE_THREADS", "0")
+        assert get_default_image_threads() == 0
+
+        monkeypatch.setenv("DECKBUILDER_IMAGE_THREADS", "invalid")
+        assert get_default_image_threads() >= 1
+
+    def test_slides_pick_up_prefetched_images(self, deck, images):
+        slides = [_picture_slide(path, f"Slide {index}") for index, path in enumerate(images)]
+        deck.create_presentation({"slides": slides}, fileName="prefetch")
+
+        stats = deck.presentation_builder.image_prefetcher.get_stats()
+        assert stats["prefetched"] == len(images)
+        assert stats["hits"] == len(images)
+        assert stats["misses"] == 0
+
+        output = next(Path(deck.output_folder).glob("prefetch.*.g.pptx"))
+        pictures = [shape for slide in Presentation(output).slides for shape in slide.shapes if hasattr(shape, "image")]
+        assert len(pictures) == len(images)
+
+    def test_prefetch_uses_layout_picture_size(self, deck, images):
+        deck._initialize_presentation("default")
+        builder = deck.presentation_builder
+        assert builder.prefetch_images(deck.prs, [_picture_slide(images[0])]) == 1
+
+        slide = builder.add_slide(deck.prs, _picture_slide(images[0]))
+        picture = next(shape for shape in slide.shapes if hasattr(shape, "image"))
+        assert picture.image.size[0] > 0
+        assert builder.image_prefetcher.get_stats()["misses"] == 0
+
+    def test_duplicate_images_submitted_once(self, deck, images):
+        deck._initialize_presentation("default")
+        slides = [_picture_slide(images[0]), _picture_slide(images[0]), _picture_slide(images[1])]
+
+        assert deck.presentation_builder.prefetch_images(deck.prs, slides) == 2
+
+    def test_invalid_image_falls_back(self, deck, tmp_path):
+        deck._initialize_presentation("default")
+        builder = deck.presentation_builder
+        missing = str(tmp_path / "missing.png")
+        slide_data = _picture_slide(missing)
+        builder.prefetch_images(deck.prs, [slide_data])
+
+        slide = builder.add_slide(deck.prs, slide_data)
+        placeholder = next(shape for shape in slide.placeholders if shape.placeholder_format.type == PP_PLACEHOLDER_TYPE.PICTURE)
+        result = builder.image_prefetcher.take(missing, placeholder_pixel_size(placeholder), fallback_context(slide_data))
+        assert result.valid is False
+        if builder.placekitten.is_available():
+            assert result.data
+
+    def test_disabled_prefetch_processes_inline(self, deck, images):
+        deck.presentation_builder.image_prefetcher.max_workers = 0
+        deck.create_presentation({"slides": [_picture_slide(images[0])]}, fileName="inline")
+
+        stats = deck.presentation_builder.image_prefetcher.get_stats()
+        assert stats["prefetched"] == 0
+        assert stats["misses"] == 1
+
+    def test_slides_without_images_submit_nothing(self, deck):
+        deck._initialize_presentation("default")
+        slides = [{"layout": "Title Slide", "placeholders": {"title": "No images"}}]
+
+        assert deck.presentation_builder.prefetch_images(deck.prs, slides) == 0
+
+    def test_failed_job_is_reported_as_not_prefetched(self, images):
+        class FailingHandler:
+            def process_image_data(self, image_path, dimensions, quality):
+                raise RuntimeError("boom")
+
+        prefetcher = ImagePrefetcher(FailingHandler(), None, max_workers=1)
+        prefetcher.submit(str(images[0]), (100, 100), {})
+        try:
+            assert prefetcher.take(str(images[0]), (100, 100), {}) is None
+        finally:
+            prefetcher.shutdown()
@@ -0,0 +1,57 @@
+"""
+Import-time regression tests.
+
+`import deckbuilder.cli` must stay cheap: the OpenCV/NumPy stack used by
+PlaceKitten smart cropping should only load when an image is actually cropped.
+Each check runs in a fresh interpreter so earlier imports do not hide costs.
+"""
+
+import json
+import os
+import subprocess  # nosec B404
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).parent.parent.parent.parent / "src"
+
+# Generous default so slow CI machines pass; override with DECKBUILDER_IMPORT_BUDGET_SECONDS
+IMPORT_BUDGET_SECONDS = float(os.getenv("DECKBUILDER_IMPORT_BUDGET_SECONDS", "1.0"))
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "heavy": [m for m in ("cv2", "numpy") if m in sys.modules]}}))
+"""
+
+
+def _probe_import(module: str) -> dict:
+    """Import a module in a fresh interpreter and report time and heavy modules loaded."""
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    result = subprocess.run([sys.executable, "-c", PROBE.format(module=module)], capture_output=True, text=True, env=env, timeout=60, check=True)  # nosec B603
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestImportTime:
+    """Test suite for startup import cost."""
+
+    @pytest.mark.parametrize("module", ["deckbuilder.cli", "deckbuilder.engine", "placekitten"])
+    def test_cv_stack_not_loaded_at_import(self, module):
+        """Importing the CLI, engine or PlaceKitten does not pull in cv2 or numpy."""
+        assert _probe_import(module)["heavy"] == []
+
+    def test_cli_import_within_budget(self):
+        """`import deckbuilder.cli` stays within the import-time budget (best of 3)."""
+        best = min(_probe_import("deckbuilder.cli")["seconds"] for _ in range(3))
+        assert best < IMPORT_BUDGET_SECONDS, f"import deckbuilder.cli took {best:.3f}s (budget {IMPORT_BUDGET_SECONDS}s)"
+
+    def test_smart_crop_engine_still_available(self):
+        """The lazily exported SmartCropEngine is still importable from placekitten."""
+        from placekitten import SmartCropEngine
+
+        assert SmartCropEngine.__name__ == "SmartCropEngine"
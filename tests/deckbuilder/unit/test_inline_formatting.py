@@ -0,0 +1,76 @@
+"""
+Unit tests for the shared single-pass inline formatting tokenizer.
+
+Checks marker precedence and combinations, that every parser entry point uses
+the same tokenizer, and that memoized results are never shared between callers.
+"""
+
+import pytest
+
+from deckbuilder import content_formatting
+from deckbuilder.content_formatter import ContentFormatter
+from deckbuilder.content_formatting import parse_inline_formatting
+from deckbuilder.content_processor import ContentProcessor
+from deckbuilder.converter import FrontmatterConverter
+
+BOLD = {"bold": True}
+ITALIC = {"italic": True}
+UNDERLINE = {"underline": True}
+BOLD_ITALIC = {"bold": True, "italic": True}
+ALL = {"bold": True, "italic": True, "underline": True}
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestInlineFormatting:
+    """Test suite for parse_inline_formatting."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("", [("", {})]),
+            ("plain text", [("plain text", {})]),
+            ("**bold** and *italic*", [("bold", BOLD), (" and ", {}), ("italic", ITALIC)]),
+            ("___under___ end", [("under", UNDERLINE), (" end", {})]),
+            ("***both***", [("both", BOLD_ITALIC)]),
+            ("***___all___***", [("all", ALL)]),
+            ("___***all***___", [("all", ALL)]),
+            ("a **b *c* d** e", [("a ", {}), ("b *c* d", BOLD), (" e", {})]),
+            ("5 * 3 = 15", [("5 * 3 = 15", {})]),
+            ("snake_case_name", [("snake_case_name", {})]),
+        ],
+    )
+    def test_markers(self, text, expected):
+        """Markers are recognised with longest-marker precedence."""
+        assert [(s["text"], s["format"]) for s in parse_inline_formatting(text)] == expected
+
+    def test_entry_points_share_tokenizer(self):
+        """ContentFormatter, ContentProcessor, the converter and content_formatting agree."""
+        text = "Mix of **bold**, *italic* and ___***everything***___"
+        expected = parse_inline_formatting(text)
+
+        assert ContentFormatter().parse_inline_formatting(text) == expected
+        assert ContentProcessor()._parse_inline_formatting(text) == expected
+        assert FrontmatterConverter()._parse_inline_formatting(text) == expected
+        assert content_formatting.content_formatter.parse_inline_formatting(text) == expected
+
+    def test_repeated_strings_hit_memo(self):
+        """Repeated strings are tokenized once."""
+        content_formatting._tokenize_inline.cache_clear()
+        for _ in range(5):
+            parse_inline_formatting("| **Header** |")
+
+        info = content_formatting._tokenize_inline.cache_info()
+        assert info.misses == 1
+        assert info.hits == 4
+        assert info.maxsize == content_formatting.INLINE_FORMAT_CACHE_SIZE
+
+    def test_memoized_results_are_fresh(self):
+        """Callers may modify returned segments without affecting later calls."""
+        first = parse_inline_formatting("**bold** text")
+        first[0]["format"]["italic"] = True
+        first[0]["text"] = "changed"
+
+        second = parse_inline_formatting("**bold** text")
+        assert second[0] == {"text": "bold", "format": BOLD}
+        assert content_formatting.INLINE_FORMATS[4][1] == BOLD
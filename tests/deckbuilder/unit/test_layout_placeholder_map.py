@@ -0,0 +1,74 @@
+"""
+Unit tests for the per-layout placeholder map used by SlideBuilder.
+
+Field resolution is precompiled once per template layout and reused for every
+slide with that layout; changing the layout mapping drops the compiled maps.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from deckbuilder.engine import Deckbuilder
+from deckbuilder.path_manager import create_library_path_manager
+
+TEMPLATES_DIR = Path(__file__).parent.parent.parent.parent / "src" / "deckbuilder" / "assets" / "templates"
+
+
+@pytest.fixture
+def builder(tmp_path):
+    """Deckbuilder with the default template loaded."""
+    pm = create_library_path_manager(template_folder=str(TEMPLATES_DIR), output_folder=str(tmp_path))
+    deck = Deckbuilder.create_instance(path_manager_instance=pm)
+    deck._initialize_presentation("default")
+    return deck
+
+
+def _add(builder, slide_data):
+    presentation_builder = builder.presentation_builder
+    return presentation_builder.add_slide(builder.prs, slide_data)
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestLayoutPlaceholderMap:
+    """Test suite for LayoutPlaceholderMap caching and resolution."""
+
+    def test_map_built_once_per_layout(self, builder):
+        """Slides sharing a layout reuse one compiled map."""
+        slide_builder = builder.presentation_builder.slide_builder
+        for i in range(3):
+            _add(builder, {"layout": "Title and Content", "placeholders": {"title": f"Slide {i}", "content": "Body"}})
+        _add(builder, {"layout": "Title Slide", "placeholders": {"title": "Cover", "subtitle": "Sub"}})
+
+        assert len(slide_builder._layout_maps) == 2
+        layout_map = next(m for m in slide_builder._layout_maps.values() if m.layout_name == "Title and Content")
+        assert set(layout_map._resolved) == {"title", "content"}
+
+    def test_fields_land_in_expected_placeholders(self, builder):
+        """Title, subtitle and mapped column fields are written to the right shapes."""
+        slide = _add(
+            builder,
+            {"layout": "Four Columns", "placeholders": {"title": "Columns", "content_col1": "First", "content_col4": "Fourth"}},
+        )
+        texts = {shape.name: shape.text_frame.text for shape in slide.placeholders if shape.has_text_frame}
+
+        assert "Columns" in texts.values()
+        assert texts.get("content_col1") == "First"
+        assert texts.get("content_col4") == "Fourth"
+
+    def test_unmapped_field_is_not_resolved(self, builder):
+        """Fields without a matching placeholder resolve to None."""
+        _add(builder, {"layout": "Title Only", "placeholders": {"title": "Only"}})
+        layout_map = next(iter(builder.presentation_builder.slide_builder._layout_maps.values()))
+
+        assert layout_map.resolve("subtitle") == (None, None)
+
+    def test_new_layout_mapping_drops_compiled_maps(self, builder):
+        """Assigning a different mapping object invalidates the cache."""
+        slide_builder = builder.presentation_builder.slide_builder
+        _add(builder, {"layout": "Title Slide", "placeholders": {"title": "Cover"}})
+        assert slide_builder._layout_maps
+
+        slide_builder.layout_mapping = dict(slide_builder.layout_mapping)
+        assert slide_builder._layout_maps == {}
@@ -0,0 +1,69 @@
+"""
+Unit tests for the debug logging channels.
+
+Channel switches are resolved once from the environment; disabled channels
+must not evaluate lazy messages or arguments.
+"""
+
+import pytest
+
+from deckbuilder import logging_config
+
+
+@pytest.fixture
+def reconfigure(monkeypatch):
+    """Set debug environment variables and re-resolve the channels; restore afterwards."""
+
+    def apply(**env):
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        logging_config.configure_logging()
+
+    yield apply
+    monkeypatch.undo()
+    logging_config.configure_logging()
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestLoggingConfig:
+    """Test suite for debug channel configuration."""
+
+    def test_disabled_channel_skips_lazy_evaluation(self, reconfigure, capsys):
+        """Nothing is printed and no lazy function is called when the channel is off."""
+        reconfigure(DECKBUILDER_SLIDE_DEBUG="false")
+        calls = []
+
+        logging_config.slide_builder_print(lambda: calls.append("message") or "message")
+        logging_config.slide_builder_print("value %s", lambda: calls.append("arg") or "arg")
+
+        assert calls == []
+        assert capsys.readouterr().out == ""
+        assert logging_config.slide_debug_enabled() is False
+
+    def test_enabled_channel_formats_lazily(self, reconfigure, capsys):
+        """Enabled channels print %-formatted messages and evaluate lazy arguments."""
+        reconfigure(DECKBUILDER_VALIDATION_DEBUG="true")
+
+        logging_config.validation_print("[Validation] Slide %d: %s", 3, lambda: ["title", "content"])
+
+        assert capsys.readouterr().out == "[Validation] Slide 3: ['title', 'content']\n"
+        assert logging_config.validation_debug_enabled() is True
+
+    def test_channels_are_independent(self, reconfigure, capsys):
+        """Enabling one channel leaves the others silent."""
+        reconfigure(DECKBUILDER_CONTENT_DEBUG="true", DECKBUILDER_SLIDE_DEBUG="false")
+
+        logging_config.content_processor_print("content on")
+        logging_config.slide_builder_print("slide off")
+
+        assert capsys.readouterr().out == "content on\n"
+
+    def test_literal_percent_without_args(self, reconfigure, capsys):
+        """Messages without arguments are printed verbatim, including percent signs."""
+        reconfigure(DECKBUILDER_DEBUG="true")
+
+        logging_config.debug_print("Revenue up 15%")
+
+        assert capsys.readouterr().out == "Revenue up 15%\n"
+        assert logging_config.DEBUG_MODE is True
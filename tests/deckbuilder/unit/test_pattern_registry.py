@@ -0,0 +1,137 @@
+"""
+Unit tests for the process-wide compiled pattern registry.
+
+Verifies that pattern directories are parsed once and shared, that adding a
+pattern file (directory mtime change) recompiles the entry, and that the
+converter, PatternLoader and structured frontmatter helpers all read from it.
+"""
+
+import json
+import os
+
+import pytest
+
+from deckbuilder.converter import StructuredFrontmatterConverter
+from deckbuilder.pattern_loader import PatternLoader
+from deckbuilder.pattern_registry import BUILTIN_PATTERNS_DIR, PatternRegistry, pattern_registry
+from deckbuilder.structured_frontmatter import StructuredFrontmatterRegistry
+
+
+def _write_pattern(directory, file_name, layout, description="Pattern used by registry tests"):
+    pattern = {
+        "description": description,
+        "yaml_pattern": {"layout": layout, "title": "str"},
+        "validation": {"required_fields": ["title"]},
+        "example": f"---\nlayout: {layout}\ntitle: Example\n---",
+    }
+    path = directory / file_name
+    path.write_text(json.dumps(pattern), encoding="utf-8")
+    return path
+
+
+def _bump_mtime(directory):
+    """Move the directory mtime forward (coarse filesystem timestamps)."""
+    stat = os.stat(directory)
+    os.utime(directory, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestPatternRegistry:
+    """Test suite for PatternRegistry."""
+
+    def test_directory_compiled_once(self, tmp_path):
+        """Repeated lookups return the same compiled object without re-reading files."""
+        _write_pattern(tmp_path, "one.json", "One")
+        registry = PatternRegistry()
+
+        first = registry.get(tmp_path)
+        second = registry.get(tmp_path)
+
+        assert first is second
+        assert list(first.patterns) == ["One"]
+        assert registry.get_stats()["misses"] == 1
+        assert registry.get_stats()["hits"] == 1
+
+    def test_directory_mtime_change_recompiles(self, tmp_path):
+        """Adding a pattern file is picked up on the next lookup."""
+        _write_pattern(tmp_path, "one.json", "One")
+        registry = PatternRegistry()
+        first = registry.get(tmp_path)
+
+        _write_pattern(tmp_path, "two.json", "Two")
+        _bump_mtime(tmp_path)
+        second = registry.get(tmp_path)
+
+        assert second is not first
+        assert set(second.patterns) == {"One", "Two"}
+
+    def test_compiled_views_are_read_only(self, tmp_path):
+        """Shared views cannot be modified by callers."""
+        _write_pattern(tmp_path, "one.json", "One")
+        compiled = PatternRegistry().get(tmp_path)
+
+        with pytest.raises(TypeError):
+            compiled.patterns["Other"] = {}
+        assert compiled.typed_patterns["One"]["yaml_pattern"]["title"] is str
+        assert compiled.patterns["One"]["yaml_pattern"]["title"] == "str"
+
+    def test_unreadable_and_invalid_files_recorded(self, tmp_path):
+        """Broken JSON and schema failures are kept as per-file results, not raised."""
+        _write_pattern(tmp_path, "good.json", "Good")
+        (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+        (tmp_path / "schema.json").write_text(json.dumps({"yaml_pattern": {"layout": "Schema"}}), encoding="utf-8")
+
+        compiled = PatternRegistry().get(tmp_path)
+
+        broken = next(f for f in compiled.files if f.path.name == "broken.json")
+        assert broken.data is None and "Invalid JSON" in broken.error
+        assert [f.layout for f in compiled.valid_files] == ["Good"]
+
+    def test_missing_directory_is_empty(self, tmp_path):
+        """A missing directory compiles to an empty set."""
+        compiled = PatternRegistry().get(tmp_path / "missing")
+
+        assert len(compiled) == 0
+
+    def test_static_table_built_once(self):
+        """In-code pattern tables are built by their factory only once."""
+        registry = PatternRegistry()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return {"Layout": {"structure_type": "test"}}
+
+        assert registry.get_static("table", factory) is registry.get_static("table", factory)
+        assert len(calls) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestPatternRegistryConsumers:
+    """The converter, PatternLoader and structured frontmatter share compiled data."""
+
+    def test_converters_share_builtin_patterns(self):
+        """Per-slide converters reuse one compiled pattern set."""
+        first = StructuredFrontmatterConverter()
+        second = StructuredFrontmatterConverter()
+
+        assert first.registry.get_structure_patterns() is second.registry.get_structure_patterns()
+        assert first.registry.get_structure_patterns() is pattern_registry.get(BUILTIN_PATTERNS_DIR).typed_patterns
+
+    def test_pattern_loaders_share_pattern_data(self, tmp_path):
+        """Separate loaders return the same parsed pattern dictionaries."""
+        first = PatternLoader(tmp_path).load_patterns()
+        second = PatternLoader(tmp_path).load_patterns()
+
+        assert first.keys() == second.keys()
+        assert all(first[name] is second[name] for name in first)
+
+    def test_structured_frontmatter_table_shared(self):
+        """The in-code structured frontmatter table is built once per process."""
+        first = StructuredFrontmatterRegistry().get_structure_patterns()
+        second = StructuredFrontmatterRegistry({"layouts": {}}).get_structure_patterns()
+
+        assert first is second
+        assert "Comparison" in first
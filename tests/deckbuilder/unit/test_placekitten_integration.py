@@ -0,0 +1,59 @@
+"""
+Unit tests for the content-addressed PlaceKitten fallback cache key.
+"""
+
+import pytest
+from PIL import Image
+
+from deckbuilder import placekitten_integration
+from deckbuilder.image_handler import ImageHandler
+from deckbuilder.placekitten_integration import PlaceKittenIntegration
+
+
+@pytest.fixture
+def integration(tmp_path):
+    integration = PlaceKittenIntegration(ImageHandler(str(tmp_path / "cache")))
+    if not integration.is_available():
+        pytest.skip("PlaceKitten is not available")
+    return integration
+
+
+@pytest.fixture
+def source_image(tmp_path, integration, monkeypatch):
+    """Point every image ID at one temporary source file."""
+    path = tmp_path / "source.png"
+    Image.new("RGB", (64, 48), "white").save(path)
+    monkeypatch.setattr(integration.pk, "get_image_path", lambda image_id: path)
+    return path
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestFallbackCacheKey:
+    """PlaceKittenIntegration._generate_fallback_cache_key."""
+
+    def test_contexts_selecting_the_same_image_share_a_key(self, integration):
+        count = integration.pk.get_image_count()
+        same_image = integration._generate_fallback_cache_key((800, 600), {"slide_index": 0})
+
+        assert integration._generate_fallback_cache_key((800, 600), {"slide_index": count}) == same_image
+        assert integration._generate_fallback_cache_key((800, 600)) == same_image
+        if count > 1:
+            assert integration._generate_fallback_cache_key((800, 600), {"slide_index": 1}) != same_image
+        assert integration._generate_fallback_cache_key((800, 601), {"slide_index": 0}) != same_image
+
+    def test_key_follows_source_content(self, integration, source_image):
+        before = integration._generate_fallback_cache_key((800, 600))
+        Image.new("RGB", (64, 48), "black").save(source_image)
+
+        assert integration._generate_fallback_cache_key((800, 600)) != before
+
+    def test_key_follows_styling_and_version(self, integration, source_image, monkeypatch):
+        before = integration._generate_fallback_cache_key((800, 600))
+
+        monkeypatch.setattr(placekitten_integration, "FALLBACK_VERSION", placekitten_integration.FALLBACK_VERSION + 1)
+        after_version = integration._generate_fallback_cache_key((800, 600))
+        integration.professional_config["smart_crop_strategy"] = "contour"
+        after_styling = integration._generate_fallback_cache_key((800, 600))
+
+        assert len({before, after_version, after_styling}) == 3
@@ -0,0 +1,83 @@
+"""
+Unit tests for in-memory vs paranoid post-generation validation.
+
+Default validation should check the live presentation object without
+re-opening the saved file; paranoid mode should still reload from disk.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from pptx import Presentation
+
+from deckbuilder.engine import Deckbuilder
+from deckbuilder.path_manager import create_library_path_manager
+from deckbuilder.validation import PresentationValidator, ValidationError
+
+TEMPLATES_DIR = Path(__file__).parent.parent.parent.parent / "src" / "deckbuilder" / "assets" / "templates"
+
+SAMPLE_DATA = {
+    "slides": [
+        {"layout": "Title Slide", "placeholders": {"title": "Validation Title", "subtitle": "Sub"}},
+        {"layout": "Title and Content", "placeholders": {"title": "Second", "content": "Body text"}},
+    ]
+}
+
+
+@pytest.fixture
+def deck(tmp_path):
+    """Fresh Deckbuilder writing to a temporary folder."""
+    Deckbuilder.reset()
+    pm = create_library_path_manager(template_folder=str(TEMPLATES_DIR), output_folder=str(tmp_path))
+    yield Deckbuilder(path_manager_instance=pm)
+    Deckbuilder.reset()
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestPostGenerationValidation:
+    """Test suite for post-generation validation modes."""
+
+    def test_default_mode_does_not_reload_file(self, deck):
+        """In-memory validation never calls Presentation() on the saved file."""
+        with patch("deckbuilder.validation.Presentation", wraps=Presentation) as mock_prs:
+            result = deck.create_presentation(SAMPLE_DATA, "in_memory")
+
+        assert "Successfully created presentation with 2 slides" in result
+        mock_prs.assert_not_called()
+
+    def test_paranoid_mode_reloads_file(self, deck):
+        """Paranoid validation re-opens the saved PPTX from disk."""
+        with patch("deckbuilder.validation.Presentation", wraps=Presentation) as mock_prs:
+            deck.create_presentation(SAMPLE_DATA, "paranoid", paranoid_validation=True)
+
+        mock_prs.assert_called_once()
+        assert str(mock_prs.call_args[0][0]).endswith(".g.pptx")
+
+    def test_paranoid_mode_from_environment(self, deck, monkeypatch):
+        """DECKBUILDER_PARANOID_VALIDATION enables paranoid mode by default."""
+        monkeypatch.setenv("DECKBUILDER_PARANOID_VALIDATION", "true")
+        with patch("deckbuilder.validation.Presentation", wraps=Presentation) as mock_prs:
+            deck.create_presentation(SAMPLE_DATA, "paranoid_env")
+
+        mock_prs.assert_called_once()
+
+    def test_in_memory_validation_detects_slide_count_mismatch(self, deck):
+        """The in-memory check still catches dropped slides."""
+        deck.create_presentation(SAMPLE_DATA, "mismatch")
+        validator = PresentationValidator(
+            {"slides": SAMPLE_DATA["slides"] + [{"layout": "Title Slide", "placeholders": {"title": "Missing"}}]},
+            "default",
+            str(TEMPLATES_DIR),
+        )
+
+        with pytest.raises(ValidationError, match="Slide count mismatch"):
+            validator.validate_post_generation(prs=deck.prs)
+
+    def test_missing_path_and_presentation_raises(self):
+        """Validation without either a path or a presentation is an error."""
+        validator = PresentationValidator(SAMPLE_DATA, "default", str(TEMPLATES_DIR))
+
+        with pytest.raises(ValidationError):
+            validator.validate_post_generation()
@@ -0,0 +1,120 @@
+"""
+Unit tests for per-stage timing instrumentation.
+
+Covers the span tree and cost-sorted summary, the no-op behaviour when
+profiling is disabled, and the stages recorded by Deckbuilder.create_presentation.
+"""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from deckbuilder.engine import Deckbuilder
+from deckbuilder.path_manager import create_library_path_manager
+from deckbuilder.profiling import current_profiler, profile_session, span
+
+TEMPLATES_DIR = Path(__file__).parent.parent.parent.parent / "src" / "deckbuilder" / "assets" / "templates"
+
+SAMPLE_DATA = {
+    "slides": [
+        {"layout": "Title Slide", "placeholders": {"title": "Profiled", "subtitle": "Deck"}},
+        {"layout": "Title and Content", "placeholders": {"title": "Second", "content": "Body text"}},
+    ]
+}
+
+
+def _names(node):
+    """Collect every span name in a timing tree."""
+    names = [node["name"]]
+    for child in node.get("children", []):
+        names.extend(_names(child))
+    return names
+
+
+@pytest.fixture
+def deck(tmp_path):
+    """Fresh Deckbuilder writing to a temporary folder."""
+    Deckbuilder.reset()
+    pm = create_library_path_manager(template_folder=str(TEMPLATES_DIR), output_folder=str(tmp_path))
+    yield Deckbuilder(path_manager_instance=pm)
+    Deckbuilder.reset()
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestProfiler:
+    """Test suite for the span tree and summary."""
+
+    def test_span_is_noop_without_session(self):
+        """Spans outside a session record nothing."""
+        assert current_profiler() is None
+        with span("ignored"):
+            pass
+        assert current_profiler() is None
+
+    def test_nested_spans_build_tree(self):
+        """Nested spans become children with attributes and self time."""
+        with profile_session("deck") as profiler:
+            with span("build_slides"):
+                with span("slide", index=1):
+                    time.sleep(0.01)
+
+        tree = profiler.to_dict()
+        slide = tree["children"][0]["children"][0]
+        assert tree["name"] == "deck"
+        assert slide["attrs"] == {"index": 1}
+        assert slide["seconds"] >= 0.01
+        assert tree["children"][0]["self_seconds"] < slide["seconds"]
+        assert current_profiler() is None
+
+    def test_summary_sorted_by_self_time(self):
+        """The summary lists the most expensive stage first."""
+        with profile_session("deck") as profiler:
+            with span("cheap"):
+                pass
+            with span("expensive"):
+                time.sleep(0.02)
+
+        rows = profiler.summarize()
+        assert rows[0]["name"] == "expensive"
+        assert "expensive" in profiler.format_summary().splitlines()[2]
+
+    def test_nested_session_joins_outer_profiler(self):
+        """An inner session records into the already active profiler."""
+        with profile_session("outer") as outer:
+            with profile_session("inner") as inner:
+                pass
+
+        assert inner is outer
+        assert _names(outer.to_dict()) == ["outer", "inner"]
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestEngineProfiling:
+    """Test suite for stages recorded by create_presentation."""
+
+    def test_create_presentation_records_stages(self, deck):
+        """profile=True records every pipeline stage and slide."""
+        deck.create_presentation(SAMPLE_DATA, "profiled", profile=True)
+
+        tree = deck.last_profile.to_dict()
+        names = _names(tree)
+        for stage in ("initialize_presentation", "pre_validation", "build_slides", "save", "post_validation"):
+            assert stage in names
+        assert names.count("slide") == 2
+        assert "placeholder" in names
+        json.dumps(tree)
+
+    def test_profiling_disabled_by_default(self, deck):
+        """Without profile or DECKBUILDER_PROFILE no timings are kept."""
+        deck.create_presentation(SAMPLE_DATA, "unprofiled")
+        assert deck.last_profile is None
+
+    def test_profiling_from_environment(self, deck, monkeypatch):
+        """DECKBUILDER_PROFILE=true enables profiling by default."""
+        monkeypatch.setenv("DECKBUILDER_PROFILE", "true")
+        deck.create_presentation(SAMPLE_DATA, "env_profiled")
+        assert deck.last_profile is not None
@@ -0,0 +1,188 @@
+"""
+Unit tests for the streaming markdown → slides pipeline.
+
+Covers the incremental frontmatter block splitter, lazy slide parsing, and
+Deckbuilder.create_presentation_from_markdown building (and validating) each
+slide before the next one is read.
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+from pptx import Presentation
+
+from deckbuilder import converter
+from deckbuilder.content_processor import ContentProcessor, iter_markdown_blocks
+from deckbuilder.engine import Deckbuilder
+from deckbuilder.path_manager import create_library_path_manager
+from deckbuilder.validation import ValidationError
+
+TEMPLATES_DIR = Path(__file__).parent.parent.parent.parent / "src" / "deckbuilder" / "assets" / "templates"
+
+SAMPLE_MARKDOWN = """---
+layout: Title Slide
+title: Streaming Deck
+subtitle: Built slide by slide
+---
+
+---
+layout: Title and Content
+title: Second Slide
+content: Body text for the second slide
+---
+
+---
+layout: Title Only
+title: Closing
+---
+"""
+
+
+class LineFeed:
+    """Iterable of lines that records how many lines have been consumed."""
+
+    def __init__(self, text):
+        self.lines = text.splitlines(keepends=True)
+        self.consumed = 0
+
+    def __iter__(self):
+        for line in self.lines:
+            self.consumed += 1
+            yield line
+
+
+@pytest.fixture
+def deck(tmp_path):
+    """Fresh Deckbuilder writing to a temporary folder."""
+    Deckbuilder.reset()
+    pm = create_library_path_manager(template_folder=str(TEMPLATES_DIR), output_folder=str(tmp_path))
+    yield Deckbuilder(path_manager_instance=pm)
+    Deckbuilder.reset()
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestMarkdownStreaming:
+    """Test suite for incremental markdown parsing."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            SAMPLE_MARKDOWN,
+            "---\nlayout: Title Only\n---   \n  \n# Heading\n----\nnot a boundary\n---",
+            "# No frontmatter at all",
+            "",
+        ],
+    )
+    def test_blocks_match_regex_split(self, text):
+        """Blocks equal re.split at frontmatter boundaries, up to surrounding whitespace."""
+        expected = [block.strip() for block in re.split(r"^---\s*$", text, flags=re.MULTILINE)]
+        assert [block.strip() for block in iter_markdown_blocks(text)] == expected
+
+    def test_streaming_matches_batch_conversion(self, tmp_path):
+        """Path, line and string sources all give the same slides as markdown_to_canonical_json."""
+        md_file = tmp_path / "deck.md"
+        md_file.write_text(SAMPLE_MARKDOWN, encoding="utf-8")
+        expected = converter.markdown_to_canonical_json(SAMPLE_MARKDOWN)["slides"]
+
+        assert list(converter.iter_canonical_slides(md_file)) == expected
+        assert list(converter.iter_canonical_slides(LineFeed(SAMPLE_MARKDOWN))) == expected
+        assert len(expected) == 3
+
+    def test_slides_are_parsed_lazily(self):
+        """The first slide is produced before the rest of the input is read."""
+        feed = LineFeed(SAMPLE_MARKDOWN)
+        slides = ContentProcessor().iter_markdown_with_frontmatter(feed)
+
+        first = next(slides)
+        assert first["title"] == "Streaming Deck"
+        assert feed.consumed < len(feed.lines)
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestStreamingPresentation:
+    """Test suite for Deckbuilder.create_presentation_from_markdown."""
+
+    def test_streamed_deck_matches_batch_build(self, deck, tmp_path):
+        """Streaming produces the same slides as the two-phase build."""
+        md_file = tmp_path / "deck.md"
+        md_file.write_text(SAMPLE_MARKDOWN, encoding="utf-8")
+
+        result = deck.create_presentation_from_markdown(md_file, "streamed")
+        streamed = Presentation(next(tmp_path.glob("streamed.*.g.pptx")))
+        deck.create_presentation(converter.markdown_to_canonical_json(SAMPLE_MARKDOWN), "batched")
+        batched = Presentation(next(tmp_path.glob("batched.*.g.pptx")))
+
+        assert "3 slides" in result
+
+        def summary(prs):
+            return [(slide.slide_layout.name, [shape.text_frame.text for shape in slide.shapes if shape.has_text_frame]) for slide in prs.slides]
+
+        assert summary(streamed) == summary(batched)
+
+    def test_invalid_slide_fails_before_next_is_parsed(self, deck):
+        """A validation error on slide 2 surfaces before slide 3 is read."""
+        markdown = SAMPLE_MARKDOWN.replace("layout: Title and Content", "layout: No Such Layout")
+        feed = LineFeed(markdown)
+
+        with pytest.raises(ValidationError, match="Slide 2: Unknown layout"):
+            deck.create_presentation_from_markdown(feed, "invalid")
+
+        assert feed.lines[feed.consumed - 1].startswith("---")
+        assert "Closing" not in "".join(feed.lines[: feed.consumed])
+
+    def test_empty_markdown_rejected(self, deck):
+        """A deck without slides is rejected like in create_presentation."""
+        with pytest.raises(ValueError, match="At least one slide is required"):
+            deck.create_presentation_from_markdown("", "empty")
+
+    def test_paranoid_validation_rereads_saved_file(self, deck, tmp_path):
+        """Paranoid mode validates the saved file after streaming."""
+        result = deck.create_presentation_from_markdown(SAMPLE_MARKDOWN, "paranoid", paranoid_validation=True)
+
+        assert "3 slides" in result
+        assert list(tmp_path.glob("paranoid.*.g.pptx"))
+
+    def test_streaming_profile_records_per_slide_stages(self, deck):
+        """Profiled streaming records parse, validation and build spans per slide."""
+        deck.create_presentation_from_markdown(SAMPLE_MARKDOWN, "profiled", profile=True)
+
+        rows = {row["name"]: row for row in deck.last_profile.summarize()}
+        assert rows["slide"]["count"] == 3
+        assert rows["markdown_parse"]["count"] == 3
+        assert "save" in rows
+
+    def test_images_are_prefetched_a_window_ahead(self, deck, monkeypatch):
+        """Slides are parsed and prefetched up to twice the image threads ahead of the one being built."""
+        builder = deck.presentation_builder
+        monkeypatch.setattr(builder.image_prefetcher, "max_workers", 1)
+        events = []
+        prefetch, add_slide = builder.prefetch_images, builder.add_slide
+
+        def record_prefetch(prs, slides):
+            events.append(("prefetch", slides[0]["placeholders"]["title"]))
+            return prefetch(prs, slides)
+
+        def record_add(prs, slide_data):
+            events.append(("build", slide_data["placeholders"]["title"]))
+            return add_slide(prs, slide_data)
+
+        monkeypatch.setattr(builder, "prefetch_images", record_prefetch)
+        monkeypatch.setattr(builder, "add_slide", record_add)
+        markdown = "".join(f"---\nlayout: Title Only\ntitle: Slide {i}\n---\n\n" for i in range(1, 6))
+
+        assert "5 slides" in deck.create_presentation_from_markdown(markdown, "window")
+        assert events == [
+            ("prefetch", "Slide 1"),
+            ("prefetch", "Slide 2"),
+            ("prefetch", "Slide 3"),
+            ("build", "Slide 1"),
+            ("prefetch", "Slide 4"),
+            ("build", "Slide 2"),
+            ("prefetch", "Slide 5"),
+            ("build", "Slide 3"),
+            ("build", "Slide 4"),
+            ("build", "Slide 5"),
+        ]
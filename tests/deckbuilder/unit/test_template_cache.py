@@ -0,0 +1,116 @@
+"""
+Unit tests for the in-process TemplateCache.
+
+Verifies that cached templates hand out independent, slide-free presentations,
+that entries are invalidated when the template changes on disk, and that
+hit/miss statistics are recorded.
+"""
+
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+from deckbuilder.template_cache import TemplateCache
+
+DEFAULT_TEMPLATE = Path(__file__).parent.parent.parent.parent / "src" / "deckbuilder" / "assets" / "templates" / "default.pptx"
+
+
+@pytest.fixture
+def template_copy(tmp_path):
+    """Copy the default template somewhere we can touch it."""
+    target = tmp_path / "default.pptx"
+    shutil.copy2(DEFAULT_TEMPLATE, target)
+    return target
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestTemplateCache:
+    """Test suite for TemplateCache."""
+
+    def test_miss_then_hit(self, template_copy):
+        """First load is a miss, subsequent loads are hits."""
+        cache = TemplateCache()
+
+        cache.get_presentation(str(template_copy))
+        cache.get_presentation(str(template_copy))
+        cache.get_presentation(str(template_copy))
+
+        stats = cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+        assert stats["entries"] == 1
+        assert stats["cached_bytes"] > 0
+
+    def test_presentations_have_no_slides(self, template_copy):
+        """Sample slides from the template are stripped on both miss and hit."""
+        cache = TemplateCache()
+
+        first = cache.get_presentation(str(template_copy))
+        second = cache.get_presentation(str(template_copy))
+
+        assert len(first.slides) == 0
+        assert len(second.slides) == 0
+        assert len(second.slide_layouts) == len(first.slide_layouts)
+
+    def test_presentations_are_independent(self, template_copy, tmp_path):
+        """Slides added to one handed-out copy never leak into another."""
+        cache = TemplateCache()
+        cache.get_presentation(str(template_copy))
+
+        a = cache.get_presentation(str(template_copy))
+        b = cache.get_presentation(str(template_copy))
+        a.slides.add_slide(a.slide_layouts[1])
+        a.slides.add_slide(a.slide_layouts[1])
+
+        assert len(a.slides) == 2
+        assert len(b.slides) == 0
+
+        out = tmp_path / "out.pptx"
+        a.save(str(out))
+        assert out.exists()
+
+    def test_mtime_change_invalidates(self, template_copy):
+        """Touching the template file forces a reload."""
+        cache = TemplateCache()
+        cache.get_presentation(str(template_copy))
+
+        later = time.time() + 10
+        os.utime(template_copy, (later, later))
+        cache.get_presentation(str(template_copy))
+
+        assert cache.get_stats()["misses"] == 2
+
+    def test_lru_eviction(self, tmp_path):
+        """Oldest template is evicted when max_entries is exceeded."""
+        cache = TemplateCache(max_entries=1)
+        first = tmp_path / "first.pptx"
+        second = tmp_path / "second.pptx"
+        shutil.copy2(DEFAULT_TEMPLATE, first)
+        shutil.copy2(DEFAULT_TEMPLATE, second)
+
+        cache.get_presentation(str(first))
+        cache.get_presentation(str(second))
+        cache.get_presentation(str(first))
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 1
+        assert stats["misses"] == 3
+
+    def test_invalidate_and_clear(self, template_copy):
+        """invalidate() drops entries, clear() also resets statistics."""
+        cache = TemplateCache()
+        cache.get_presentation(str(template_copy))
+
+        cache.invalidate(str(template_copy))
+        assert cache.get_stats()["entries"] == 0
+
+        cache.get_presentation(str(template_copy))
+        cache.clear()
+        stats = cache.get_stats()
+        assert stats["entries"] == 0
+        assert stats["hits"] == 0
+        assert stats["misses"] == 0
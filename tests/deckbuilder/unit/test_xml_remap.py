@@ -0,0 +1,114 @@
+"""
+Unit tests for the XML-level remap path (FormattingSupport.update_presentation
+with fast=True), checked against the python-pptx object model path.
+"""
+
+import zipfile
+
+import pytest
+from pptx import Presentation
+from pptx.util import Inches
+
+from deckbuilder.formatting_support import FormattingSupport
+from deckbuilder.xml_remap import NS, XmlRemapper
+
+
+def _write_deck(path):
+    """Deck with text boxes, a hyperlinked run, a table and a grouped text box."""
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide.shapes.title.text = "Optimize the color scheme"
+    run = slide.placeholders[1].text_frame.paragraphs[0].add_run()
+    run.text = "Visit our theater"
+    run.hyperlink.address = "https://example.com"
+
+    table = slide.shapes.add_table(2, 2, Inches(1), Inches(4), Inches(4), Inches(1)).table
+    table.cell(0, 0).text = "Gray"
+    table.cell(1, 1).text = "Center"
+
+    group = prs.slides.add_slide(prs.slide_layouts[6]).shapes.add_group_shape()
+    group.shapes.add_textbox(Inches(1), Inches(1), Inches(3), Inches(1)).text_frame.text = "The TV program"
+    prs.save(path)
+    return path
+
+
+def _runs(path):
+    """(text, lang, latin typeface, rPr child order) of every run python-pptx visits."""
+    prs = Presentation(path)
+    parts = [master for master in prs.slide_masters]
+    parts += [layout for master in prs.slide_masters for layout in master.slide_layouts]
+    parts += list(prs.slides)
+    runs = []
+    for part in parts:
+        for r in part.element.iter("{%s}r" % NS["a"]):
+            r_pr = r.find("a:rPr", NS)
+            latin = r_pr.find("a:latin", NS) if r_pr is not None else None
+            children = [child.tag.split("}")[1] for child in r_pr] if r_pr is not None else None
+            runs.append((r.findtext("a:t", namespaces=NS), r_pr.get("lang") if r_pr is not None else None, latin.get("typeface") if latin is not None else None, children))
+    return runs
+
+
+@pytest.fixture
+def deck(tmp_path):
+    return _write_deck(tmp_path / "deck.pptx")
+
+
+@pytest.mark.unit
+@pytest.mark.deckbuilder
+class TestXmlRemap:
+    """Test suite for the XML-level remap path."""
+
+    @pytest.mark.parametrize("language, font", [("en-AU", None), (None, "Arial"), ("en-GB", "Calibri")])
+    def test_matches_python_pptx_path(self, deck, tmp_path, language, font):
+        """Runs, statistics and theme fonts are the same as with the object model path."""
+        legacy = FormattingSupport().update_presentation(str(deck), language, font, output_path=str(tmp_path / "legacy.pptx"), create_backup=False)
+        fast = FormattingSupport().update_presentation(str(deck), language, font, output_path=str(tmp_path / "fast.pptx"), create_backup=False, fast=True)
+
+        assert fast["success"], fast.get("error")
+        assert fast["stats"] == legacy["stats"]
+        assert _runs(tmp_path / "fast.pptx") == _runs(tmp_path / "legacy.pptx")
+
+    def test_text_and_attributes_rewritten(self, deck, tmp_path):
+        """Run text, lang and latin typeface are rewritten in slides, tables and groups."""
+        output = tmp_path / "fast.pptx"
+        FormattingSupport().update_presentation(str(deck), "en-AU", "Arial", output_path=str(output), create_backup=False, fast=True)
+
+        texts = [text for text, lang, typeface, _ in _runs(output) if lang == "en-AU" and typeface == "Arial"]
+        assert {"Optimise the colour scheme", "Visit our theatre", "Grey", "Centre", "The TV programme"} <= set(texts)
+
+    def test_other_parts_copied_unchanged(self, deck, tmp_path):
+        """Entries other than changed slide, layout, master and theme parts are copied byte for byte."""
+        output = tmp_path / "fast.pptx"
+        FormattingSupport().update_presentation(str(deck), "en-AU", output_path=str(output), create_backup=False, fast=True)
+
+        with zipfile.ZipFile(deck) as before, zipfile.ZipFile(output) as after:
+            assert before.namelist() == after.namelist()
+            unchanged = [name for name in before.namelist() if before.read(name) == after.read(name)]
+            assert "[Content_Types].xml" in unchanged
+            assert "ppt/theme/theme1.xml" in unchanged
+            assert "ppt/slides/_rels/slide1.xml.rels" in unchanged
+
+    def test_in_place_with_backup(self, deck):
+        """Remapping in place keeps a backup of the original file."""
+        original = deck.read_bytes()
+
+        result = FormattingSupport().update_presentation(str(deck), "en-AU", fast=True)
+
+        assert result["success"]
+        assert (deck.parent / "deck.bak.pptx").read_bytes() == original
+        assert deck.read_bytes() != original
+        assert not list(deck.parent.glob(".*.tmp"))
+
+    def test_invalid_package_reported(self, tmp_path):
+        """A file that is not a .pptx package fails without leaving output behind."""
+        broken = tmp_path / "broken.pptx"
+        broken.write_bytes(b"not a presentation")
+
+        result = FormattingSupport().update_presentation(str(broken), "en-AU", create_backup=False, fast=True)
+
+        assert not result["success"]
+        assert broken.read_bytes() == b"not a presentation"
+
+    def test_language_names_accepted(self):
+        """Language names resolve to the same lang attribute as codes."""
+        assert XmlRemapper(FormattingSupport(), "English (Australia)").lang == XmlRemapper(FormattingSupport(), "en-AU").lang == "en-AU"
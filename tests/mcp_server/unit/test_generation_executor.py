@@ -0,0 +1,95 @@
+"""
+Unit tests for the bounded MCP generation executor.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))  # noqa: E402
+
+from mcp_server.generation_executor import GenerationExecutor, GenerationQueueFull  # noqa: E402
+
+
+@pytest.mark.unit
+@pytest.mark.mcp_server
+class TestGenerationExecutor:
+    """Test suite for GenerationExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_event_loop_thread(self):
+        """Jobs execute on a worker thread, not the event loop thread."""
+        executor = GenerationExecutor(max_concurrency=1, max_queue=0)
+        loop_thread = threading.get_ident()
+
+        worker_thread = await executor.run(threading.get_ident)
+
+        assert worker_thread != loop_thread
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self):
+        """A slow job does not stall other coroutines."""
+        executor = GenerationExecutor(max_concurrency=1, max_queue=0)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(executor.run(time.sleep, 0.2), ticker())
+
+        assert len(ticks) == 5
+        assert ticks[-1] - ticks[0] < 0.2
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        """Work beyond concurrency + queue depth is rejected with a clear error."""
+        executor = GenerationExecutor(max_concurrency=1, max_queue=1)
+        release = threading.Event()
+
+        running = asyncio.ensure_future(executor.run(release.wait, 5))
+        queued = asyncio.ensure_future(executor.run(lambda: "queued"))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(GenerationQueueFull, match="Server busy"):
+            await executor.run(lambda: "rejected")
+
+        assert executor.get_stats()["rejected"] == 1
+        release.set()
+        assert await running is True
+        assert await queued == "queued"
+        assert executor.get_stats()["in_flight"] == 0
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_exceptions_propagate_and_release_slot(self):
+        """Errors raised by the job reach the caller and free the slot."""
+        executor = GenerationExecutor(max_concurrency=1, max_queue=0)
+
+        def fail():
+            raise ValueError("bad deck")
+
+        with pytest.raises(ValueError, match="bad deck"):
+            await executor.run(fail)
+
+        assert await executor.run(lambda: 42) == 42
+        executor.shutdown()
+
+    def test_settings_from_environment(self, monkeypatch):
+        """Concurrency and queue depth can be configured via environment variables."""
+        monkeypatch.setenv("DECKBUILDER_MAX_CONCURRENCY", "3")
+        monkeypatch.setenv("DECKBUILDER_MAX_QUEUE", "5")
+
+        executor = GenerationExecutor()
+
+        assert executor.max_concurrency == 3
+        assert executor.max_queue == 5
+        assert executor.capacity == 8
+        executor.shutdown()
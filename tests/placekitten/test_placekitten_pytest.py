@@ -113,6 +113,123 @@ class TestPlaceKittenSmartCrop:
         assert Path(wide_file).exists()
 
 
+class TestSmartCropProxy:
+    """Test smart cropping with detection on a downscaled proxy."""
+
+    @pytest.fixture
+    def source_image(self):
+        """A bundled kitten image at its original resolution."""
+        from PIL import Image
+
+        images = sorted((src_path / "placekitten" / "images").glob("*.png"))
+        with Image.open(images[0]) as img:
+            return img.convert("RGB")
+
+    @pytest.mark.parametrize("strategy", ["haar-face", "contour"])
+    def test_proxy_crop_matches_target_size(self, source_image, strategy):
+        """Proxy mode analyses a smaller image but returns the requested size."""
+        from placekitten.smart_crop import PROXY_ANALYSIS_SIZE, SmartCropEngine
+
+        cropped, crop_info = SmartCropEngine().smart_crop(source_image, 400, 300, strategy=strategy, analysis_size=PROXY_ANALYSIS_SIZE)
+
+        assert cropped.size == (400, 300)
+        assert max(crop_info["analysis_size"]) == PROXY_ANALYSIS_SIZE
+        x1, y1, x2, y2 = crop_info["crop_box"]
+        assert 0 <= x1 < x2 <= source_image.width
+        assert 0 <= y1 < y2 <= source_image.height
+
+    def test_subject_box_mapped_to_full_resolution(self, source_image):
+        """The subject box found on the proxy is reported in original coordinates."""
+        from placekitten.smart_crop import SmartCropEngine
+
+        engine = SmartCropEngine()
+        _, full_info = engine.smart_crop(source_image, 400, 400, strategy="contour")
+        _, proxy_info = engine.smart_crop(source_image, 400, 400, strategy="contour", analysis_size=256)
+
+        x, y, w, h = proxy_info["subject_bbox"]
+        assert x + w <= source_image.width and y + h <= source_image.height
+        # A quarter-size proxy cannot report a subject only a few pixels wide
+        assert w > 4 and h > 4
+        assert full_info["analysis_size"] == source_image.size
+
+    def test_small_image_not_downscaled(self, source_image):
+        """Images already within analysis_size are analysed unchanged."""
+        from placekitten.smart_crop import SmartCropEngine
+
+        small = source_image.resize((400, 300))
+        _, crop_info = SmartCropEngine().smart_crop(small, 200, 200, analysis_size=512)
+
+        assert crop_info["analysis_size"] == (400, 300)
+
+
+class TestSmartCropModes:
+    """Test the production (crop box only) and debug (recorded steps) modes."""
+
+    def test_find_crop_box_matches_smart_crop(self, placekitten):
+        """find_crop_box locates the same box smart_crop crops to."""
+        from placekitten.smart_crop import SmartCropEngine
+
+        image = placekitten.generate(width=800, height=600, image_id=1).image
+        engine = SmartCropEngine()
+
+        crop_info = engine.find_crop_box(image, 400, 400)
+        _, smart_info = engine.smart_crop(image, 400, 400)
+
+        assert crop_info["crop_box"] == smart_info["crop_box"]
+        assert crop_info["steps_saved"] == 0
+
+    def test_production_mode_records_no_steps(self, placekitten):
+        """Without save_steps no visualisation frames are kept."""
+        from placekitten.smart_crop import SmartCropEngine
+
+        image = placekitten.generate(width=800, height=600, image_id=1).image
+        engine = SmartCropEngine()
+        engine.smart_crop(image, 400, 300)
+
+        assert engine.get_debug_steps() == []
+
+    def test_debug_mode_records_every_step(self, placekitten, test_output_dir):
+        """With save_steps all nine steps are recorded."""
+        from placekitten.smart_crop import SmartCropEngine
+
+        image = placekitten.generate(width=800, height=600, image_id=1).image
+        engine = SmartCropEngine()
+        _, crop_info = engine.smart_crop(image, 400, 300, save_steps=True, output_prefix="pytest_modes", output_folder=str(test_output_dir))
+
+        names = [step["name"] for step in engine.get_debug_steps()]
+        assert crop_info["steps_saved"] == 9
+        assert names[0] == "1-original" and names[-1] == "9-final"
+
+
+class TestFaceCascadeCache:
+    """Test the per-thread Haar cascade cache and detection settings."""
+
+    def test_cascade_reused_on_same_thread(self):
+        """The cascade is parsed once and reused by later calls on a thread."""
+        from placekitten.smart_crop import _get_face_cascade
+
+        assert _get_face_cascade() is _get_face_cascade()
+
+    def test_cascade_not_shared_across_threads(self):
+        """Each thread gets its own classifier."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from placekitten.smart_crop import _get_face_cascade
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(_get_face_cascade).result()
+
+        assert other is not _get_face_cascade()
+
+    def test_detection_settings_accepted(self, placekitten):
+        """A coarser scale step and minimum face size still produce a crop."""
+        processor = placekitten.generate(width=800, height=600, image_id=1)
+
+        result = processor.smart_crop(width=400, height=300, face_scale_factor=1.3, face_min_size=80)
+
+        assert result.image.size == (400, 300)
+
+
 class TestPlaceKittenFilters:
     """Test filter pipeline functionality."""
 
@@ -212,3 +329,97 @@ class TestCleanup:
             for file in test_output_dir.iterdir():
                 if file.is_file() and not file.name.startswith("."):
                     assert file.suffix in [".jpg", ".jpeg", ".png"], f"Unexpected file type: {file}"
+
+
+class TestImageIndex:
+    """Test the precomputed subject metadata index."""
+
+    @pytest.mark.parametrize("strategy", ["haar-face", "contour"])
+    def test_index_crop_matches_detection(self, placekitten, strategy):
+        """Crops from the bundled index choose the same box as running detection."""
+        from placekitten.geometry import calculate_optimal_crop
+        from placekitten.image_index import subject_bbox_for
+        from placekitten.smart_crop import SmartCropEngine
+
+        engine = SmartCropEngine()
+        for image_path in placekitten._get_available_images():
+            metadata = placekitten.image_index.get(image_path)
+            assert metadata is not None, f"{image_path.name} missing from the bundled index"
+
+            processor = placekitten.generate(image_id=placekitten._get_available_images().index(image_path) + 1)
+            for width, height in [(1920, 1080), (400, 400), (600, 900)]:
+                crop_info = engine.find_crop_box(processor.image, width, height, strategy=strategy)
+                box = calculate_optimal_crop(*processor.image.size, width, height, subject_bbox_for(metadata, strategy))
+                assert box == crop_info["crop_box"]
+
+    def test_generate_uses_index(self, placekitten):
+        """PlaceKitten crops its source images from the index."""
+        result = placekitten.generate(width=400, height=300, image_id=1)
+
+        assert result.image.size == (400, 300)
+        assert result.crop_info["from_index"] is True
+
+    def test_non_default_detection_settings_run_detection(self, placekitten):
+        """The index only holds results for the default face settings."""
+        from placekitten import geometry, smart_crop
+
+        assert smart_crop.DEFAULT_FACE_SCALE_FACTOR is geometry.DEFAULT_FACE_SCALE_FACTOR
+        result = placekitten.generate(image_id=1).smart_crop(400, 300, face_scale_factor=geometry.DEFAULT_FACE_SCALE_FACTOR + 0.1)
+
+        assert "from_index" not in result.crop_info
+
+    def test_derived_images_run_detection(self, placekitten):
+        """A filtered image no longer matches the index, so detection runs."""
+        result = placekitten.generate(image_id=1).apply_filter("grayscale").smart_crop(400, 300)
+
+        assert "from_index" not in result.crop_info
+
+    def test_custom_folder_indexed_lazily(self, tmp_path):
+        """Images without an entry are analysed on first use and saved."""
+        import shutil
+
+        from placekitten.image_index import INDEX_FILENAME, ImageIndex
+
+        image_path = tmp_path / "kitten.png"
+        shutil.copy(sorted((src_path / "placekitten" / "images").glob("*.png"))[0], image_path)
+
+        index = ImageIndex.load(tmp_path)
+        assert index.get(image_path) is None
+
+        entry = index.get_or_build(image_path)
+        assert entry["contour_bbox"] is not None
+        assert (tmp_path / INDEX_FILENAME).exists()
+        assert ImageIndex.load(tmp_path).get(image_path) == entry
+
+    def test_changed_file_not_served_from_index(self, tmp_path):
+        """An entry whose file size no longer matches is ignored."""
+        from PIL import Image
+
+        from placekitten.image_index import ImageIndex
+
+        image_path = tmp_path / "square.png"
+        Image.new("RGB", (64, 64), "white").save(image_path)
+        index = ImageIndex(tmp_path)
+        index.build([image_path])
+
+        Image.new("RGB", (96, 96), "black").save(image_path)
+        assert index.get(image_path) is None
+
+    def test_same_size_edit_not_served_from_index(self, tmp_path):
+        """In custom folders an edit that keeps the byte size is caught by the modification time."""
+        import os
+
+        from PIL import Image
+
+        from placekitten.image_index import ImageIndex
+
+        image_path = tmp_path / "square.png"
+        Image.new("RGB", (64, 64), "white").save(image_path)
+        index = ImageIndex(tmp_path)
+        index.build([image_path])
+        stat = image_path.stat()
+
+        os.utime(image_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert index.get(image_path) is None
+        # The bundled images are matched on name and size only
+        assert ImageIndex(tmp_path, index.entries, check_mtime=False).get(image_path) is not None
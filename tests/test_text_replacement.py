@@ -7,7 +7,7 @@ in addition to changing language IDs.
 
 from unittest.mock import patch, mock_open
 
-from src.deckbuilder.formatting_support import FormattingSupport
+from src.deckbuilder.formatting_support import CompiledLanguageMapping, FormattingSupport, LanguageMappingCache, language_mapping_cache
 
 
 class TestTextReplacement:
@@ -231,3 +231,47 @@ class TestTextReplacementEdgeCases:
         """Test case preservation with empty original"""
         result = self.formatter.preserve_case("", "test")
         assert result == "test"
+
+
+class TestCompiledLanguageMapping:
+    """Test the single-pass compiled replacement matcher"""
+
+    def test_matcher_shared_across_instances(self):
+        """Instances loading the same language file reuse one compiled matcher"""
+        first = FormattingSupport().load_language_mapping("en-AU")
+        second = FormattingSupport().load_language_mapping("en-AU")
+
+        assert first is not second
+        assert language_mapping_cache.get(first) is language_mapping_cache.get(second)
+
+    def test_mapping_compiled_once(self):
+        """Repeated replacements do not recompile the mapping"""
+        cache = LanguageMappingCache()
+        mapping = {"spelling_patterns": {"color": "colour"}}
+
+        assert cache.get(mapping) is cache.get(dict(mapping))
+        assert cache.get_stats()["compiled"] == 1
+
+    def test_longest_source_wins(self):
+        """A phrase is preferred over a shorter source starting at the same word"""
+        compiled = CompiledLanguageMapping({"spelling_patterns": {"cell": "cel"}, "vocabulary": {"cell phone": "mobile phone"}})
+
+        matches = [m.group() for m in compiled.pattern.finditer("cell phone cell")]
+        assert matches == ["cell phone", "cell"]
+        assert compiled.lookup("CELL PHONE") == ("cell phone", "mobile phone", ())
+
+    def test_replacements_are_not_chained(self):
+        """Replacement output is not matched again by later entries"""
+        mapping = {"spelling_patterns": {"color": "colour"}, "vocabulary": {"colour": "hue"}}
+        formatter = FormattingSupport()
+
+        with patch.object(formatter, "load_language_mapping", return_value=mapping):
+            assert formatter.apply_text_replacements("color and colour", "en-AU") == "colour and hue"
+
+    def test_builtin_mapping_single_pass(self):
+        """The shipped en-AU mapping replaces spelling, conditional and vocabulary entries in one call"""
+        text = "Optimize the COLOR of the TV program on your cell phone. Then run the computer program."
+
+        result = FormattingSupport().apply_text_replacements(text, "en-AU")
+
+        assert result == "Optimise the COLOUR of the TV programme on your mobile phone. Then run the computer program."